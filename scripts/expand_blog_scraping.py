@@ -2,13 +2,18 @@
 Expand blog scraping to find ALL blog posts with restaurant lists
 Then extract every restaurant from those posts
 """
-import requests
+import os
+import sys
 from bs4 import BeautifulSoup
 import re
 import hashlib
 import json
 from typing import List, Dict
 
+# Add project root to path for the shared HTTP cache
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from src.clients.http_cache import get_http_cache
+
 # Known food category blog posts
 BLOG_POSTS = {
     'jollof': 'https://chowdeck.com/blog/get-it-here-jollof-rice-on-chowdeck',
@@ -68,7 +73,7 @@ class ExpandedBlogScraper:
             print(f"  URL: {url}")
 
             try:
-                response = requests.get(url, timeout=self.timeout)
+                response = get_http_cache().get(url, timeout=self.timeout)
 
                 # Check if post exists
                 if response.status_code == 404:
@@ -7,14 +7,15 @@ Expand Lagos database to 500+ by adding:
 - Pepper soup joints
 - Shawarma spots
 """
-import json
+import os
 import hashlib
 import re
 
 # Load existing database
 import sys
-sys.path.insert(0, '/home/glitch/api')
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from src.data.comprehensive_lagos import get_comprehensive_lagos_restaurants
+from src.data.loader import data_path, write_records
 
 
 def generate_id(name, city):
@@ -168,7 +169,7 @@ VARIATION_PATTERNS = [
 def expand_database():
     """Expand to 500+ restaurants"""
     # Start with existing
-    restaurants = get_comprehensive_lagos_restaurants()
+    restaurants = list(get_comprehensive_lagos_restaurants())
     existing_ids = {r['id'] for r in restaurants}
 
     # Add additional spots
@@ -247,15 +248,8 @@ def main():
         print(f"  {lga}: {lgas[lga]}")
 
     # Save
-    output_file = '/home/glitch/api/src/data/comprehensive_lagos.py'
-
-    with open(output_file, 'w') as f:
-        f.write('"""\nComprehensive Lagos restaurant database - 500+ restaurants\n"""\n\n')
-        f.write('COMPREHENSIVE_LAGOS_RESTAURANTS = ')
-        f.write(json.dumps(restaurants, indent=4))
-        f.write('\n\n\ndef get_comprehensive_lagos_restaurants():\n')
-        f.write('    """Get all comprehensive Lagos restaurants"""\n')
-        f.write('    return COMPREHENSIVE_LAGOS_RESTAURANTS\n')
+    output_file = data_path('comprehensive_lagos.jsonl')
+    write_records(output_file, restaurants)
 
     print(f"\nSaved to {output_file}")
     print(f"\n{'=' * 60}")
@@ -2,10 +2,15 @@
 Generate 10,000+ Lagos restaurants
 Includes extensive variations, street-level locations, and numbered establishments
 """
-import json
+import os
+import sys
 import hashlib
 import re
 
+# Add project root to path for the data loader
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from src.data.loader import data_path, write_records
+
 def generate_id(name, city):
     """Generate unique restaurant ID"""
     combined = f"{name}_{city}"
@@ -203,38 +208,11 @@ def main():
     for lga in sorted(lga_counts.keys()):
         print(f"  {lga}: {lga_counts[lga]}")
 
-    # Save to Python file
-    output_file = '/home/glitch/api/src/data/mega_lagos_restaurants.py'
+    # Save as JSON Lines, loaded lazily by src/data/mega_lagos_restaurants.py
+    output_file = data_path('mega_lagos_restaurants.jsonl')
 
     print(f"\nSaving to {output_file}...")
-
-    with open(output_file, 'w') as f:
-        f.write('"""\nMega Lagos restaurant database - 10,000+ restaurants\n"""\n\n')
-        f.write('MEGA_LAGOS_RESTAURANTS = [\n')
-
-        for i, r in enumerate(restaurants):
-            f.write('    {\n')
-            for key, value in r.items():
-                if value is None:
-                    f.write(f'        "{key}": None,\n')
-                elif isinstance(value, str):
-                    # Escape quotes
-                    escaped_value = value.replace('"', '\\"')
-                    f.write(f'        "{key}": "{escaped_value}",\n')
-                elif isinstance(value, list):
-                    f.write(f'        "{key}": {repr(value)},\n')
-                else:
-                    f.write(f'        "{key}": {value},\n')
-
-            if i < len(restaurants) - 1:
-                f.write('    },\n')
-            else:
-                f.write('    }\n')
-
-        f.write(']\n\n')
-        f.write('def get_mega_lagos_restaurants():\n')
-        f.write('    """Get all mega Lagos restaurants (10K+)"""\n')
-        f.write('    return MEGA_LAGOS_RESTAURANTS\n')
+    write_records(output_file, restaurants)
 
     print(f"✓ Saved {len(restaurants)} restaurants")
     print(f"\n{'=' * 60}")
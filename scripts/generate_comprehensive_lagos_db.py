@@ -2,10 +2,15 @@
 Generate comprehensive Lagos restaurant database with 500+ entries
 Includes chains with multiple branches + local establishments across all LGAs
 """
-import json
+import os
+import sys
 import hashlib
 import re
 
+# Add project root to path for the data loader
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from src.data.loader import data_path, write_records
+
 # Major chains with multiple branches across Lagos
 MAJOR_CHAINS = {
     "Chicken Republic": {
@@ -407,15 +412,8 @@ def main():
         print(f"  {lga}: {len(lgas[lga])} restaurants")
 
     # Save to file
-    output_file = '/home/glitch/api/src/data/comprehensive_lagos.py'
-
-    with open(output_file, 'w') as f:
-        f.write('"""\nComprehensive Lagos restaurant database - 500+ restaurants\n"""\n\n')
-        f.write('COMPREHENSIVE_LAGOS_RESTAURANTS = ')
-        f.write(json.dumps(restaurants, indent=4))
-        f.write('\n\n\ndef get_comprehensive_lagos_restaurants():\n')
-        f.write('    """Get all comprehensive Lagos restaurants"""\n')
-        f.write('    return COMPREHENSIVE_LAGOS_RESTAURANTS\n')
+    output_file = data_path('comprehensive_lagos.jsonl')
+    write_records(output_file, restaurants)
 
     print(f"\nSaved to {output_file}")
     print(f"\n{'=' * 60}")
@@ -2,10 +2,15 @@
 Comprehensive Chowdeck scraper using multiple sources
 Aggregates restaurants from blog posts and other available sources
 """
-import requests
+import os
+import sys
 from bs4 import BeautifulSoup
 import json
 
+# Add project root to path for the shared HTTP cache
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from src.clients.http_cache import get_http_cache
+
 # Known blog posts with restaurant listings
 BLOG_POSTS = [
     'https://chowdeck.com/blog/get-it-here-jollof-rice-on-chowdeck',
@@ -26,7 +31,7 @@ def scrape_blog_post(url):
     restaurants = []
 
     try:
-        response = requests.get(url, timeout=30)
+        response = get_http_cache().get(url, timeout=30)
         response.raise_for_status()
 
         soup = BeautifulSoup(response.content, 'html.parser')
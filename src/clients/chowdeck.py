@@ -7,6 +7,7 @@ import hashlib
 import requests
 from bs4 import BeautifulSoup
 from typing import List, Dict
+from src.clients.http_cache import get_http_cache
 
 
 class ChowdeckClient:
@@ -62,22 +63,23 @@ class ChowdeckClient:
             except Exception as e:
                 print(f"Dynamic scraper failed: {str(e)}, falling back to static scraper")
 
-        # Use static blog scraper
+        # Use static blog scraper (conditional GET; a 304 reuses the last parse)
         try:
-            response = requests.get(self.base_url, timeout=self.timeout)
-            response.raise_for_status()
-
-            # Parse HTML content
-            soup = BeautifulSoup(response.content, 'html.parser')
-
-            # Extract restaurant data
-            restaurants = self._parse_restaurants(soup)
-
-            return restaurants
+            restaurants = get_http_cache().get_parsed(
+                self.base_url,
+                self._parse_response,
+                timeout=self.timeout
+            )
+            return list(restaurants)
 
         except requests.RequestException as e:
             raise Exception(f"Failed to fetch data from Chowdeck: {str(e)}")
 
+    def _parse_response(self, response) -> List[Dict]:
+        """Parse a blog post response into restaurant dictionaries"""
+        soup = BeautifulSoup(response.content, 'html.parser')
+        return self._parse_restaurants(soup)
+
     def _parse_restaurants(self, soup: BeautifulSoup) -> List[Dict]:
         """
         Parse restaurant data from Chowdeck blog post HTML
@@ -217,7 +219,7 @@ class ChowdeckClient:
         Fetch detailed information for a specific restaurant
         """
         try:
-            response = requests.get(restaurant_url, timeout=self.timeout)
+            response = get_http_cache().get(restaurant_url, timeout=self.timeout)
             response.raise_for_status()
 
             soup = BeautifulSoup(response.content, 'html.parser')
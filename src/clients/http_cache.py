@@ -0,0 +1,187 @@
+"""
+Shared HTTP layer with a conditional-GET response cache
+Responses are kept in memory and on disk; cached entries are revalidated
+with ETag/Last-Modified so an unchanged page costs a 304 and no re-parse.
+"""
+import os
+import json
+import hashlib
+import threading
+import requests
+from typing import Any, Callable, Dict, Optional, Tuple
+
+DEFAULT_CACHE_DIR = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))),
+    '.cache',
+    'http'
+)
+
+
+class CachedResponse:
+    """Minimal response object returned by HTTPCache.get"""
+
+    def __init__(self, url: str, status_code: int, content: bytes,
+                 headers: Optional[Dict] = None, from_cache: bool = False):
+        self.url = url
+        self.status_code = status_code
+        self.content = content
+        self.headers = headers or {}
+        # True when the body came from the cache (304 Not Modified)
+        self.from_cache = from_cache
+
+    @property
+    def text(self) -> str:
+        return self.content.decode('utf-8', errors='replace')
+
+    def raise_for_status(self):
+        """Raise requests.HTTPError for 4xx/5xx responses"""
+        if self.status_code >= 400:
+            raise requests.HTTPError(
+                f"{self.status_code} Error for url: {self.url}"
+            )
+
+
+class HTTPCache:
+    """HTTP GET client with an in-memory and on-disk validator cache"""
+
+    def __init__(self, cache_dir: Optional[str] = DEFAULT_CACHE_DIR, session=None):
+        self.cache_dir = cache_dir
+        self.session = session or requests.Session()
+        # url -> ETag/Last-Modified, headers and body of the last cached 200
+        self._entries: Dict[str, Dict[str, Any]] = {}
+        # (url, parser name) -> parse result for that body
+        self._parsed: Dict[Tuple[str, str], Any] = {}
+        self._lock = threading.Lock()
+
+    def get(self, url: str, timeout: int = 30,
+            headers: Optional[Dict] = None) -> CachedResponse:
+        """
+        GET a URL, revalidating any cached copy with a conditional request
+        Only 200 responses are cached; other statuses are returned as-is.
+        """
+        entry = self._get_entry(url)
+        request_headers = dict(headers or {})
+
+        if entry:
+            if entry.get('etag'):
+                request_headers['If-None-Match'] = entry['etag']
+            if entry.get('last_modified'):
+                request_headers['If-Modified-Since'] = entry['last_modified']
+
+        response = self.session.get(url, headers=request_headers, timeout=timeout)
+
+        if response.status_code == 304 and entry:
+            return CachedResponse(url, 200, entry['content'], entry['headers'], from_cache=True)
+
+        if response.status_code == 200:
+            self._store_entry(url, response)
+
+        return CachedResponse(url, response.status_code, response.content, dict(response.headers))
+
+    def get_parsed(self, url: str, parse: Callable, timeout: int = 30):
+        """
+        GET a URL and return `parse(response)`, reusing the previous parse
+        result when the server answers 304 Not Modified
+        Callers must treat the returned object as read-only.
+        """
+        key = (url, getattr(parse, '__qualname__', repr(parse)))
+        response = self.get(url, timeout=timeout)
+        response.raise_for_status()
+
+        with self._lock:
+            if response.from_cache and key in self._parsed:
+                return self._parsed[key]
+
+        parsed = parse(response)
+
+        with self._lock:
+            self._parsed[key] = parsed
+
+        return parsed
+
+    def clear(self):
+        """Drop all in-memory entries (disk entries are kept)"""
+        with self._lock:
+            self._entries.clear()
+            self._parsed.clear()
+
+    def _get_entry(self, url: str) -> Optional[Dict]:
+        """Get the cached entry for a URL from memory, falling back to disk"""
+        with self._lock:
+            entry = self._entries.get(url)
+        if entry is not None or not self.cache_dir:
+            return entry
+
+        meta_path, body_path = self._paths(self.cache_dir, url)
+        try:
+            with open(meta_path) as f:
+                entry = json.load(f)
+            with open(body_path, 'rb') as f:
+                entry['content'] = f.read()
+        except (OSError, ValueError):
+            return None
+
+        with self._lock:
+            self._entries[url] = entry
+        return entry
+
+    def _store_entry(self, url: str, response):
+        """Cache a 200 response if it carries a validator"""
+        etag = response.headers.get('ETag')
+        last_modified = response.headers.get('Last-Modified')
+        if not etag and not last_modified:
+            return
+
+        entry = {
+            'etag': etag,
+            'last_modified': last_modified,
+            'headers': dict(response.headers),
+            'content': response.content,
+        }
+
+        with self._lock:
+            self._entries[url] = entry
+            # A new body invalidates any parse result for this URL
+            for key in [k for k in self._parsed if k[0] == url]:
+                del self._parsed[key]
+
+        if not self.cache_dir:
+            return
+
+        meta_path, body_path = self._paths(self.cache_dir, url)
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            with open(body_path, 'wb') as f:
+                f.write(response.content)
+            meta = {key: value for key, value in entry.items() if key != 'content'}
+            meta['url'] = url
+            with open(meta_path, 'w') as f:
+                json.dump(meta, f)
+        except OSError as e:
+            print(f"Could not write HTTP cache for {url}: {str(e)}")
+
+    @staticmethod
+    def _paths(cache_dir: str, url: str):
+        """Get the (metadata, body) file paths for a URL in `cache_dir`"""
+        digest = hashlib.sha1(url.encode()).hexdigest()
+        base = os.path.join(cache_dir, digest)
+        return f"{base}.json", f"{base}.body"
+
+
+_http_cache = None
+_http_cache_lock = threading.Lock()
+
+
+def get_http_cache() -> HTTPCache:
+    """
+    Get the process-wide HTTP cache shared by every Chowdeck client
+    The on-disk location can be set with HTTP_CACHE_DIR.
+    """
+    global _http_cache
+
+    if _http_cache is None:
+        with _http_cache_lock:
+            if _http_cache is None:
+                _http_cache = HTTPCache(os.getenv('HTTP_CACHE_DIR', DEFAULT_CACHE_DIR))
+
+    return _http_cache
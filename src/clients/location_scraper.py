@@ -4,9 +4,9 @@ Fetches restaurants on-demand based on state and LGA selection
 """
 import re
 import hashlib
-import requests
 from bs4 import BeautifulSoup
-from typing import List, Dict
+from typing import List, Dict, Optional
+from src.clients.http_cache import get_http_cache
 from src.data.locations import get_areas_for_lga, get_chowdeck_url_for_area
 from src.data.seed_restaurants import get_all_seed_restaurants
 from src.data.mega_lagos_restaurants import get_mega_lagos_restaurants
@@ -27,16 +27,25 @@ class LocationBasedScraper:
     def __init__(self):
         self.timeout = 30
 
-    def fetch_for_location(self, state: str, lga: str = None) -> List[Dict]:
+    def fetch_for_location(self, state: str, lga: Optional[str] = None,
+                           restaurants: Optional[List[Dict]] = None) -> List[Dict]:
         """
         Fetch restaurants for a specific state and optionally LGA
+        If `restaurants` is given it is used as the already-filtered static
+        result (e.g. from RestaurantService's indexes) instead of scanning
+        the static databases.
         Returns list of restaurant dictionaries
         """
         all_restaurants = []
         seen_ids = set()
 
+        if restaurants is not None:
+            for restaurant in restaurants:
+                all_restaurants.append(restaurant)
+                seen_ids.add(restaurant['id'])
+
         # 1. Load mega Lagos database if state is Lagos (24,000+ restaurants)
-        if state == 'Lagos':
+        elif state == 'Lagos':
             try:
                 lagos_restaurants = get_mega_lagos_restaurants()
 
@@ -65,101 +74,118 @@ class LocationBasedScraper:
                 print(f"Error loading seed restaurants: {str(e)}")
 
         # 2. Fetch from all blog posts (additional dynamic data)
+        for restaurant in self.fetch_blog_restaurants(state, lga):
+            if restaurant['id'] not in seen_ids:
+                all_restaurants.append(restaurant)
+                seen_ids.add(restaurant['id'])
+
+        return all_restaurants
+
+    def fetch_blog_restaurants(self, state: str, lga: Optional[str] = None) -> List[Dict]:
+        """
+        Fetch restaurants for a location from every known blog post
+        Returns list of restaurant dictionaries, deduplicated by ID
+        """
+        restaurants = []
+        seen_ids = set()
+
         for food_type, url in self.BLOG_POSTS.items():
             try:
-                restaurants = self._scrape_blog_post(url, state, lga)
-
-                # Deduplicate
-                for restaurant in restaurants:
+                for restaurant in self._scrape_blog_post(url, state, lga):
                     if restaurant['id'] not in seen_ids:
-                        all_restaurants.append(restaurant)
+                        restaurants.append(restaurant)
                         seen_ids.add(restaurant['id'])
 
             except Exception as e:
                 print(f"Error scraping {food_type}: {str(e)}")
                 continue
 
-        return all_restaurants
+        return restaurants
 
-    def _scrape_blog_post(self, url: str, state: str, lga: str = None) -> List[Dict]:
+    def _scrape_blog_post(self, url: str, state: str, lga: Optional[str] = None) -> List[Dict]:
         """Scrape a single blog post and filter by location"""
+        try:
+            # Parsed once per page version; a 304 reuses the previous parse
+            restaurants = get_http_cache().get_parsed(
+                url,
+                self._parse_blog_post,
+                timeout=self.timeout
+            )
+        except Exception as e:
+            raise Exception(f"Failed to fetch from {url}: {str(e)}")
+
+        return [r for r in restaurants if self._matches_location(r, state, lga)]
+
+    def _parse_blog_post(self, response) -> List[Dict]:
+        """Parse every restaurant from a blog post response"""
         restaurants = []
 
-        try:
-            response = requests.get(url, timeout=self.timeout)
-            response.raise_for_status()
-
-            soup = BeautifulSoup(response.content, 'html.parser')
-            restaurant_headings = soup.find_all('h2')
-
-            for heading in restaurant_headings:
-                try:
-                    link = heading.find('a')
-                    if not link:
-                        continue
-
-                    name = link.get_text(strip=True)
-                    if not name or name.lower() in ['chowdeck', 'get it here']:
-                        continue
-
-                    # Initialize restaurant data
-                    restaurant_data = {
-                        'id': self._generate_id(name),
-                        'name': name,
-                        'url': link.get('href', ''),
-                        'city': None,
-                        'state': None,
-                        'lga': None,
-                        'location': None,
-                        'rating': None,
-                        'delivery_areas': [],
-                        'opening_hours': None,
-                        'cuisine': 'Nigerian',
-                        'specialties': []
-                    }
-
-                    # Parse details
-                    current = heading.find_next_sibling()
-
-                    while current and current.name != 'h2' and current.name != 'hr':
-                        if current.name == 'p':
-                            text = current.get_text(strip=True)
-
-                            # Extract rating
-                            rating_match = re.search(r'(\d+\.\d+)\s*out of\s*5', text)
-                            if rating_match:
-                                restaurant_data['rating'] = float(rating_match.group(1))
-
-                            # Extract location
-                            if 'Where:' in text or text.startswith('Where'):
-                                location_text = text.replace('Where:', '').strip()
-                                restaurant_data['location'] = location_text
-
-                                # Parse location data
-                                self._parse_location(restaurant_data, location_text)
-
-                            # Extract delivery areas
-                            if 'Delivering To:' in text or 'Delivering to:' in text:
-                                delivery_text = re.sub(r'Delivering [Tt]o:\s*', '', text).strip()
-                                areas = [area.strip() for area in delivery_text.split(',') if area.strip()]
-                                restaurant_data['delivery_areas'] = areas
-
-                            # Extract opening hours
-                            if 'Opening Hours:' in text or 'Hours:' in text:
-                                hours_text = re.sub(r'Opening Hours:\s*|Hours:\s*', '', text).strip()
-                                restaurant_data['opening_hours'] = hours_text
-
-                        current = current.find_next_sibling()
-
-                    # Filter by state and LGA
-                    if self._matches_location(restaurant_data, state, lga):
-                        restaurants.append(restaurant_data)
-
-                except Exception:
+        soup = BeautifulSoup(response.content, 'html.parser')
+        restaurant_headings = soup.find_all('h2')
+
+        for heading in restaurant_headings:
+            try:
+                link = heading.find('a')
+                if not link:
                     continue
 
-        except Exception as e:
-            raise Exception(f"Failed to fetch from {url}: {str(e)}")
+                name = link.get_text(strip=True)
+                if not name or name.lower() in ['chowdeck', 'get it here']:
+                    continue
+
+                # Initialize restaurant data
+                restaurant_data = {
+                    'id': self._generate_id(name),
+                    'name': name,
+                    'url': link.get('href', ''),
+                    'city': None,
+                    'state': None,
+                    'lga': None,
+                    'location': None,
+                    'rating': None,
+                    'delivery_areas': [],
+                    'opening_hours': None,
+                    'cuisine': 'Nigerian',
+                    'specialties': []
+                }
+
+                # Parse details
+                current = heading.find_next_sibling()
+
+                while current and current.name != 'h2' and current.name != 'hr':
+                    if current.name == 'p':
+                        text = current.get_text(strip=True)
+
+                        # Extract rating
+                        rating_match = re.search(r'(\d+\.\d+)\s*out of\s*5', text)
+                        if rating_match:
+                            restaurant_data['rating'] = float(rating_match.group(1))
+
+                        # Extract location
+                        if 'Where:' in text or text.startswith('Where'):
+                            location_text = text.replace('Where:', '').strip()
+                            restaurant_data['location'] = location_text
+
+                            # Parse location data
+                            self._parse_location(restaurant_data, location_text)
+
+                        # Extract delivery areas
+                        if 'Delivering To:' in text or 'Delivering to:' in text:
+                            delivery_text = re.sub(r'Delivering [Tt]o:\s*', '', text).strip()
+                            areas = [area.strip() for area in delivery_text.split(',') if area.strip()]
+                            restaurant_data['delivery_areas'] = areas
+
+                        # Extract opening hours
+                        if 'Opening Hours:' in text or 'Hours:' in text:
+                            hours_text = re.sub(r'Opening Hours:\s*|Hours:\s*', '', text).strip()
+                            restaurant_data['opening_hours'] = hours_text
+
+                    current = current.find_next_sibling()
+
+                restaurants.append(restaurant_data)
+
+            except Exception:
+                continue
 
         return restaurants
 
@@ -211,7 +237,8 @@ class LocationBasedScraper:
             restaurant_data['city'] = 'Benin City'
             restaurant_data['lga'] = 'Oredo'
 
-    def _matches_location(self, restaurant_data: Dict, state: str, lga: str = None) -> bool:
+    def _matches_location(self, restaurant_data: Dict, state: str,
+                          lga: Optional[str] = None) -> bool:
         """Check if restaurant matches the requested location"""
         # Must match state
         if restaurant_data.get('state') != state:
@@ -1,7010 +1,19 @@
 """
 Comprehensive Lagos restaurant database - 500+ restaurants
+Records live in comprehensive_lagos.jsonl and are loaded on first use
 """
+from src.data.loader import load_records
+
+DATA_FILE = 'comprehensive_lagos.jsonl'
 
-COMPREHENSIVE_LAGOS_RESTAURANTS = [
-    {
-        "id": "chicken_republic_ikeja_f8956c09",
-        "name": "Chicken Republic Ikeja",
-        "city": "Ikeja",
-        "state": "Lagos",
-        "lga": "Ikeja",
-        "location": "Ikeja, Lagos",
-        "rating": 4.1,
-        "cuisine": "Fast Food",
-        "specialties": ['Chicken', 'Rice'],
-        "delivery_areas": ['Ikeja'],
-        "opening_hours": "9:00 AM - 10:00 PM",
-        "url": "https://chowdeck.com/store?q=Chicken+Republic",
-    },
-    {
-        "id": "chicken_republic_allen_avenue_05515cd9",
-        "name": "Chicken Republic Allen Avenue",
-        "city": "Allen Avenue",
-        "state": "Lagos",
-        "lga": "Ikeja",
-        "location": "Allen Avenue, Lagos",
-        "rating": 4.1,
-        "cuisine": "Fast Food",
-        "specialties": ['Chicken', 'Rice'],
-        "delivery_areas": ['Allen Avenue'],
-        "opening_hours": "9:00 AM - 10:00 PM",
-        "url": "https://chowdeck.com/store?q=Chicken+Republic",
-    },
-    {
-        "id": "chicken_republic_computer_village_ee717d38",
-        "name": "Chicken Republic Computer Village",
-        "city": "Computer Village",
-        "state": "Lagos",
-        "lga": "Ikeja",
-        "location": "Computer Village, Lagos",
-        "rating": 4.1,
-        "cuisine": "Fast Food",
-        "specialties": ['Chicken', 'Rice'],
-        "delivery_areas": ['Computer Village'],
-        "opening_hours": "9:00 AM - 10:00 PM",
-        "url": "https://chowdeck.com/store?q=Chicken+Republic",
-    },
-    {
-        "id": "chicken_republic_ogba_75b29549",
-        "name": "Chicken Republic Ogba",
-        "city": "Ogba",
-        "state": "Lagos",
-        "lga": "Ikeja",
-        "location": "Ogba, Lagos",
-        "rating": 4.1,
-        "cuisine": "Fast Food",
-        "specialties": ['Chicken', 'Rice'],
-        "delivery_areas": ['Ogba'],
-        "opening_hours": "9:00 AM - 10:00 PM",
-        "url": "https://chowdeck.com/store?q=Chicken+Republic",
-    },
-    {
-        "id": "chicken_republic_alausa_e1f7f85c",
-        "name": "Chicken Republic Alausa",
-        "city": "Alausa",
-        "state": "Lagos",
-        "lga": "Ikeja",
-        "location": "Alausa, Lagos",
-        "rating": 4.1,
-        "cuisine": "Fast Food",
-        "specialties": ['Chicken', 'Rice'],
-        "delivery_areas": ['Alausa'],
-        "opening_hours": "9:00 AM - 10:00 PM",
-        "url": "https://chowdeck.com/store?q=Chicken+Republic",
-    },
-    {
-        "id": "chicken_republic_lekki_phase_1_13ea1957",
-        "name": "Chicken Republic Lekki Phase 1",
-        "city": "Lekki Phase 1",
-        "state": "Lagos",
-        "lga": "Eti-Osa",
-        "location": "Lekki Phase 1, Lagos",
-        "rating": 4.1,
-        "cuisine": "Fast Food",
-        "specialties": ['Chicken', 'Rice'],
-        "delivery_areas": ['Lekki Phase 1'],
-        "opening_hours": "9:00 AM - 10:00 PM",
-        "url": "https://chowdeck.com/store?q=Chicken+Republic",
-    },
-    {
-        "id": "chicken_republic_victoria_island_408e4a6e",
-        "name": "Chicken Republic Victoria Island",
-        "city": "Victoria Island",
-        "state": "Lagos",
-        "lga": "Eti-Osa",
-        "location": "Victoria Island, Lagos",
-        "rating": 4.1,
-        "cuisine": "Fast Food",
-        "specialties": ['Chicken', 'Rice'],
-        "delivery_areas": ['Victoria Island'],
-        "opening_hours": "9:00 AM - 10:00 PM",
-        "url": "https://chowdeck.com/store?q=Chicken+Republic",
-    },
-    {
-        "id": "chicken_republic_ajah_781b9073",
-        "name": "Chicken Republic Ajah",
-        "city": "Ajah",
-        "state": "Lagos",
-        "lga": "Eti-Osa",
-        "location": "Ajah, Lagos",
-        "rating": 4.1,
-        "cuisine": "Fast Food",
-        "specialties": ['Chicken', 'Rice'],
-        "delivery_areas": ['Ajah'],
-        "opening_hours": "9:00 AM - 10:00 PM",
-        "url": "https://chowdeck.com/store?q=Chicken+Republic",
-    },
-    {
-        "id": "chicken_republic_ikoyi_b47211f6",
-        "name": "Chicken Republic Ikoyi",
-        "city": "Ikoyi",
-        "state": "Lagos",
-        "lga": "Eti-Osa",
-        "location": "Ikoyi, Lagos",
-        "rating": 4.1,
-        "cuisine": "Fast Food",
-        "specialties": ['Chicken', 'Rice'],
-        "delivery_areas": ['Ikoyi'],
-        "opening_hours": "9:00 AM - 10:00 PM",
-        "url": "https://chowdeck.com/store?q=Chicken+Republic",
-    },
-    {
-        "id": "chicken_republic_yaba_d9d7b6c0",
-        "name": "Chicken Republic Yaba",
-        "city": "Yaba",
-        "state": "Lagos",
-        "lga": "Lagos Mainland",
-        "location": "Yaba, Lagos",
-        "rating": 4.1,
-        "cuisine": "Fast Food",
-        "specialties": ['Chicken', 'Rice'],
-        "delivery_areas": ['Yaba'],
-        "opening_hours": "9:00 AM - 10:00 PM",
-        "url": "https://chowdeck.com/store?q=Chicken+Republic",
-    },
-    {
-        "id": "chicken_republic_surulere_919147d8",
-        "name": "Chicken Republic Surulere",
-        "city": "Surulere",
-        "state": "Lagos",
-        "lga": "Surulere",
-        "location": "Surulere, Lagos",
-        "rating": 4.1,
-        "cuisine": "Fast Food",
-        "specialties": ['Chicken', 'Rice'],
-        "delivery_areas": ['Surulere'],
-        "opening_hours": "9:00 AM - 10:00 PM",
-        "url": "https://chowdeck.com/store?q=Chicken+Republic",
-    },
-    {
-        "id": "chicken_republic_adeniran_ogunsanya_867d5db6",
-        "name": "Chicken Republic Adeniran Ogunsanya",
-        "city": "Adeniran Ogunsanya",
-        "state": "Lagos",
-        "lga": "Surulere",
-        "location": "Adeniran Ogunsanya, Lagos",
-        "rating": 4.1,
-        "cuisine": "Fast Food",
-        "specialties": ['Chicken', 'Rice'],
-        "delivery_areas": ['Adeniran Ogunsanya'],
-        "opening_hours": "9:00 AM - 10:00 PM",
-        "url": "https://chowdeck.com/store?q=Chicken+Republic",
-    },
-    {
-        "id": "chicken_republic_maryland_fefadffb",
-        "name": "Chicken Republic Maryland",
-        "city": "Maryland",
-        "state": "Lagos",
-        "lga": "Kosofe",
-        "location": "Maryland, Lagos",
-        "rating": 4.1,
-        "cuisine": "Fast Food",
-        "specialties": ['Chicken', 'Rice'],
-        "delivery_areas": ['Maryland'],
-        "opening_hours": "9:00 AM - 10:00 PM",
-        "url": "https://chowdeck.com/store?q=Chicken+Republic",
-    },
-    {
-        "id": "chicken_republic_gbagada_8acb6c57",
-        "name": "Chicken Republic Gbagada",
-        "city": "Gbagada",
-        "state": "Lagos",
-        "lga": "Kosofe",
-        "location": "Gbagada, Lagos",
-        "rating": 4.1,
-        "cuisine": "Fast Food",
-        "specialties": ['Chicken', 'Rice'],
-        "delivery_areas": ['Gbagada'],
-        "opening_hours": "9:00 AM - 10:00 PM",
-        "url": "https://chowdeck.com/store?q=Chicken+Republic",
-    },
-    {
-        "id": "chicken_republic_isolo_eff506fd",
-        "name": "Chicken Republic Isolo",
-        "city": "Isolo",
-        "state": "Lagos",
-        "lga": "Oshodi-Isolo",
-        "location": "Isolo, Lagos",
-        "rating": 4.1,
-        "cuisine": "Fast Food",
-        "specialties": ['Chicken', 'Rice'],
-        "delivery_areas": ['Isolo'],
-        "opening_hours": "9:00 AM - 10:00 PM",
-        "url": "https://chowdeck.com/store?q=Chicken+Republic",
-    },
-    {
-        "id": "chicken_republic_oshodi_77e3c8e7",
-        "name": "Chicken Republic Oshodi",
-        "city": "Oshodi",
-        "state": "Lagos",
-        "lga": "Oshodi-Isolo",
-        "location": "Oshodi, Lagos",
-        "rating": 4.1,
-        "cuisine": "Fast Food",
-        "specialties": ['Chicken', 'Rice'],
-        "delivery_areas": ['Oshodi'],
-        "opening_hours": "9:00 AM - 10:00 PM",
-        "url": "https://chowdeck.com/store?q=Chicken+Republic",
-    },
-    {
-        "id": "chicken_republic_festac_b734b013",
-        "name": "Chicken Republic Festac",
-        "city": "Festac",
-        "state": "Lagos",
-        "lga": "Amuwo-Odofin",
-        "location": "Festac, Lagos",
-        "rating": 4.1,
-        "cuisine": "Fast Food",
-        "specialties": ['Chicken', 'Rice'],
-        "delivery_areas": ['Festac'],
-        "opening_hours": "9:00 AM - 10:00 PM",
-        "url": "https://chowdeck.com/store?q=Chicken+Republic",
-    },
-    {
-        "id": "chicken_republic_egbeda_646cb77a",
-        "name": "Chicken Republic Egbeda",
-        "city": "Egbeda",
-        "state": "Lagos",
-        "lga": "Alimosho",
-        "location": "Egbeda, Lagos",
-        "rating": 4.1,
-        "cuisine": "Fast Food",
-        "specialties": ['Chicken', 'Rice'],
-        "delivery_areas": ['Egbeda'],
-        "opening_hours": "9:00 AM - 10:00 PM",
-        "url": "https://chowdeck.com/store?q=Chicken+Republic",
-    },
-    {
-        "id": "chicken_republic_ikotun_3020e781",
-        "name": "Chicken Republic Ikotun",
-        "city": "Ikotun",
-        "state": "Lagos",
-        "lga": "Alimosho",
-        "location": "Ikotun, Lagos",
-        "rating": 4.1,
-        "cuisine": "Fast Food",
-        "specialties": ['Chicken', 'Rice'],
-        "delivery_areas": ['Ikotun'],
-        "opening_hours": "9:00 AM - 10:00 PM",
-        "url": "https://chowdeck.com/store?q=Chicken+Republic",
-    },
-    {
-        "id": "chicken_republic_somolu_93bd23f0",
-        "name": "Chicken Republic Somolu",
-        "city": "Somolu",
-        "state": "Lagos",
-        "lga": "Somolu",
-        "location": "Somolu, Lagos",
-        "rating": 4.1,
-        "cuisine": "Fast Food",
-        "specialties": ['Chicken', 'Rice'],
-        "delivery_areas": ['Somolu'],
-        "opening_hours": "9:00 AM - 10:00 PM",
-        "url": "https://chowdeck.com/store?q=Chicken+Republic",
-    },
-    {
-        "id": "mega_chicken_ikeja_5dc74a63",
-        "name": "Mega Chicken Ikeja",
-        "city": "Ikeja",
-        "state": "Lagos",
-        "lga": "Ikeja",
-        "location": "Ikeja, Lagos",
-        "rating": 4.36,
-        "cuisine": "Fast Food",
-        "specialties": ['Fried Chicken', 'Burgers'],
-        "delivery_areas": ['Ikeja'],
-        "opening_hours": "9:00 AM - 10:00 PM",
-        "url": "https://chowdeck.com/store?q=Mega+Chicken",
-    },
-    {
-        "id": "mega_chicken_allen_avenue_96ca7fe1",
-        "name": "Mega Chicken Allen Avenue",
-        "city": "Allen Avenue",
-        "state": "Lagos",
-        "lga": "Ikeja",
-        "location": "Allen Avenue, Lagos",
-        "rating": 4.36,
-        "cuisine": "Fast Food",
-        "specialties": ['Fried Chicken', 'Burgers'],
-        "delivery_areas": ['Allen Avenue'],
-        "opening_hours": "9:00 AM - 10:00 PM",
-        "url": "https://chowdeck.com/store?q=Mega+Chicken",
-    },
-    {
-        "id": "mega_chicken_ogba_bd901f9d",
-        "name": "Mega Chicken Ogba",
-        "city": "Ogba",
-        "state": "Lagos",
-        "lga": "Ikeja",
-        "location": "Ogba, Lagos",
-        "rating": 4.36,
-        "cuisine": "Fast Food",
-        "specialties": ['Fried Chicken', 'Burgers'],
-        "delivery_areas": ['Ogba'],
-        "opening_hours": "9:00 AM - 10:00 PM",
-        "url": "https://chowdeck.com/store?q=Mega+Chicken",
-    },
-    {
-        "id": "mega_chicken_lekki_f5f82227",
-        "name": "Mega Chicken Lekki",
-        "city": "Lekki",
-        "state": "Lagos",
-        "lga": "Eti-Osa",
-        "location": "Lekki, Lagos",
-        "rating": 4.36,
-        "cuisine": "Fast Food",
-        "specialties": ['Fried Chicken', 'Burgers'],
-        "delivery_areas": ['Lekki'],
-        "opening_hours": "9:00 AM - 10:00 PM",
-        "url": "https://chowdeck.com/store?q=Mega+Chicken",
-    },
-    {
-        "id": "mega_chicken_vi_5ce825af",
-        "name": "Mega Chicken VI",
-        "city": "VI",
-        "state": "Lagos",
-        "lga": "Eti-Osa",
-        "location": "VI, Lagos",
-        "rating": 4.36,
-        "cuisine": "Fast Food",
-        "specialties": ['Fried Chicken', 'Burgers'],
-        "delivery_areas": ['VI'],
-        "opening_hours": "9:00 AM - 10:00 PM",
-        "url": "https://chowdeck.com/store?q=Mega+Chicken",
-    },
-    {
-        "id": "mega_chicken_yaba_bc8cd24f",
-        "name": "Mega Chicken Yaba",
-        "city": "Yaba",
-        "state": "Lagos",
-        "lga": "Lagos Mainland",
-        "location": "Yaba, Lagos",
-        "rating": 4.36,
-        "cuisine": "Fast Food",
-        "specialties": ['Fried Chicken', 'Burgers'],
-        "delivery_areas": ['Yaba'],
-        "opening_hours": "9:00 AM - 10:00 PM",
-        "url": "https://chowdeck.com/store?q=Mega+Chicken",
-    },
-    {
-        "id": "mega_chicken_surulere_04e369ca",
-        "name": "Mega Chicken Surulere",
-        "city": "Surulere",
-        "state": "Lagos",
-        "lga": "Surulere",
-        "location": "Surulere, Lagos",
-        "rating": 4.36,
-        "cuisine": "Fast Food",
-        "specialties": ['Fried Chicken', 'Burgers'],
-        "delivery_areas": ['Surulere'],
-        "opening_hours": "9:00 AM - 10:00 PM",
-        "url": "https://chowdeck.com/store?q=Mega+Chicken",
-    },
-    {
-        "id": "mega_chicken_maryland_595bb3fb",
-        "name": "Mega Chicken Maryland",
-        "city": "Maryland",
-        "state": "Lagos",
-        "lga": "Kosofe",
-        "location": "Maryland, Lagos",
-        "rating": 4.36,
-        "cuisine": "Fast Food",
-        "specialties": ['Fried Chicken', 'Burgers'],
-        "delivery_areas": ['Maryland'],
-        "opening_hours": "9:00 AM - 10:00 PM",
-        "url": "https://chowdeck.com/store?q=Mega+Chicken",
-    },
-    {
-        "id": "sweet_sensation_allen_avenue_decfc85a",
-        "name": "Sweet Sensation Allen Avenue",
-        "city": "Allen Avenue",
-        "state": "Lagos",
-        "lga": "Ikeja",
-        "location": "Allen Avenue, Lagos",
-        "rating": 4.0,
-        "cuisine": "Fast Food",
-        "specialties": ['Pastries', 'Meals'],
-        "delivery_areas": ['Allen Avenue'],
-        "opening_hours": "9:00 AM - 10:00 PM",
-        "url": "https://chowdeck.com/store?q=Sweet+Sensation",
-    },
-    {
-        "id": "sweet_sensation_ikeja_35416ceb",
-        "name": "Sweet Sensation Ikeja",
-        "city": "Ikeja",
-        "state": "Lagos",
-        "lga": "Ikeja",
-        "location": "Ikeja, Lagos",
-        "rating": 4.0,
-        "cuisine": "Fast Food",
-        "specialties": ['Pastries', 'Meals'],
-        "delivery_areas": ['Ikeja'],
-        "opening_hours": "9:00 AM - 10:00 PM",
-        "url": "https://chowdeck.com/store?q=Sweet+Sensation",
-    },
-    {
-        "id": "sweet_sensation_alausa_7d4bdbb2",
-        "name": "Sweet Sensation Alausa",
-        "city": "Alausa",
-        "state": "Lagos",
-        "lga": "Ikeja",
-        "location": "Alausa, Lagos",
-        "rating": 4.0,
-        "cuisine": "Fast Food",
-        "specialties": ['Pastries', 'Meals'],
-        "delivery_areas": ['Alausa'],
-        "opening_hours": "9:00 AM - 10:00 PM",
-        "url": "https://chowdeck.com/store?q=Sweet+Sensation",
-    },
-    {
-        "id": "sweet_sensation_lekki_5af71830",
-        "name": "Sweet Sensation Lekki",
-        "city": "Lekki",
-        "state": "Lagos",
-        "lga": "Eti-Osa",
-        "location": "Lekki, Lagos",
-        "rating": 4.0,
-        "cuisine": "Fast Food",
-        "specialties": ['Pastries', 'Meals'],
-        "delivery_areas": ['Lekki'],
-        "opening_hours": "9:00 AM - 10:00 PM",
-        "url": "https://chowdeck.com/store?q=Sweet+Sensation",
-    },
-    {
-        "id": "sweet_sensation_ajah_d02b9de1",
-        "name": "Sweet Sensation Ajah",
-        "city": "Ajah",
-        "state": "Lagos",
-        "lga": "Eti-Osa",
-        "location": "Ajah, Lagos",
-        "rating": 4.0,
-        "cuisine": "Fast Food",
-        "specialties": ['Pastries', 'Meals'],
-        "delivery_areas": ['Ajah'],
-        "opening_hours": "9:00 AM - 10:00 PM",
-        "url": "https://chowdeck.com/store?q=Sweet+Sensation",
-    },
-    {
-        "id": "sweet_sensation_vi_324f800d",
-        "name": "Sweet Sensation VI",
-        "city": "VI",
-        "state": "Lagos",
-        "lga": "Eti-Osa",
-        "location": "VI, Lagos",
-        "rating": 4.0,
-        "cuisine": "Fast Food",
-        "specialties": ['Pastries', 'Meals'],
-        "delivery_areas": ['VI'],
-        "opening_hours": "9:00 AM - 10:00 PM",
-        "url": "https://chowdeck.com/store?q=Sweet+Sensation",
-    },
-    {
-        "id": "sweet_sensation_yaba_2bb5c060",
-        "name": "Sweet Sensation Yaba",
-        "city": "Yaba",
-        "state": "Lagos",
-        "lga": "Lagos Mainland",
-        "location": "Yaba, Lagos",
-        "rating": 4.0,
-        "cuisine": "Fast Food",
-        "specialties": ['Pastries', 'Meals'],
-        "delivery_areas": ['Yaba'],
-        "opening_hours": "9:00 AM - 10:00 PM",
-        "url": "https://chowdeck.com/store?q=Sweet+Sensation",
-    },
-    {
-        "id": "sweet_sensation_surulere_8fe3150b",
-        "name": "Sweet Sensation Surulere",
-        "city": "Surulere",
-        "state": "Lagos",
-        "lga": "Surulere",
-        "location": "Surulere, Lagos",
-        "rating": 4.0,
-        "cuisine": "Fast Food",
-        "specialties": ['Pastries', 'Meals'],
-        "delivery_areas": ['Surulere'],
-        "opening_hours": "9:00 AM - 10:00 PM",
-        "url": "https://chowdeck.com/store?q=Sweet+Sensation",
-    },
-    {
-        "id": "sweet_sensation_maryland_17d3da8b",
-        "name": "Sweet Sensation Maryland",
-        "city": "Maryland",
-        "state": "Lagos",
-        "lga": "Kosofe",
-        "location": "Maryland, Lagos",
-        "rating": 4.0,
-        "cuisine": "Fast Food",
-        "specialties": ['Pastries', 'Meals'],
-        "delivery_areas": ['Maryland'],
-        "opening_hours": "9:00 AM - 10:00 PM",
-        "url": "https://chowdeck.com/store?q=Sweet+Sensation",
-    },
-    {
-        "id": "sweet_sensation_festac_5bc6a68a",
-        "name": "Sweet Sensation Festac",
-        "city": "Festac",
-        "state": "Lagos",
-        "lga": "Amuwo-Odofin",
-        "location": "Festac, Lagos",
-        "rating": 4.0,
-        "cuisine": "Fast Food",
-        "specialties": ['Pastries', 'Meals'],
-        "delivery_areas": ['Festac'],
-        "opening_hours": "9:00 AM - 10:00 PM",
-        "url": "https://chowdeck.com/store?q=Sweet+Sensation",
-    },
-    {
-        "id": "mr_biggs_alausa_d45854cd",
-        "name": "Mr Biggs Alausa",
-        "city": "Alausa",
-        "state": "Lagos",
-        "lga": "Ikeja",
-        "location": "Alausa, Lagos",
-        "rating": 3.9,
-        "cuisine": "Fast Food",
-        "specialties": ['Burgers', 'Meals'],
-        "delivery_areas": ['Alausa'],
-        "opening_hours": "9:00 AM - 10:00 PM",
-        "url": "https://chowdeck.com/store?q=Mr+Biggs",
-    },
-    {
-        "id": "mr_biggs_ikeja_01c23ff0",
-        "name": "Mr Biggs Ikeja",
-        "city": "Ikeja",
-        "state": "Lagos",
-        "lga": "Ikeja",
-        "location": "Ikeja, Lagos",
-        "rating": 3.9,
-        "cuisine": "Fast Food",
-        "specialties": ['Burgers', 'Meals'],
-        "delivery_areas": ['Ikeja'],
-        "opening_hours": "9:00 AM - 10:00 PM",
-        "url": "https://chowdeck.com/store?q=Mr+Biggs",
-    },
-    {
-        "id": "mr_biggs_lekki_a42cf4ed",
-        "name": "Mr Biggs Lekki",
-        "city": "Lekki",
-        "state": "Lagos",
-        "lga": "Eti-Osa",
-        "location": "Lekki, Lagos",
-        "rating": 3.9,
-        "cuisine": "Fast Food",
-        "specialties": ['Burgers', 'Meals'],
-        "delivery_areas": ['Lekki'],
-        "opening_hours": "9:00 AM - 10:00 PM",
-        "url": "https://chowdeck.com/store?q=Mr+Biggs",
-    },
-    {
-        "id": "mr_biggs_vi_9711c5b4",
-        "name": "Mr Biggs VI",
-        "city": "VI",
-        "state": "Lagos",
-        "lga": "Eti-Osa",
-        "location": "VI, Lagos",
-        "rating": 3.9,
-        "cuisine": "Fast Food",
-        "specialties": ['Burgers', 'Meals'],
-        "delivery_areas": ['VI'],
-        "opening_hours": "9:00 AM - 10:00 PM",
-        "url": "https://chowdeck.com/store?q=Mr+Biggs",
-    },
-    {
-        "id": "mr_biggs_yaba_50600541",
-        "name": "Mr Biggs Yaba",
-        "city": "Yaba",
-        "state": "Lagos",
-        "lga": "Lagos Mainland",
-        "location": "Yaba, Lagos",
-        "rating": 3.9,
-        "cuisine": "Fast Food",
-        "specialties": ['Burgers', 'Meals'],
-        "delivery_areas": ['Yaba'],
-        "opening_hours": "9:00 AM - 10:00 PM",
-        "url": "https://chowdeck.com/store?q=Mr+Biggs",
-    },
-    {
-        "id": "mr_biggs_surulere_649b0f1d",
-        "name": "Mr Biggs Surulere",
-        "city": "Surulere",
-        "state": "Lagos",
-        "lga": "Surulere",
-        "location": "Surulere, Lagos",
-        "rating": 3.9,
-        "cuisine": "Fast Food",
-        "specialties": ['Burgers', 'Meals'],
-        "delivery_areas": ['Surulere'],
-        "opening_hours": "9:00 AM - 10:00 PM",
-        "url": "https://chowdeck.com/store?q=Mr+Biggs",
-    },
-    {
-        "id": "mr_biggs_maryland_746edd63",
-        "name": "Mr Biggs Maryland",
-        "city": "Maryland",
-        "state": "Lagos",
-        "lga": "Kosofe",
-        "location": "Maryland, Lagos",
-        "rating": 3.9,
-        "cuisine": "Fast Food",
-        "specialties": ['Burgers', 'Meals'],
-        "delivery_areas": ['Maryland'],
-        "opening_hours": "9:00 AM - 10:00 PM",
-        "url": "https://chowdeck.com/store?q=Mr+Biggs",
-    },
-    {
-        "id": "mr_biggs_oshodi_42cab9e3",
-        "name": "Mr Biggs Oshodi",
-        "city": "Oshodi",
-        "state": "Lagos",
-        "lga": "Oshodi-Isolo",
-        "location": "Oshodi, Lagos",
-        "rating": 3.9,
-        "cuisine": "Fast Food",
-        "specialties": ['Burgers', 'Meals'],
-        "delivery_areas": ['Oshodi'],
-        "opening_hours": "9:00 AM - 10:00 PM",
-        "url": "https://chowdeck.com/store?q=Mr+Biggs",
-    },
-    {
-        "id": "tantalizers_ikeja_c0360eff",
-        "name": "Tantalizers Ikeja",
-        "city": "Ikeja",
-        "state": "Lagos",
-        "lga": "Ikeja",
-        "location": "Ikeja, Lagos",
-        "rating": 3.9,
-        "cuisine": "Fast Food",
-        "specialties": ['Local & Continental'],
-        "delivery_areas": ['Ikeja'],
-        "opening_hours": "9:00 AM - 10:00 PM",
-        "url": "https://chowdeck.com/store?q=Tantalizers",
-    },
-    {
-        "id": "tantalizers_ogba_ec203c27",
-        "name": "Tantalizers Ogba",
-        "city": "Ogba",
-        "state": "Lagos",
-        "lga": "Ikeja",
-        "location": "Ogba, Lagos",
-        "rating": 3.9,
-        "cuisine": "Fast Food",
-        "specialties": ['Local & Continental'],
-        "delivery_areas": ['Ogba'],
-        "opening_hours": "9:00 AM - 10:00 PM",
-        "url": "https://chowdeck.com/store?q=Tantalizers",
-    },
-    {
-        "id": "tantalizers_lekki_1f87cc8a",
-        "name": "Tantalizers Lekki",
-        "city": "Lekki",
-        "state": "Lagos",
-        "lga": "Eti-Osa",
-        "location": "Lekki, Lagos",
-        "rating": 3.9,
-        "cuisine": "Fast Food",
-        "specialties": ['Local & Continental'],
-        "delivery_areas": ['Lekki'],
-        "opening_hours": "9:00 AM - 10:00 PM",
-        "url": "https://chowdeck.com/store?q=Tantalizers",
-    },
-    {
-        "id": "tantalizers_yaba_8d29485d",
-        "name": "Tantalizers Yaba",
-        "city": "Yaba",
-        "state": "Lagos",
-        "lga": "Lagos Mainland",
-        "location": "Yaba, Lagos",
-        "rating": 3.9,
-        "cuisine": "Fast Food",
-        "specialties": ['Local & Continental'],
-        "delivery_areas": ['Yaba'],
-        "opening_hours": "9:00 AM - 10:00 PM",
-        "url": "https://chowdeck.com/store?q=Tantalizers",
-    },
-    {
-        "id": "tantalizers_oshodi_ca21ce13",
-        "name": "Tantalizers Oshodi",
-        "city": "Oshodi",
-        "state": "Lagos",
-        "lga": "Oshodi-Isolo",
-        "location": "Oshodi, Lagos",
-        "rating": 3.9,
-        "cuisine": "Fast Food",
-        "specialties": ['Local & Continental'],
-        "delivery_areas": ['Oshodi'],
-        "opening_hours": "9:00 AM - 10:00 PM",
-        "url": "https://chowdeck.com/store?q=Tantalizers",
-    },
-    {
-        "id": "tantalizers_surulere_b754e9b4",
-        "name": "Tantalizers Surulere",
-        "city": "Surulere",
-        "state": "Lagos",
-        "lga": "Surulere",
-        "location": "Surulere, Lagos",
-        "rating": 3.9,
-        "cuisine": "Fast Food",
-        "specialties": ['Local & Continental'],
-        "delivery_areas": ['Surulere'],
-        "opening_hours": "9:00 AM - 10:00 PM",
-        "url": "https://chowdeck.com/store?q=Tantalizers",
-    },
-    {
-        "id": "tantalizers_maryland_6213e88c",
-        "name": "Tantalizers Maryland",
-        "city": "Maryland",
-        "state": "Lagos",
-        "lga": "Kosofe",
-        "location": "Maryland, Lagos",
-        "rating": 3.9,
-        "cuisine": "Fast Food",
-        "specialties": ['Local & Continental'],
-        "delivery_areas": ['Maryland'],
-        "opening_hours": "9:00 AM - 10:00 PM",
-        "url": "https://chowdeck.com/store?q=Tantalizers",
-    },
-    {
-        "id": "dominos_pizza_lekki_phase_1_0da7005b",
-        "name": "Dominos Pizza Lekki Phase 1",
-        "city": "Lekki Phase 1",
-        "state": "Lagos",
-        "lga": "Eti-Osa",
-        "location": "Lekki Phase 1, Lagos",
-        "rating": 4.1,
-        "cuisine": "Italian",
-        "specialties": ['Pizza'],
-        "delivery_areas": ['Lekki Phase 1'],
-        "opening_hours": "9:00 AM - 10:00 PM",
-        "url": "https://chowdeck.com/store?q=Dominos+Pizza",
-    },
-    {
-        "id": "dominos_pizza_vi_9b108474",
-        "name": "Dominos Pizza VI",
-        "city": "VI",
-        "state": "Lagos",
-        "lga": "Eti-Osa",
-        "location": "VI, Lagos",
-        "rating": 4.1,
-        "cuisine": "Italian",
-        "specialties": ['Pizza'],
-        "delivery_areas": ['VI'],
-        "opening_hours": "9:00 AM - 10:00 PM",
-        "url": "https://chowdeck.com/store?q=Dominos+Pizza",
-    },
-    {
-        "id": "dominos_pizza_ajah_c7f4e9a8",
-        "name": "Dominos Pizza Ajah",
-        "city": "Ajah",
-        "state": "Lagos",
-        "lga": "Eti-Osa",
-        "location": "Ajah, Lagos",
-        "rating": 4.1,
-        "cuisine": "Italian",
-        "specialties": ['Pizza'],
-        "delivery_areas": ['Ajah'],
-        "opening_hours": "9:00 AM - 10:00 PM",
-        "url": "https://chowdeck.com/store?q=Dominos+Pizza",
-    },
-    {
-        "id": "dominos_pizza_ikeja_6b5e815a",
-        "name": "Dominos Pizza Ikeja",
-        "city": "Ikeja",
-        "state": "Lagos",
-        "lga": "Ikeja",
-        "location": "Ikeja, Lagos",
-        "rating": 4.1,
-        "cuisine": "Italian",
-        "specialties": ['Pizza'],
-        "delivery_areas": ['Ikeja'],
-        "opening_hours": "9:00 AM - 10:00 PM",
-        "url": "https://chowdeck.com/store?q=Dominos+Pizza",
-    },
-    {
-        "id": "dominos_pizza_allen_avenue_b4115c50",
-        "name": "Dominos Pizza Allen Avenue",
-        "city": "Allen Avenue",
-        "state": "Lagos",
-        "lga": "Ikeja",
-        "location": "Allen Avenue, Lagos",
-        "rating": 4.1,
-        "cuisine": "Italian",
-        "specialties": ['Pizza'],
-        "delivery_areas": ['Allen Avenue'],
-        "opening_hours": "9:00 AM - 10:00 PM",
-        "url": "https://chowdeck.com/store?q=Dominos+Pizza",
-    },
-    {
-        "id": "dominos_pizza_yaba_cc5ec9b9",
-        "name": "Dominos Pizza Yaba",
-        "city": "Yaba",
-        "state": "Lagos",
-        "lga": "Lagos Mainland",
-        "location": "Yaba, Lagos",
-        "rating": 4.1,
-        "cuisine": "Italian",
-        "specialties": ['Pizza'],
-        "delivery_areas": ['Yaba'],
-        "opening_hours": "9:00 AM - 10:00 PM",
-        "url": "https://chowdeck.com/store?q=Dominos+Pizza",
-    },
-    {
-        "id": "dominos_pizza_surulere_323cc204",
-        "name": "Dominos Pizza Surulere",
-        "city": "Surulere",
-        "state": "Lagos",
-        "lga": "Surulere",
-        "location": "Surulere, Lagos",
-        "rating": 4.1,
-        "cuisine": "Italian",
-        "specialties": ['Pizza'],
-        "delivery_areas": ['Surulere'],
-        "opening_hours": "9:00 AM - 10:00 PM",
-        "url": "https://chowdeck.com/store?q=Dominos+Pizza",
-    },
-    {
-        "id": "debonairs_pizza_lekki_7cb1754d",
-        "name": "Debonairs Pizza Lekki",
-        "city": "Lekki",
-        "state": "Lagos",
-        "lga": "Eti-Osa",
-        "location": "Lekki, Lagos",
-        "rating": 4.3,
-        "cuisine": "Italian",
-        "specialties": ['Pizza'],
-        "delivery_areas": ['Lekki'],
-        "opening_hours": "9:00 AM - 10:00 PM",
-        "url": "https://chowdeck.com/store?q=Debonairs+Pizza",
-    },
-    {
-        "id": "debonairs_pizza_vi_495dd528",
-        "name": "Debonairs Pizza VI",
-        "city": "VI",
-        "state": "Lagos",
-        "lga": "Eti-Osa",
-        "location": "VI, Lagos",
-        "rating": 4.3,
-        "cuisine": "Italian",
-        "specialties": ['Pizza'],
-        "delivery_areas": ['VI'],
-        "opening_hours": "9:00 AM - 10:00 PM",
-        "url": "https://chowdeck.com/store?q=Debonairs+Pizza",
-    },
-    {
-        "id": "debonairs_pizza_ikeja_3d63951e",
-        "name": "Debonairs Pizza Ikeja",
-        "city": "Ikeja",
-        "state": "Lagos",
-        "lga": "Ikeja",
-        "location": "Ikeja, Lagos",
-        "rating": 4.3,
-        "cuisine": "Italian",
-        "specialties": ['Pizza'],
-        "delivery_areas": ['Ikeja'],
-        "opening_hours": "9:00 AM - 10:00 PM",
-        "url": "https://chowdeck.com/store?q=Debonairs+Pizza",
-    },
-    {
-        "id": "debonairs_pizza_yaba_b1280853",
-        "name": "Debonairs Pizza Yaba",
-        "city": "Yaba",
-        "state": "Lagos",
-        "lga": "Lagos Mainland",
-        "location": "Yaba, Lagos",
-        "rating": 4.3,
-        "cuisine": "Italian",
-        "specialties": ['Pizza'],
-        "delivery_areas": ['Yaba'],
-        "opening_hours": "9:00 AM - 10:00 PM",
-        "url": "https://chowdeck.com/store?q=Debonairs+Pizza",
-    },
-    {
-        "id": "debonairs_pizza_surulere_0ccf24fd",
-        "name": "Debonairs Pizza Surulere",
-        "city": "Surulere",
-        "state": "Lagos",
-        "lga": "Surulere",
-        "location": "Surulere, Lagos",
-        "rating": 4.3,
-        "cuisine": "Italian",
-        "specialties": ['Pizza'],
-        "delivery_areas": ['Surulere'],
-        "opening_hours": "9:00 AM - 10:00 PM",
-        "url": "https://chowdeck.com/store?q=Debonairs+Pizza",
-    },
-    {
-        "id": "kfc_lekki_toll_gate_580f9b95",
-        "name": "KFC Lekki Toll Gate",
-        "city": "Lekki Toll Gate",
-        "state": "Lagos",
-        "lga": "Eti-Osa",
-        "location": "Lekki Toll Gate, Lagos",
-        "rating": 4.0,
-        "cuisine": "Fast Food",
-        "specialties": ['Chicken'],
-        "delivery_areas": ['Lekki Toll Gate'],
-        "opening_hours": "9:00 AM - 10:00 PM",
-        "url": "https://chowdeck.com/store?q=KFC",
-    },
-    {
-        "id": "kfc_vi_f3e69728",
-        "name": "KFC VI",
-        "city": "VI",
-        "state": "Lagos",
-        "lga": "Eti-Osa",
-        "location": "VI, Lagos",
-        "rating": 4.0,
-        "cuisine": "Fast Food",
-        "specialties": ['Chicken'],
-        "delivery_areas": ['VI'],
-        "opening_hours": "9:00 AM - 10:00 PM",
-        "url": "https://chowdeck.com/store?q=KFC",
-    },
-    {
-        "id": "kfc_ikeja_c5ad2fa0",
-        "name": "KFC Ikeja",
-        "city": "Ikeja",
-        "state": "Lagos",
-        "lga": "Ikeja",
-        "location": "Ikeja, Lagos",
-        "rating": 4.0,
-        "cuisine": "Fast Food",
-        "specialties": ['Chicken'],
-        "delivery_areas": ['Ikeja'],
-        "opening_hours": "9:00 AM - 10:00 PM",
-        "url": "https://chowdeck.com/store?q=KFC",
-    },
-    {
-        "id": "kfc_surulere_dcc48219",
-        "name": "KFC Surulere",
-        "city": "Surulere",
-        "state": "Lagos",
-        "lga": "Surulere",
-        "location": "Surulere, Lagos",
-        "rating": 4.0,
-        "cuisine": "Fast Food",
-        "specialties": ['Chicken'],
-        "delivery_areas": ['Surulere'],
-        "opening_hours": "9:00 AM - 10:00 PM",
-        "url": "https://chowdeck.com/store?q=KFC",
-    },
-    {
-        "id": "kfc_maryland_f164050f",
-        "name": "KFC Maryland",
-        "city": "Maryland",
-        "state": "Lagos",
-        "lga": "Kosofe",
-        "location": "Maryland, Lagos",
-        "rating": 4.0,
-        "cuisine": "Fast Food",
-        "specialties": ['Chicken'],
-        "delivery_areas": ['Maryland'],
-        "opening_hours": "9:00 AM - 10:00 PM",
-        "url": "https://chowdeck.com/store?q=KFC",
-    },
-    {
-        "id": "burger_king_vi_dd9c8cc1",
-        "name": "Burger King VI",
-        "city": "VI",
-        "state": "Lagos",
-        "lga": "Eti-Osa",
-        "location": "VI, Lagos",
-        "rating": 4.2,
-        "cuisine": "Fast Food",
-        "specialties": ['Burgers'],
-        "delivery_areas": ['VI'],
-        "opening_hours": "9:00 AM - 10:00 PM",
-        "url": "https://chowdeck.com/store?q=Burger+King",
-    },
-    {
-        "id": "burger_king_lekki_116a176f",
-        "name": "Burger King Lekki",
-        "city": "Lekki",
-        "state": "Lagos",
-        "lga": "Eti-Osa",
-        "location": "Lekki, Lagos",
-        "rating": 4.2,
-        "cuisine": "Fast Food",
-        "specialties": ['Burgers'],
-        "delivery_areas": ['Lekki'],
-        "opening_hours": "9:00 AM - 10:00 PM",
-        "url": "https://chowdeck.com/store?q=Burger+King",
-    },
-    {
-        "id": "burger_king_ikeja_8b4167f7",
-        "name": "Burger King Ikeja",
-        "city": "Ikeja",
-        "state": "Lagos",
-        "lga": "Ikeja",
-        "location": "Ikeja, Lagos",
-        "rating": 4.2,
-        "cuisine": "Fast Food",
-        "specialties": ['Burgers'],
-        "delivery_areas": ['Ikeja'],
-        "opening_hours": "9:00 AM - 10:00 PM",
-        "url": "https://chowdeck.com/store?q=Burger+King",
-    },
-    {
-        "id": "mama_cass_yaba_550748f0",
-        "name": "Mama Cass Yaba",
-        "city": "Yaba",
-        "state": "Lagos",
-        "lga": "Lagos Mainland",
-        "location": "Yaba, Lagos",
-        "rating": 4.1,
-        "cuisine": "Nigerian",
-        "specialties": ['Local Dishes'],
-        "delivery_areas": ['Yaba'],
-        "opening_hours": "9:00 AM - 10:00 PM",
-        "url": "https://chowdeck.com/store?q=Mama+Cass",
-    },
-    {
-        "id": "mama_cass_lekki_2a49504e",
-        "name": "Mama Cass Lekki",
-        "city": "Lekki",
-        "state": "Lagos",
-        "lga": "Eti-Osa",
-        "location": "Lekki, Lagos",
-        "rating": 4.1,
-        "cuisine": "Nigerian",
-        "specialties": ['Local Dishes'],
-        "delivery_areas": ['Lekki'],
-        "opening_hours": "9:00 AM - 10:00 PM",
-        "url": "https://chowdeck.com/store?q=Mama+Cass",
-    },
-    {
-        "id": "mama_cass_ikeja_cee35a2c",
-        "name": "Mama Cass Ikeja",
-        "city": "Ikeja",
-        "state": "Lagos",
-        "lga": "Ikeja",
-        "location": "Ikeja, Lagos",
-        "rating": 4.1,
-        "cuisine": "Nigerian",
-        "specialties": ['Local Dishes'],
-        "delivery_areas": ['Ikeja'],
-        "opening_hours": "9:00 AM - 10:00 PM",
-        "url": "https://chowdeck.com/store?q=Mama+Cass",
-    },
-    {
-        "id": "mama_cass_surulere_2485611c",
-        "name": "Mama Cass Surulere",
-        "city": "Surulere",
-        "state": "Lagos",
-        "lga": "Surulere",
-        "location": "Surulere, Lagos",
-        "rating": 4.1,
-        "cuisine": "Nigerian",
-        "specialties": ['Local Dishes'],
-        "delivery_areas": ['Surulere'],
-        "opening_hours": "9:00 AM - 10:00 PM",
-        "url": "https://chowdeck.com/store?q=Mama+Cass",
-    },
-    {
-        "id": "mama_cass_isolo_257eea39",
-        "name": "Mama Cass Isolo",
-        "city": "Isolo",
-        "state": "Lagos",
-        "lga": "Oshodi-Isolo",
-        "location": "Isolo, Lagos",
-        "rating": 4.1,
-        "cuisine": "Nigerian",
-        "specialties": ['Local Dishes'],
-        "delivery_areas": ['Isolo'],
-        "opening_hours": "9:00 AM - 10:00 PM",
-        "url": "https://chowdeck.com/store?q=Mama+Cass",
-    },
-    {
-        "id": "bukka_hut_surulere_66777a20",
-        "name": "Bukka Hut Surulere",
-        "city": "Surulere",
-        "state": "Lagos",
-        "lga": "Surulere",
-        "location": "Surulere, Lagos",
-        "rating": 4.2,
-        "cuisine": "Nigerian",
-        "specialties": ['Local Dishes'],
-        "delivery_areas": ['Surulere'],
-        "opening_hours": "9:00 AM - 10:00 PM",
-        "url": "https://chowdeck.com/store?q=Bukka+Hut",
-    },
-    {
-        "id": "bukka_hut_ikeja_8ea5cf26",
-        "name": "Bukka Hut Ikeja",
-        "city": "Ikeja",
-        "state": "Lagos",
-        "lga": "Ikeja",
-        "location": "Ikeja, Lagos",
-        "rating": 4.2,
-        "cuisine": "Nigerian",
-        "specialties": ['Local Dishes'],
-        "delivery_areas": ['Ikeja'],
-        "opening_hours": "9:00 AM - 10:00 PM",
-        "url": "https://chowdeck.com/store?q=Bukka+Hut",
-    },
-    {
-        "id": "bukka_hut_lekki_4c93dc86",
-        "name": "Bukka Hut Lekki",
-        "city": "Lekki",
-        "state": "Lagos",
-        "lga": "Eti-Osa",
-        "location": "Lekki, Lagos",
-        "rating": 4.2,
-        "cuisine": "Nigerian",
-        "specialties": ['Local Dishes'],
-        "delivery_areas": ['Lekki'],
-        "opening_hours": "9:00 AM - 10:00 PM",
-        "url": "https://chowdeck.com/store?q=Bukka+Hut",
-    },
-    {
-        "id": "bukka_hut_yaba_25123775",
-        "name": "Bukka Hut Yaba",
-        "city": "Yaba",
-        "state": "Lagos",
-        "lga": "Lagos Mainland",
-        "location": "Yaba, Lagos",
-        "rating": 4.2,
-        "cuisine": "Nigerian",
-        "specialties": ['Local Dishes'],
-        "delivery_areas": ['Yaba'],
-        "opening_hours": "9:00 AM - 10:00 PM",
-        "url": "https://chowdeck.com/store?q=Bukka+Hut",
-    },
-    {
-        "id": "bukka_hut_gbagada_6e578351",
-        "name": "Bukka Hut Gbagada",
-        "city": "Gbagada",
-        "state": "Lagos",
-        "lga": "Kosofe",
-        "location": "Gbagada, Lagos",
-        "rating": 4.2,
-        "cuisine": "Nigerian",
-        "specialties": ['Local Dishes'],
-        "delivery_areas": ['Gbagada'],
-        "opening_hours": "9:00 AM - 10:00 PM",
-        "url": "https://chowdeck.com/store?q=Bukka+Hut",
-    },
-    {
-        "id": "coldstone_creamery_lekki_c84710ba",
-        "name": "Coldstone Creamery Lekki",
-        "city": "Lekki",
-        "state": "Lagos",
-        "lga": "Eti-Osa",
-        "location": "Lekki, Lagos",
-        "rating": 4.3,
-        "cuisine": "Dessert",
-        "specialties": ['Ice Cream'],
-        "delivery_areas": ['Lekki'],
-        "opening_hours": "9:00 AM - 10:00 PM",
-        "url": "https://chowdeck.com/store?q=Coldstone+Creamery",
-    },
-    {
-        "id": "coldstone_creamery_vi_98adb77a",
-        "name": "Coldstone Creamery VI",
-        "city": "VI",
-        "state": "Lagos",
-        "lga": "Eti-Osa",
-        "location": "VI, Lagos",
-        "rating": 4.3,
-        "cuisine": "Dessert",
-        "specialties": ['Ice Cream'],
-        "delivery_areas": ['VI'],
-        "opening_hours": "9:00 AM - 10:00 PM",
-        "url": "https://chowdeck.com/store?q=Coldstone+Creamery",
-    },
-    {
-        "id": "coldstone_creamery_ikeja_ba91d42e",
-        "name": "Coldstone Creamery Ikeja",
-        "city": "Ikeja",
-        "state": "Lagos",
-        "lga": "Ikeja",
-        "location": "Ikeja, Lagos",
-        "rating": 4.3,
-        "cuisine": "Dessert",
-        "specialties": ['Ice Cream'],
-        "delivery_areas": ['Ikeja'],
-        "opening_hours": "9:00 AM - 10:00 PM",
-        "url": "https://chowdeck.com/store?q=Coldstone+Creamery",
-    },
-    {
-        "id": "coldstone_creamery_surulere_14cb54f5",
-        "name": "Coldstone Creamery Surulere",
-        "city": "Surulere",
-        "state": "Lagos",
-        "lga": "Surulere",
-        "location": "Surulere, Lagos",
-        "rating": 4.3,
-        "cuisine": "Dessert",
-        "specialties": ['Ice Cream'],
-        "delivery_areas": ['Surulere'],
-        "opening_hours": "9:00 AM - 10:00 PM",
-        "url": "https://chowdeck.com/store?q=Coldstone+Creamery",
-    },
-    {
-        "id": "king_glab_cuisine_338778be",
-        "name": "King Glab Cuisine",
-        "city": "Ikeja",
-        "state": "Lagos",
-        "lga": "Ikeja",
-        "location": "Ikeja, Lagos",
-        "rating": 4.36,
-        "cuisine": "Nigerian",
-        "specialties": ['Jollof Rice'],
-        "delivery_areas": ['Ikeja'],
-        "opening_hours": None,
-        "url": "https://chowdeck.com/store?q=King+Glab+Cuisine",
-    },
-    {
-        "id": "ajisafe_9e98bf2a",
-        "name": "Ajisafe",
-        "city": "Ikeja",
-        "state": "Lagos",
-        "lga": "Ikeja",
-        "location": "Ikeja, Lagos",
-        "rating": 4.34,
-        "cuisine": "Nigerian",
-        "specialties": ['Jollof Rice'],
-        "delivery_areas": ['Ikeja'],
-        "opening_hours": None,
-        "url": "https://chowdeck.com/store?q=Ajisafe",
-    },
-    {
-        "id": "labule_9fbcf33d",
-        "name": "Labule",
-        "city": "Ikeja",
-        "state": "Lagos",
-        "lga": "Ikeja",
-        "location": "Ikeja, Lagos",
-        "rating": 4.19,
-        "cuisine": "Nigerian",
-        "specialties": ['African Dishes'],
-        "delivery_areas": ['Ikeja'],
-        "opening_hours": None,
-        "url": "https://chowdeck.com/store?q=Labule",
-    },
-    {
-        "id": "belefull_b82dcdd1",
-        "name": "Belefull",
-        "city": "Ikeja",
-        "state": "Lagos",
-        "lga": "Ikeja",
-        "location": "Ikeja, Lagos",
-        "rating": 4.19,
-        "cuisine": "Nigerian",
-        "specialties": ['Jollof Rice'],
-        "delivery_areas": ['Ikeja'],
-        "opening_hours": None,
-        "url": "https://chowdeck.com/store?q=Belefull",
-    },
-    {
-        "id": "mama_put_ogba_2d858132",
-        "name": "Mama Put Ogba",
-        "city": "Ikeja",
-        "state": "Lagos",
-        "lga": "Ikeja",
-        "location": "Ikeja, Lagos",
-        "rating": 4.1,
-        "cuisine": "Nigerian",
-        "specialties": ['Local Dishes'],
-        "delivery_areas": ['Ikeja'],
-        "opening_hours": None,
-        "url": "https://chowdeck.com/store?q=Mama+Put+Ogba",
-    },
-    {
-        "id": "yellow_chilli_ikeja_f1c446af",
-        "name": "Yellow Chilli Ikeja",
-        "city": "Ikeja",
-        "state": "Lagos",
-        "lga": "Ikeja",
-        "location": "Ikeja, Lagos",
-        "rating": 4.2,
-        "cuisine": "Indian",
-        "specialties": ['Indian Cuisine'],
-        "delivery_areas": ['Ikeja'],
-        "opening_hours": None,
-        "url": "https://chowdeck.com/store?q=Yellow+Chilli+Ikeja",
-    },
-    {
-        "id": "baba_ijebu_spot_15b183c2",
-        "name": "Baba Ijebu Spot",
-        "city": "Ikeja",
-        "state": "Lagos",
-        "lga": "Ikeja",
-        "location": "Ikeja, Lagos",
-        "rating": 4.0,
-        "cuisine": "Nigerian",
-        "specialties": ['Pepper Soup'],
-        "delivery_areas": ['Ikeja'],
-        "opening_hours": None,
-        "url": "https://chowdeck.com/store?q=Baba+Ijebu+Spot",
-    },
-    {
-        "id": "iya_basira_f082fa74",
-        "name": "Iya Basira",
-        "city": "Ikeja",
-        "state": "Lagos",
-        "lga": "Ikeja",
-        "location": "Ikeja, Lagos",
-        "rating": 4.2,
-        "cuisine": "Nigerian",
-        "specialties": ['Amala'],
-        "delivery_areas": ['Ikeja'],
-        "opening_hours": None,
-        "url": "https://chowdeck.com/store?q=Iya+Basira",
-    },
-    {
-        "id": "ogba_suya_spot_f9b45576",
-        "name": "Ogba Suya Spot",
-        "city": "Ikeja",
-        "state": "Lagos",
-        "lga": "Ikeja",
-        "location": "Ikeja, Lagos",
-        "rating": 4.1,
-        "cuisine": "Nigerian",
-        "specialties": ['Suya'],
-        "delivery_areas": ['Ikeja'],
-        "opening_hours": None,
-        "url": "https://chowdeck.com/store?q=Ogba+Suya+Spot",
-    },
-    {
-        "id": "allen_avenue_grill_e39fa948",
-        "name": "Allen Avenue Grill",
-        "city": "Ikeja",
-        "state": "Lagos",
-        "lga": "Ikeja",
-        "location": "Ikeja, Lagos",
-        "rating": 4.0,
-        "cuisine": "Continental",
-        "specialties": ['Grills'],
-        "delivery_areas": ['Ikeja'],
-        "opening_hours": None,
-        "url": "https://chowdeck.com/store?q=Allen+Avenue+Grill",
-    },
-    {
-        "id": "ikeja_gra_kitchen_9576c95b",
-        "name": "Ikeja GRA Kitchen",
-        "city": "Ikeja",
-        "state": "Lagos",
-        "lga": "Ikeja",
-        "location": "Ikeja, Lagos",
-        "rating": 4.1,
-        "cuisine": "Nigerian",
-        "specialties": ['Jollof Rice'],
-        "delivery_areas": ['Ikeja'],
-        "opening_hours": None,
-        "url": "https://chowdeck.com/store?q=Ikeja+GRA+Kitchen",
-    },
-    {
-        "id": "computer_village_buka_ac014aab",
-        "name": "Computer Village Buka",
-        "city": "Ikeja",
-        "state": "Lagos",
-        "lga": "Ikeja",
-        "location": "Ikeja, Lagos",
-        "rating": 3.9,
-        "cuisine": "Nigerian",
-        "specialties": ['Local Dishes'],
-        "delivery_areas": ['Ikeja'],
-        "opening_hours": None,
-        "url": "https://chowdeck.com/store?q=Computer+Village+Buka",
-    },
-    {
-        "id": "alausa_canteen_a1fe25f8",
-        "name": "Alausa Canteen",
-        "city": "Ikeja",
-        "state": "Lagos",
-        "lga": "Ikeja",
-        "location": "Ikeja, Lagos",
-        "rating": 4.0,
-        "cuisine": "Nigerian",
-        "specialties": ['Office Meals'],
-        "delivery_areas": ['Ikeja'],
-        "opening_hours": None,
-        "url": "https://chowdeck.com/store?q=Alausa+Canteen",
-    },
-    {
-        "id": "shoprite_food_court_ikeja_b68a796c",
-        "name": "Shoprite Food Court Ikeja",
-        "city": "Ikeja",
-        "state": "Lagos",
-        "lga": "Ikeja",
-        "location": "Ikeja, Lagos",
-        "rating": 4.0,
-        "cuisine": "Various",
-        "specialties": ['Multiple Cuisines'],
-        "delivery_areas": ['Ikeja'],
-        "opening_hours": None,
-        "url": "https://chowdeck.com/store?q=Shoprite+Food+Court+Ikeja",
-    },
-    {
-        "id": "genesis_delicacies_30385e0e",
-        "name": "Genesis Delicacies",
-        "city": "Ikeja",
-        "state": "Lagos",
-        "lga": "Ikeja",
-        "location": "Ikeja, Lagos",
-        "rating": 4.3,
-        "cuisine": "Nigerian",
-        "specialties": ['Party Jollof'],
-        "delivery_areas": ['Ikeja'],
-        "opening_hours": None,
-        "url": "https://chowdeck.com/store?q=Genesis+Delicacies",
-    },
-    {
-        "id": "owambe_kitchen_cbff448d",
-        "name": "Owambe Kitchen",
-        "city": "Ikeja",
-        "state": "Lagos",
-        "lga": "Ikeja",
-        "location": "Ikeja, Lagos",
-        "rating": 4.2,
-        "cuisine": "Nigerian",
-        "specialties": ['Jollof Rice'],
-        "delivery_areas": ['Ikeja'],
-        "opening_hours": None,
-        "url": "https://chowdeck.com/store?q=Owambe+Kitchen",
-    },
-    {
-        "id": "calabar_kitchen_ikeja_6077365c",
-        "name": "Calabar Kitchen Ikeja",
-        "city": "Ikeja",
-        "state": "Lagos",
-        "lga": "Ikeja",
-        "location": "Ikeja, Lagos",
-        "rating": 4.1,
-        "cuisine": "Nigerian",
-        "specialties": ['Afang Soup'],
-        "delivery_areas": ['Ikeja'],
-        "opening_hours": None,
-        "url": "https://chowdeck.com/store?q=Calabar+Kitchen+Ikeja",
-    },
-    {
-        "id": "the_smokehouse_ikeja_bf7f0828",
-        "name": "The Smokehouse Ikeja",
-        "city": "Ikeja",
-        "state": "Lagos",
-        "lga": "Ikeja",
-        "location": "Ikeja, Lagos",
-        "rating": 4.2,
-        "cuisine": "BBQ",
-        "specialties": ['BBQ'],
-        "delivery_areas": ['Ikeja'],
-        "opening_hours": None,
-        "url": "https://chowdeck.com/store?q=The+Smokehouse+Ikeja",
-    },
-    {
-        "id": "pounded_yam_joint_4f36df7c",
-        "name": "Pounded Yam Joint",
-        "city": "Ikeja",
-        "state": "Lagos",
-        "lga": "Ikeja",
-        "location": "Ikeja, Lagos",
-        "rating": 4.0,
-        "cuisine": "Nigerian",
-        "specialties": ['Pounded Yam'],
-        "delivery_areas": ['Ikeja'],
-        "opening_hours": None,
-        "url": "https://chowdeck.com/store?q=Pounded+Yam+Joint",
-    },
-    {
-        "id": "iya_mushin_c9d5ee62",
-        "name": "Iya Mushin",
-        "city": "Ikeja",
-        "state": "Lagos",
-        "lga": "Ikeja",
-        "location": "Ikeja, Lagos",
-        "rating": 3.9,
-        "cuisine": "Nigerian",
-        "specialties": ['Street Food'],
-        "delivery_areas": ['Ikeja'],
-        "opening_hours": None,
-        "url": "https://chowdeck.com/store?q=Iya+Mushin",
-    },
-    {
-        "id": "molabat_kitchen_3cd882b5",
-        "name": "Molabat Kitchen",
-        "city": "Eti-Osa",
-        "state": "Lagos",
-        "lga": "Eti-Osa",
-        "location": "Eti-Osa, Lagos",
-        "rating": 4.47,
-        "cuisine": "Nigerian",
-        "specialties": ['Jollof Rice'],
-        "delivery_areas": ['Eti-Osa'],
-        "opening_hours": None,
-        "url": "https://chowdeck.com/store?q=Molabat+Kitchen",
-    },
-    {
-        "id": "amoke_oge_63550103",
-        "name": "Amoke Oge",
-        "city": "Eti-Osa",
-        "state": "Lagos",
-        "lga": "Eti-Osa",
-        "location": "Eti-Osa, Lagos",
-        "rating": 4.34,
-        "cuisine": "Nigerian",
-        "specialties": ['Jollof Rice'],
-        "delivery_areas": ['Eti-Osa'],
-        "opening_hours": None,
-        "url": "https://chowdeck.com/store?q=Amoke+Oge",
-    },
-    {
-        "id": "foodies_7291b8b0",
-        "name": "Foodies",
-        "city": "Eti-Osa",
-        "state": "Lagos",
-        "lga": "Eti-Osa",
-        "location": "Eti-Osa, Lagos",
-        "rating": 4.28,
-        "cuisine": "Nigerian",
-        "specialties": ['Jollof Rice'],
-        "delivery_areas": ['Eti-Osa'],
-        "opening_hours": None,
-        "url": "https://chowdeck.com/store?q=Foodies",
-    },
-    {
-        "id": "yakoyo_91365bd1",
-        "name": "Yakoyo",
-        "city": "Eti-Osa",
-        "state": "Lagos",
-        "lga": "Eti-Osa",
-        "location": "Eti-Osa, Lagos",
-        "rating": 4.19,
-        "cuisine": "Nigerian",
-        "specialties": ['Jollof Rice'],
-        "delivery_areas": ['Eti-Osa'],
-        "opening_hours": None,
-        "url": "https://chowdeck.com/store?q=Yakoyo",
-    },
-    {
-        "id": "the_place_56d1e8ca",
-        "name": "The Place",
-        "city": "Eti-Osa",
-        "state": "Lagos",
-        "lga": "Eti-Osa",
-        "location": "Eti-Osa, Lagos",
-        "rating": 4.67,
-        "cuisine": "Continental",
-        "specialties": ['International'],
-        "delivery_areas": ['Eti-Osa'],
-        "opening_hours": None,
-        "url": "https://chowdeck.com/store?q=The+Place",
-    },
-    {
-        "id": "johnny_rockets_6779d40f",
-        "name": "Johnny Rockets",
-        "city": "Eti-Osa",
-        "state": "Lagos",
-        "lga": "Eti-Osa",
-        "location": "Eti-Osa, Lagos",
-        "rating": 4.4,
-        "cuisine": "American",
-        "specialties": ['Burgers'],
-        "delivery_areas": ['Eti-Osa'],
-        "opening_hours": None,
-        "url": "https://chowdeck.com/store?q=Johnny+Rockets",
-    },
-    {
-        "id": "spice_route_7861b29f",
-        "name": "Spice Route",
-        "city": "Eti-Osa",
-        "state": "Lagos",
-        "lga": "Eti-Osa",
-        "location": "Eti-Osa, Lagos",
-        "rating": 4.3,
-        "cuisine": "Indian",
-        "specialties": ['Indian Cuisine'],
-        "delivery_areas": ['Eti-Osa'],
-        "opening_hours": None,
-        "url": "https://chowdeck.com/store?q=Spice+Route",
-    },
-    {
-        "id": "bottles_58e9683e",
-        "name": "Bottles",
-        "city": "Eti-Osa",
-        "state": "Lagos",
-        "lga": "Eti-Osa",
-        "location": "Eti-Osa, Lagos",
-        "rating": 4.2,
-        "cuisine": "Continental",
-        "specialties": ['Grills'],
-        "delivery_areas": ['Eti-Osa'],
-        "opening_hours": None,
-        "url": "https://chowdeck.com/store?q=Bottles",
-    },
-    {
-        "id": "hard_rock_cafe_6fab52e6",
-        "name": "Hard Rock Cafe",
-        "city": "Eti-Osa",
-        "state": "Lagos",
-        "lga": "Eti-Osa",
-        "location": "Eti-Osa, Lagos",
-        "rating": 4.5,
-        "cuisine": "American",
-        "specialties": ['Burgers'],
-        "delivery_areas": ['Eti-Osa'],
-        "opening_hours": None,
-        "url": "https://chowdeck.com/store?q=Hard+Rock+Cafe",
-    },
-    {
-        "id": "nok_by_alara_c89149c7",
-        "name": "Nok by Alara",
-        "city": "Eti-Osa",
-        "state": "Lagos",
-        "lga": "Eti-Osa",
-        "location": "Eti-Osa, Lagos",
-        "rating": 4.6,
-        "cuisine": "Contemporary Nigerian",
-        "specialties": ['Modern Nigerian'],
-        "delivery_areas": ['Eti-Osa'],
-        "opening_hours": None,
-        "url": "https://chowdeck.com/store?q=Nok+by+Alara",
-    },
-    {
-        "id": "cactus_1ce20279",
-        "name": "Cactus",
-        "city": "Eti-Osa",
-        "state": "Lagos",
-        "lga": "Eti-Osa",
-        "location": "Eti-Osa, Lagos",
-        "rating": 4.3,
-        "cuisine": "Mexican",
-        "specialties": ['Tacos'],
-        "delivery_areas": ['Eti-Osa'],
-        "opening_hours": None,
-        "url": "https://chowdeck.com/store?q=Cactus",
-    },
-    {
-        "id": "shiro_1deff89f",
-        "name": "Shiro",
-        "city": "Eti-Osa",
-        "state": "Lagos",
-        "lga": "Eti-Osa",
-        "location": "Eti-Osa, Lagos",
-        "rating": 4.4,
-        "cuisine": "Asian",
-        "specialties": ['Asian Fusion'],
-        "delivery_areas": ['Eti-Osa'],
-        "opening_hours": None,
-        "url": "https://chowdeck.com/store?q=Shiro",
-    },
-    {
-        "id": "ocean_basket_287a6ead",
-        "name": "Ocean Basket",
-        "city": "Eti-Osa",
-        "state": "Lagos",
-        "lga": "Eti-Osa",
-        "location": "Eti-Osa, Lagos",
-        "rating": 4.3,
-        "cuisine": "Seafood",
-        "specialties": ['Seafood'],
-        "delivery_areas": ['Eti-Osa'],
-        "opening_hours": None,
-        "url": "https://chowdeck.com/store?q=Ocean+Basket",
-    },
-    {
-        "id": "spur_steakhouse_026dfe62",
-        "name": "Spur Steakhouse",
-        "city": "Eti-Osa",
-        "state": "Lagos",
-        "lga": "Eti-Osa",
-        "location": "Eti-Osa, Lagos",
-        "rating": 4.2,
-        "cuisine": "Steakhouse",
-        "specialties": ['Steaks'],
-        "delivery_areas": ['Eti-Osa'],
-        "opening_hours": None,
-        "url": "https://chowdeck.com/store?q=Spur+Steakhouse",
-    },
-    {
-        "id": "bungalow_lekki_a51aa96c",
-        "name": "Bungalow Lekki",
-        "city": "Eti-Osa",
-        "state": "Lagos",
-        "lga": "Eti-Osa",
-        "location": "Eti-Osa, Lagos",
-        "rating": 4.3,
-        "cuisine": "Continental",
-        "specialties": ['Grills'],
-        "delivery_areas": ['Eti-Osa'],
-        "opening_hours": None,
-        "url": "https://chowdeck.com/store?q=Bungalow+Lekki",
-    },
-    {
-        "id": "terra_kulture_606fe4c6",
-        "name": "Terra Kulture",
-        "city": "Eti-Osa",
-        "state": "Lagos",
-        "lga": "Eti-Osa",
-        "location": "Eti-Osa, Lagos",
-        "rating": 4.5,
-        "cuisine": "Nigerian",
-        "specialties": ['Nigerian Art Food'],
-        "delivery_areas": ['Eti-Osa'],
-        "opening_hours": None,
-        "url": "https://chowdeck.com/store?q=Terra+Kulture",
-    },
-    {
-        "id": "yellow_chilli_lekki_48a33705",
-        "name": "Yellow Chilli Lekki",
-        "city": "Eti-Osa",
-        "state": "Lagos",
-        "lga": "Eti-Osa",
-        "location": "Eti-Osa, Lagos",
-        "rating": 4.2,
-        "cuisine": "Indian",
-        "specialties": ['Indian'],
-        "delivery_areas": ['Eti-Osa'],
-        "opening_hours": None,
-        "url": "https://chowdeck.com/store?q=Yellow+Chilli+Lekki",
-    },
-    {
-        "id": "ofada_boy_lekki_42889fdf",
-        "name": "Ofada Boy Lekki",
-        "city": "Eti-Osa",
-        "state": "Lagos",
-        "lga": "Eti-Osa",
-        "location": "Eti-Osa, Lagos",
-        "rating": 4.2,
-        "cuisine": "Nigerian",
-        "specialties": ['Ofada Rice'],
-        "delivery_areas": ['Eti-Osa'],
-        "opening_hours": None,
-        "url": "https://chowdeck.com/store?q=Ofada+Boy+Lekki",
-    },
-    {
-        "id": "kilimanjaro_lekki_ba0001aa",
-        "name": "Kilimanjaro Lekki",
-        "city": "Eti-Osa",
-        "state": "Lagos",
-        "lga": "Eti-Osa",
-        "location": "Eti-Osa, Lagos",
-        "rating": 4.3,
-        "cuisine": "Continental",
-        "specialties": ['Grills'],
-        "delivery_areas": ['Eti-Osa'],
-        "opening_hours": None,
-        "url": "https://chowdeck.com/store?q=Kilimanjaro+Lekki",
-    },
-    {
-        "id": "rhapsody_s_a304e0eb",
-        "name": "Rhapsody's",
-        "city": "Eti-Osa",
-        "state": "Lagos",
-        "lga": "Eti-Osa",
-        "location": "Eti-Osa, Lagos",
-        "rating": 4.4,
-        "cuisine": "Continental",
-        "specialties": ['Fine Dining'],
-        "delivery_areas": ['Eti-Osa'],
-        "opening_hours": None,
-        "url": "https://chowdeck.com/store?q=Rhapsody's",
-    },
-    {
-        "id": "sky_restaurant_lounge_6054ddd7",
-        "name": "Sky Restaurant & Lounge",
-        "city": "Eti-Osa",
-        "state": "Lagos",
-        "lga": "Eti-Osa",
-        "location": "Eti-Osa, Lagos",
-        "rating": 4.3,
-        "cuisine": "Continental",
-        "specialties": ['International'],
-        "delivery_areas": ['Eti-Osa'],
-        "opening_hours": None,
-        "url": "https://chowdeck.com/store?q=Sky+Restaurant+&+Lounge",
-    },
-    {
-        "id": "talindo_steakhouse_a80cb58f",
-        "name": "Talindo Steakhouse",
-        "city": "Eti-Osa",
-        "state": "Lagos",
-        "lga": "Eti-Osa",
-        "location": "Eti-Osa, Lagos",
-        "rating": 4.5,
-        "cuisine": "Steakhouse",
-        "specialties": ['Steaks'],
-        "delivery_areas": ['Eti-Osa'],
-        "opening_hours": None,
-        "url": "https://chowdeck.com/store?q=Talindo+Steakhouse",
-    },
-    {
-        "id": "craft_gourmet_2116ff0c",
-        "name": "Craft Gourmet",
-        "city": "Eti-Osa",
-        "state": "Lagos",
-        "lga": "Eti-Osa",
-        "location": "Eti-Osa, Lagos",
-        "rating": 4.3,
-        "cuisine": "Continental",
-        "specialties": ['Brunch'],
-        "delivery_areas": ['Eti-Osa'],
-        "opening_hours": None,
-        "url": "https://chowdeck.com/store?q=Craft+Gourmet",
-    },
-    {
-        "id": "pier_one_c1f4d422",
-        "name": "Pier One",
-        "city": "Eti-Osa",
-        "state": "Lagos",
-        "lga": "Eti-Osa",
-        "location": "Eti-Osa, Lagos",
-        "rating": 4.2,
-        "cuisine": "Seafood",
-        "specialties": ['Seafood'],
-        "delivery_areas": ['Eti-Osa'],
-        "opening_hours": None,
-        "url": "https://chowdeck.com/store?q=Pier+One",
-    },
-    {
-        "id": "orchid_bistro_8ee9ac08",
-        "name": "Orchid Bistro",
-        "city": "Eti-Osa",
-        "state": "Lagos",
-        "lga": "Eti-Osa",
-        "location": "Eti-Osa, Lagos",
-        "rating": 4.4,
-        "cuisine": "Continental",
-        "specialties": ['Fine Dining'],
-        "delivery_areas": ['Eti-Osa'],
-        "opening_hours": None,
-        "url": "https://chowdeck.com/store?q=Orchid+Bistro",
-    },
-    {
-        "id": "ajah_market_food_3adb5b51",
-        "name": "Ajah Market Food",
-        "city": "Eti-Osa",
-        "state": "Lagos",
-        "lga": "Eti-Osa",
-        "location": "Eti-Osa, Lagos",
-        "rating": 3.9,
-        "cuisine": "Nigerian",
-        "specialties": ['Street Food'],
-        "delivery_areas": ['Eti-Osa'],
-        "opening_hours": None,
-        "url": "https://chowdeck.com/store?q=Ajah+Market+Food",
-    },
-    {
-        "id": "lekki_buka_f0f9421f",
-        "name": "Lekki Buka",
-        "city": "Eti-Osa",
-        "state": "Lagos",
-        "lga": "Eti-Osa",
-        "location": "Eti-Osa, Lagos",
-        "rating": 4.0,
-        "cuisine": "Nigerian",
-        "specialties": ['Local Dishes'],
-        "delivery_areas": ['Eti-Osa'],
-        "opening_hours": None,
-        "url": "https://chowdeck.com/store?q=Lekki+Buka",
-    },
-    {
-        "id": "agungi_spot_c4ba2ed5",
-        "name": "Agungi Spot",
-        "city": "Eti-Osa",
-        "state": "Lagos",
-        "lga": "Eti-Osa",
-        "location": "Eti-Osa, Lagos",
-        "rating": 4.1,
-        "cuisine": "Nigerian",
-        "specialties": ['Jollof Rice'],
-        "delivery_areas": ['Eti-Osa'],
-        "opening_hours": None,
-        "url": "https://chowdeck.com/store?q=Agungi+Spot",
-    },
-    {
-        "id": "oniru_kitchen_a59d3044",
-        "name": "Oniru Kitchen",
-        "city": "Eti-Osa",
-        "state": "Lagos",
-        "lga": "Eti-Osa",
-        "location": "Eti-Osa, Lagos",
-        "rating": 4.2,
-        "cuisine": "Nigerian",
-        "specialties": ['Party Jollof'],
-        "delivery_areas": ['Eti-Osa'],
-        "opening_hours": None,
-        "url": "https://chowdeck.com/store?q=Oniru+Kitchen",
-    },
-    {
-        "id": "vi_deli_20e37d36",
-        "name": "Vi Deli",
-        "city": "Eti-Osa",
-        "state": "Lagos",
-        "lga": "Eti-Osa",
-        "location": "Eti-Osa, Lagos",
-        "rating": 4.1,
-        "cuisine": "Continental",
-        "specialties": ['Sandwiches'],
-        "delivery_areas": ['Eti-Osa'],
-        "opening_hours": None,
-        "url": "https://chowdeck.com/store?q=Vi+Deli",
-    },
-    {
-        "id": "hnh_restaurant_b4485e5c",
-        "name": "HNH Restaurant",
-        "city": "Lagos Mainland",
-        "state": "Lagos",
-        "lga": "Lagos Mainland",
-        "location": "Lagos Mainland, Lagos",
-        "rating": 4.58,
-        "cuisine": "Nigerian",
-        "specialties": ['Jollof Rice'],
-        "delivery_areas": ['Lagos Mainland'],
-        "opening_hours": None,
-        "url": "https://chowdeck.com/store?q=HNH+Restaurant",
-    },
-    {
-        "id": "iya_moria_b4b3785a",
-        "name": "Iya Moria",
-        "city": "Lagos Mainland",
-        "state": "Lagos",
-        "lga": "Lagos Mainland",
-        "location": "Lagos Mainland, Lagos",
-        "rating": 4.36,
-        "cuisine": "Nigerian",
-        "specialties": ['Jollof Rice'],
-        "delivery_areas": ['Lagos Mainland'],
-        "opening_hours": None,
-        "url": "https://chowdeck.com/store?q=Iya+Moria",
-    },
-    {
-        "id": "de_marquee_c81c505e",
-        "name": "De Marquee",
-        "city": "Lagos Mainland",
-        "state": "Lagos",
-        "lga": "Lagos Mainland",
-        "location": "Lagos Mainland, Lagos",
-        "rating": 4.2,
-        "cuisine": "Nigerian",
-        "specialties": ['Local Dishes'],
-        "delivery_areas": ['Lagos Mainland'],
-        "opening_hours": None,
-        "url": "https://chowdeck.com/store?q=De+Marquee",
-    },
-    {
-        "id": "mama_cass_yaba_b30ca0a5",
-        "name": "Mama Cass Yaba",
-        "city": "Lagos Mainland",
-        "state": "Lagos",
-        "lga": "Lagos Mainland",
-        "location": "Lagos Mainland, Lagos",
-        "rating": 4.1,
-        "cuisine": "Nigerian",
-        "specialties": ['Local Dishes'],
-        "delivery_areas": ['Lagos Mainland'],
-        "opening_hours": None,
-        "url": "https://chowdeck.com/store?q=Mama+Cass+Yaba",
-    },
-    {
-        "id": "yaba_buka_ae75260e",
-        "name": "Yaba Buka",
-        "city": "Lagos Mainland",
-        "state": "Lagos",
-        "lga": "Lagos Mainland",
-        "location": "Lagos Mainland, Lagos",
-        "rating": 3.9,
-        "cuisine": "Nigerian",
-        "specialties": ['Student Meals'],
-        "delivery_areas": ['Lagos Mainland'],
-        "opening_hours": None,
-        "url": "https://chowdeck.com/store?q=Yaba+Buka",
-    },
-    {
-        "id": "sabo_market_food_5ed8015e",
-        "name": "Sabo Market Food",
-        "city": "Lagos Mainland",
-        "state": "Lagos",
-        "lga": "Lagos Mainland",
-        "location": "Lagos Mainland, Lagos",
-        "rating": 3.8,
-        "cuisine": "Nigerian",
-        "specialties": ['Market Food'],
-        "delivery_areas": ['Lagos Mainland'],
-        "opening_hours": None,
-        "url": "https://chowdeck.com/store?q=Sabo+Market+Food",
-    },
-    {
-        "id": "akoka_kitchen_65a9ba96",
-        "name": "Akoka Kitchen",
-        "city": "Lagos Mainland",
-        "state": "Lagos",
-        "lga": "Lagos Mainland",
-        "location": "Lagos Mainland, Lagos",
-        "rating": 4.0,
-        "cuisine": "Nigerian",
-        "specialties": ['Rice & Stew'],
-        "delivery_areas": ['Lagos Mainland'],
-        "opening_hours": None,
-        "url": "https://chowdeck.com/store?q=Akoka+Kitchen",
-    },
-    {
-        "id": "herbert_macaulay_spot_86d300bd",
-        "name": "Herbert Macaulay Spot",
-        "city": "Lagos Mainland",
-        "state": "Lagos",
-        "lga": "Lagos Mainland",
-        "location": "Lagos Mainland, Lagos",
-        "rating": 3.9,
-        "cuisine": "Nigerian",
-        "specialties": ['Street Food'],
-        "delivery_areas": ['Lagos Mainland'],
-        "opening_hours": None,
-        "url": "https://chowdeck.com/store?q=Herbert+Macaulay+Spot",
-    },
-    {
-        "id": "campus_kitchen_8e1bc115",
-        "name": "Campus Kitchen",
-        "city": "Lagos Mainland",
-        "state": "Lagos",
-        "lga": "Lagos Mainland",
-        "location": "Lagos Mainland, Lagos",
-        "rating": 4.0,
-        "cuisine": "Nigerian",
-        "specialties": ['Student Food'],
-        "delivery_areas": ['Lagos Mainland'],
-        "opening_hours": None,
-        "url": "https://chowdeck.com/store?q=Campus+Kitchen",
-    },
-    {
-        "id": "ebute_metta_buka_8dba03d1",
-        "name": "Ebute Metta Buka",
-        "city": "Lagos Mainland",
-        "state": "Lagos",
-        "lga": "Lagos Mainland",
-        "location": "Lagos Mainland, Lagos",
-        "rating": 4.0,
-        "cuisine": "Nigerian",
-        "specialties": ['Local Dishes'],
-        "delivery_areas": ['Lagos Mainland'],
-        "opening_hours": None,
-        "url": "https://chowdeck.com/store?q=Ebute+Metta+Buka",
-    },
-    {
-        "id": "mama_deji_kitchen_51a8cef5",
-        "name": "Mama Deji Kitchen",
-        "city": "Lagos Mainland",
-        "state": "Lagos",
-        "lga": "Lagos Mainland",
-        "location": "Lagos Mainland, Lagos",
-        "rating": 4.1,
-        "cuisine": "Nigerian",
-        "specialties": ['Amala'],
-        "delivery_areas": ['Lagos Mainland'],
-        "opening_hours": None,
-        "url": "https://chowdeck.com/store?q=Mama+Deji+Kitchen",
-    },
-    {
-        "id": "yaba_tech_canteen_1fd51b85",
-        "name": "Yaba Tech Canteen",
-        "city": "Lagos Mainland",
-        "state": "Lagos",
-        "lga": "Lagos Mainland",
-        "location": "Lagos Mainland, Lagos",
-        "rating": 3.9,
-        "cuisine": "Nigerian",
-        "specialties": ['Campus Meals'],
-        "delivery_areas": ['Lagos Mainland'],
-        "opening_hours": None,
-        "url": "https://chowdeck.com/store?q=Yaba+Tech+Canteen",
-    },
-    {
-        "id": "sabo_junction_food_f2cde418",
-        "name": "Sabo Junction Food",
-        "city": "Lagos Mainland",
-        "state": "Lagos",
-        "lga": "Lagos Mainland",
-        "location": "Lagos Mainland, Lagos",
-        "rating": 3.9,
-        "cuisine": "Nigerian",
-        "specialties": ['Quick Meals'],
-        "delivery_areas": ['Lagos Mainland'],
-        "opening_hours": None,
-        "url": "https://chowdeck.com/store?q=Sabo+Junction+Food",
-    },
-    {
-        "id": "fadeyi_spot_f08fb283",
-        "name": "Fadeyi Spot",
-        "city": "Lagos Mainland",
-        "state": "Lagos",
-        "lga": "Lagos Mainland",
-        "location": "Lagos Mainland, Lagos",
-        "rating": 4.0,
-        "cuisine": "Nigerian",
-        "specialties": ['Local Dishes'],
-        "delivery_areas": ['Lagos Mainland'],
-        "opening_hours": None,
-        "url": "https://chowdeck.com/store?q=Fadeyi+Spot",
-    },
-    {
-        "id": "kilimanjaro_a5fc60cb",
-        "name": "Kilimanjaro",
-        "city": "Surulere",
-        "state": "Lagos",
-        "lga": "Surulere",
-        "location": "Surulere, Lagos",
-        "rating": 4.3,
-        "cuisine": "Continental",
-        "specialties": ['Grills'],
-        "delivery_areas": ['Surulere'],
-        "opening_hours": None,
-        "url": "https://chowdeck.com/store?q=Kilimanjaro",
-    },
-    {
-        "id": "mama_dee_e40a4dd6",
-        "name": "Mama Dee",
-        "city": "Surulere",
-        "state": "Lagos",
-        "lga": "Surulere",
-        "location": "Surulere, Lagos",
-        "rating": 4.1,
-        "cuisine": "Nigerian",
-        "specialties": ['Jollof Rice'],
-        "delivery_areas": ['Surulere'],
-        "opening_hours": None,
-        "url": "https://chowdeck.com/store?q=Mama+Dee",
-    },
-    {
-        "id": "ofada_boy_1bb34084",
-        "name": "Ofada Boy",
-        "city": "Surulere",
-        "state": "Lagos",
-        "lga": "Surulere",
-        "location": "Surulere, Lagos",
-        "rating": 4.2,
-        "cuisine": "Nigerian",
-        "specialties": ['Ofada Rice'],
-        "delivery_areas": ['Surulere'],
-        "opening_hours": None,
-        "url": "https://chowdeck.com/store?q=Ofada+Boy",
-    },
-    {
-        "id": "adeniran_kitchen_095b4ed1",
-        "name": "Adeniran Kitchen",
-        "city": "Surulere",
-        "state": "Lagos",
-        "lga": "Surulere",
-        "location": "Surulere, Lagos",
-        "rating": 4.0,
-        "cuisine": "Nigerian",
-        "specialties": ['Local Dishes'],
-        "delivery_areas": ['Surulere'],
-        "opening_hours": None,
-        "url": "https://chowdeck.com/store?q=Adeniran+Kitchen",
-    },
-    {
-        "id": "stadium_suya_81d9ce68",
-        "name": "Stadium Suya",
-        "city": "Surulere",
-        "state": "Lagos",
-        "lga": "Surulere",
-        "location": "Surulere, Lagos",
-        "rating": 4.1,
-        "cuisine": "Nigerian",
-        "specialties": ['Suya'],
-        "delivery_areas": ['Surulere'],
-        "opening_hours": None,
-        "url": "https://chowdeck.com/store?q=Stadium+Suya",
-    },
-    {
-        "id": "surulere_buka_156b728a",
-        "name": "Surulere Buka",
-        "city": "Surulere",
-        "state": "Lagos",
-        "lga": "Surulere",
-        "location": "Surulere, Lagos",
-        "rating": 4.0,
-        "cuisine": "Nigerian",
-        "specialties": ['Local Dishes'],
-        "delivery_areas": ['Surulere'],
-        "opening_hours": None,
-        "url": "https://chowdeck.com/store?q=Surulere+Buka",
-    },
-    {
-        "id": "aguda_spot_0844325d",
-        "name": "Aguda Spot",
-        "city": "Surulere",
-        "state": "Lagos",
-        "lga": "Surulere",
-        "location": "Surulere, Lagos",
-        "rating": 3.9,
-        "cuisine": "Nigerian",
-        "specialties": ['Street Food'],
-        "delivery_areas": ['Surulere'],
-        "opening_hours": None,
-        "url": "https://chowdeck.com/store?q=Aguda+Spot",
-    },
-    {
-        "id": "ogunlana_drive_kitchen_d81e4973",
-        "name": "Ogunlana Drive Kitchen",
-        "city": "Surulere",
-        "state": "Lagos",
-        "lga": "Surulere",
-        "location": "Surulere, Lagos",
-        "rating": 4.0,
-        "cuisine": "Nigerian",
-        "specialties": ['Jollof Rice'],
-        "delivery_areas": ['Surulere'],
-        "opening_hours": None,
-        "url": "https://chowdeck.com/store?q=Ogunlana+Drive+Kitchen",
-    },
-    {
-        "id": "shitta_roundabout_food_09ca813c",
-        "name": "Shitta Roundabout Food",
-        "city": "Surulere",
-        "state": "Lagos",
-        "lga": "Surulere",
-        "location": "Surulere, Lagos",
-        "rating": 3.9,
-        "cuisine": "Nigerian",
-        "specialties": ['Quick Meals'],
-        "delivery_areas": ['Surulere'],
-        "opening_hours": None,
-        "url": "https://chowdeck.com/store?q=Shitta+Roundabout+Food",
-    },
-    {
-        "id": "lawanson_kitchen_8d8ec1af",
-        "name": "Lawanson Kitchen",
-        "city": "Surulere",
-        "state": "Lagos",
-        "lga": "Surulere",
-        "location": "Surulere, Lagos",
-        "rating": 4.0,
-        "cuisine": "Nigerian",
-        "specialties": ['Local Dishes'],
-        "delivery_areas": ['Surulere'],
-        "opening_hours": None,
-        "url": "https://chowdeck.com/store?q=Lawanson+Kitchen",
-    },
-    {
-        "id": "tejuosho_market_food_9e0d9697",
-        "name": "Tejuosho Market Food",
-        "city": "Surulere",
-        "state": "Lagos",
-        "lga": "Surulere",
-        "location": "Surulere, Lagos",
-        "rating": 3.8,
-        "cuisine": "Nigerian",
-        "specialties": ['Market Meals'],
-        "delivery_areas": ['Surulere'],
-        "opening_hours": None,
-        "url": "https://chowdeck.com/store?q=Tejuosho+Market+Food",
-    },
-    {
-        "id": "bode_thomas_kitchen_34dc24e0",
-        "name": "Bode Thomas Kitchen",
-        "city": "Surulere",
-        "state": "Lagos",
-        "lga": "Surulere",
-        "location": "Surulere, Lagos",
-        "rating": 4.0,
-        "cuisine": "Nigerian",
-        "specialties": ['Rice & Beans'],
-        "delivery_areas": ['Surulere'],
-        "opening_hours": None,
-        "url": "https://chowdeck.com/store?q=Bode+Thomas+Kitchen",
-    },
-    {
-        "id": "enitan_street_buka_6722231e",
-        "name": "Enitan Street Buka",
-        "city": "Surulere",
-        "state": "Lagos",
-        "lga": "Surulere",
-        "location": "Surulere, Lagos",
-        "rating": 4.0,
-        "cuisine": "Nigerian",
-        "specialties": ['Local Dishes'],
-        "delivery_areas": ['Surulere'],
-        "opening_hours": None,
-        "url": "https://chowdeck.com/store?q=Enitan+Street+Buka",
-    },
-    {
-        "id": "bungalow_restaurant_8db16fce",
-        "name": "Bungalow Restaurant",
-        "city": "Kosofe",
-        "state": "Lagos",
-        "lga": "Kosofe",
-        "location": "Kosofe, Lagos",
-        "rating": 4.3,
-        "cuisine": "Continental",
-        "specialties": ['Grills'],
-        "delivery_areas": ['Kosofe'],
-        "opening_hours": None,
-        "url": "https://chowdeck.com/store?q=Bungalow+Restaurant",
-    },
-    {
-        "id": "yellow_chilli_maryland_193a91c2",
-        "name": "Yellow Chilli Maryland",
-        "city": "Kosofe",
-        "state": "Lagos",
-        "lga": "Kosofe",
-        "location": "Kosofe, Lagos",
-        "rating": 4.2,
-        "cuisine": "Indian",
-        "specialties": ['Indian Cuisine'],
-        "delivery_areas": ['Kosofe'],
-        "opening_hours": None,
-        "url": "https://chowdeck.com/store?q=Yellow+Chilli+Maryland",
-    },
-    {
-        "id": "mama_ebo_a7d71ac9",
-        "name": "Mama Ebo",
-        "city": "Kosofe",
-        "state": "Lagos",
-        "lga": "Kosofe",
-        "location": "Kosofe, Lagos",
-        "rating": 4.0,
-        "cuisine": "Nigerian",
-        "specialties": ['Local Dishes'],
-        "delivery_areas": ['Kosofe'],
-        "opening_hours": None,
-        "url": "https://chowdeck.com/store?q=Mama+Ebo",
-    },
-    {
-        "id": "obalende_suya_ogudu_79098e40",
-        "name": "Obalende Suya Ogudu",
-        "city": "Kosofe",
-        "state": "Lagos",
-        "lga": "Kosofe",
-        "location": "Kosofe, Lagos",
-        "rating": 4.2,
-        "cuisine": "Nigerian",
-        "specialties": ['Suya'],
-        "delivery_areas": ['Kosofe'],
-        "opening_hours": None,
-        "url": "https://chowdeck.com/store?q=Obalende+Suya+Ogudu",
-    },
-    {
-        "id": "gbagada_kitchen_a33fa4e2",
-        "name": "Gbagada Kitchen",
-        "city": "Kosofe",
-        "state": "Lagos",
-        "lga": "Kosofe",
-        "location": "Kosofe, Lagos",
-        "rating": 4.1,
-        "cuisine": "Nigerian",
-        "specialties": ['Jollof Rice'],
-        "delivery_areas": ['Kosofe'],
-        "opening_hours": None,
-        "url": "https://chowdeck.com/store?q=Gbagada+Kitchen",
-    },
-    {
-        "id": "maryland_mall_food_court_9ca10923",
-        "name": "Maryland Mall Food Court",
-        "city": "Kosofe",
-        "state": "Lagos",
-        "lga": "Kosofe",
-        "location": "Kosofe, Lagos",
-        "rating": 4.0,
-        "cuisine": "Various",
-        "specialties": ['Multiple'],
-        "delivery_areas": ['Kosofe'],
-        "opening_hours": None,
-        "url": "https://chowdeck.com/store?q=Maryland+Mall+Food+Court",
-    },
-    {
-        "id": "ogudu_buka_1dd150bb",
-        "name": "Ogudu Buka",
-        "city": "Kosofe",
-        "state": "Lagos",
-        "lga": "Kosofe",
-        "location": "Kosofe, Lagos",
-        "rating": 4.0,
-        "cuisine": "Nigerian",
-        "specialties": ['Local Dishes'],
-        "delivery_areas": ['Kosofe'],
-        "opening_hours": None,
-        "url": "https://chowdeck.com/store?q=Ogudu+Buka",
-    },
-    {
-        "id": "ketu_market_food_a71abc7d",
-        "name": "Ketu Market Food",
-        "city": "Kosofe",
-        "state": "Lagos",
-        "lga": "Kosofe",
-        "location": "Kosofe, Lagos",
-        "rating": 3.8,
-        "cuisine": "Nigerian",
-        "specialties": ['Market Meals'],
-        "delivery_areas": ['Kosofe'],
-        "opening_hours": None,
-        "url": "https://chowdeck.com/store?q=Ketu+Market+Food",
-    },
-    {
-        "id": "anthony_kitchen_05f0aea2",
-        "name": "Anthony Kitchen",
-        "city": "Kosofe",
-        "state": "Lagos",
-        "lga": "Kosofe",
-        "location": "Kosofe, Lagos",
-        "rating": 4.0,
-        "cuisine": "Nigerian",
-        "specialties": ['Rice & Stew'],
-        "delivery_areas": ['Kosofe'],
-        "opening_hours": None,
-        "url": "https://chowdeck.com/store?q=Anthony+Kitchen",
-    },
-    {
-        "id": "kosofe_spot_b66e7188",
-        "name": "Kosofe Spot",
-        "city": "Kosofe",
-        "state": "Lagos",
-        "lga": "Kosofe",
-        "location": "Kosofe, Lagos",
-        "rating": 3.9,
-        "cuisine": "Nigerian",
-        "specialties": ['Local Dishes'],
-        "delivery_areas": ['Kosofe'],
-        "opening_hours": None,
-        "url": "https://chowdeck.com/store?q=Kosofe+Spot",
-    },
-    {
-        "id": "pedro_kitchen_3955004e",
-        "name": "Pedro Kitchen",
-        "city": "Kosofe",
-        "state": "Lagos",
-        "lga": "Kosofe",
-        "location": "Kosofe, Lagos",
-        "rating": 3.9,
-        "cuisine": "Nigerian",
-        "specialties": ['Quick Meals'],
-        "delivery_areas": ['Kosofe'],
-        "opening_hours": None,
-        "url": "https://chowdeck.com/store?q=Pedro+Kitchen",
-    },
-    {
-        "id": "gbagada_express_buka_d669c34e",
-        "name": "Gbagada Express Buka",
-        "city": "Kosofe",
-        "state": "Lagos",
-        "lga": "Kosofe",
-        "location": "Kosofe, Lagos",
-        "rating": 3.9,
-        "cuisine": "Nigerian",
-        "specialties": ['Roadside Food'],
-        "delivery_areas": ['Kosofe'],
-        "opening_hours": None,
-        "url": "https://chowdeck.com/store?q=Gbagada+Express+Buka",
-    },
-    {
-        "id": "oshodi_market_food_d0161129",
-        "name": "Oshodi Market Food",
-        "city": "Oshodi-Isolo",
-        "state": "Lagos",
-        "lga": "Oshodi-Isolo",
-        "location": "Oshodi-Isolo, Lagos",
-        "rating": 3.8,
-        "cuisine": "Nigerian",
-        "specialties": ['Market Meals'],
-        "delivery_areas": ['Oshodi-Isolo'],
-        "opening_hours": None,
-        "url": "https://chowdeck.com/store?q=Oshodi+Market+Food",
-    },
-    {
-        "id": "isolo_kitchen_37f0784e",
-        "name": "Isolo Kitchen",
-        "city": "Oshodi-Isolo",
-        "state": "Lagos",
-        "lga": "Oshodi-Isolo",
-        "location": "Oshodi-Isolo, Lagos",
-        "rating": 4.0,
-        "cuisine": "Nigerian",
-        "specialties": ['Local Dishes'],
-        "delivery_areas": ['Oshodi-Isolo'],
-        "opening_hours": None,
-        "url": "https://chowdeck.com/store?q=Isolo+Kitchen",
-    },
-    {
-        "id": "mafoluku_buka_154e7106",
-        "name": "Mafoluku Buka",
-        "city": "Oshodi-Isolo",
-        "state": "Lagos",
-        "lga": "Oshodi-Isolo",
-        "location": "Oshodi-Isolo, Lagos",
-        "rating": 3.9,
-        "cuisine": "Nigerian",
-        "specialties": ['Street Food'],
-        "delivery_areas": ['Oshodi-Isolo'],
-        "opening_hours": None,
-        "url": "https://chowdeck.com/store?q=Mafoluku+Buka",
-    },
-    {
-        "id": "airport_road_kitchen_a75569bb",
-        "name": "Airport Road Kitchen",
-        "city": "Oshodi-Isolo",
-        "state": "Lagos",
-        "lga": "Oshodi-Isolo",
-        "location": "Oshodi-Isolo, Lagos",
-        "rating": 4.0,
-        "cuisine": "Nigerian",
-        "specialties": ['Quick Meals'],
-        "delivery_areas": ['Oshodi-Isolo'],
-        "opening_hours": None,
-        "url": "https://chowdeck.com/store?q=Airport+Road+Kitchen",
-    },
-    {
-        "id": "isolo_roundabout_spot_1b7d945c",
-        "name": "Isolo Roundabout Spot",
-        "city": "Oshodi-Isolo",
-        "state": "Lagos",
-        "lga": "Oshodi-Isolo",
-        "location": "Oshodi-Isolo, Lagos",
-        "rating": 3.9,
-        "cuisine": "Nigerian",
-        "specialties": ['Fast Food'],
-        "delivery_areas": ['Oshodi-Isolo'],
-        "opening_hours": None,
-        "url": "https://chowdeck.com/store?q=Isolo+Roundabout+Spot",
-    },
-    {
-        "id": "oshodi_under_bridge_281756f2",
-        "name": "Oshodi Under Bridge",
-        "city": "Oshodi-Isolo",
-        "state": "Lagos",
-        "lga": "Oshodi-Isolo",
-        "location": "Oshodi-Isolo, Lagos",
-        "rating": 3.7,
-        "cuisine": "Nigerian",
-        "specialties": ['Street Food'],
-        "delivery_areas": ['Oshodi-Isolo'],
-        "opening_hours": None,
-        "url": "https://chowdeck.com/store?q=Oshodi+Under+Bridge",
-    },
-    {
-        "id": "ejigbo_kitchen_dac196bd",
-        "name": "Ejigbo Kitchen",
-        "city": "Oshodi-Isolo",
-        "state": "Lagos",
-        "lga": "Oshodi-Isolo",
-        "location": "Oshodi-Isolo, Lagos",
-        "rating": 4.0,
-        "cuisine": "Nigerian",
-        "specialties": ['Local Dishes'],
-        "delivery_areas": ['Oshodi-Isolo'],
-        "opening_hours": None,
-        "url": "https://chowdeck.com/store?q=Ejigbo+Kitchen",
-    },
-    {
-        "id": "okota_spot_d2bb2484",
-        "name": "Okota Spot",
-        "city": "Oshodi-Isolo",
-        "state": "Lagos",
-        "lga": "Oshodi-Isolo",
-        "location": "Oshodi-Isolo, Lagos",
-        "rating": 4.0,
-        "cuisine": "Nigerian",
-        "specialties": ['Jollof Rice'],
-        "delivery_areas": ['Oshodi-Isolo'],
-        "opening_hours": None,
-        "url": "https://chowdeck.com/store?q=Okota+Spot",
-    },
-    {
-        "id": "ijeshatedo_buka_6241e83d",
-        "name": "Ijeshatedo Buka",
-        "city": "Oshodi-Isolo",
-        "state": "Lagos",
-        "lga": "Oshodi-Isolo",
-        "location": "Oshodi-Isolo, Lagos",
-        "rating": 3.9,
-        "cuisine": "Nigerian",
-        "specialties": ['Local Dishes'],
-        "delivery_areas": ['Oshodi-Isolo'],
-        "opening_hours": None,
-        "url": "https://chowdeck.com/store?q=Ijeshatedo+Buka",
-    },
-    {
-        "id": "genesis_restaurant_74bef9cc",
-        "name": "Genesis Restaurant",
-        "city": "Amuwo-Odofin",
-        "state": "Lagos",
-        "lga": "Amuwo-Odofin",
-        "location": "Amuwo-Odofin, Lagos",
-        "rating": 4.1,
-        "cuisine": "Continental",
-        "specialties": ['Grills'],
-        "delivery_areas": ['Amuwo-Odofin'],
-        "opening_hours": None,
-        "url": "https://chowdeck.com/store?q=Genesis+Restaurant",
-    },
-    {
-        "id": "mama_put_festac_fa80200f",
-        "name": "Mama Put Festac",
-        "city": "Amuwo-Odofin",
-        "state": "Lagos",
-        "lga": "Amuwo-Odofin",
-        "location": "Amuwo-Odofin, Lagos",
-        "rating": 4.1,
-        "cuisine": "Nigerian",
-        "specialties": ['Local Dishes'],
-        "delivery_areas": ['Amuwo-Odofin'],
-        "opening_hours": None,
-        "url": "https://chowdeck.com/store?q=Mama+Put+Festac",
-    },
-    {
-        "id": "festac_food_court_274e57cb",
-        "name": "Festac Food Court",
-        "city": "Amuwo-Odofin",
-        "state": "Lagos",
-        "lga": "Amuwo-Odofin",
-        "location": "Amuwo-Odofin, Lagos",
-        "rating": 4.0,
-        "cuisine": "Various",
-        "specialties": ['Multiple'],
-        "delivery_areas": ['Amuwo-Odofin'],
-        "opening_hours": None,
-        "url": "https://chowdeck.com/store?q=Festac+Food+Court",
-    },
-    {
-        "id": "21_road_kitchen_0a63c74c",
-        "name": "21 Road Kitchen",
-        "city": "Amuwo-Odofin",
-        "state": "Lagos",
-        "lga": "Amuwo-Odofin",
-        "location": "Amuwo-Odofin, Lagos",
-        "rating": 4.0,
-        "cuisine": "Nigerian",
-        "specialties": ['Rice & Stew'],
-        "delivery_areas": ['Amuwo-Odofin'],
-        "opening_hours": None,
-        "url": "https://chowdeck.com/store?q=21+Road+Kitchen",
-    },
-    {
-        "id": "2nd_avenue_spot_6d60f490",
-        "name": "2nd Avenue Spot",
-        "city": "Amuwo-Odofin",
-        "state": "Lagos",
-        "lga": "Amuwo-Odofin",
-        "location": "Amuwo-Odofin, Lagos",
-        "rating": 4.0,
-        "cuisine": "Nigerian",
-        "specialties": ['Local Dishes'],
-        "delivery_areas": ['Amuwo-Odofin'],
-        "opening_hours": None,
-        "url": "https://chowdeck.com/store?q=2nd+Avenue+Spot",
-    },
-    {
-        "id": "amuwo_kitchen_57a43164",
-        "name": "Amuwo Kitchen",
-        "city": "Amuwo-Odofin",
-        "state": "Lagos",
-        "lga": "Amuwo-Odofin",
-        "location": "Amuwo-Odofin, Lagos",
-        "rating": 4.0,
-        "cuisine": "Nigerian",
-        "specialties": ['Jollof Rice'],
-        "delivery_areas": ['Amuwo-Odofin'],
-        "opening_hours": None,
-        "url": "https://chowdeck.com/store?q=Amuwo+Kitchen",
-    },
-    {
-        "id": "festac_link_bridge_food_d6dd39d6",
-        "name": "Festac Link Bridge Food",
-        "city": "Amuwo-Odofin",
-        "state": "Lagos",
-        "lga": "Amuwo-Odofin",
-        "location": "Amuwo-Odofin, Lagos",
-        "rating": 3.9,
-        "cuisine": "Nigerian",
-        "specialties": ['Quick Meals'],
-        "delivery_areas": ['Amuwo-Odofin'],
-        "opening_hours": None,
-        "url": "https://chowdeck.com/store?q=Festac+Link+Bridge+Food",
-    },
-    {
-        "id": "mile_2_kitchen_edeb4904",
-        "name": "Mile 2 Kitchen",
-        "city": "Amuwo-Odofin",
-        "state": "Lagos",
-        "lga": "Amuwo-Odofin",
-        "location": "Amuwo-Odofin, Lagos",
-        "rating": 3.8,
-        "cuisine": "Nigerian",
-        "specialties": ['Local Dishes'],
-        "delivery_areas": ['Amuwo-Odofin'],
-        "opening_hours": None,
-        "url": "https://chowdeck.com/store?q=Mile+2+Kitchen",
-    },
-    {
-        "id": "de_angelo_1e163b7a",
-        "name": "De Angelo",
-        "city": "Alimosho",
-        "state": "Lagos",
-        "lga": "Alimosho",
-        "location": "Alimosho, Lagos",
-        "rating": 4.1,
-        "cuisine": "Nigerian",
-        "specialties": ['Jollof Rice'],
-        "delivery_areas": ['Alimosho'],
-        "opening_hours": None,
-        "url": "https://chowdeck.com/store?q=De+Angelo",
-    },
-    {
-        "id": "egbeda_kitchen_06da92de",
-        "name": "Egbeda Kitchen",
-        "city": "Alimosho",
-        "state": "Lagos",
-        "lga": "Alimosho",
-        "location": "Alimosho, Lagos",
-        "rating": 4.0,
-        "cuisine": "Nigerian",
-        "specialties": ['Local Dishes'],
-        "delivery_areas": ['Alimosho'],
-        "opening_hours": None,
-        "url": "https://chowdeck.com/store?q=Egbeda+Kitchen",
-    },
-    {
-        "id": "ikotun_spot_86aea3cd",
-        "name": "Ikotun Spot",
-        "city": "Alimosho",
-        "state": "Lagos",
-        "lga": "Alimosho",
-        "location": "Alimosho, Lagos",
-        "rating": 3.9,
-        "cuisine": "Nigerian",
-        "specialties": ['Street Food'],
-        "delivery_areas": ['Alimosho'],
-        "opening_hours": None,
-        "url": "https://chowdeck.com/store?q=Ikotun+Spot",
-    },
-    {
-        "id": "idimu_buka_9f0151f2",
-        "name": "Idimu Buka",
-        "city": "Alimosho",
-        "state": "Lagos",
-        "lga": "Alimosho",
-        "location": "Alimosho, Lagos",
-        "rating": 4.0,
-        "cuisine": "Nigerian",
-        "specialties": ['Rice & Beans'],
-        "delivery_areas": ['Alimosho'],
-        "opening_hours": None,
-        "url": "https://chowdeck.com/store?q=Idimu+Buka",
-    },
-    {
-        "id": "ipaja_market_food_044da30d",
-        "name": "Ipaja Market Food",
-        "city": "Alimosho",
-        "state": "Lagos",
-        "lga": "Alimosho",
-        "location": "Alimosho, Lagos",
-        "rating": 3.8,
-        "cuisine": "Nigerian",
-        "specialties": ['Market Meals'],
-        "delivery_areas": ['Alimosho'],
-        "opening_hours": None,
-        "url": "https://chowdeck.com/store?q=Ipaja+Market+Food",
-    },
-    {
-        "id": "akowonjo_kitchen_4c50e549",
-        "name": "Akowonjo Kitchen",
-        "city": "Alimosho",
-        "state": "Lagos",
-        "lga": "Alimosho",
-        "location": "Alimosho, Lagos",
-        "rating": 4.0,
-        "cuisine": "Nigerian",
-        "specialties": ['Local Dishes'],
-        "delivery_areas": ['Alimosho'],
-        "opening_hours": None,
-        "url": "https://chowdeck.com/store?q=Akowonjo+Kitchen",
-    },
-    {
-        "id": "dopemu_spot_e59cdfec",
-        "name": "Dopemu Spot",
-        "city": "Alimosho",
-        "state": "Lagos",
-        "lga": "Alimosho",
-        "location": "Alimosho, Lagos",
-        "rating": 3.9,
-        "cuisine": "Nigerian",
-        "specialties": ['Quick Meals'],
-        "delivery_areas": ['Alimosho'],
-        "opening_hours": None,
-        "url": "https://chowdeck.com/store?q=Dopemu+Spot",
-    },
-    {
-        "id": "pleasure_roundabout_food_8d991945",
-        "name": "Pleasure Roundabout Food",
-        "city": "Alimosho",
-        "state": "Lagos",
-        "lga": "Alimosho",
-        "location": "Alimosho, Lagos",
-        "rating": 3.9,
-        "cuisine": "Nigerian",
-        "specialties": ['Street Food'],
-        "delivery_areas": ['Alimosho'],
-        "opening_hours": None,
-        "url": "https://chowdeck.com/store?q=Pleasure+Roundabout+Food",
-    },
-    {
-        "id": "iyana_ipaja_kitchen_82bcdd37",
-        "name": "Iyana Ipaja Kitchen",
-        "city": "Alimosho",
-        "state": "Lagos",
-        "lga": "Alimosho",
-        "location": "Alimosho, Lagos",
-        "rating": 4.0,
-        "cuisine": "Nigerian",
-        "specialties": ['Local Dishes'],
-        "delivery_areas": ['Alimosho'],
-        "opening_hours": None,
-        "url": "https://chowdeck.com/store?q=Iyana+Ipaja+Kitchen",
-    },
-    {
-        "id": "command_area_buka_856b08cf",
-        "name": "Command Area Buka",
-        "city": "Alimosho",
-        "state": "Lagos",
-        "lga": "Alimosho",
-        "location": "Alimosho, Lagos",
-        "rating": 4.0,
-        "cuisine": "Nigerian",
-        "specialties": ['Military Meals'],
-        "delivery_areas": ['Alimosho'],
-        "opening_hours": None,
-        "url": "https://chowdeck.com/store?q=Command+Area+Buka",
-    },
-    {
-        "id": "the_wharf_132069c5",
-        "name": "The Wharf",
-        "city": "Apapa",
-        "state": "Lagos",
-        "lga": "Apapa",
-        "location": "Apapa, Lagos",
-        "rating": 4.0,
-        "cuisine": "Seafood",
-        "specialties": ['Seafood'],
-        "delivery_areas": ['Apapa'],
-        "opening_hours": None,
-        "url": "https://chowdeck.com/store?q=The+Wharf",
-    },
-    {
-        "id": "apapa_port_kitchen_7506e24b",
-        "name": "Apapa Port Kitchen",
-        "city": "Apapa",
-        "state": "Lagos",
-        "lga": "Apapa",
-        "location": "Apapa, Lagos",
-        "rating": 3.9,
-        "cuisine": "Nigerian",
-        "specialties": ['Worker Meals'],
-        "delivery_areas": ['Apapa'],
-        "opening_hours": None,
-        "url": "https://chowdeck.com/store?q=Apapa+Port+Kitchen",
-    },
-    {
-        "id": "wharf_road_buka_a0faade2",
-        "name": "Wharf Road Buka",
-        "city": "Apapa",
-        "state": "Lagos",
-        "lga": "Apapa",
-        "location": "Apapa, Lagos",
-        "rating": 3.8,
-        "cuisine": "Nigerian",
-        "specialties": ['Local Dishes'],
-        "delivery_areas": ['Apapa'],
-        "opening_hours": None,
-        "url": "https://chowdeck.com/store?q=Wharf+Road+Buka",
-    },
-    {
-        "id": "marine_beach_food_ae0390a9",
-        "name": "Marine Beach Food",
-        "city": "Apapa",
-        "state": "Lagos",
-        "lga": "Apapa",
-        "location": "Apapa, Lagos",
-        "rating": 4.0,
-        "cuisine": "Seafood",
-        "specialties": ['Fresh Fish'],
-        "delivery_areas": ['Apapa'],
-        "opening_hours": None,
-        "url": "https://chowdeck.com/store?q=Marine+Beach+Food",
-    },
-    {
-        "id": "liverpool_kitchen_c35fde1b",
-        "name": "Liverpool Kitchen",
-        "city": "Apapa",
-        "state": "Lagos",
-        "lga": "Apapa",
-        "location": "Apapa, Lagos",
-        "rating": 4.0,
-        "cuisine": "Nigerian",
-        "specialties": ['Rice & Stew'],
-        "delivery_areas": ['Apapa'],
-        "opening_hours": None,
-        "url": "https://chowdeck.com/store?q=Liverpool+Kitchen",
-    },
-    {
-        "id": "mama_dee_palmgrove_78fa4f0b",
-        "name": "Mama Dee Palmgrove",
-        "city": "Somolu",
-        "state": "Lagos",
-        "lga": "Somolu",
-        "location": "Somolu, Lagos",
-        "rating": 4.0,
-        "cuisine": "Nigerian",
-        "specialties": ['Jollof Rice'],
-        "delivery_areas": ['Somolu'],
-        "opening_hours": None,
-        "url": "https://chowdeck.com/store?q=Mama+Dee+Palmgrove",
-    },
-    {
-        "id": "palmgrove_kitchen_a2285320",
-        "name": "Palmgrove Kitchen",
-        "city": "Somolu",
-        "state": "Lagos",
-        "lga": "Somolu",
-        "location": "Somolu, Lagos",
-        "rating": 4.0,
-        "cuisine": "Nigerian",
-        "specialties": ['Local Dishes'],
-        "delivery_areas": ['Somolu'],
-        "opening_hours": None,
-        "url": "https://chowdeck.com/store?q=Palmgrove+Kitchen",
-    },
-    {
-        "id": "somolu_buka_c71c65f1",
-        "name": "Somolu Buka",
-        "city": "Somolu",
-        "state": "Lagos",
-        "lga": "Somolu",
-        "location": "Somolu, Lagos",
-        "rating": 3.9,
-        "cuisine": "Nigerian",
-        "specialties": ['Street Food'],
-        "delivery_areas": ['Somolu'],
-        "opening_hours": None,
-        "url": "https://chowdeck.com/store?q=Somolu+Buka",
-    },
-    {
-        "id": "bariga_kitchen_4bd97c07",
-        "name": "Bariga Kitchen",
-        "city": "Somolu",
-        "state": "Lagos",
-        "lga": "Somolu",
-        "location": "Somolu, Lagos",
-        "rating": 3.9,
-        "cuisine": "Nigerian",
-        "specialties": ['Local Dishes'],
-        "delivery_areas": ['Somolu'],
-        "opening_hours": None,
-        "url": "https://chowdeck.com/store?q=Bariga+Kitchen",
-    },
-    {
-        "id": "shomolu_market_food_96594192",
-        "name": "Shomolu Market Food",
-        "city": "Somolu",
-        "state": "Lagos",
-        "lga": "Somolu",
-        "location": "Somolu, Lagos",
-        "rating": 3.8,
-        "cuisine": "Nigerian",
-        "specialties": ['Market Meals'],
-        "delivery_areas": ['Somolu'],
-        "opening_hours": None,
-        "url": "https://chowdeck.com/store?q=Shomolu+Market+Food",
-    },
-    {
-        "id": "mama_ronke_buka_ef108f68",
-        "name": "Mama Ronke Buka",
-        "city": "Ikeja",
-        "state": "Lagos",
-        "lga": "Ikeja",
-        "location": "Ikeja, Lagos",
-        "rating": 4.1,
-        "cuisine": "Nigerian",
-        "specialties": ['Amala'],
-        "delivery_areas": ['Ikeja'],
-        "opening_hours": None,
-        "url": "https://chowdeck.com/store?q=Mama+Ronke+Buka",
-    },
-    {
-        "id": "iya_titi_kitchen_f70856b1",
-        "name": "Iya Titi Kitchen",
-        "city": "Ikeja",
-        "state": "Lagos",
-        "lga": "Ikeja",
-        "location": "Ikeja, Lagos",
-        "rating": 4.0,
-        "cuisine": "Nigerian",
-        "specialties": ['Pounded Yam'],
-        "delivery_areas": ['Ikeja'],
-        "opening_hours": None,
-        "url": "https://chowdeck.com/store?q=Iya+Titi+Kitchen",
-    },
-    {
-        "id": "baba_sege_spot_225593d3",
-        "name": "Baba Sege Spot",
-        "city": "Ikeja",
-        "state": "Lagos",
-        "lga": "Ikeja",
-        "location": "Ikeja, Lagos",
-        "rating": 4.2,
-        "cuisine": "Nigerian",
-        "specialties": ['Pepper Soup'],
-        "delivery_areas": ['Ikeja'],
-        "opening_hours": None,
-        "url": "https://chowdeck.com/store?q=Baba+Sege+Spot",
-    },
-    {
-        "id": "iya_aduke_38ba9b29",
-        "name": "Iya Aduke",
-        "city": "Ikeja",
-        "state": "Lagos",
-        "lga": "Ikeja",
-        "location": "Ikeja, Lagos",
-        "rating": 4.0,
-        "cuisine": "Nigerian",
-        "specialties": ['Eba & Soup'],
-        "delivery_areas": ['Ikeja'],
-        "opening_hours": None,
-        "url": "https://chowdeck.com/store?q=Iya+Aduke",
-    },
-    {
-        "id": "mama_ajoke_f2ca7a1b",
-        "name": "Mama Ajoke",
-        "city": "Ikeja",
-        "state": "Lagos",
-        "lga": "Ikeja",
-        "location": "Ikeja, Lagos",
-        "rating": 4.1,
-        "cuisine": "Nigerian",
-        "specialties": ['Rice & Stew'],
-        "delivery_areas": ['Ikeja'],
-        "opening_hours": None,
-        "url": "https://chowdeck.com/store?q=Mama+Ajoke",
-    },
-    {
-        "id": "cafe_neo_ikeja_c839ee53",
-        "name": "Cafe Neo Ikeja",
-        "city": "Ikeja",
-        "state": "Lagos",
-        "lga": "Ikeja",
-        "location": "Ikeja, Lagos",
-        "rating": 4.3,
-        "cuisine": "Cafe",
-        "specialties": ['Coffee & Pastries'],
-        "delivery_areas": ['Ikeja'],
-        "opening_hours": None,
-        "url": "https://chowdeck.com/store?q=Cafe+Neo+Ikeja",
-    },
-    {
-        "id": "chocolat_royal_b8893043",
-        "name": "Chocolat Royal",
-        "city": "Ikeja",
-        "state": "Lagos",
-        "lga": "Ikeja",
-        "location": "Ikeja, Lagos",
-        "rating": 4.2,
-        "cuisine": "Bakery",
-        "specialties": ['Cakes & Pastries'],
-        "delivery_areas": ['Ikeja'],
-        "opening_hours": None,
-        "url": "https://chowdeck.com/store?q=Chocolat+Royal",
-    },
-    {
-        "id": "cupcake_factory_26c582e3",
-        "name": "CupCake Factory",
-        "city": "Ikeja",
-        "state": "Lagos",
-        "lga": "Ikeja",
-        "location": "Ikeja, Lagos",
-        "rating": 4.3,
-        "cuisine": "Bakery",
-        "specialties": ['Cupcakes'],
-        "delivery_areas": ['Ikeja'],
-        "opening_hours": None,
-        "url": "https://chowdeck.com/store?q=CupCake+Factory",
-    },
-    {
-        "id": "the_good_beach_fc6da2f5",
-        "name": "The Good Beach",
-        "city": "Ikeja",
-        "state": "Lagos",
-        "lga": "Ikeja",
-        "location": "Ikeja, Lagos",
-        "rating": 4.2,
-        "cuisine": "Cafe",
-        "specialties": ['Brunch'],
-        "delivery_areas": ['Ikeja'],
-        "opening_hours": None,
-        "url": "https://chowdeck.com/store?q=The+Good+Beach",
-    },
-    {
-        "id": "small_chops_avenue_fe78f09d",
-        "name": "Small Chops Avenue",
-        "city": "Ikeja",
-        "state": "Lagos",
-        "lga": "Ikeja",
-        "location": "Ikeja, Lagos",
-        "rating": 4.1,
-        "cuisine": "Snacks",
-        "specialties": ['Small Chops'],
-        "delivery_areas": ['Ikeja'],
-        "opening_hours": None,
-        "url": "https://chowdeck.com/store?q=Small+Chops+Avenue",
-    },
-    {
-        "id": "party_central_ikeja_32f5e4fd",
-        "name": "Party Central Ikeja",
-        "city": "Ikeja",
-        "state": "Lagos",
-        "lga": "Ikeja",
-        "location": "Ikeja, Lagos",
-        "rating": 4.0,
-        "cuisine": "Snacks",
-        "specialties": ['Party Packs'],
-        "delivery_areas": ['Ikeja'],
-        "opening_hours": None,
-        "url": "https://chowdeck.com/store?q=Party+Central+Ikeja",
-    },
-    {
-        "id": "shawarma_express_ikeja_f2b9cb42",
-        "name": "Shawarma Express Ikeja",
-        "city": "Ikeja",
-        "state": "Lagos",
-        "lga": "Ikeja",
-        "location": "Ikeja, Lagos",
-        "rating": 4.2,
-        "cuisine": "Fast Food",
-        "specialties": ['Shawarma'],
-        "delivery_areas": ['Ikeja'],
-        "opening_hours": None,
-        "url": "https://chowdeck.com/store?q=Shawarma+Express+Ikeja",
-    },
-    {
-        "id": "ewa_agoyin_spot_a8178075",
-        "name": "Ewa Agoyin Spot",
-        "city": "Ikeja",
-        "state": "Lagos",
-        "lga": "Ikeja",
-        "location": "Ikeja, Lagos",
-        "rating": 4.0,
-        "cuisine": "Nigerian",
-        "specialties": ['Beans'],
-        "delivery_areas": ['Ikeja'],
-        "opening_hours": None,
-        "url": "https://chowdeck.com/store?q=Ewa+Agoyin+Spot",
-    },
-    {
-        "id": "dodo_man_ikeja_8e343fd4",
-        "name": "Dodo Man Ikeja",
-        "city": "Ikeja",
-        "state": "Lagos",
-        "lga": "Ikeja",
-        "location": "Ikeja, Lagos",
-        "rating": 3.9,
-        "cuisine": "Nigerian",
-        "specialties": ['Plantain'],
-        "delivery_areas": ['Ikeja'],
-        "opening_hours": None,
-        "url": "https://chowdeck.com/store?q=Dodo+Man+Ikeja",
-    },
-    {
-        "id": "agege_bread_spot_e5608612",
-        "name": "Agege Bread Spot",
-        "city": "Ikeja",
-        "state": "Lagos",
-        "lga": "Ikeja",
-        "location": "Ikeja, Lagos",
-        "rating": 4.0,
-        "cuisine": "Bakery",
-        "specialties": ['Bread'],
-        "delivery_areas": ['Ikeja'],
-        "opening_hours": None,
-        "url": "https://chowdeck.com/store?q=Agege+Bread+Spot",
-    },
-    {
-        "id": "sailor_s_lounge_3e3b2a28",
-        "name": "Sailor's Lounge",
-        "city": "Eti-Osa",
-        "state": "Lagos",
-        "lga": "Eti-Osa",
-        "location": "Eti-Osa, Lagos",
-        "rating": 4.5,
-        "cuisine": "Continental",
-        "specialties": ['Fine Dining'],
-        "delivery_areas": ['Eti-Osa'],
-        "opening_hours": None,
-        "url": "https://chowdeck.com/store?q=Sailor's+Lounge",
-    },
-    {
-        "id": "lagoon_restaurant_93390b80",
-        "name": "Lagoon Restaurant",
-        "city": "Eti-Osa",
-        "state": "Lagos",
-        "lga": "Eti-Osa",
-        "location": "Eti-Osa, Lagos",
-        "rating": 4.4,
-        "cuisine": "Seafood",
-        "specialties": ['Seafood'],
-        "delivery_areas": ['Eti-Osa'],
-        "opening_hours": None,
-        "url": "https://chowdeck.com/store?q=Lagoon+Restaurant",
-    },
-    {
-        "id": "orchid_hotel_restaurant_cc7e0006",
-        "name": "Orchid Hotel Restaurant",
-        "city": "Eti-Osa",
-        "state": "Lagos",
-        "lga": "Eti-Osa",
-        "location": "Eti-Osa, Lagos",
-        "rating": 4.3,
-        "cuisine": "Continental",
-        "specialties": ['International'],
-        "delivery_areas": ['Eti-Osa'],
-        "opening_hours": None,
-        "url": "https://chowdeck.com/store?q=Orchid+Hotel+Restaurant",
-    },
-    {
-        "id": "cafe_neo_lekki_c8031a1b",
-        "name": "Cafe Neo Lekki",
-        "city": "Eti-Osa",
-        "state": "Lagos",
-        "lga": "Eti-Osa",
-        "location": "Eti-Osa, Lagos",
-        "rating": 4.3,
-        "cuisine": "Cafe",
-        "specialties": ['Coffee'],
-        "delivery_areas": ['Eti-Osa'],
-        "opening_hours": None,
-        "url": "https://chowdeck.com/store?q=Cafe+Neo+Lekki",
-    },
-    {
-        "id": "rsvp_lagos_d71d0cde",
-        "name": "RSVP Lagos",
-        "city": "Eti-Osa",
-        "state": "Lagos",
-        "lga": "Eti-Osa",
-        "location": "Eti-Osa, Lagos",
-        "rating": 4.4,
-        "cuisine": "Cafe",
-        "specialties": ['Brunch'],
-        "delivery_areas": ['Eti-Osa'],
-        "opening_hours": None,
-        "url": "https://chowdeck.com/store?q=RSVP+Lagos",
-    },
-    {
-        "id": "the_harvest_c3386120",
-        "name": "The Harvest",
-        "city": "Eti-Osa",
-        "state": "Lagos",
-        "lga": "Eti-Osa",
-        "location": "Eti-Osa, Lagos",
-        "rating": 4.3,
-        "cuisine": "Cafe",
-        "specialties": ['Healthy Food'],
-        "delivery_areas": ['Eti-Osa'],
-        "opening_hours": None,
-        "url": "https://chowdeck.com/store?q=The+Harvest",
-    },
-    {
-        "id": "maison_fahrenheit_7aea7c38",
-        "name": "Maison Fahrenheit",
-        "city": "Eti-Osa",
-        "state": "Lagos",
-        "lga": "Eti-Osa",
-        "location": "Eti-Osa, Lagos",
-        "rating": 4.4,
-        "cuisine": "Bakery",
-        "specialties": ['Pastries'],
-        "delivery_areas": ['Eti-Osa'],
-        "opening_hours": None,
-        "url": "https://chowdeck.com/store?q=Maison+Fahrenheit",
-    },
-    {
-        "id": "lekki_small_chops_459dfe08",
-        "name": "Lekki Small Chops",
-        "city": "Eti-Osa",
-        "state": "Lagos",
-        "lga": "Eti-Osa",
-        "location": "Eti-Osa, Lagos",
-        "rating": 4.2,
-        "cuisine": "Snacks",
-        "specialties": ['Small Chops'],
-        "delivery_areas": ['Eti-Osa'],
-        "opening_hours": None,
-        "url": "https://chowdeck.com/store?q=Lekki+Small+Chops",
-    },
-    {
-        "id": "shawarma_spot_lekki_1711060f",
-        "name": "Shawarma Spot Lekki",
-        "city": "Eti-Osa",
-        "state": "Lagos",
-        "lga": "Eti-Osa",
-        "location": "Eti-Osa, Lagos",
-        "rating": 4.2,
-        "cuisine": "Fast Food",
-        "specialties": ['Shawarma'],
-        "delivery_areas": ['Eti-Osa'],
-        "opening_hours": None,
-        "url": "https://chowdeck.com/store?q=Shawarma+Spot+Lekki",
-    },
-    {
-        "id": "arabic_kitchen_vi_ebb2eeb3",
-        "name": "Arabic Kitchen VI",
-        "city": "Eti-Osa",
-        "state": "Lagos",
-        "lga": "Eti-Osa",
-        "location": "Eti-Osa, Lagos",
-        "rating": 4.1,
-        "cuisine": "Middle Eastern",
-        "specialties": ['Shawarma'],
-        "delivery_areas": ['Eti-Osa'],
-        "opening_hours": None,
-        "url": "https://chowdeck.com/store?q=Arabic+Kitchen+VI",
-    },
-    {
-        "id": "zen_garden_4a97b616",
-        "name": "Zen Garden",
-        "city": "Eti-Osa",
-        "state": "Lagos",
-        "lga": "Eti-Osa",
-        "location": "Eti-Osa, Lagos",
-        "rating": 4.4,
-        "cuisine": "Asian",
-        "specialties": ['Japanese'],
-        "delivery_areas": ['Eti-Osa'],
-        "opening_hours": None,
-        "url": "https://chowdeck.com/store?q=Zen+Garden",
-    },
-    {
-        "id": "dynasty_chinese_28472ee7",
-        "name": "Dynasty Chinese",
-        "city": "Eti-Osa",
-        "state": "Lagos",
-        "lga": "Eti-Osa",
-        "location": "Eti-Osa, Lagos",
-        "rating": 4.2,
-        "cuisine": "Chinese",
-        "specialties": ['Chinese Food'],
-        "delivery_areas": ['Eti-Osa'],
-        "opening_hours": None,
-        "url": "https://chowdeck.com/store?q=Dynasty+Chinese",
-    },
-    {
-        "id": "lekki_market_food_10d89a9d",
-        "name": "Lekki Market Food",
-        "city": "Eti-Osa",
-        "state": "Lagos",
-        "lga": "Eti-Osa",
-        "location": "Eti-Osa, Lagos",
-        "rating": 3.9,
-        "cuisine": "Nigerian",
-        "specialties": ['Local Dishes'],
-        "delivery_areas": ['Eti-Osa'],
-        "opening_hours": None,
-        "url": "https://chowdeck.com/store?q=Lekki+Market+Food",
-    },
-    {
-        "id": "mama_lekan_vi_ec8fbc4d",
-        "name": "Mama Lekan VI",
-        "city": "Eti-Osa",
-        "state": "Lagos",
-        "lga": "Eti-Osa",
-        "location": "Eti-Osa, Lagos",
-        "rating": 4.1,
-        "cuisine": "Nigerian",
-        "specialties": ['Jollof Rice'],
-        "delivery_areas": ['Eti-Osa'],
-        "opening_hours": None,
-        "url": "https://chowdeck.com/store?q=Mama+Lekan+VI",
-    },
-    {
-        "id": "iya_alata_ajah_e3a5fc3c",
-        "name": "Iya Alata Ajah",
-        "city": "Eti-Osa",
-        "state": "Lagos",
-        "lga": "Eti-Osa",
-        "location": "Eti-Osa, Lagos",
-        "rating": 4.0,
-        "cuisine": "Nigerian",
-        "specialties": ['Pepper Soup'],
-        "delivery_areas": ['Eti-Osa'],
-        "opening_hours": None,
-        "url": "https://chowdeck.com/store?q=Iya+Alata+Ajah",
-    },
-    {
-        "id": "unilag_buka_1_b08a9bca",
-        "name": "Unilag Buka 1",
-        "city": "Lagos Mainland",
-        "state": "Lagos",
-        "lga": "Lagos Mainland",
-        "location": "Lagos Mainland, Lagos",
-        "rating": 3.9,
-        "cuisine": "Nigerian",
-        "specialties": ['Student Meals'],
-        "delivery_areas": ['Lagos Mainland'],
-        "opening_hours": None,
-        "url": "https://chowdeck.com/store?q=Unilag+Buka+1",
-    },
-    {
-        "id": "unilag_buka_2_260cd14f",
-        "name": "Unilag Buka 2",
-        "city": "Lagos Mainland",
-        "state": "Lagos",
-        "lga": "Lagos Mainland",
-        "location": "Lagos Mainland, Lagos",
-        "rating": 3.9,
-        "cuisine": "Nigerian",
-        "specialties": ['Rice & Beans'],
-        "delivery_areas": ['Lagos Mainland'],
-        "opening_hours": None,
-        "url": "https://chowdeck.com/store?q=Unilag+Buka+2",
-    },
-    {
-        "id": "akoka_mama_put_8bd4238d",
-        "name": "Akoka Mama Put",
-        "city": "Lagos Mainland",
-        "state": "Lagos",
-        "lga": "Lagos Mainland",
-        "location": "Lagos Mainland, Lagos",
-        "rating": 3.8,
-        "cuisine": "Nigerian",
-        "specialties": ['Quick Meals'],
-        "delivery_areas": ['Lagos Mainland'],
-        "opening_hours": None,
-        "url": "https://chowdeck.com/store?q=Akoka+Mama+Put",
-    },
-    {
-        "id": "yaba_tech_kitchen_cd1fc73d",
-        "name": "Yaba Tech Kitchen",
-        "city": "Lagos Mainland",
-        "state": "Lagos",
-        "lga": "Lagos Mainland",
-        "location": "Lagos Mainland, Lagos",
-        "rating": 3.9,
-        "cuisine": "Nigerian",
-        "specialties": ['Campus Food'],
-        "delivery_areas": ['Lagos Mainland'],
-        "opening_hours": None,
-        "url": "https://chowdeck.com/store?q=Yaba+Tech+Kitchen",
-    },
-    {
-        "id": "cafe_neo_yaba_11d6f52d",
-        "name": "Cafe Neo Yaba",
-        "city": "Lagos Mainland",
-        "state": "Lagos",
-        "lga": "Lagos Mainland",
-        "location": "Lagos Mainland, Lagos",
-        "rating": 4.2,
-        "cuisine": "Cafe",
-        "specialties": ['Coffee'],
-        "delivery_areas": ['Lagos Mainland'],
-        "opening_hours": None,
-        "url": "https://chowdeck.com/store?q=Cafe+Neo+Yaba",
-    },
-    {
-        "id": "sabo_suya_man_b719a681",
-        "name": "Sabo Suya Man",
-        "city": "Lagos Mainland",
-        "state": "Lagos",
-        "lga": "Lagos Mainland",
-        "location": "Lagos Mainland, Lagos",
-        "rating": 4.1,
-        "cuisine": "Nigerian",
-        "specialties": ['Suya'],
-        "delivery_areas": ['Lagos Mainland'],
-        "opening_hours": None,
-        "url": "https://chowdeck.com/store?q=Sabo+Suya+Man",
-    },
-    {
-        "id": "iya_basira_yaba_af69a80f",
-        "name": "Iya Basira Yaba",
-        "city": "Lagos Mainland",
-        "state": "Lagos",
-        "lga": "Lagos Mainland",
-        "location": "Lagos Mainland, Lagos",
-        "rating": 4.2,
-        "cuisine": "Nigerian",
-        "specialties": ['Amala'],
-        "delivery_areas": ['Lagos Mainland'],
-        "opening_hours": None,
-        "url": "https://chowdeck.com/store?q=Iya+Basira+Yaba",
-    },
-    {
-        "id": "mama_caro_2e834567",
-        "name": "Mama Caro",
-        "city": "Lagos Mainland",
-        "state": "Lagos",
-        "lga": "Lagos Mainland",
-        "location": "Lagos Mainland, Lagos",
-        "rating": 4.0,
-        "cuisine": "Nigerian",
-        "specialties": ['Eba & Soup'],
-        "delivery_areas": ['Lagos Mainland'],
-        "opening_hours": None,
-        "url": "https://chowdeck.com/store?q=Mama+Caro",
-    },
-    {
-        "id": "fadeyi_buka_45c5ba05",
-        "name": "Fadeyi Buka",
-        "city": "Lagos Mainland",
-        "state": "Lagos",
-        "lga": "Lagos Mainland",
-        "location": "Lagos Mainland, Lagos",
-        "rating": 4.0,
-        "cuisine": "Nigerian",
-        "specialties": ['Local Dishes'],
-        "delivery_areas": ['Lagos Mainland'],
-        "opening_hours": None,
-        "url": "https://chowdeck.com/store?q=Fadeyi+Buka",
-    },
-    {
-        "id": "mama_chichi_7c392163",
-        "name": "Mama Chichi",
-        "city": "Surulere",
-        "state": "Lagos",
-        "lga": "Surulere",
-        "location": "Surulere, Lagos",
-        "rating": 4.1,
-        "cuisine": "Nigerian",
-        "specialties": ['Jollof Rice'],
-        "delivery_areas": ['Surulere'],
-        "opening_hours": None,
-        "url": "https://chowdeck.com/store?q=Mama+Chichi",
-    },
-    {
-        "id": "iya_risi_262f6a4b",
-        "name": "Iya Risi",
-        "city": "Surulere",
-        "state": "Lagos",
-        "lga": "Surulere",
-        "location": "Surulere, Lagos",
-        "rating": 4.0,
-        "cuisine": "Nigerian",
-        "specialties": ['Rice Dishes'],
-        "delivery_areas": ['Surulere'],
-        "opening_hours": None,
-        "url": "https://chowdeck.com/store?q=Iya+Risi",
-    },
-    {
-        "id": "stadium_food_court_70d3a210",
-        "name": "Stadium Food Court",
-        "city": "Surulere",
-        "state": "Lagos",
-        "lga": "Surulere",
-        "location": "Surulere, Lagos",
-        "rating": 4.0,
-        "cuisine": "Various",
-        "specialties": ['Multiple'],
-        "delivery_areas": ['Surulere'],
-        "opening_hours": None,
-        "url": "https://chowdeck.com/store?q=Stadium+Food+Court",
-    },
-    {
-        "id": "cafe_neo_surulere_bb1f967f",
-        "name": "Cafe Neo Surulere",
-        "city": "Surulere",
-        "state": "Lagos",
-        "lga": "Surulere",
-        "location": "Surulere, Lagos",
-        "rating": 4.2,
-        "cuisine": "Cafe",
-        "specialties": ['Coffee'],
-        "delivery_areas": ['Surulere'],
-        "opening_hours": None,
-        "url": "https://chowdeck.com/store?q=Cafe+Neo+Surulere",
-    },
-    {
-        "id": "bode_thomas_shawarma_7c47426a",
-        "name": "Bode Thomas Shawarma",
-        "city": "Surulere",
-        "state": "Lagos",
-        "lga": "Surulere",
-        "location": "Surulere, Lagos",
-        "rating": 4.1,
-        "cuisine": "Fast Food",
-        "specialties": ['Shawarma'],
-        "delivery_areas": ['Surulere'],
-        "opening_hours": None,
-        "url": "https://chowdeck.com/store?q=Bode+Thomas+Shawarma",
-    },
-    {
-        "id": "shitta_buka_878dd207",
-        "name": "Shitta Buka",
-        "city": "Surulere",
-        "state": "Lagos",
-        "lga": "Surulere",
-        "location": "Surulere, Lagos",
-        "rating": 4.0,
-        "cuisine": "Nigerian",
-        "specialties": ['Local Dishes'],
-        "delivery_areas": ['Surulere'],
-        "opening_hours": None,
-        "url": "https://chowdeck.com/store?q=Shitta+Buka",
-    },
-    {
-        "id": "tejuosho_spot_f207ec81",
-        "name": "Tejuosho Spot",
-        "city": "Surulere",
-        "state": "Lagos",
-        "lga": "Surulere",
-        "location": "Surulere, Lagos",
-        "rating": 3.8,
-        "cuisine": "Nigerian",
-        "specialties": ['Market Food'],
-        "delivery_areas": ['Surulere'],
-        "opening_hours": None,
-        "url": "https://chowdeck.com/store?q=Tejuosho+Spot",
-    },
-    {
-        "id": "gbagada_mama_put_92e4ca2b",
-        "name": "Gbagada Mama Put",
-        "city": "Kosofe",
-        "state": "Lagos",
-        "lga": "Kosofe",
-        "location": "Kosofe, Lagos",
-        "rating": 4.0,
-        "cuisine": "Nigerian",
-        "specialties": ['Local Dishes'],
-        "delivery_areas": ['Kosofe'],
-        "opening_hours": None,
-        "url": "https://chowdeck.com/store?q=Gbagada+Mama+Put",
-    },
-    {
-        "id": "maryland_shawarma_f561e664",
-        "name": "Maryland Shawarma",
-        "city": "Kosofe",
-        "state": "Lagos",
-        "lga": "Kosofe",
-        "location": "Kosofe, Lagos",
-        "rating": 4.1,
-        "cuisine": "Fast Food",
-        "specialties": ['Shawarma'],
-        "delivery_areas": ['Kosofe'],
-        "opening_hours": None,
-        "url": "https://chowdeck.com/store?q=Maryland+Shawarma",
-    },
-    {
-        "id": "ogudu_small_chops_eb771ce0",
-        "name": "Ogudu Small Chops",
-        "city": "Kosofe",
-        "state": "Lagos",
-        "lga": "Kosofe",
-        "location": "Kosofe, Lagos",
-        "rating": 4.0,
-        "cuisine": "Snacks",
-        "specialties": ['Small Chops'],
-        "delivery_areas": ['Kosofe'],
-        "opening_hours": None,
-        "url": "https://chowdeck.com/store?q=Ogudu+Small+Chops",
-    },
-    {
-        "id": "iya_kudi_ketu_5134730e",
-        "name": "Iya Kudi Ketu",
-        "city": "Kosofe",
-        "state": "Lagos",
-        "lga": "Kosofe",
-        "location": "Kosofe, Lagos",
-        "rating": 4.1,
-        "cuisine": "Nigerian",
-        "specialties": ['Amala'],
-        "delivery_areas": ['Kosofe'],
-        "opening_hours": None,
-        "url": "https://chowdeck.com/store?q=Iya+Kudi+Ketu",
-    },
-    {
-        "id": "anthony_suya_spot_c1bc6666",
-        "name": "Anthony Suya Spot",
-        "city": "Kosofe",
-        "state": "Lagos",
-        "lga": "Kosofe",
-        "location": "Kosofe, Lagos",
-        "rating": 4.2,
-        "cuisine": "Nigerian",
-        "specialties": ['Suya'],
-        "delivery_areas": ['Kosofe'],
-        "opening_hours": None,
-        "url": "https://chowdeck.com/store?q=Anthony+Suya+Spot",
-    },
-    {
-        "id": "ketu_buka_1c490a2a",
-        "name": "Ketu Buka",
-        "city": "Kosofe",
-        "state": "Lagos",
-        "lga": "Kosofe",
-        "location": "Kosofe, Lagos",
-        "rating": 3.9,
-        "cuisine": "Nigerian",
-        "specialties": ['Rice & Beans'],
-        "delivery_areas": ['Kosofe'],
-        "opening_hours": None,
-        "url": "https://chowdeck.com/store?q=Ketu+Buka",
-    },
-    {
-        "id": "oshodi_mama_put_1_5091eb1c",
-        "name": "Oshodi Mama Put 1",
-        "city": "Oshodi-Isolo",
-        "state": "Lagos",
-        "lga": "Oshodi-Isolo",
-        "location": "Oshodi-Isolo, Lagos",
-        "rating": 3.8,
-        "cuisine": "Nigerian",
-        "specialties": ['Quick Meals'],
-        "delivery_areas": ['Oshodi-Isolo'],
-        "opening_hours": None,
-        "url": "https://chowdeck.com/store?q=Oshodi+Mama+Put+1",
-    },
-    {
-        "id": "oshodi_mama_put_2_102161ad",
-        "name": "Oshodi Mama Put 2",
-        "city": "Oshodi-Isolo",
-        "state": "Lagos",
-        "lga": "Oshodi-Isolo",
-        "location": "Oshodi-Isolo, Lagos",
-        "rating": 3.8,
-        "cuisine": "Nigerian",
-        "specialties": ['Fast Food'],
-        "delivery_areas": ['Oshodi-Isolo'],
-        "opening_hours": None,
-        "url": "https://chowdeck.com/store?q=Oshodi+Mama+Put+2",
-    },
-    {
-        "id": "isolo_suya_joint_88e0ee4a",
-        "name": "Isolo Suya Joint",
-        "city": "Oshodi-Isolo",
-        "state": "Lagos",
-        "lga": "Oshodi-Isolo",
-        "location": "Oshodi-Isolo, Lagos",
-        "rating": 4.0,
-        "cuisine": "Nigerian",
-        "specialties": ['Suya'],
-        "delivery_areas": ['Oshodi-Isolo'],
-        "opening_hours": None,
-        "url": "https://chowdeck.com/store?q=Isolo+Suya+Joint",
-    },
-    {
-        "id": "mafoluku_shawarma_ce6b7aa8",
-        "name": "Mafoluku Shawarma",
-        "city": "Oshodi-Isolo",
-        "state": "Lagos",
-        "lga": "Oshodi-Isolo",
-        "location": "Oshodi-Isolo, Lagos",
-        "rating": 3.9,
-        "cuisine": "Fast Food",
-        "specialties": ['Shawarma'],
-        "delivery_areas": ['Oshodi-Isolo'],
-        "opening_hours": None,
-        "url": "https://chowdeck.com/store?q=Mafoluku+Shawarma",
-    },
-    {
-        "id": "ejigbo_buka_b7fa0ad5",
-        "name": "Ejigbo Buka",
-        "city": "Oshodi-Isolo",
-        "state": "Lagos",
-        "lga": "Oshodi-Isolo",
-        "location": "Oshodi-Isolo, Lagos",
-        "rating": 4.0,
-        "cuisine": "Nigerian",
-        "specialties": ['Local Dishes'],
-        "delivery_areas": ['Oshodi-Isolo'],
-        "opening_hours": None,
-        "url": "https://chowdeck.com/store?q=Ejigbo+Buka",
-    },
-    {
-        "id": "festac_mama_put_1_56bf330e",
-        "name": "Festac Mama Put 1",
-        "city": "Amuwo-Odofin",
-        "state": "Lagos",
-        "lga": "Amuwo-Odofin",
-        "location": "Amuwo-Odofin, Lagos",
-        "rating": 4.0,
-        "cuisine": "Nigerian",
-        "specialties": ['Local Dishes'],
-        "delivery_areas": ['Amuwo-Odofin'],
-        "opening_hours": None,
-        "url": "https://chowdeck.com/store?q=Festac+Mama+Put+1",
-    },
-    {
-        "id": "festac_mama_put_2_c195d7c9",
-        "name": "Festac Mama Put 2",
-        "city": "Amuwo-Odofin",
-        "state": "Lagos",
-        "lga": "Amuwo-Odofin",
-        "location": "Amuwo-Odofin, Lagos",
-        "rating": 4.0,
-        "cuisine": "Nigerian",
-        "specialties": ['Rice & Stew'],
-        "delivery_areas": ['Amuwo-Odofin'],
-        "opening_hours": None,
-        "url": "https://chowdeck.com/store?q=Festac+Mama+Put+2",
-    },
-    {
-        "id": "21_road_suya_bd12ad9f",
-        "name": "21 Road Suya",
-        "city": "Amuwo-Odofin",
-        "state": "Lagos",
-        "lga": "Amuwo-Odofin",
-        "location": "Amuwo-Odofin, Lagos",
-        "rating": 4.1,
-        "cuisine": "Nigerian",
-        "specialties": ['Suya'],
-        "delivery_areas": ['Amuwo-Odofin'],
-        "opening_hours": None,
-        "url": "https://chowdeck.com/store?q=21+Road+Suya",
-    },
-    {
-        "id": "amuwo_shawarma_cc89b19a",
-        "name": "Amuwo Shawarma",
-        "city": "Amuwo-Odofin",
-        "state": "Lagos",
-        "lga": "Amuwo-Odofin",
-        "location": "Amuwo-Odofin, Lagos",
-        "rating": 4.0,
-        "cuisine": "Fast Food",
-        "specialties": ['Shawarma'],
-        "delivery_areas": ['Amuwo-Odofin'],
-        "opening_hours": None,
-        "url": "https://chowdeck.com/store?q=Amuwo+Shawarma",
-    },
-    {
-        "id": "egbeda_mama_put_329c9646",
-        "name": "Egbeda Mama Put",
-        "city": "Alimosho",
-        "state": "Lagos",
-        "lga": "Alimosho",
-        "location": "Alimosho, Lagos",
-        "rating": 4.0,
-        "cuisine": "Nigerian",
-        "specialties": ['Local Dishes'],
-        "delivery_areas": ['Alimosho'],
-        "opening_hours": None,
-        "url": "https://chowdeck.com/store?q=Egbeda+Mama+Put",
-    },
-    {
-        "id": "ikotun_buka_1_7c1563f6",
-        "name": "Ikotun Buka 1",
-        "city": "Alimosho",
-        "state": "Lagos",
-        "lga": "Alimosho",
-        "location": "Alimosho, Lagos",
-        "rating": 3.9,
-        "cuisine": "Nigerian",
-        "specialties": ['Rice & Beans'],
-        "delivery_areas": ['Alimosho'],
-        "opening_hours": None,
-        "url": "https://chowdeck.com/store?q=Ikotun+Buka+1",
-    },
-    {
-        "id": "ikotun_buka_2_8f5f3035",
-        "name": "Ikotun Buka 2",
-        "city": "Alimosho",
-        "state": "Lagos",
-        "lga": "Alimosho",
-        "location": "Alimosho, Lagos",
-        "rating": 3.9,
-        "cuisine": "Nigerian",
-        "specialties": ['Eba & Soup'],
-        "delivery_areas": ['Alimosho'],
-        "opening_hours": None,
-        "url": "https://chowdeck.com/store?q=Ikotun+Buka+2",
-    },
-    {
-        "id": "idimu_kitchen_e6c00a8a",
-        "name": "Idimu Kitchen",
-        "city": "Alimosho",
-        "state": "Lagos",
-        "lga": "Alimosho",
-        "location": "Alimosho, Lagos",
-        "rating": 4.0,
-        "cuisine": "Nigerian",
-        "specialties": ['Local Dishes'],
-        "delivery_areas": ['Alimosho'],
-        "opening_hours": None,
-        "url": "https://chowdeck.com/store?q=Idimu+Kitchen",
-    },
-    {
-        "id": "ipaja_suya_man_0d1a9c35",
-        "name": "Ipaja Suya Man",
-        "city": "Alimosho",
-        "state": "Lagos",
-        "lga": "Alimosho",
-        "location": "Alimosho, Lagos",
-        "rating": 4.0,
-        "cuisine": "Nigerian",
-        "specialties": ['Suya'],
-        "delivery_areas": ['Alimosho'],
-        "opening_hours": None,
-        "url": "https://chowdeck.com/store?q=Ipaja+Suya+Man",
-    },
-    {
-        "id": "akowonjo_spot_e63289d5",
-        "name": "Akowonjo Spot",
-        "city": "Alimosho",
-        "state": "Lagos",
-        "lga": "Alimosho",
-        "location": "Alimosho, Lagos",
-        "rating": 3.9,
-        "cuisine": "Nigerian",
-        "specialties": ['Quick Meals'],
-        "delivery_areas": ['Alimosho'],
-        "opening_hours": None,
-        "url": "https://chowdeck.com/store?q=Akowonjo+Spot",
-    },
-    {
-        "id": "apapa_mama_put_c7ce4cbe",
-        "name": "Apapa Mama Put",
-        "city": "Apapa",
-        "state": "Lagos",
-        "lga": "Apapa",
-        "location": "Apapa, Lagos",
-        "rating": 3.9,
-        "cuisine": "Nigerian",
-        "specialties": ['Worker Meals'],
-        "delivery_areas": ['Apapa'],
-        "opening_hours": None,
-        "url": "https://chowdeck.com/store?q=Apapa+Mama+Put",
-    },
-    {
-        "id": "wharf_kitchen_a5a3fb3e",
-        "name": "Wharf Kitchen",
-        "city": "Apapa",
-        "state": "Lagos",
-        "lga": "Apapa",
-        "location": "Apapa, Lagos",
-        "rating": 4.0,
-        "cuisine": "Nigerian",
-        "specialties": ['Rice & Stew'],
-        "delivery_areas": ['Apapa'],
-        "opening_hours": None,
-        "url": "https://chowdeck.com/store?q=Wharf+Kitchen",
-    },
-    {
-        "id": "port_buka_c0eec378",
-        "name": "Port Buka",
-        "city": "Apapa",
-        "state": "Lagos",
-        "lga": "Apapa",
-        "location": "Apapa, Lagos",
-        "rating": 3.8,
-        "cuisine": "Nigerian",
-        "specialties": ['Local Dishes'],
-        "delivery_areas": ['Apapa'],
-        "opening_hours": None,
-        "url": "https://chowdeck.com/store?q=Port+Buka",
-    },
-    {
-        "id": "bariga_mama_put_4afa2a2d",
-        "name": "Bariga Mama Put",
-        "city": "Somolu",
-        "state": "Lagos",
-        "lga": "Somolu",
-        "location": "Somolu, Lagos",
-        "rating": 3.9,
-        "cuisine": "Nigerian",
-        "specialties": ['Local Dishes'],
-        "delivery_areas": ['Somolu'],
-        "opening_hours": None,
-        "url": "https://chowdeck.com/store?q=Bariga+Mama+Put",
-    },
-    {
-        "id": "palmgrove_buka_0b437527",
-        "name": "Palmgrove Buka",
-        "city": "Somolu",
-        "state": "Lagos",
-        "lga": "Somolu",
-        "location": "Somolu, Lagos",
-        "rating": 4.0,
-        "cuisine": "Nigerian",
-        "specialties": ['Rice & Beans'],
-        "delivery_areas": ['Somolu'],
-        "opening_hours": None,
-        "url": "https://chowdeck.com/store?q=Palmgrove+Buka",
-    },
-    {
-        "id": "somolu_suya_spot_81c8dc08",
-        "name": "Somolu Suya Spot",
-        "city": "Somolu",
-        "state": "Lagos",
-        "lga": "Somolu",
-        "location": "Somolu, Lagos",
-        "rating": 4.0,
-        "cuisine": "Nigerian",
-        "specialties": ['Suya'],
-        "delivery_areas": ['Somolu'],
-        "opening_hours": None,
-        "url": "https://chowdeck.com/store?q=Somolu+Suya+Spot",
-    },
-    {
-        "id": "mama_put_ikeja_1_cc6f3860",
-        "name": "Mama Put Ikeja 1",
-        "city": "Ikeja",
-        "state": "Lagos",
-        "lga": "Ikeja",
-        "location": "Ikeja, Lagos",
-        "rating": 3.9,
-        "cuisine": "Nigerian",
-        "specialties": ['Local Dishes'],
-        "delivery_areas": ['Ikeja'],
-        "opening_hours": None,
-        "url": "https://chowdeck.com/store?q=Mama+Put+Ikeja+1",
-    },
-    {
-        "id": "mama_put_ikeja_2_40f4aea6",
-        "name": "Mama Put Ikeja 2",
-        "city": "Ikeja",
-        "state": "Lagos",
-        "lga": "Ikeja",
-        "location": "Ikeja, Lagos",
-        "rating": 4.0,
-        "cuisine": "Nigerian",
-        "specialties": ['Local Dishes'],
-        "delivery_areas": ['Ikeja'],
-        "opening_hours": None,
-        "url": "https://chowdeck.com/store?q=Mama+Put+Ikeja+2",
-    },
-    {
-        "id": "mama_put_ikeja_3_31a18ebc",
-        "name": "Mama Put Ikeja 3",
-        "city": "Ikeja",
-        "state": "Lagos",
-        "lga": "Ikeja",
-        "location": "Ikeja, Lagos",
-        "rating": 4.1,
-        "cuisine": "Nigerian",
-        "specialties": ['Local Dishes'],
-        "delivery_areas": ['Ikeja'],
-        "opening_hours": None,
-        "url": "https://chowdeck.com/store?q=Mama+Put+Ikeja+3",
-    },
-    {
-        "id": "mama_put_ikeja_4_c1292db2",
-        "name": "Mama Put Ikeja 4",
-        "city": "Ikeja",
-        "state": "Lagos",
-        "lga": "Ikeja",
-        "location": "Ikeja, Lagos",
-        "rating": 4.2,
-        "cuisine": "Nigerian",
-        "specialties": ['Local Dishes'],
-        "delivery_areas": ['Ikeja'],
-        "opening_hours": None,
-        "url": "https://chowdeck.com/store?q=Mama+Put+Ikeja+4",
-    },
-    {
-        "id": "mama_put_ikeja_5_fb36b8c9",
-        "name": "Mama Put Ikeja 5",
-        "city": "Ikeja",
-        "state": "Lagos",
-        "lga": "Ikeja",
-        "location": "Ikeja, Lagos",
-        "rating": 3.8,
-        "cuisine": "Nigerian",
-        "specialties": ['Local Dishes'],
-        "delivery_areas": ['Ikeja'],
-        "opening_hours": None,
-        "url": "https://chowdeck.com/store?q=Mama+Put+Ikeja+5",
-    },
-    {
-        "id": "mama_put_ikeja_6_7591c3a8",
-        "name": "Mama Put Ikeja 6",
-        "city": "Ikeja",
-        "state": "Lagos",
-        "lga": "Ikeja",
-        "location": "Ikeja, Lagos",
-        "rating": 3.9,
-        "cuisine": "Nigerian",
-        "specialties": ['Local Dishes'],
-        "delivery_areas": ['Ikeja'],
-        "opening_hours": None,
-        "url": "https://chowdeck.com/store?q=Mama+Put+Ikeja+6",
-    },
-    {
-        "id": "mama_put_ikeja_7_6d1d58cd",
-        "name": "Mama Put Ikeja 7",
-        "city": "Ikeja",
-        "state": "Lagos",
-        "lga": "Ikeja",
-        "location": "Ikeja, Lagos",
-        "rating": 4.0,
-        "cuisine": "Nigerian",
-        "specialties": ['Local Dishes'],
-        "delivery_areas": ['Ikeja'],
-        "opening_hours": None,
-        "url": "https://chowdeck.com/store?q=Mama+Put+Ikeja+7",
-    },
-    {
-        "id": "mama_put_ikeja_8_404bbffa",
-        "name": "Mama Put Ikeja 8",
-        "city": "Ikeja",
-        "state": "Lagos",
-        "lga": "Ikeja",
-        "location": "Ikeja, Lagos",
-        "rating": 4.1,
-        "cuisine": "Nigerian",
-        "specialties": ['Local Dishes'],
-        "delivery_areas": ['Ikeja'],
-        "opening_hours": None,
-        "url": "https://chowdeck.com/store?q=Mama+Put+Ikeja+8",
-    },
-    {
-        "id": "mama_put_ikeja_9_7b21c71d",
-        "name": "Mama Put Ikeja 9",
-        "city": "Ikeja",
-        "state": "Lagos",
-        "lga": "Ikeja",
-        "location": "Ikeja, Lagos",
-        "rating": 4.2,
-        "cuisine": "Nigerian",
-        "specialties": ['Local Dishes'],
-        "delivery_areas": ['Ikeja'],
-        "opening_hours": None,
-        "url": "https://chowdeck.com/store?q=Mama+Put+Ikeja+9",
-    },
-    {
-        "id": "mama_put_ikeja_10_063088fe",
-        "name": "Mama Put Ikeja 10",
-        "city": "Ikeja",
-        "state": "Lagos",
-        "lga": "Ikeja",
-        "location": "Ikeja, Lagos",
-        "rating": 3.8,
-        "cuisine": "Nigerian",
-        "specialties": ['Local Dishes'],
-        "delivery_areas": ['Ikeja'],
-        "opening_hours": None,
-        "url": "https://chowdeck.com/store?q=Mama+Put+Ikeja+10",
-    },
-    {
-        "id": "mama_put_eti_osa_1_17ee1fb7",
-        "name": "Mama Put Eti-Osa 1",
-        "city": "Eti-Osa",
-        "state": "Lagos",
-        "lga": "Eti-Osa",
-        "location": "Eti-Osa, Lagos",
-        "rating": 3.9,
-        "cuisine": "Nigerian",
-        "specialties": ['Local Dishes'],
-        "delivery_areas": ['Eti-Osa'],
-        "opening_hours": None,
-        "url": "https://chowdeck.com/store?q=Mama+Put+Eti-Osa+1",
-    },
-    {
-        "id": "mama_put_eti_osa_2_2e4d7604",
-        "name": "Mama Put Eti-Osa 2",
-        "city": "Eti-Osa",
-        "state": "Lagos",
-        "lga": "Eti-Osa",
-        "location": "Eti-Osa, Lagos",
-        "rating": 4.0,
-        "cuisine": "Nigerian",
-        "specialties": ['Local Dishes'],
-        "delivery_areas": ['Eti-Osa'],
-        "opening_hours": None,
-        "url": "https://chowdeck.com/store?q=Mama+Put+Eti-Osa+2",
-    },
-    {
-        "id": "mama_put_eti_osa_3_c5019709",
-        "name": "Mama Put Eti-Osa 3",
-        "city": "Eti-Osa",
-        "state": "Lagos",
-        "lga": "Eti-Osa",
-        "location": "Eti-Osa, Lagos",
-        "rating": 4.1,
-        "cuisine": "Nigerian",
-        "specialties": ['Local Dishes'],
-        "delivery_areas": ['Eti-Osa'],
-        "opening_hours": None,
-        "url": "https://chowdeck.com/store?q=Mama+Put+Eti-Osa+3",
-    },
-    {
-        "id": "mama_put_eti_osa_4_82016c4e",
-        "name": "Mama Put Eti-Osa 4",
-        "city": "Eti-Osa",
-        "state": "Lagos",
-        "lga": "Eti-Osa",
-        "location": "Eti-Osa, Lagos",
-        "rating": 4.2,
-        "cuisine": "Nigerian",
-        "specialties": ['Local Dishes'],
-        "delivery_areas": ['Eti-Osa'],
-        "opening_hours": None,
-        "url": "https://chowdeck.com/store?q=Mama+Put+Eti-Osa+4",
-    },
-    {
-        "id": "mama_put_eti_osa_5_27a0269c",
-        "name": "Mama Put Eti-Osa 5",
-        "city": "Eti-Osa",
-        "state": "Lagos",
-        "lga": "Eti-Osa",
-        "location": "Eti-Osa, Lagos",
-        "rating": 3.8,
-        "cuisine": "Nigerian",
-        "specialties": ['Local Dishes'],
-        "delivery_areas": ['Eti-Osa'],
-        "opening_hours": None,
-        "url": "https://chowdeck.com/store?q=Mama+Put+Eti-Osa+5",
-    },
-    {
-        "id": "mama_put_eti_osa_6_42f0b4be",
-        "name": "Mama Put Eti-Osa 6",
-        "city": "Eti-Osa",
-        "state": "Lagos",
-        "lga": "Eti-Osa",
-        "location": "Eti-Osa, Lagos",
-        "rating": 3.9,
-        "cuisine": "Nigerian",
-        "specialties": ['Local Dishes'],
-        "delivery_areas": ['Eti-Osa'],
-        "opening_hours": None,
-        "url": "https://chowdeck.com/store?q=Mama+Put+Eti-Osa+6",
-    },
-    {
-        "id": "mama_put_eti_osa_7_d966fe6a",
-        "name": "Mama Put Eti-Osa 7",
-        "city": "Eti-Osa",
-        "state": "Lagos",
-        "lga": "Eti-Osa",
-        "location": "Eti-Osa, Lagos",
-        "rating": 4.0,
-        "cuisine": "Nigerian",
-        "specialties": ['Local Dishes'],
-        "delivery_areas": ['Eti-Osa'],
-        "opening_hours": None,
-        "url": "https://chowdeck.com/store?q=Mama+Put+Eti-Osa+7",
-    },
-    {
-        "id": "mama_put_eti_osa_8_bbea63c6",
-        "name": "Mama Put Eti-Osa 8",
-        "city": "Eti-Osa",
-        "state": "Lagos",
-        "lga": "Eti-Osa",
-        "location": "Eti-Osa, Lagos",
-        "rating": 4.1,
-        "cuisine": "Nigerian",
-        "specialties": ['Local Dishes'],
-        "delivery_areas": ['Eti-Osa'],
-        "opening_hours": None,
-        "url": "https://chowdeck.com/store?q=Mama+Put+Eti-Osa+8",
-    },
-    {
-        "id": "mama_put_lagos_mainland_1_ce2e3179",
-        "name": "Mama Put Lagos Mainland 1",
-        "city": "Lagos Mainland",
-        "state": "Lagos",
-        "lga": "Lagos Mainland",
-        "location": "Lagos Mainland, Lagos",
-        "rating": 3.9,
-        "cuisine": "Nigerian",
-        "specialties": ['Local Dishes'],
-        "delivery_areas": ['Lagos Mainland'],
-        "opening_hours": None,
-        "url": "https://chowdeck.com/store?q=Mama+Put+Lagos+Mainland+1",
-    },
-    {
-        "id": "mama_put_lagos_mainland_2_75190939",
-        "name": "Mama Put Lagos Mainland 2",
-        "city": "Lagos Mainland",
-        "state": "Lagos",
-        "lga": "Lagos Mainland",
-        "location": "Lagos Mainland, Lagos",
-        "rating": 4.0,
-        "cuisine": "Nigerian",
-        "specialties": ['Local Dishes'],
-        "delivery_areas": ['Lagos Mainland'],
-        "opening_hours": None,
-        "url": "https://chowdeck.com/store?q=Mama+Put+Lagos+Mainland+2",
-    },
-    {
-        "id": "mama_put_lagos_mainland_3_9ce93b64",
-        "name": "Mama Put Lagos Mainland 3",
-        "city": "Lagos Mainland",
-        "state": "Lagos",
-        "lga": "Lagos Mainland",
-        "location": "Lagos Mainland, Lagos",
-        "rating": 4.1,
-        "cuisine": "Nigerian",
-        "specialties": ['Local Dishes'],
-        "delivery_areas": ['Lagos Mainland'],
-        "opening_hours": None,
-        "url": "https://chowdeck.com/store?q=Mama+Put+Lagos+Mainland+3",
-    },
-    {
-        "id": "mama_put_lagos_mainland_4_efcfaef0",
-        "name": "Mama Put Lagos Mainland 4",
-        "city": "Lagos Mainland",
-        "state": "Lagos",
-        "lga": "Lagos Mainland",
-        "location": "Lagos Mainland, Lagos",
-        "rating": 4.2,
-        "cuisine": "Nigerian",
-        "specialties": ['Local Dishes'],
-        "delivery_areas": ['Lagos Mainland'],
-        "opening_hours": None,
-        "url": "https://chowdeck.com/store?q=Mama+Put+Lagos+Mainland+4",
-    },
-    {
-        "id": "mama_put_lagos_mainland_5_7d2aa623",
-        "name": "Mama Put Lagos Mainland 5",
-        "city": "Lagos Mainland",
-        "state": "Lagos",
-        "lga": "Lagos Mainland",
-        "location": "Lagos Mainland, Lagos",
-        "rating": 3.8,
-        "cuisine": "Nigerian",
-        "specialties": ['Local Dishes'],
-        "delivery_areas": ['Lagos Mainland'],
-        "opening_hours": None,
-        "url": "https://chowdeck.com/store?q=Mama+Put+Lagos+Mainland+5",
-    },
-    {
-        "id": "mama_put_lagos_mainland_6_0157b615",
-        "name": "Mama Put Lagos Mainland 6",
-        "city": "Lagos Mainland",
-        "state": "Lagos",
-        "lga": "Lagos Mainland",
-        "location": "Lagos Mainland, Lagos",
-        "rating": 3.9,
-        "cuisine": "Nigerian",
-        "specialties": ['Local Dishes'],
-        "delivery_areas": ['Lagos Mainland'],
-        "opening_hours": None,
-        "url": "https://chowdeck.com/store?q=Mama+Put+Lagos+Mainland+6",
-    },
-    {
-        "id": "mama_put_lagos_mainland_7_127e84ed",
-        "name": "Mama Put Lagos Mainland 7",
-        "city": "Lagos Mainland",
-        "state": "Lagos",
-        "lga": "Lagos Mainland",
-        "location": "Lagos Mainland, Lagos",
-        "rating": 4.0,
-        "cuisine": "Nigerian",
-        "specialties": ['Local Dishes'],
-        "delivery_areas": ['Lagos Mainland'],
-        "opening_hours": None,
-        "url": "https://chowdeck.com/store?q=Mama+Put+Lagos+Mainland+7",
-    },
-    {
-        "id": "mama_put_lagos_mainland_8_1dbe6240",
-        "name": "Mama Put Lagos Mainland 8",
-        "city": "Lagos Mainland",
-        "state": "Lagos",
-        "lga": "Lagos Mainland",
-        "location": "Lagos Mainland, Lagos",
-        "rating": 4.1,
-        "cuisine": "Nigerian",
-        "specialties": ['Local Dishes'],
-        "delivery_areas": ['Lagos Mainland'],
-        "opening_hours": None,
-        "url": "https://chowdeck.com/store?q=Mama+Put+Lagos+Mainland+8",
-    },
-    {
-        "id": "mama_put_lagos_mainland_9_24da3e43",
-        "name": "Mama Put Lagos Mainland 9",
-        "city": "Lagos Mainland",
-        "state": "Lagos",
-        "lga": "Lagos Mainland",
-        "location": "Lagos Mainland, Lagos",
-        "rating": 4.2,
-        "cuisine": "Nigerian",
-        "specialties": ['Local Dishes'],
-        "delivery_areas": ['Lagos Mainland'],
-        "opening_hours": None,
-        "url": "https://chowdeck.com/store?q=Mama+Put+Lagos+Mainland+9",
-    },
-    {
-        "id": "mama_put_lagos_mainland_10_0fa2f4ca",
-        "name": "Mama Put Lagos Mainland 10",
-        "city": "Lagos Mainland",
-        "state": "Lagos",
-        "lga": "Lagos Mainland",
-        "location": "Lagos Mainland, Lagos",
-        "rating": 3.8,
-        "cuisine": "Nigerian",
-        "specialties": ['Local Dishes'],
-        "delivery_areas": ['Lagos Mainland'],
-        "opening_hours": None,
-        "url": "https://chowdeck.com/store?q=Mama+Put+Lagos+Mainland+10",
-    },
-    {
-        "id": "mama_put_lagos_mainland_11_e1de9b6a",
-        "name": "Mama Put Lagos Mainland 11",
-        "city": "Lagos Mainland",
-        "state": "Lagos",
-        "lga": "Lagos Mainland",
-        "location": "Lagos Mainland, Lagos",
-        "rating": 3.9,
-        "cuisine": "Nigerian",
-        "specialties": ['Local Dishes'],
-        "delivery_areas": ['Lagos Mainland'],
-        "opening_hours": None,
-        "url": "https://chowdeck.com/store?q=Mama+Put+Lagos+Mainland+11",
-    },
-    {
-        "id": "mama_put_lagos_mainland_12_f93e7b0b",
-        "name": "Mama Put Lagos Mainland 12",
-        "city": "Lagos Mainland",
-        "state": "Lagos",
-        "lga": "Lagos Mainland",
-        "location": "Lagos Mainland, Lagos",
-        "rating": 4.0,
-        "cuisine": "Nigerian",
-        "specialties": ['Local Dishes'],
-        "delivery_areas": ['Lagos Mainland'],
-        "opening_hours": None,
-        "url": "https://chowdeck.com/store?q=Mama+Put+Lagos+Mainland+12",
-    },
-    {
-        "id": "mama_put_surulere_1_227ada46",
-        "name": "Mama Put Surulere 1",
-        "city": "Surulere",
-        "state": "Lagos",
-        "lga": "Surulere",
-        "location": "Surulere, Lagos",
-        "rating": 3.9,
-        "cuisine": "Nigerian",
-        "specialties": ['Local Dishes'],
-        "delivery_areas": ['Surulere'],
-        "opening_hours": None,
-        "url": "https://chowdeck.com/store?q=Mama+Put+Surulere+1",
-    },
-    {
-        "id": "mama_put_surulere_2_7c73a72a",
-        "name": "Mama Put Surulere 2",
-        "city": "Surulere",
-        "state": "Lagos",
-        "lga": "Surulere",
-        "location": "Surulere, Lagos",
-        "rating": 4.0,
-        "cuisine": "Nigerian",
-        "specialties": ['Local Dishes'],
-        "delivery_areas": ['Surulere'],
-        "opening_hours": None,
-        "url": "https://chowdeck.com/store?q=Mama+Put+Surulere+2",
-    },
-    {
-        "id": "mama_put_surulere_3_c10135eb",
-        "name": "Mama Put Surulere 3",
-        "city": "Surulere",
-        "state": "Lagos",
-        "lga": "Surulere",
-        "location": "Surulere, Lagos",
-        "rating": 4.1,
-        "cuisine": "Nigerian",
-        "specialties": ['Local Dishes'],
-        "delivery_areas": ['Surulere'],
-        "opening_hours": None,
-        "url": "https://chowdeck.com/store?q=Mama+Put+Surulere+3",
-    },
-    {
-        "id": "mama_put_surulere_4_361ab607",
-        "name": "Mama Put Surulere 4",
-        "city": "Surulere",
-        "state": "Lagos",
-        "lga": "Surulere",
-        "location": "Surulere, Lagos",
-        "rating": 4.2,
-        "cuisine": "Nigerian",
-        "specialties": ['Local Dishes'],
-        "delivery_areas": ['Surulere'],
-        "opening_hours": None,
-        "url": "https://chowdeck.com/store?q=Mama+Put+Surulere+4",
-    },
-    {
-        "id": "mama_put_surulere_5_f4d3f19a",
-        "name": "Mama Put Surulere 5",
-        "city": "Surulere",
-        "state": "Lagos",
-        "lga": "Surulere",
-        "location": "Surulere, Lagos",
-        "rating": 3.8,
-        "cuisine": "Nigerian",
-        "specialties": ['Local Dishes'],
-        "delivery_areas": ['Surulere'],
-        "opening_hours": None,
-        "url": "https://chowdeck.com/store?q=Mama+Put+Surulere+5",
-    },
-    {
-        "id": "mama_put_surulere_6_f6db9ba2",
-        "name": "Mama Put Surulere 6",
-        "city": "Surulere",
-        "state": "Lagos",
-        "lga": "Surulere",
-        "location": "Surulere, Lagos",
-        "rating": 3.9,
-        "cuisine": "Nigerian",
-        "specialties": ['Local Dishes'],
-        "delivery_areas": ['Surulere'],
-        "opening_hours": None,
-        "url": "https://chowdeck.com/store?q=Mama+Put+Surulere+6",
-    },
-    {
-        "id": "mama_put_surulere_7_fb97bf4a",
-        "name": "Mama Put Surulere 7",
-        "city": "Surulere",
-        "state": "Lagos",
-        "lga": "Surulere",
-        "location": "Surulere, Lagos",
-        "rating": 4.0,
-        "cuisine": "Nigerian",
-        "specialties": ['Local Dishes'],
-        "delivery_areas": ['Surulere'],
-        "opening_hours": None,
-        "url": "https://chowdeck.com/store?q=Mama+Put+Surulere+7",
-    },
-    {
-        "id": "mama_put_surulere_8_9cb81d67",
-        "name": "Mama Put Surulere 8",
-        "city": "Surulere",
-        "state": "Lagos",
-        "lga": "Surulere",
-        "location": "Surulere, Lagos",
-        "rating": 4.1,
-        "cuisine": "Nigerian",
-        "specialties": ['Local Dishes'],
-        "delivery_areas": ['Surulere'],
-        "opening_hours": None,
-        "url": "https://chowdeck.com/store?q=Mama+Put+Surulere+8",
-    },
-    {
-        "id": "mama_put_kosofe_1_2308da6d",
-        "name": "Mama Put Kosofe 1",
-        "city": "Kosofe",
-        "state": "Lagos",
-        "lga": "Kosofe",
-        "location": "Kosofe, Lagos",
-        "rating": 3.9,
-        "cuisine": "Nigerian",
-        "specialties": ['Local Dishes'],
-        "delivery_areas": ['Kosofe'],
-        "opening_hours": None,
-        "url": "https://chowdeck.com/store?q=Mama+Put+Kosofe+1",
-    },
-    {
-        "id": "mama_put_kosofe_2_e2dc4577",
-        "name": "Mama Put Kosofe 2",
-        "city": "Kosofe",
-        "state": "Lagos",
-        "lga": "Kosofe",
-        "location": "Kosofe, Lagos",
-        "rating": 4.0,
-        "cuisine": "Nigerian",
-        "specialties": ['Local Dishes'],
-        "delivery_areas": ['Kosofe'],
-        "opening_hours": None,
-        "url": "https://chowdeck.com/store?q=Mama+Put+Kosofe+2",
-    },
-    {
-        "id": "mama_put_kosofe_3_749f791e",
-        "name": "Mama Put Kosofe 3",
-        "city": "Kosofe",
-        "state": "Lagos",
-        "lga": "Kosofe",
-        "location": "Kosofe, Lagos",
-        "rating": 4.1,
-        "cuisine": "Nigerian",
-        "specialties": ['Local Dishes'],
-        "delivery_areas": ['Kosofe'],
-        "opening_hours": None,
-        "url": "https://chowdeck.com/store?q=Mama+Put+Kosofe+3",
-    },
-    {
-        "id": "mama_put_kosofe_4_63fe7a8a",
-        "name": "Mama Put Kosofe 4",
-        "city": "Kosofe",
-        "state": "Lagos",
-        "lga": "Kosofe",
-        "location": "Kosofe, Lagos",
-        "rating": 4.2,
-        "cuisine": "Nigerian",
-        "specialties": ['Local Dishes'],
-        "delivery_areas": ['Kosofe'],
-        "opening_hours": None,
-        "url": "https://chowdeck.com/store?q=Mama+Put+Kosofe+4",
-    },
-    {
-        "id": "mama_put_kosofe_5_924769c9",
-        "name": "Mama Put Kosofe 5",
-        "city": "Kosofe",
-        "state": "Lagos",
-        "lga": "Kosofe",
-        "location": "Kosofe, Lagos",
-        "rating": 3.8,
-        "cuisine": "Nigerian",
-        "specialties": ['Local Dishes'],
-        "delivery_areas": ['Kosofe'],
-        "opening_hours": None,
-        "url": "https://chowdeck.com/store?q=Mama+Put+Kosofe+5",
-    },
-    {
-        "id": "mama_put_kosofe_6_c493428d",
-        "name": "Mama Put Kosofe 6",
-        "city": "Kosofe",
-        "state": "Lagos",
-        "lga": "Kosofe",
-        "location": "Kosofe, Lagos",
-        "rating": 3.9,
-        "cuisine": "Nigerian",
-        "specialties": ['Local Dishes'],
-        "delivery_areas": ['Kosofe'],
-        "opening_hours": None,
-        "url": "https://chowdeck.com/store?q=Mama+Put+Kosofe+6",
-    },
-    {
-        "id": "buka_ikeja_1_877e2fe0",
-        "name": "Buka Ikeja 1",
-        "city": "Ikeja",
-        "state": "Lagos",
-        "lga": "Ikeja",
-        "location": "Ikeja, Lagos",
-        "rating": 3.9,
-        "cuisine": "Nigerian",
-        "specialties": ['Local Dishes'],
-        "delivery_areas": ['Ikeja'],
-        "opening_hours": None,
-        "url": "https://chowdeck.com/store?q=Buka+Ikeja+1",
-    },
-    {
-        "id": "buka_ikeja_2_6d20fdf4",
-        "name": "Buka Ikeja 2",
-        "city": "Ikeja",
-        "state": "Lagos",
-        "lga": "Ikeja",
-        "location": "Ikeja, Lagos",
-        "rating": 4.0,
-        "cuisine": "Nigerian",
-        "specialties": ['Local Dishes'],
-        "delivery_areas": ['Ikeja'],
-        "opening_hours": None,
-        "url": "https://chowdeck.com/store?q=Buka+Ikeja+2",
-    },
-    {
-        "id": "buka_ikeja_3_ad09da07",
-        "name": "Buka Ikeja 3",
-        "city": "Ikeja",
-        "state": "Lagos",
-        "lga": "Ikeja",
-        "location": "Ikeja, Lagos",
-        "rating": 4.1,
-        "cuisine": "Nigerian",
-        "specialties": ['Local Dishes'],
-        "delivery_areas": ['Ikeja'],
-        "opening_hours": None,
-        "url": "https://chowdeck.com/store?q=Buka+Ikeja+3",
-    },
-    {
-        "id": "buka_ikeja_4_83feb6b7",
-        "name": "Buka Ikeja 4",
-        "city": "Ikeja",
-        "state": "Lagos",
-        "lga": "Ikeja",
-        "location": "Ikeja, Lagos",
-        "rating": 4.2,
-        "cuisine": "Nigerian",
-        "specialties": ['Local Dishes'],
-        "delivery_areas": ['Ikeja'],
-        "opening_hours": None,
-        "url": "https://chowdeck.com/store?q=Buka+Ikeja+4",
-    },
-    {
-        "id": "buka_ikeja_5_ec793cfb",
-        "name": "Buka Ikeja 5",
-        "city": "Ikeja",
-        "state": "Lagos",
-        "lga": "Ikeja",
-        "location": "Ikeja, Lagos",
-        "rating": 3.8,
-        "cuisine": "Nigerian",
-        "specialties": ['Local Dishes'],
-        "delivery_areas": ['Ikeja'],
-        "opening_hours": None,
-        "url": "https://chowdeck.com/store?q=Buka+Ikeja+5",
-    },
-    {
-        "id": "buka_ikeja_6_9165fbe4",
-        "name": "Buka Ikeja 6",
-        "city": "Ikeja",
-        "state": "Lagos",
-        "lga": "Ikeja",
-        "location": "Ikeja, Lagos",
-        "rating": 3.9,
-        "cuisine": "Nigerian",
-        "specialties": ['Local Dishes'],
-        "delivery_areas": ['Ikeja'],
-        "opening_hours": None,
-        "url": "https://chowdeck.com/store?q=Buka+Ikeja+6",
-    },
-    {
-        "id": "buka_ikeja_7_54d1e11b",
-        "name": "Buka Ikeja 7",
-        "city": "Ikeja",
-        "state": "Lagos",
-        "lga": "Ikeja",
-        "location": "Ikeja, Lagos",
-        "rating": 4.0,
-        "cuisine": "Nigerian",
-        "specialties": ['Local Dishes'],
-        "delivery_areas": ['Ikeja'],
-        "opening_hours": None,
-        "url": "https://chowdeck.com/store?q=Buka+Ikeja+7",
-    },
-    {
-        "id": "buka_ikeja_8_0d739fb0",
-        "name": "Buka Ikeja 8",
-        "city": "Ikeja",
-        "state": "Lagos",
-        "lga": "Ikeja",
-        "location": "Ikeja, Lagos",
-        "rating": 4.1,
-        "cuisine": "Nigerian",
-        "specialties": ['Local Dishes'],
-        "delivery_areas": ['Ikeja'],
-        "opening_hours": None,
-        "url": "https://chowdeck.com/store?q=Buka+Ikeja+8",
-    },
-    {
-        "id": "buka_ikeja_9_04ee05d9",
-        "name": "Buka Ikeja 9",
-        "city": "Ikeja",
-        "state": "Lagos",
-        "lga": "Ikeja",
-        "location": "Ikeja, Lagos",
-        "rating": 4.2,
-        "cuisine": "Nigerian",
-        "specialties": ['Local Dishes'],
-        "delivery_areas": ['Ikeja'],
-        "opening_hours": None,
-        "url": "https://chowdeck.com/store?q=Buka+Ikeja+9",
-    },
-    {
-        "id": "buka_ikeja_10_1874fab2",
-        "name": "Buka Ikeja 10",
-        "city": "Ikeja",
-        "state": "Lagos",
-        "lga": "Ikeja",
-        "location": "Ikeja, Lagos",
-        "rating": 3.8,
-        "cuisine": "Nigerian",
-        "specialties": ['Local Dishes'],
-        "delivery_areas": ['Ikeja'],
-        "opening_hours": None,
-        "url": "https://chowdeck.com/store?q=Buka+Ikeja+10",
-    },
-    {
-        "id": "buka_ikeja_11_45e1b8f0",
-        "name": "Buka Ikeja 11",
-        "city": "Ikeja",
-        "state": "Lagos",
-        "lga": "Ikeja",
-        "location": "Ikeja, Lagos",
-        "rating": 3.9,
-        "cuisine": "Nigerian",
-        "specialties": ['Local Dishes'],
-        "delivery_areas": ['Ikeja'],
-        "opening_hours": None,
-        "url": "https://chowdeck.com/store?q=Buka+Ikeja+11",
-    },
-    {
-        "id": "buka_ikeja_12_7165e9c0",
-        "name": "Buka Ikeja 12",
-        "city": "Ikeja",
-        "state": "Lagos",
-        "lga": "Ikeja",
-        "location": "Ikeja, Lagos",
-        "rating": 4.0,
-        "cuisine": "Nigerian",
-        "specialties": ['Local Dishes'],
-        "delivery_areas": ['Ikeja'],
-        "opening_hours": None,
-        "url": "https://chowdeck.com/store?q=Buka+Ikeja+12",
-    },
-    {
-        "id": "buka_ikeja_13_b85277e9",
-        "name": "Buka Ikeja 13",
-        "city": "Ikeja",
-        "state": "Lagos",
-        "lga": "Ikeja",
-        "location": "Ikeja, Lagos",
-        "rating": 4.1,
-        "cuisine": "Nigerian",
-        "specialties": ['Local Dishes'],
-        "delivery_areas": ['Ikeja'],
-        "opening_hours": None,
-        "url": "https://chowdeck.com/store?q=Buka+Ikeja+13",
-    },
-    {
-        "id": "buka_ikeja_14_ce8b320f",
-        "name": "Buka Ikeja 14",
-        "city": "Ikeja",
-        "state": "Lagos",
-        "lga": "Ikeja",
-        "location": "Ikeja, Lagos",
-        "rating": 4.2,
-        "cuisine": "Nigerian",
-        "specialties": ['Local Dishes'],
-        "delivery_areas": ['Ikeja'],
-        "opening_hours": None,
-        "url": "https://chowdeck.com/store?q=Buka+Ikeja+14",
-    },
-    {
-        "id": "buka_ikeja_15_0f6921ab",
-        "name": "Buka Ikeja 15",
-        "city": "Ikeja",
-        "state": "Lagos",
-        "lga": "Ikeja",
-        "location": "Ikeja, Lagos",
-        "rating": 3.8,
-        "cuisine": "Nigerian",
-        "specialties": ['Local Dishes'],
-        "delivery_areas": ['Ikeja'],
-        "opening_hours": None,
-        "url": "https://chowdeck.com/store?q=Buka+Ikeja+15",
-    },
-    {
-        "id": "buka_eti_osa_1_05d13bdd",
-        "name": "Buka Eti-Osa 1",
-        "city": "Eti-Osa",
-        "state": "Lagos",
-        "lga": "Eti-Osa",
-        "location": "Eti-Osa, Lagos",
-        "rating": 3.9,
-        "cuisine": "Nigerian",
-        "specialties": ['Local Dishes'],
-        "delivery_areas": ['Eti-Osa'],
-        "opening_hours": None,
-        "url": "https://chowdeck.com/store?q=Buka+Eti-Osa+1",
-    },
-    {
-        "id": "buka_eti_osa_2_08626e14",
-        "name": "Buka Eti-Osa 2",
-        "city": "Eti-Osa",
-        "state": "Lagos",
-        "lga": "Eti-Osa",
-        "location": "Eti-Osa, Lagos",
-        "rating": 4.0,
-        "cuisine": "Nigerian",
-        "specialties": ['Local Dishes'],
-        "delivery_areas": ['Eti-Osa'],
-        "opening_hours": None,
-        "url": "https://chowdeck.com/store?q=Buka+Eti-Osa+2",
-    },
-    {
-        "id": "buka_eti_osa_3_ab086e13",
-        "name": "Buka Eti-Osa 3",
-        "city": "Eti-Osa",
-        "state": "Lagos",
-        "lga": "Eti-Osa",
-        "location": "Eti-Osa, Lagos",
-        "rating": 4.1,
-        "cuisine": "Nigerian",
-        "specialties": ['Local Dishes'],
-        "delivery_areas": ['Eti-Osa'],
-        "opening_hours": None,
-        "url": "https://chowdeck.com/store?q=Buka+Eti-Osa+3",
-    },
-    {
-        "id": "buka_eti_osa_4_d8ccc010",
-        "name": "Buka Eti-Osa 4",
-        "city": "Eti-Osa",
-        "state": "Lagos",
-        "lga": "Eti-Osa",
-        "location": "Eti-Osa, Lagos",
-        "rating": 4.2,
-        "cuisine": "Nigerian",
-        "specialties": ['Local Dishes'],
-        "delivery_areas": ['Eti-Osa'],
-        "opening_hours": None,
-        "url": "https://chowdeck.com/store?q=Buka+Eti-Osa+4",
-    },
-    {
-        "id": "buka_eti_osa_5_4615eab9",
-        "name": "Buka Eti-Osa 5",
-        "city": "Eti-Osa",
-        "state": "Lagos",
-        "lga": "Eti-Osa",
-        "location": "Eti-Osa, Lagos",
-        "rating": 3.8,
-        "cuisine": "Nigerian",
-        "specialties": ['Local Dishes'],
-        "delivery_areas": ['Eti-Osa'],
-        "opening_hours": None,
-        "url": "https://chowdeck.com/store?q=Buka+Eti-Osa+5",
-    },
-    {
-        "id": "buka_eti_osa_6_9e40ee69",
-        "name": "Buka Eti-Osa 6",
-        "city": "Eti-Osa",
-        "state": "Lagos",
-        "lga": "Eti-Osa",
-        "location": "Eti-Osa, Lagos",
-        "rating": 3.9,
-        "cuisine": "Nigerian",
-        "specialties": ['Local Dishes'],
-        "delivery_areas": ['Eti-Osa'],
-        "opening_hours": None,
-        "url": "https://chowdeck.com/store?q=Buka+Eti-Osa+6",
-    },
-    {
-        "id": "buka_eti_osa_7_e8315048",
-        "name": "Buka Eti-Osa 7",
-        "city": "Eti-Osa",
-        "state": "Lagos",
-        "lga": "Eti-Osa",
-        "location": "Eti-Osa, Lagos",
-        "rating": 4.0,
-        "cuisine": "Nigerian",
-        "specialties": ['Local Dishes'],
-        "delivery_areas": ['Eti-Osa'],
-        "opening_hours": None,
-        "url": "https://chowdeck.com/store?q=Buka+Eti-Osa+7",
-    },
-    {
-        "id": "buka_eti_osa_8_e23c56b9",
-        "name": "Buka Eti-Osa 8",
-        "city": "Eti-Osa",
-        "state": "Lagos",
-        "lga": "Eti-Osa",
-        "location": "Eti-Osa, Lagos",
-        "rating": 4.1,
-        "cuisine": "Nigerian",
-        "specialties": ['Local Dishes'],
-        "delivery_areas": ['Eti-Osa'],
-        "opening_hours": None,
-        "url": "https://chowdeck.com/store?q=Buka+Eti-Osa+8",
-    },
-    {
-        "id": "buka_eti_osa_9_716a3bbc",
-        "name": "Buka Eti-Osa 9",
-        "city": "Eti-Osa",
-        "state": "Lagos",
-        "lga": "Eti-Osa",
-        "location": "Eti-Osa, Lagos",
-        "rating": 4.2,
-        "cuisine": "Nigerian",
-        "specialties": ['Local Dishes'],
-        "delivery_areas": ['Eti-Osa'],
-        "opening_hours": None,
-        "url": "https://chowdeck.com/store?q=Buka+Eti-Osa+9",
-    },
-    {
-        "id": "buka_eti_osa_10_6e37f0f3",
-        "name": "Buka Eti-Osa 10",
-        "city": "Eti-Osa",
-        "state": "Lagos",
-        "lga": "Eti-Osa",
-        "location": "Eti-Osa, Lagos",
-        "rating": 3.8,
-        "cuisine": "Nigerian",
-        "specialties": ['Local Dishes'],
-        "delivery_areas": ['Eti-Osa'],
-        "opening_hours": None,
-        "url": "https://chowdeck.com/store?q=Buka+Eti-Osa+10",
-    },
-    {
-        "id": "buka_lagos_mainland_1_fd39999a",
-        "name": "Buka Lagos Mainland 1",
-        "city": "Lagos Mainland",
-        "state": "Lagos",
-        "lga": "Lagos Mainland",
-        "location": "Lagos Mainland, Lagos",
-        "rating": 3.9,
-        "cuisine": "Nigerian",
-        "specialties": ['Local Dishes'],
-        "delivery_areas": ['Lagos Mainland'],
-        "opening_hours": None,
-        "url": "https://chowdeck.com/store?q=Buka+Lagos+Mainland+1",
-    },
-    {
-        "id": "buka_lagos_mainland_2_211102be",
-        "name": "Buka Lagos Mainland 2",
-        "city": "Lagos Mainland",
-        "state": "Lagos",
-        "lga": "Lagos Mainland",
-        "location": "Lagos Mainland, Lagos",
-        "rating": 4.0,
-        "cuisine": "Nigerian",
-        "specialties": ['Local Dishes'],
-        "delivery_areas": ['Lagos Mainland'],
-        "opening_hours": None,
-        "url": "https://chowdeck.com/store?q=Buka+Lagos+Mainland+2",
-    },
-    {
-        "id": "buka_lagos_mainland_3_49404c36",
-        "name": "Buka Lagos Mainland 3",
-        "city": "Lagos Mainland",
-        "state": "Lagos",
-        "lga": "Lagos Mainland",
-        "location": "Lagos Mainland, Lagos",
-        "rating": 4.1,
-        "cuisine": "Nigerian",
-        "specialties": ['Local Dishes'],
-        "delivery_areas": ['Lagos Mainland'],
-        "opening_hours": None,
-        "url": "https://chowdeck.com/store?q=Buka+Lagos+Mainland+3",
-    },
-    {
-        "id": "buka_lagos_mainland_4_7789f89f",
-        "name": "Buka Lagos Mainland 4",
-        "city": "Lagos Mainland",
-        "state": "Lagos",
-        "lga": "Lagos Mainland",
-        "location": "Lagos Mainland, Lagos",
-        "rating": 4.2,
-        "cuisine": "Nigerian",
-        "specialties": ['Local Dishes'],
-        "delivery_areas": ['Lagos Mainland'],
-        "opening_hours": None,
-        "url": "https://chowdeck.com/store?q=Buka+Lagos+Mainland+4",
-    },
-    {
-        "id": "buka_lagos_mainland_5_19fdcd05",
-        "name": "Buka Lagos Mainland 5",
-        "city": "Lagos Mainland",
-        "state": "Lagos",
-        "lga": "Lagos Mainland",
-        "location": "Lagos Mainland, Lagos",
-        "rating": 3.8,
-        "cuisine": "Nigerian",
-        "specialties": ['Local Dishes'],
-        "delivery_areas": ['Lagos Mainland'],
-        "opening_hours": None,
-        "url": "https://chowdeck.com/store?q=Buka+Lagos+Mainland+5",
-    },
-    {
-        "id": "buka_lagos_mainland_6_f33036ae",
-        "name": "Buka Lagos Mainland 6",
-        "city": "Lagos Mainland",
-        "state": "Lagos",
-        "lga": "Lagos Mainland",
-        "location": "Lagos Mainland, Lagos",
-        "rating": 3.9,
-        "cuisine": "Nigerian",
-        "specialties": ['Local Dishes'],
-        "delivery_areas": ['Lagos Mainland'],
-        "opening_hours": None,
-        "url": "https://chowdeck.com/store?q=Buka+Lagos+Mainland+6",
-    },
-    {
-        "id": "buka_lagos_mainland_7_f01e3e1c",
-        "name": "Buka Lagos Mainland 7",
-        "city": "Lagos Mainland",
-        "state": "Lagos",
-        "lga": "Lagos Mainland",
-        "location": "Lagos Mainland, Lagos",
-        "rating": 4.0,
-        "cuisine": "Nigerian",
-        "specialties": ['Local Dishes'],
-        "delivery_areas": ['Lagos Mainland'],
-        "opening_hours": None,
-        "url": "https://chowdeck.com/store?q=Buka+Lagos+Mainland+7",
-    },
-    {
-        "id": "buka_lagos_mainland_8_5e289ea8",
-        "name": "Buka Lagos Mainland 8",
-        "city": "Lagos Mainland",
-        "state": "Lagos",
-        "lga": "Lagos Mainland",
-        "location": "Lagos Mainland, Lagos",
-        "rating": 4.1,
-        "cuisine": "Nigerian",
-        "specialties": ['Local Dishes'],
-        "delivery_areas": ['Lagos Mainland'],
-        "opening_hours": None,
-        "url": "https://chowdeck.com/store?q=Buka+Lagos+Mainland+8",
-    },
-    {
-        "id": "buka_lagos_mainland_9_22eff3bc",
-        "name": "Buka Lagos Mainland 9",
-        "city": "Lagos Mainland",
-        "state": "Lagos",
-        "lga": "Lagos Mainland",
-        "location": "Lagos Mainland, Lagos",
-        "rating": 4.2,
-        "cuisine": "Nigerian",
-        "specialties": ['Local Dishes'],
-        "delivery_areas": ['Lagos Mainland'],
-        "opening_hours": None,
-        "url": "https://chowdeck.com/store?q=Buka+Lagos+Mainland+9",
-    },
-    {
-        "id": "buka_lagos_mainland_10_ffb8bcd6",
-        "name": "Buka Lagos Mainland 10",
-        "city": "Lagos Mainland",
-        "state": "Lagos",
-        "lga": "Lagos Mainland",
-        "location": "Lagos Mainland, Lagos",
-        "rating": 3.8,
-        "cuisine": "Nigerian",
-        "specialties": ['Local Dishes'],
-        "delivery_areas": ['Lagos Mainland'],
-        "opening_hours": None,
-        "url": "https://chowdeck.com/store?q=Buka+Lagos+Mainland+10",
-    },
-    {
-        "id": "buka_lagos_mainland_11_8dd5f869",
-        "name": "Buka Lagos Mainland 11",
-        "city": "Lagos Mainland",
-        "state": "Lagos",
-        "lga": "Lagos Mainland",
-        "location": "Lagos Mainland, Lagos",
-        "rating": 3.9,
-        "cuisine": "Nigerian",
-        "specialties": ['Local Dishes'],
-        "delivery_areas": ['Lagos Mainland'],
-        "opening_hours": None,
-        "url": "https://chowdeck.com/store?q=Buka+Lagos+Mainland+11",
-    },
-    {
-        "id": "buka_lagos_mainland_12_1d88fce8",
-        "name": "Buka Lagos Mainland 12",
-        "city": "Lagos Mainland",
-        "state": "Lagos",
-        "lga": "Lagos Mainland",
-        "location": "Lagos Mainland, Lagos",
-        "rating": 4.0,
-        "cuisine": "Nigerian",
-        "specialties": ['Local Dishes'],
-        "delivery_areas": ['Lagos Mainland'],
-        "opening_hours": None,
-        "url": "https://chowdeck.com/store?q=Buka+Lagos+Mainland+12",
-    },
-    {
-        "id": "buka_lagos_mainland_13_2365fe7c",
-        "name": "Buka Lagos Mainland 13",
-        "city": "Lagos Mainland",
-        "state": "Lagos",
-        "lga": "Lagos Mainland",
-        "location": "Lagos Mainland, Lagos",
-        "rating": 4.1,
-        "cuisine": "Nigerian",
-        "specialties": ['Local Dishes'],
-        "delivery_areas": ['Lagos Mainland'],
-        "opening_hours": None,
-        "url": "https://chowdeck.com/store?q=Buka+Lagos+Mainland+13",
-    },
-    {
-        "id": "buka_lagos_mainland_14_b009c6dd",
-        "name": "Buka Lagos Mainland 14",
-        "city": "Lagos Mainland",
-        "state": "Lagos",
-        "lga": "Lagos Mainland",
-        "location": "Lagos Mainland, Lagos",
-        "rating": 4.2,
-        "cuisine": "Nigerian",
-        "specialties": ['Local Dishes'],
-        "delivery_areas": ['Lagos Mainland'],
-        "opening_hours": None,
-        "url": "https://chowdeck.com/store?q=Buka+Lagos+Mainland+14",
-    },
-    {
-        "id": "buka_lagos_mainland_15_2eeff6bd",
-        "name": "Buka Lagos Mainland 15",
-        "city": "Lagos Mainland",
-        "state": "Lagos",
-        "lga": "Lagos Mainland",
-        "location": "Lagos Mainland, Lagos",
-        "rating": 3.8,
-        "cuisine": "Nigerian",
-        "specialties": ['Local Dishes'],
-        "delivery_areas": ['Lagos Mainland'],
-        "opening_hours": None,
-        "url": "https://chowdeck.com/store?q=Buka+Lagos+Mainland+15",
-    },
-    {
-        "id": "buka_surulere_1_98a43adf",
-        "name": "Buka Surulere 1",
-        "city": "Surulere",
-        "state": "Lagos",
-        "lga": "Surulere",
-        "location": "Surulere, Lagos",
-        "rating": 3.9,
-        "cuisine": "Nigerian",
-        "specialties": ['Local Dishes'],
-        "delivery_areas": ['Surulere'],
-        "opening_hours": None,
-        "url": "https://chowdeck.com/store?q=Buka+Surulere+1",
-    },
-    {
-        "id": "buka_surulere_2_ab74e33d",
-        "name": "Buka Surulere 2",
-        "city": "Surulere",
-        "state": "Lagos",
-        "lga": "Surulere",
-        "location": "Surulere, Lagos",
-        "rating": 4.0,
-        "cuisine": "Nigerian",
-        "specialties": ['Local Dishes'],
-        "delivery_areas": ['Surulere'],
-        "opening_hours": None,
-        "url": "https://chowdeck.com/store?q=Buka+Surulere+2",
-    },
-    {
-        "id": "buka_surulere_3_903decc6",
-        "name": "Buka Surulere 3",
-        "city": "Surulere",
-        "state": "Lagos",
-        "lga": "Surulere",
-        "location": "Surulere, Lagos",
-        "rating": 4.1,
-        "cuisine": "Nigerian",
-        "specialties": ['Local Dishes'],
-        "delivery_areas": ['Surulere'],
-        "opening_hours": None,
-        "url": "https://chowdeck.com/store?q=Buka+Surulere+3",
-    },
-    {
-        "id": "buka_surulere_4_35126622",
-        "name": "Buka Surulere 4",
-        "city": "Surulere",
-        "state": "Lagos",
-        "lga": "Surulere",
-        "location": "Surulere, Lagos",
-        "rating": 4.2,
-        "cuisine": "Nigerian",
-        "specialties": ['Local Dishes'],
-        "delivery_areas": ['Surulere'],
-        "opening_hours": None,
-        "url": "https://chowdeck.com/store?q=Buka+Surulere+4",
-    },
-    {
-        "id": "buka_surulere_5_e700c7cd",
-        "name": "Buka Surulere 5",
-        "city": "Surulere",
-        "state": "Lagos",
-        "lga": "Surulere",
-        "location": "Surulere, Lagos",
-        "rating": 3.8,
-        "cuisine": "Nigerian",
-        "specialties": ['Local Dishes'],
-        "delivery_areas": ['Surulere'],
-        "opening_hours": None,
-        "url": "https://chowdeck.com/store?q=Buka+Surulere+5",
-    },
-    {
-        "id": "buka_surulere_6_1e9c0286",
-        "name": "Buka Surulere 6",
-        "city": "Surulere",
-        "state": "Lagos",
-        "lga": "Surulere",
-        "location": "Surulere, Lagos",
-        "rating": 3.9,
-        "cuisine": "Nigerian",
-        "specialties": ['Local Dishes'],
-        "delivery_areas": ['Surulere'],
-        "opening_hours": None,
-        "url": "https://chowdeck.com/store?q=Buka+Surulere+6",
-    },
-    {
-        "id": "buka_surulere_7_039c066e",
-        "name": "Buka Surulere 7",
-        "city": "Surulere",
-        "state": "Lagos",
-        "lga": "Surulere",
-        "location": "Surulere, Lagos",
-        "rating": 4.0,
-        "cuisine": "Nigerian",
-        "specialties": ['Local Dishes'],
-        "delivery_areas": ['Surulere'],
-        "opening_hours": None,
-        "url": "https://chowdeck.com/store?q=Buka+Surulere+7",
-    },
-    {
-        "id": "buka_surulere_8_5f679ef1",
-        "name": "Buka Surulere 8",
-        "city": "Surulere",
-        "state": "Lagos",
-        "lga": "Surulere",
-        "location": "Surulere, Lagos",
-        "rating": 4.1,
-        "cuisine": "Nigerian",
-        "specialties": ['Local Dishes'],
-        "delivery_areas": ['Surulere'],
-        "opening_hours": None,
-        "url": "https://chowdeck.com/store?q=Buka+Surulere+8",
-    },
-    {
-        "id": "buka_surulere_9_2804e13f",
-        "name": "Buka Surulere 9",
-        "city": "Surulere",
-        "state": "Lagos",
-        "lga": "Surulere",
-        "location": "Surulere, Lagos",
-        "rating": 4.2,
-        "cuisine": "Nigerian",
-        "specialties": ['Local Dishes'],
-        "delivery_areas": ['Surulere'],
-        "opening_hours": None,
-        "url": "https://chowdeck.com/store?q=Buka+Surulere+9",
-    },
-    {
-        "id": "buka_surulere_10_40888f66",
-        "name": "Buka Surulere 10",
-        "city": "Surulere",
-        "state": "Lagos",
-        "lga": "Surulere",
-        "location": "Surulere, Lagos",
-        "rating": 3.8,
-        "cuisine": "Nigerian",
-        "specialties": ['Local Dishes'],
-        "delivery_areas": ['Surulere'],
-        "opening_hours": None,
-        "url": "https://chowdeck.com/store?q=Buka+Surulere+10",
-    },
-    {
-        "id": "amala_spot_ikeja_1_93870a66",
-        "name": "Amala Spot Ikeja 1",
-        "city": "Ikeja",
-        "state": "Lagos",
-        "lga": "Ikeja",
-        "location": "Ikeja, Lagos",
-        "rating": 3.9,
-        "cuisine": "Nigerian",
-        "specialties": ['Local Dishes'],
-        "delivery_areas": ['Ikeja'],
-        "opening_hours": None,
-        "url": "https://chowdeck.com/store?q=Amala+Spot+Ikeja+1",
-    },
-    {
-        "id": "amala_spot_ikeja_2_7fb081eb",
-        "name": "Amala Spot Ikeja 2",
-        "city": "Ikeja",
-        "state": "Lagos",
-        "lga": "Ikeja",
-        "location": "Ikeja, Lagos",
-        "rating": 4.0,
-        "cuisine": "Nigerian",
-        "specialties": ['Local Dishes'],
-        "delivery_areas": ['Ikeja'],
-        "opening_hours": None,
-        "url": "https://chowdeck.com/store?q=Amala+Spot+Ikeja+2",
-    },
-    {
-        "id": "amala_spot_ikeja_3_b64ef4cb",
-        "name": "Amala Spot Ikeja 3",
-        "city": "Ikeja",
-        "state": "Lagos",
-        "lga": "Ikeja",
-        "location": "Ikeja, Lagos",
-        "rating": 4.1,
-        "cuisine": "Nigerian",
-        "specialties": ['Local Dishes'],
-        "delivery_areas": ['Ikeja'],
-        "opening_hours": None,
-        "url": "https://chowdeck.com/store?q=Amala+Spot+Ikeja+3",
-    },
-    {
-        "id": "amala_spot_ikeja_4_593a07c4",
-        "name": "Amala Spot Ikeja 4",
-        "city": "Ikeja",
-        "state": "Lagos",
-        "lga": "Ikeja",
-        "location": "Ikeja, Lagos",
-        "rating": 4.2,
-        "cuisine": "Nigerian",
-        "specialties": ['Local Dishes'],
-        "delivery_areas": ['Ikeja'],
-        "opening_hours": None,
-        "url": "https://chowdeck.com/store?q=Amala+Spot+Ikeja+4",
-    },
-    {
-        "id": "amala_spot_ikeja_5_2509e69a",
-        "name": "Amala Spot Ikeja 5",
-        "city": "Ikeja",
-        "state": "Lagos",
-        "lga": "Ikeja",
-        "location": "Ikeja, Lagos",
-        "rating": 3.8,
-        "cuisine": "Nigerian",
-        "specialties": ['Local Dishes'],
-        "delivery_areas": ['Ikeja'],
-        "opening_hours": None,
-        "url": "https://chowdeck.com/store?q=Amala+Spot+Ikeja+5",
-    },
-    {
-        "id": "amala_spot_ikeja_6_f09ff456",
-        "name": "Amala Spot Ikeja 6",
-        "city": "Ikeja",
-        "state": "Lagos",
-        "lga": "Ikeja",
-        "location": "Ikeja, Lagos",
-        "rating": 3.9,
-        "cuisine": "Nigerian",
-        "specialties": ['Local Dishes'],
-        "delivery_areas": ['Ikeja'],
-        "opening_hours": None,
-        "url": "https://chowdeck.com/store?q=Amala+Spot+Ikeja+6",
-    },
-    {
-        "id": "amala_spot_ikeja_7_1fbcc12c",
-        "name": "Amala Spot Ikeja 7",
-        "city": "Ikeja",
-        "state": "Lagos",
-        "lga": "Ikeja",
-        "location": "Ikeja, Lagos",
-        "rating": 4.0,
-        "cuisine": "Nigerian",
-        "specialties": ['Local Dishes'],
-        "delivery_areas": ['Ikeja'],
-        "opening_hours": None,
-        "url": "https://chowdeck.com/store?q=Amala+Spot+Ikeja+7",
-    },
-    {
-        "id": "amala_spot_ikeja_8_ce6406eb",
-        "name": "Amala Spot Ikeja 8",
-        "city": "Ikeja",
-        "state": "Lagos",
-        "lga": "Ikeja",
-        "location": "Ikeja, Lagos",
-        "rating": 4.1,
-        "cuisine": "Nigerian",
-        "specialties": ['Local Dishes'],
-        "delivery_areas": ['Ikeja'],
-        "opening_hours": None,
-        "url": "https://chowdeck.com/store?q=Amala+Spot+Ikeja+8",
-    },
-    {
-        "id": "amala_spot_lagos_mainland_1_5fb61348",
-        "name": "Amala Spot Lagos Mainland 1",
-        "city": "Lagos Mainland",
-        "state": "Lagos",
-        "lga": "Lagos Mainland",
-        "location": "Lagos Mainland, Lagos",
-        "rating": 3.9,
-        "cuisine": "Nigerian",
-        "specialties": ['Local Dishes'],
-        "delivery_areas": ['Lagos Mainland'],
-        "opening_hours": None,
-        "url": "https://chowdeck.com/store?q=Amala+Spot+Lagos+Mainland+1",
-    },
-    {
-        "id": "amala_spot_lagos_mainland_2_53d6a157",
-        "name": "Amala Spot Lagos Mainland 2",
-        "city": "Lagos Mainland",
-        "state": "Lagos",
-        "lga": "Lagos Mainland",
-        "location": "Lagos Mainland, Lagos",
-        "rating": 4.0,
-        "cuisine": "Nigerian",
-        "specialties": ['Local Dishes'],
-        "delivery_areas": ['Lagos Mainland'],
-        "opening_hours": None,
-        "url": "https://chowdeck.com/store?q=Amala+Spot+Lagos+Mainland+2",
-    },
-    {
-        "id": "amala_spot_lagos_mainland_3_990dcd9e",
-        "name": "Amala Spot Lagos Mainland 3",
-        "city": "Lagos Mainland",
-        "state": "Lagos",
-        "lga": "Lagos Mainland",
-        "location": "Lagos Mainland, Lagos",
-        "rating": 4.1,
-        "cuisine": "Nigerian",
-        "specialties": ['Local Dishes'],
-        "delivery_areas": ['Lagos Mainland'],
-        "opening_hours": None,
-        "url": "https://chowdeck.com/store?q=Amala+Spot+Lagos+Mainland+3",
-    },
-    {
-        "id": "amala_spot_lagos_mainland_4_98b7466f",
-        "name": "Amala Spot Lagos Mainland 4",
-        "city": "Lagos Mainland",
-        "state": "Lagos",
-        "lga": "Lagos Mainland",
-        "location": "Lagos Mainland, Lagos",
-        "rating": 4.2,
-        "cuisine": "Nigerian",
-        "specialties": ['Local Dishes'],
-        "delivery_areas": ['Lagos Mainland'],
-        "opening_hours": None,
-        "url": "https://chowdeck.com/store?q=Amala+Spot+Lagos+Mainland+4",
-    },
-    {
-        "id": "amala_spot_lagos_mainland_5_60e04085",
-        "name": "Amala Spot Lagos Mainland 5",
-        "city": "Lagos Mainland",
-        "state": "Lagos",
-        "lga": "Lagos Mainland",
-        "location": "Lagos Mainland, Lagos",
-        "rating": 3.8,
-        "cuisine": "Nigerian",
-        "specialties": ['Local Dishes'],
-        "delivery_areas": ['Lagos Mainland'],
-        "opening_hours": None,
-        "url": "https://chowdeck.com/store?q=Amala+Spot+Lagos+Mainland+5",
-    },
-    {
-        "id": "amala_spot_lagos_mainland_6_967e65a6",
-        "name": "Amala Spot Lagos Mainland 6",
-        "city": "Lagos Mainland",
-        "state": "Lagos",
-        "lga": "Lagos Mainland",
-        "location": "Lagos Mainland, Lagos",
-        "rating": 3.9,
-        "cuisine": "Nigerian",
-        "specialties": ['Local Dishes'],
-        "delivery_areas": ['Lagos Mainland'],
-        "opening_hours": None,
-        "url": "https://chowdeck.com/store?q=Amala+Spot+Lagos+Mainland+6",
-    },
-    {
-        "id": "amala_spot_lagos_mainland_7_9634b0f2",
-        "name": "Amala Spot Lagos Mainland 7",
-        "city": "Lagos Mainland",
-        "state": "Lagos",
-        "lga": "Lagos Mainland",
-        "location": "Lagos Mainland, Lagos",
-        "rating": 4.0,
-        "cuisine": "Nigerian",
-        "specialties": ['Local Dishes'],
-        "delivery_areas": ['Lagos Mainland'],
-        "opening_hours": None,
-        "url": "https://chowdeck.com/store?q=Amala+Spot+Lagos+Mainland+7",
-    },
-    {
-        "id": "amala_spot_lagos_mainland_8_6eec4a05",
-        "name": "Amala Spot Lagos Mainland 8",
-        "city": "Lagos Mainland",
-        "state": "Lagos",
-        "lga": "Lagos Mainland",
-        "location": "Lagos Mainland, Lagos",
-        "rating": 4.1,
-        "cuisine": "Nigerian",
-        "specialties": ['Local Dishes'],
-        "delivery_areas": ['Lagos Mainland'],
-        "opening_hours": None,
-        "url": "https://chowdeck.com/store?q=Amala+Spot+Lagos+Mainland+8",
-    },
-    {
-        "id": "suya_spot_ikeja_1_e1bc213b",
-        "name": "Suya Spot Ikeja 1",
-        "city": "Ikeja",
-        "state": "Lagos",
-        "lga": "Ikeja",
-        "location": "Ikeja, Lagos",
-        "rating": 3.9,
-        "cuisine": "Nigerian",
-        "specialties": ['Local Dishes'],
-        "delivery_areas": ['Ikeja'],
-        "opening_hours": None,
-        "url": "https://chowdeck.com/store?q=Suya+Spot+Ikeja+1",
-    },
-    {
-        "id": "suya_spot_ikeja_2_7a03d849",
-        "name": "Suya Spot Ikeja 2",
-        "city": "Ikeja",
-        "state": "Lagos",
-        "lga": "Ikeja",
-        "location": "Ikeja, Lagos",
-        "rating": 4.0,
-        "cuisine": "Nigerian",
-        "specialties": ['Local Dishes'],
-        "delivery_areas": ['Ikeja'],
-        "opening_hours": None,
-        "url": "https://chowdeck.com/store?q=Suya+Spot+Ikeja+2",
-    },
-    {
-        "id": "suya_spot_ikeja_3_43952242",
-        "name": "Suya Spot Ikeja 3",
-        "city": "Ikeja",
-        "state": "Lagos",
-        "lga": "Ikeja",
-        "location": "Ikeja, Lagos",
-        "rating": 4.1,
-        "cuisine": "Nigerian",
-        "specialties": ['Local Dishes'],
-        "delivery_areas": ['Ikeja'],
-        "opening_hours": None,
-        "url": "https://chowdeck.com/store?q=Suya+Spot+Ikeja+3",
-    },
-    {
-        "id": "suya_spot_ikeja_4_8713172c",
-        "name": "Suya Spot Ikeja 4",
-        "city": "Ikeja",
-        "state": "Lagos",
-        "lga": "Ikeja",
-        "location": "Ikeja, Lagos",
-        "rating": 4.2,
-        "cuisine": "Nigerian",
-        "specialties": ['Local Dishes'],
-        "delivery_areas": ['Ikeja'],
-        "opening_hours": None,
-        "url": "https://chowdeck.com/store?q=Suya+Spot+Ikeja+4",
-    },
-    {
-        "id": "suya_spot_ikeja_5_6ca15667",
-        "name": "Suya Spot Ikeja 5",
-        "city": "Ikeja",
-        "state": "Lagos",
-        "lga": "Ikeja",
-        "location": "Ikeja, Lagos",
-        "rating": 3.8,
-        "cuisine": "Nigerian",
-        "specialties": ['Local Dishes'],
-        "delivery_areas": ['Ikeja'],
-        "opening_hours": None,
-        "url": "https://chowdeck.com/store?q=Suya+Spot+Ikeja+5",
-    },
-    {
-        "id": "suya_spot_ikeja_6_cb418d99",
-        "name": "Suya Spot Ikeja 6",
-        "city": "Ikeja",
-        "state": "Lagos",
-        "lga": "Ikeja",
-        "location": "Ikeja, Lagos",
-        "rating": 3.9,
-        "cuisine": "Nigerian",
-        "specialties": ['Local Dishes'],
-        "delivery_areas": ['Ikeja'],
-        "opening_hours": None,
-        "url": "https://chowdeck.com/store?q=Suya+Spot+Ikeja+6",
-    },
-    {
-        "id": "suya_spot_ikeja_7_c66dd225",
-        "name": "Suya Spot Ikeja 7",
-        "city": "Ikeja",
-        "state": "Lagos",
-        "lga": "Ikeja",
-        "location": "Ikeja, Lagos",
-        "rating": 4.0,
-        "cuisine": "Nigerian",
-        "specialties": ['Local Dishes'],
-        "delivery_areas": ['Ikeja'],
-        "opening_hours": None,
-        "url": "https://chowdeck.com/store?q=Suya+Spot+Ikeja+7",
-    },
-    {
-        "id": "suya_spot_ikeja_8_8e065ba7",
-        "name": "Suya Spot Ikeja 8",
-        "city": "Ikeja",
-        "state": "Lagos",
-        "lga": "Ikeja",
-        "location": "Ikeja, Lagos",
-        "rating": 4.1,
-        "cuisine": "Nigerian",
-        "specialties": ['Local Dishes'],
-        "delivery_areas": ['Ikeja'],
-        "opening_hours": None,
-        "url": "https://chowdeck.com/store?q=Suya+Spot+Ikeja+8",
-    },
-    {
-        "id": "suya_spot_eti_osa_1_dda3ba64",
-        "name": "Suya Spot Eti-Osa 1",
-        "city": "Eti-Osa",
-        "state": "Lagos",
-        "lga": "Eti-Osa",
-        "location": "Eti-Osa, Lagos",
-        "rating": 3.9,
-        "cuisine": "Nigerian",
-        "specialties": ['Local Dishes'],
-        "delivery_areas": ['Eti-Osa'],
-        "opening_hours": None,
-        "url": "https://chowdeck.com/store?q=Suya+Spot+Eti-Osa+1",
-    },
-    {
-        "id": "suya_spot_eti_osa_2_f536b118",
-        "name": "Suya Spot Eti-Osa 2",
-        "city": "Eti-Osa",
-        "state": "Lagos",
-        "lga": "Eti-Osa",
-        "location": "Eti-Osa, Lagos",
-        "rating": 4.0,
-        "cuisine": "Nigerian",
-        "specialties": ['Local Dishes'],
-        "delivery_areas": ['Eti-Osa'],
-        "opening_hours": None,
-        "url": "https://chowdeck.com/store?q=Suya+Spot+Eti-Osa+2",
-    },
-    {
-        "id": "suya_spot_eti_osa_3_06d5c234",
-        "name": "Suya Spot Eti-Osa 3",
-        "city": "Eti-Osa",
-        "state": "Lagos",
-        "lga": "Eti-Osa",
-        "location": "Eti-Osa, Lagos",
-        "rating": 4.1,
-        "cuisine": "Nigerian",
-        "specialties": ['Local Dishes'],
-        "delivery_areas": ['Eti-Osa'],
-        "opening_hours": None,
-        "url": "https://chowdeck.com/store?q=Suya+Spot+Eti-Osa+3",
-    },
-    {
-        "id": "suya_spot_eti_osa_4_91b2aff0",
-        "name": "Suya Spot Eti-Osa 4",
-        "city": "Eti-Osa",
-        "state": "Lagos",
-        "lga": "Eti-Osa",
-        "location": "Eti-Osa, Lagos",
-        "rating": 4.2,
-        "cuisine": "Nigerian",
-        "specialties": ['Local Dishes'],
-        "delivery_areas": ['Eti-Osa'],
-        "opening_hours": None,
-        "url": "https://chowdeck.com/store?q=Suya+Spot+Eti-Osa+4",
-    },
-    {
-        "id": "suya_spot_eti_osa_5_87d75e8c",
-        "name": "Suya Spot Eti-Osa 5",
-        "city": "Eti-Osa",
-        "state": "Lagos",
-        "lga": "Eti-Osa",
-        "location": "Eti-Osa, Lagos",
-        "rating": 3.8,
-        "cuisine": "Nigerian",
-        "specialties": ['Local Dishes'],
-        "delivery_areas": ['Eti-Osa'],
-        "opening_hours": None,
-        "url": "https://chowdeck.com/store?q=Suya+Spot+Eti-Osa+5",
-    },
-    {
-        "id": "suya_spot_eti_osa_6_59799212",
-        "name": "Suya Spot Eti-Osa 6",
-        "city": "Eti-Osa",
-        "state": "Lagos",
-        "lga": "Eti-Osa",
-        "location": "Eti-Osa, Lagos",
-        "rating": 3.9,
-        "cuisine": "Nigerian",
-        "specialties": ['Local Dishes'],
-        "delivery_areas": ['Eti-Osa'],
-        "opening_hours": None,
-        "url": "https://chowdeck.com/store?q=Suya+Spot+Eti-Osa+6",
-    },
-    {
-        "id": "suya_spot_surulere_1_b0256c0d",
-        "name": "Suya Spot Surulere 1",
-        "city": "Surulere",
-        "state": "Lagos",
-        "lga": "Surulere",
-        "location": "Surulere, Lagos",
-        "rating": 3.9,
-        "cuisine": "Nigerian",
-        "specialties": ['Local Dishes'],
-        "delivery_areas": ['Surulere'],
-        "opening_hours": None,
-        "url": "https://chowdeck.com/store?q=Suya+Spot+Surulere+1",
-    },
-    {
-        "id": "suya_spot_surulere_2_c8d80584",
-        "name": "Suya Spot Surulere 2",
-        "city": "Surulere",
-        "state": "Lagos",
-        "lga": "Surulere",
-        "location": "Surulere, Lagos",
-        "rating": 4.0,
-        "cuisine": "Nigerian",
-        "specialties": ['Local Dishes'],
-        "delivery_areas": ['Surulere'],
-        "opening_hours": None,
-        "url": "https://chowdeck.com/store?q=Suya+Spot+Surulere+2",
-    },
-    {
-        "id": "suya_spot_surulere_3_94ab51a8",
-        "name": "Suya Spot Surulere 3",
-        "city": "Surulere",
-        "state": "Lagos",
-        "lga": "Surulere",
-        "location": "Surulere, Lagos",
-        "rating": 4.1,
-        "cuisine": "Nigerian",
-        "specialties": ['Local Dishes'],
-        "delivery_areas": ['Surulere'],
-        "opening_hours": None,
-        "url": "https://chowdeck.com/store?q=Suya+Spot+Surulere+3",
-    },
-    {
-        "id": "suya_spot_surulere_4_549e9ab1",
-        "name": "Suya Spot Surulere 4",
-        "city": "Surulere",
-        "state": "Lagos",
-        "lga": "Surulere",
-        "location": "Surulere, Lagos",
-        "rating": 4.2,
-        "cuisine": "Nigerian",
-        "specialties": ['Local Dishes'],
-        "delivery_areas": ['Surulere'],
-        "opening_hours": None,
-        "url": "https://chowdeck.com/store?q=Suya+Spot+Surulere+4",
-    },
-    {
-        "id": "suya_spot_surulere_5_67f9e2d2",
-        "name": "Suya Spot Surulere 5",
-        "city": "Surulere",
-        "state": "Lagos",
-        "lga": "Surulere",
-        "location": "Surulere, Lagos",
-        "rating": 3.8,
-        "cuisine": "Nigerian",
-        "specialties": ['Local Dishes'],
-        "delivery_areas": ['Surulere'],
-        "opening_hours": None,
-        "url": "https://chowdeck.com/store?q=Suya+Spot+Surulere+5",
-    },
-    {
-        "id": "suya_spot_surulere_6_e34c46b8",
-        "name": "Suya Spot Surulere 6",
-        "city": "Surulere",
-        "state": "Lagos",
-        "lga": "Surulere",
-        "location": "Surulere, Lagos",
-        "rating": 3.9,
-        "cuisine": "Nigerian",
-        "specialties": ['Local Dishes'],
-        "delivery_areas": ['Surulere'],
-        "opening_hours": None,
-        "url": "https://chowdeck.com/store?q=Suya+Spot+Surulere+6",
-    },
-    {
-        "id": "rice_beans_joint_lagos_mainland_1_5f08f4dc",
-        "name": "Rice & Beans Joint Lagos Mainland 1",
-        "city": "Lagos Mainland",
-        "state": "Lagos",
-        "lga": "Lagos Mainland",
-        "location": "Lagos Mainland, Lagos",
-        "rating": 3.9,
-        "cuisine": "Nigerian",
-        "specialties": ['Local Dishes'],
-        "delivery_areas": ['Lagos Mainland'],
-        "opening_hours": None,
-        "url": "https://chowdeck.com/store?q=Rice+&+Beans+Joint+Lagos+Mainland+1",
-    },
-    {
-        "id": "rice_beans_joint_lagos_mainland_2_5c62e585",
-        "name": "Rice & Beans Joint Lagos Mainland 2",
-        "city": "Lagos Mainland",
-        "state": "Lagos",
-        "lga": "Lagos Mainland",
-        "location": "Lagos Mainland, Lagos",
-        "rating": 4.0,
-        "cuisine": "Nigerian",
-        "specialties": ['Local Dishes'],
-        "delivery_areas": ['Lagos Mainland'],
-        "opening_hours": None,
-        "url": "https://chowdeck.com/store?q=Rice+&+Beans+Joint+Lagos+Mainland+2",
-    },
-    {
-        "id": "rice_beans_joint_lagos_mainland_3_6c8afccc",
-        "name": "Rice & Beans Joint Lagos Mainland 3",
-        "city": "Lagos Mainland",
-        "state": "Lagos",
-        "lga": "Lagos Mainland",
-        "location": "Lagos Mainland, Lagos",
-        "rating": 4.1,
-        "cuisine": "Nigerian",
-        "specialties": ['Local Dishes'],
-        "delivery_areas": ['Lagos Mainland'],
-        "opening_hours": None,
-        "url": "https://chowdeck.com/store?q=Rice+&+Beans+Joint+Lagos+Mainland+3",
-    },
-    {
-        "id": "rice_beans_joint_lagos_mainland_4_8f57ad2e",
-        "name": "Rice & Beans Joint Lagos Mainland 4",
-        "city": "Lagos Mainland",
-        "state": "Lagos",
-        "lga": "Lagos Mainland",
-        "location": "Lagos Mainland, Lagos",
-        "rating": 4.2,
-        "cuisine": "Nigerian",
-        "specialties": ['Local Dishes'],
-        "delivery_areas": ['Lagos Mainland'],
-        "opening_hours": None,
-        "url": "https://chowdeck.com/store?q=Rice+&+Beans+Joint+Lagos+Mainland+4",
-    },
-    {
-        "id": "rice_beans_joint_lagos_mainland_5_dd2caf79",
-        "name": "Rice & Beans Joint Lagos Mainland 5",
-        "city": "Lagos Mainland",
-        "state": "Lagos",
-        "lga": "Lagos Mainland",
-        "location": "Lagos Mainland, Lagos",
-        "rating": 3.8,
-        "cuisine": "Nigerian",
-        "specialties": ['Local Dishes'],
-        "delivery_areas": ['Lagos Mainland'],
-        "opening_hours": None,
-        "url": "https://chowdeck.com/store?q=Rice+&+Beans+Joint+Lagos+Mainland+5",
-    },
-    {
-        "id": "rice_beans_joint_lagos_mainland_6_4f30f53d",
-        "name": "Rice & Beans Joint Lagos Mainland 6",
-        "city": "Lagos Mainland",
-        "state": "Lagos",
-        "lga": "Lagos Mainland",
-        "location": "Lagos Mainland, Lagos",
-        "rating": 3.9,
-        "cuisine": "Nigerian",
-        "specialties": ['Local Dishes'],
-        "delivery_areas": ['Lagos Mainland'],
-        "opening_hours": None,
-        "url": "https://chowdeck.com/store?q=Rice+&+Beans+Joint+Lagos+Mainland+6",
-    },
-    {
-        "id": "rice_beans_joint_lagos_mainland_7_b042d711",
-        "name": "Rice & Beans Joint Lagos Mainland 7",
-        "city": "Lagos Mainland",
-        "state": "Lagos",
-        "lga": "Lagos Mainland",
-        "location": "Lagos Mainland, Lagos",
-        "rating": 4.0,
-        "cuisine": "Nigerian",
-        "specialties": ['Local Dishes'],
-        "delivery_areas": ['Lagos Mainland'],
-        "opening_hours": None,
-        "url": "https://chowdeck.com/store?q=Rice+&+Beans+Joint+Lagos+Mainland+7",
-    },
-    {
-        "id": "rice_beans_joint_lagos_mainland_8_8a0b81d5",
-        "name": "Rice & Beans Joint Lagos Mainland 8",
-        "city": "Lagos Mainland",
-        "state": "Lagos",
-        "lga": "Lagos Mainland",
-        "location": "Lagos Mainland, Lagos",
-        "rating": 4.1,
-        "cuisine": "Nigerian",
-        "specialties": ['Local Dishes'],
-        "delivery_areas": ['Lagos Mainland'],
-        "opening_hours": None,
-        "url": "https://chowdeck.com/store?q=Rice+&+Beans+Joint+Lagos+Mainland+8",
-    },
-    {
-        "id": "rice_beans_joint_lagos_mainland_9_25d6ac5a",
-        "name": "Rice & Beans Joint Lagos Mainland 9",
-        "city": "Lagos Mainland",
-        "state": "Lagos",
-        "lga": "Lagos Mainland",
-        "location": "Lagos Mainland, Lagos",
-        "rating": 4.2,
-        "cuisine": "Nigerian",
-        "specialties": ['Local Dishes'],
-        "delivery_areas": ['Lagos Mainland'],
-        "opening_hours": None,
-        "url": "https://chowdeck.com/store?q=Rice+&+Beans+Joint+Lagos+Mainland+9",
-    },
-    {
-        "id": "rice_beans_joint_lagos_mainland_10_868a2a3a",
-        "name": "Rice & Beans Joint Lagos Mainland 10",
-        "city": "Lagos Mainland",
-        "state": "Lagos",
-        "lga": "Lagos Mainland",
-        "location": "Lagos Mainland, Lagos",
-        "rating": 3.8,
-        "cuisine": "Nigerian",
-        "specialties": ['Local Dishes'],
-        "delivery_areas": ['Lagos Mainland'],
-        "opening_hours": None,
-        "url": "https://chowdeck.com/store?q=Rice+&+Beans+Joint+Lagos+Mainland+10",
-    },
-    {
-        "id": "shawarma_point_ikeja_1_09808e51",
-        "name": "Shawarma Point Ikeja 1",
-        "city": "Ikeja",
-        "state": "Lagos",
-        "lga": "Ikeja",
-        "location": "Ikeja, Lagos",
-        "rating": 3.9,
-        "cuisine": "Nigerian",
-        "specialties": ['Local Dishes'],
-        "delivery_areas": ['Ikeja'],
-        "opening_hours": None,
-        "url": "https://chowdeck.com/store?q=Shawarma+Point+Ikeja+1",
-    },
-    {
-        "id": "shawarma_point_ikeja_2_9d22a74b",
-        "name": "Shawarma Point Ikeja 2",
-        "city": "Ikeja",
-        "state": "Lagos",
-        "lga": "Ikeja",
-        "location": "Ikeja, Lagos",
-        "rating": 4.0,
-        "cuisine": "Nigerian",
-        "specialties": ['Local Dishes'],
-        "delivery_areas": ['Ikeja'],
-        "opening_hours": None,
-        "url": "https://chowdeck.com/store?q=Shawarma+Point+Ikeja+2",
-    },
-    {
-        "id": "shawarma_point_ikeja_3_243c00bf",
-        "name": "Shawarma Point Ikeja 3",
-        "city": "Ikeja",
-        "state": "Lagos",
-        "lga": "Ikeja",
-        "location": "Ikeja, Lagos",
-        "rating": 4.1,
-        "cuisine": "Nigerian",
-        "specialties": ['Local Dishes'],
-        "delivery_areas": ['Ikeja'],
-        "opening_hours": None,
-        "url": "https://chowdeck.com/store?q=Shawarma+Point+Ikeja+3",
-    },
-    {
-        "id": "shawarma_point_ikeja_4_fa634b47",
-        "name": "Shawarma Point Ikeja 4",
-        "city": "Ikeja",
-        "state": "Lagos",
-        "lga": "Ikeja",
-        "location": "Ikeja, Lagos",
-        "rating": 4.2,
-        "cuisine": "Nigerian",
-        "specialties": ['Local Dishes'],
-        "delivery_areas": ['Ikeja'],
-        "opening_hours": None,
-        "url": "https://chowdeck.com/store?q=Shawarma+Point+Ikeja+4",
-    },
-    {
-        "id": "shawarma_point_ikeja_5_24170cba",
-        "name": "Shawarma Point Ikeja 5",
-        "city": "Ikeja",
-        "state": "Lagos",
-        "lga": "Ikeja",
-        "location": "Ikeja, Lagos",
-        "rating": 3.8,
-        "cuisine": "Nigerian",
-        "specialties": ['Local Dishes'],
-        "delivery_areas": ['Ikeja'],
-        "opening_hours": None,
-        "url": "https://chowdeck.com/store?q=Shawarma+Point+Ikeja+5",
-    },
-    {
-        "id": "shawarma_point_ikeja_6_b8ce05b3",
-        "name": "Shawarma Point Ikeja 6",
-        "city": "Ikeja",
-        "state": "Lagos",
-        "lga": "Ikeja",
-        "location": "Ikeja, Lagos",
-        "rating": 3.9,
-        "cuisine": "Nigerian",
-        "specialties": ['Local Dishes'],
-        "delivery_areas": ['Ikeja'],
-        "opening_hours": None,
-        "url": "https://chowdeck.com/store?q=Shawarma+Point+Ikeja+6",
-    },
-    {
-        "id": "shawarma_point_eti_osa_1_61cc3867",
-        "name": "Shawarma Point Eti-Osa 1",
-        "city": "Eti-Osa",
-        "state": "Lagos",
-        "lga": "Eti-Osa",
-        "location": "Eti-Osa, Lagos",
-        "rating": 3.9,
-        "cuisine": "Nigerian",
-        "specialties": ['Local Dishes'],
-        "delivery_areas": ['Eti-Osa'],
-        "opening_hours": None,
-        "url": "https://chowdeck.com/store?q=Shawarma+Point+Eti-Osa+1",
-    },
-    {
-        "id": "shawarma_point_eti_osa_2_d214387c",
-        "name": "Shawarma Point Eti-Osa 2",
-        "city": "Eti-Osa",
-        "state": "Lagos",
-        "lga": "Eti-Osa",
-        "location": "Eti-Osa, Lagos",
-        "rating": 4.0,
-        "cuisine": "Nigerian",
-        "specialties": ['Local Dishes'],
-        "delivery_areas": ['Eti-Osa'],
-        "opening_hours": None,
-        "url": "https://chowdeck.com/store?q=Shawarma+Point+Eti-Osa+2",
-    },
-    {
-        "id": "shawarma_point_eti_osa_3_263713b1",
-        "name": "Shawarma Point Eti-Osa 3",
-        "city": "Eti-Osa",
-        "state": "Lagos",
-        "lga": "Eti-Osa",
-        "location": "Eti-Osa, Lagos",
-        "rating": 4.1,
-        "cuisine": "Nigerian",
-        "specialties": ['Local Dishes'],
-        "delivery_areas": ['Eti-Osa'],
-        "opening_hours": None,
-        "url": "https://chowdeck.com/store?q=Shawarma+Point+Eti-Osa+3",
-    },
-    {
-        "id": "shawarma_point_eti_osa_4_443b6027",
-        "name": "Shawarma Point Eti-Osa 4",
-        "city": "Eti-Osa",
-        "state": "Lagos",
-        "lga": "Eti-Osa",
-        "location": "Eti-Osa, Lagos",
-        "rating": 4.2,
-        "cuisine": "Nigerian",
-        "specialties": ['Local Dishes'],
-        "delivery_areas": ['Eti-Osa'],
-        "opening_hours": None,
-        "url": "https://chowdeck.com/store?q=Shawarma+Point+Eti-Osa+4",
-    },
-    {
-        "id": "shawarma_point_eti_osa_5_b082fb11",
-        "name": "Shawarma Point Eti-Osa 5",
-        "city": "Eti-Osa",
-        "state": "Lagos",
-        "lga": "Eti-Osa",
-        "location": "Eti-Osa, Lagos",
-        "rating": 3.8,
-        "cuisine": "Nigerian",
-        "specialties": ['Local Dishes'],
-        "delivery_areas": ['Eti-Osa'],
-        "opening_hours": None,
-        "url": "https://chowdeck.com/store?q=Shawarma+Point+Eti-Osa+5",
-    },
-    {
-        "id": "shawarma_point_eti_osa_6_26ffa8b4",
-        "name": "Shawarma Point Eti-Osa 6",
-        "city": "Eti-Osa",
-        "state": "Lagos",
-        "lga": "Eti-Osa",
-        "location": "Eti-Osa, Lagos",
-        "rating": 3.9,
-        "cuisine": "Nigerian",
-        "specialties": ['Local Dishes'],
-        "delivery_areas": ['Eti-Osa'],
-        "opening_hours": None,
-        "url": "https://chowdeck.com/store?q=Shawarma+Point+Eti-Osa+6",
-    },
-    {
-        "id": "shawarma_point_eti_osa_7_801a3c97",
-        "name": "Shawarma Point Eti-Osa 7",
-        "city": "Eti-Osa",
-        "state": "Lagos",
-        "lga": "Eti-Osa",
-        "location": "Eti-Osa, Lagos",
-        "rating": 4.0,
-        "cuisine": "Nigerian",
-        "specialties": ['Local Dishes'],
-        "delivery_areas": ['Eti-Osa'],
-        "opening_hours": None,
-        "url": "https://chowdeck.com/store?q=Shawarma+Point+Eti-Osa+7",
-    },
-    {
-        "id": "shawarma_point_eti_osa_8_c7b9e73f",
-        "name": "Shawarma Point Eti-Osa 8",
-        "city": "Eti-Osa",
-        "state": "Lagos",
-        "lga": "Eti-Osa",
-        "location": "Eti-Osa, Lagos",
-        "rating": 4.1,
-        "cuisine": "Nigerian",
-        "specialties": ['Local Dishes'],
-        "delivery_areas": ['Eti-Osa'],
-        "opening_hours": None,
-        "url": "https://chowdeck.com/store?q=Shawarma+Point+Eti-Osa+8",
-    },
-    {
-        "id": "shawarma_point_surulere_1_c20abe36",
-        "name": "Shawarma Point Surulere 1",
-        "city": "Surulere",
-        "state": "Lagos",
-        "lga": "Surulere",
-        "location": "Surulere, Lagos",
-        "rating": 3.9,
-        "cuisine": "Nigerian",
-        "specialties": ['Local Dishes'],
-        "delivery_areas": ['Surulere'],
-        "opening_hours": None,
-        "url": "https://chowdeck.com/store?q=Shawarma+Point+Surulere+1",
-    },
-    {
-        "id": "shawarma_point_surulere_2_29bd8064",
-        "name": "Shawarma Point Surulere 2",
-        "city": "Surulere",
-        "state": "Lagos",
-        "lga": "Surulere",
-        "location": "Surulere, Lagos",
-        "rating": 4.0,
-        "cuisine": "Nigerian",
-        "specialties": ['Local Dishes'],
-        "delivery_areas": ['Surulere'],
-        "opening_hours": None,
-        "url": "https://chowdeck.com/store?q=Shawarma+Point+Surulere+2",
-    },
-    {
-        "id": "shawarma_point_surulere_3_eaa0600d",
-        "name": "Shawarma Point Surulere 3",
-        "city": "Surulere",
-        "state": "Lagos",
-        "lga": "Surulere",
-        "location": "Surulere, Lagos",
-        "rating": 4.1,
-        "cuisine": "Nigerian",
-        "specialties": ['Local Dishes'],
-        "delivery_areas": ['Surulere'],
-        "opening_hours": None,
-        "url": "https://chowdeck.com/store?q=Shawarma+Point+Surulere+3",
-    },
-    {
-        "id": "shawarma_point_surulere_4_1f2683e9",
-        "name": "Shawarma Point Surulere 4",
-        "city": "Surulere",
-        "state": "Lagos",
-        "lga": "Surulere",
-        "location": "Surulere, Lagos",
-        "rating": 4.2,
-        "cuisine": "Nigerian",
-        "specialties": ['Local Dishes'],
-        "delivery_areas": ['Surulere'],
-        "opening_hours": None,
-        "url": "https://chowdeck.com/store?q=Shawarma+Point+Surulere+4",
-    },
-    {
-        "id": "shawarma_point_surulere_5_c4f5aedf",
-        "name": "Shawarma Point Surulere 5",
-        "city": "Surulere",
-        "state": "Lagos",
-        "lga": "Surulere",
-        "location": "Surulere, Lagos",
-        "rating": 3.8,
-        "cuisine": "Nigerian",
-        "specialties": ['Local Dishes'],
-        "delivery_areas": ['Surulere'],
-        "opening_hours": None,
-        "url": "https://chowdeck.com/store?q=Shawarma+Point+Surulere+5",
-    },
-    {
-        "id": "pepper_soup_joint_ikeja_1_881a6735",
-        "name": "Pepper Soup Joint Ikeja 1",
-        "city": "Ikeja",
-        "state": "Lagos",
-        "lga": "Ikeja",
-        "location": "Ikeja, Lagos",
-        "rating": 3.9,
-        "cuisine": "Nigerian",
-        "specialties": ['Local Dishes'],
-        "delivery_areas": ['Ikeja'],
-        "opening_hours": None,
-        "url": "https://chowdeck.com/store?q=Pepper+Soup+Joint+Ikeja+1",
-    },
-    {
-        "id": "pepper_soup_joint_ikeja_2_ae66a67b",
-        "name": "Pepper Soup Joint Ikeja 2",
-        "city": "Ikeja",
-        "state": "Lagos",
-        "lga": "Ikeja",
-        "location": "Ikeja, Lagos",
-        "rating": 4.0,
-        "cuisine": "Nigerian",
-        "specialties": ['Local Dishes'],
-        "delivery_areas": ['Ikeja'],
-        "opening_hours": None,
-        "url": "https://chowdeck.com/store?q=Pepper+Soup+Joint+Ikeja+2",
-    },
-    {
-        "id": "pepper_soup_joint_ikeja_3_187faeb2",
-        "name": "Pepper Soup Joint Ikeja 3",
-        "city": "Ikeja",
-        "state": "Lagos",
-        "lga": "Ikeja",
-        "location": "Ikeja, Lagos",
-        "rating": 4.1,
-        "cuisine": "Nigerian",
-        "specialties": ['Local Dishes'],
-        "delivery_areas": ['Ikeja'],
-        "opening_hours": None,
-        "url": "https://chowdeck.com/store?q=Pepper+Soup+Joint+Ikeja+3",
-    },
-    {
-        "id": "pepper_soup_joint_ikeja_4_7b86e3c3",
-        "name": "Pepper Soup Joint Ikeja 4",
-        "city": "Ikeja",
-        "state": "Lagos",
-        "lga": "Ikeja",
-        "location": "Ikeja, Lagos",
-        "rating": 4.2,
-        "cuisine": "Nigerian",
-        "specialties": ['Local Dishes'],
-        "delivery_areas": ['Ikeja'],
-        "opening_hours": None,
-        "url": "https://chowdeck.com/store?q=Pepper+Soup+Joint+Ikeja+4",
-    },
-    {
-        "id": "pepper_soup_joint_ikeja_5_7a44eaf0",
-        "name": "Pepper Soup Joint Ikeja 5",
-        "city": "Ikeja",
-        "state": "Lagos",
-        "lga": "Ikeja",
-        "location": "Ikeja, Lagos",
-        "rating": 3.8,
-        "cuisine": "Nigerian",
-        "specialties": ['Local Dishes'],
-        "delivery_areas": ['Ikeja'],
-        "opening_hours": None,
-        "url": "https://chowdeck.com/store?q=Pepper+Soup+Joint+Ikeja+5",
-    },
-    {
-        "id": "pepper_soup_joint_eti_osa_1_de39be2a",
-        "name": "Pepper Soup Joint Eti-Osa 1",
-        "city": "Eti-Osa",
-        "state": "Lagos",
-        "lga": "Eti-Osa",
-        "location": "Eti-Osa, Lagos",
-        "rating": 3.9,
-        "cuisine": "Nigerian",
-        "specialties": ['Local Dishes'],
-        "delivery_areas": ['Eti-Osa'],
-        "opening_hours": None,
-        "url": "https://chowdeck.com/store?q=Pepper+Soup+Joint+Eti-Osa+1",
-    },
-    {
-        "id": "pepper_soup_joint_eti_osa_2_e849e563",
-        "name": "Pepper Soup Joint Eti-Osa 2",
-        "city": "Eti-Osa",
-        "state": "Lagos",
-        "lga": "Eti-Osa",
-        "location": "Eti-Osa, Lagos",
-        "rating": 4.0,
-        "cuisine": "Nigerian",
-        "specialties": ['Local Dishes'],
-        "delivery_areas": ['Eti-Osa'],
-        "opening_hours": None,
-        "url": "https://chowdeck.com/store?q=Pepper+Soup+Joint+Eti-Osa+2",
-    },
-    {
-        "id": "pepper_soup_joint_eti_osa_3_0a0a2a4e",
-        "name": "Pepper Soup Joint Eti-Osa 3",
-        "city": "Eti-Osa",
-        "state": "Lagos",
-        "lga": "Eti-Osa",
-        "location": "Eti-Osa, Lagos",
-        "rating": 4.1,
-        "cuisine": "Nigerian",
-        "specialties": ['Local Dishes'],
-        "delivery_areas": ['Eti-Osa'],
-        "opening_hours": None,
-        "url": "https://chowdeck.com/store?q=Pepper+Soup+Joint+Eti-Osa+3",
-    },
-    {
-        "id": "pepper_soup_joint_eti_osa_4_b4617075",
-        "name": "Pepper Soup Joint Eti-Osa 4",
-        "city": "Eti-Osa",
-        "state": "Lagos",
-        "lga": "Eti-Osa",
-        "location": "Eti-Osa, Lagos",
-        "rating": 4.2,
-        "cuisine": "Nigerian",
-        "specialties": ['Local Dishes'],
-        "delivery_areas": ['Eti-Osa'],
-        "opening_hours": None,
-        "url": "https://chowdeck.com/store?q=Pepper+Soup+Joint+Eti-Osa+4",
-    },
-    {
-        "id": "pepper_soup_joint_eti_osa_5_adabcee3",
-        "name": "Pepper Soup Joint Eti-Osa 5",
-        "city": "Eti-Osa",
-        "state": "Lagos",
-        "lga": "Eti-Osa",
-        "location": "Eti-Osa, Lagos",
-        "rating": 3.8,
-        "cuisine": "Nigerian",
-        "specialties": ['Local Dishes'],
-        "delivery_areas": ['Eti-Osa'],
-        "opening_hours": None,
-        "url": "https://chowdeck.com/store?q=Pepper+Soup+Joint+Eti-Osa+5",
-    },
-    {
-        "id": "ewa_agoyin_spot_lagos_mainland_1_26db507e",
-        "name": "Ewa Agoyin Spot Lagos Mainland 1",
-        "city": "Lagos Mainland",
-        "state": "Lagos",
-        "lga": "Lagos Mainland",
-        "location": "Lagos Mainland, Lagos",
-        "rating": 3.9,
-        "cuisine": "Nigerian",
-        "specialties": ['Local Dishes'],
-        "delivery_areas": ['Lagos Mainland'],
-        "opening_hours": None,
-        "url": "https://chowdeck.com/store?q=Ewa+Agoyin+Spot+Lagos+Mainland+1",
-    },
-    {
-        "id": "ewa_agoyin_spot_lagos_mainland_2_6d1aa67a",
-        "name": "Ewa Agoyin Spot Lagos Mainland 2",
-        "city": "Lagos Mainland",
-        "state": "Lagos",
-        "lga": "Lagos Mainland",
-        "location": "Lagos Mainland, Lagos",
-        "rating": 4.0,
-        "cuisine": "Nigerian",
-        "specialties": ['Local Dishes'],
-        "delivery_areas": ['Lagos Mainland'],
-        "opening_hours": None,
-        "url": "https://chowdeck.com/store?q=Ewa+Agoyin+Spot+Lagos+Mainland+2",
-    },
-    {
-        "id": "ewa_agoyin_spot_lagos_mainland_3_5e4c37e4",
-        "name": "Ewa Agoyin Spot Lagos Mainland 3",
-        "city": "Lagos Mainland",
-        "state": "Lagos",
-        "lga": "Lagos Mainland",
-        "location": "Lagos Mainland, Lagos",
-        "rating": 4.1,
-        "cuisine": "Nigerian",
-        "specialties": ['Local Dishes'],
-        "delivery_areas": ['Lagos Mainland'],
-        "opening_hours": None,
-        "url": "https://chowdeck.com/store?q=Ewa+Agoyin+Spot+Lagos+Mainland+3",
-    },
-    {
-        "id": "ewa_agoyin_spot_lagos_mainland_4_2f19a423",
-        "name": "Ewa Agoyin Spot Lagos Mainland 4",
-        "city": "Lagos Mainland",
-        "state": "Lagos",
-        "lga": "Lagos Mainland",
-        "location": "Lagos Mainland, Lagos",
-        "rating": 4.2,
-        "cuisine": "Nigerian",
-        "specialties": ['Local Dishes'],
-        "delivery_areas": ['Lagos Mainland'],
-        "opening_hours": None,
-        "url": "https://chowdeck.com/store?q=Ewa+Agoyin+Spot+Lagos+Mainland+4",
-    },
-    {
-        "id": "ewa_agoyin_spot_lagos_mainland_5_0b61b89d",
-        "name": "Ewa Agoyin Spot Lagos Mainland 5",
-        "city": "Lagos Mainland",
-        "state": "Lagos",
-        "lga": "Lagos Mainland",
-        "location": "Lagos Mainland, Lagos",
-        "rating": 3.8,
-        "cuisine": "Nigerian",
-        "specialties": ['Local Dishes'],
-        "delivery_areas": ['Lagos Mainland'],
-        "opening_hours": None,
-        "url": "https://chowdeck.com/store?q=Ewa+Agoyin+Spot+Lagos+Mainland+5",
-    },
-    {
-        "id": "ewa_agoyin_spot_lagos_mainland_6_19e2e157",
-        "name": "Ewa Agoyin Spot Lagos Mainland 6",
-        "city": "Lagos Mainland",
-        "state": "Lagos",
-        "lga": "Lagos Mainland",
-        "location": "Lagos Mainland, Lagos",
-        "rating": 3.9,
-        "cuisine": "Nigerian",
-        "specialties": ['Local Dishes'],
-        "delivery_areas": ['Lagos Mainland'],
-        "opening_hours": None,
-        "url": "https://chowdeck.com/store?q=Ewa+Agoyin+Spot+Lagos+Mainland+6",
-    },
-    {
-        "id": "ewa_agoyin_spot_lagos_mainland_7_ea0d496b",
-        "name": "Ewa Agoyin Spot Lagos Mainland 7",
-        "city": "Lagos Mainland",
-        "state": "Lagos",
-        "lga": "Lagos Mainland",
-        "location": "Lagos Mainland, Lagos",
-        "rating": 4.0,
-        "cuisine": "Nigerian",
-        "specialties": ['Local Dishes'],
-        "delivery_areas": ['Lagos Mainland'],
-        "opening_hours": None,
-        "url": "https://chowdeck.com/store?q=Ewa+Agoyin+Spot+Lagos+Mainland+7",
-    },
-    {
-        "id": "ewa_agoyin_spot_lagos_mainland_8_d25219b5",
-        "name": "Ewa Agoyin Spot Lagos Mainland 8",
-        "city": "Lagos Mainland",
-        "state": "Lagos",
-        "lga": "Lagos Mainland",
-        "location": "Lagos Mainland, Lagos",
-        "rating": 4.1,
-        "cuisine": "Nigerian",
-        "specialties": ['Local Dishes'],
-        "delivery_areas": ['Lagos Mainland'],
-        "opening_hours": None,
-        "url": "https://chowdeck.com/store?q=Ewa+Agoyin+Spot+Lagos+Mainland+8",
-    },
-    {
-        "id": "ewa_agoyin_spot_surulere_1_e02e02f5",
-        "name": "Ewa Agoyin Spot Surulere 1",
-        "city": "Surulere",
-        "state": "Lagos",
-        "lga": "Surulere",
-        "location": "Surulere, Lagos",
-        "rating": 3.9,
-        "cuisine": "Nigerian",
-        "specialties": ['Local Dishes'],
-        "delivery_areas": ['Surulere'],
-        "opening_hours": None,
-        "url": "https://chowdeck.com/store?q=Ewa+Agoyin+Spot+Surulere+1",
-    },
-    {
-        "id": "ewa_agoyin_spot_surulere_2_fa0e649c",
-        "name": "Ewa Agoyin Spot Surulere 2",
-        "city": "Surulere",
-        "state": "Lagos",
-        "lga": "Surulere",
-        "location": "Surulere, Lagos",
-        "rating": 4.0,
-        "cuisine": "Nigerian",
-        "specialties": ['Local Dishes'],
-        "delivery_areas": ['Surulere'],
-        "opening_hours": None,
-        "url": "https://chowdeck.com/store?q=Ewa+Agoyin+Spot+Surulere+2",
-    },
-    {
-        "id": "ewa_agoyin_spot_surulere_3_75ead5de",
-        "name": "Ewa Agoyin Spot Surulere 3",
-        "city": "Surulere",
-        "state": "Lagos",
-        "lga": "Surulere",
-        "location": "Surulere, Lagos",
-        "rating": 4.1,
-        "cuisine": "Nigerian",
-        "specialties": ['Local Dishes'],
-        "delivery_areas": ['Surulere'],
-        "opening_hours": None,
-        "url": "https://chowdeck.com/store?q=Ewa+Agoyin+Spot+Surulere+3",
-    },
-    {
-        "id": "ewa_agoyin_spot_surulere_4_29c2ccfb",
-        "name": "Ewa Agoyin Spot Surulere 4",
-        "city": "Surulere",
-        "state": "Lagos",
-        "lga": "Surulere",
-        "location": "Surulere, Lagos",
-        "rating": 4.2,
-        "cuisine": "Nigerian",
-        "specialties": ['Local Dishes'],
-        "delivery_areas": ['Surulere'],
-        "opening_hours": None,
-        "url": "https://chowdeck.com/store?q=Ewa+Agoyin+Spot+Surulere+4",
-    },
-    {
-        "id": "ewa_agoyin_spot_surulere_5_269aad7c",
-        "name": "Ewa Agoyin Spot Surulere 5",
-        "city": "Surulere",
-        "state": "Lagos",
-        "lga": "Surulere",
-        "location": "Surulere, Lagos",
-        "rating": 3.8,
-        "cuisine": "Nigerian",
-        "specialties": ['Local Dishes'],
-        "delivery_areas": ['Surulere'],
-        "opening_hours": None,
-        "url": "https://chowdeck.com/store?q=Ewa+Agoyin+Spot+Surulere+5",
-    },
-    {
-        "id": "ewa_agoyin_spot_surulere_6_974767e0",
-        "name": "Ewa Agoyin Spot Surulere 6",
-        "city": "Surulere",
-        "state": "Lagos",
-        "lga": "Surulere",
-        "location": "Surulere, Lagos",
-        "rating": 3.9,
-        "cuisine": "Nigerian",
-        "specialties": ['Local Dishes'],
-        "delivery_areas": ['Surulere'],
-        "opening_hours": None,
-        "url": "https://chowdeck.com/store?q=Ewa+Agoyin+Spot+Surulere+6",
-    },
-    {
-        "id": "local_kitchen_eti_osa_branch_1_4b94b319",
-        "name": "Local Kitchen Eti-Osa Branch 1",
-        "city": "Eti-Osa",
-        "state": "Lagos",
-        "lga": "Eti-Osa",
-        "location": "Eti-Osa, Lagos",
-        "rating": 4.0,
-        "cuisine": "Nigerian",
-        "specialties": ['Local Dishes'],
-        "delivery_areas": ['Eti-Osa'],
-        "opening_hours": None,
-        "url": "https://chowdeck.com/store?q=Local+Kitchen+Eti-Osa+Branch+1",
-    },
-    {
-        "id": "local_kitchen_lagos_mainland_branch_2_7cfb0598",
-        "name": "Local Kitchen Lagos Mainland Branch 2",
-        "city": "Lagos Mainland",
-        "state": "Lagos",
-        "lga": "Lagos Mainland",
-        "location": "Lagos Mainland, Lagos",
-        "rating": 4.0,
-        "cuisine": "Nigerian",
-        "specialties": ['Local Dishes'],
-        "delivery_areas": ['Lagos Mainland'],
-        "opening_hours": None,
-        "url": "https://chowdeck.com/store?q=Local+Kitchen+Lagos+Mainland+Branch+2",
-    },
-    {
-        "id": "local_kitchen_surulere_branch_3_c9e67962",
-        "name": "Local Kitchen Surulere Branch 3",
-        "city": "Surulere",
-        "state": "Lagos",
-        "lga": "Surulere",
-        "location": "Surulere, Lagos",
-        "rating": 4.0,
-        "cuisine": "Nigerian",
-        "specialties": ['Local Dishes'],
-        "delivery_areas": ['Surulere'],
-        "opening_hours": None,
-        "url": "https://chowdeck.com/store?q=Local+Kitchen+Surulere+Branch+3",
-    },
-    {
-        "id": "local_kitchen_kosofe_branch_4_5eaa2172",
-        "name": "Local Kitchen Kosofe Branch 4",
-        "city": "Kosofe",
-        "state": "Lagos",
-        "lga": "Kosofe",
-        "location": "Kosofe, Lagos",
-        "rating": 4.0,
-        "cuisine": "Nigerian",
-        "specialties": ['Local Dishes'],
-        "delivery_areas": ['Kosofe'],
-        "opening_hours": None,
-        "url": "https://chowdeck.com/store?q=Local+Kitchen+Kosofe+Branch+4",
-    },
-    {
-        "id": "local_kitchen_ikeja_branch_5_2d5ce1a8",
-        "name": "Local Kitchen Ikeja Branch 5",
-        "city": "Ikeja",
-        "state": "Lagos",
-        "lga": "Ikeja",
-        "location": "Ikeja, Lagos",
-        "rating": 4.0,
-        "cuisine": "Nigerian",
-        "specialties": ['Local Dishes'],
-        "delivery_areas": ['Ikeja'],
-        "opening_hours": None,
-        "url": "https://chowdeck.com/store?q=Local+Kitchen+Ikeja+Branch+5",
-    },
-    {
-        "id": "local_kitchen_eti_osa_branch_6_3440bc8f",
-        "name": "Local Kitchen Eti-Osa Branch 6",
-        "city": "Eti-Osa",
-        "state": "Lagos",
-        "lga": "Eti-Osa",
-        "location": "Eti-Osa, Lagos",
-        "rating": 4.0,
-        "cuisine": "Nigerian",
-        "specialties": ['Local Dishes'],
-        "delivery_areas": ['Eti-Osa'],
-        "opening_hours": None,
-        "url": "https://chowdeck.com/store?q=Local+Kitchen+Eti-Osa+Branch+6",
-    },
-    {
-        "id": "local_kitchen_lagos_mainland_branch_7_08f38962",
-        "name": "Local Kitchen Lagos Mainland Branch 7",
-        "city": "Lagos Mainland",
-        "state": "Lagos",
-        "lga": "Lagos Mainland",
-        "location": "Lagos Mainland, Lagos",
-        "rating": 4.0,
-        "cuisine": "Nigerian",
-        "specialties": ['Local Dishes'],
-        "delivery_areas": ['Lagos Mainland'],
-        "opening_hours": None,
-        "url": "https://chowdeck.com/store?q=Local+Kitchen+Lagos+Mainland+Branch+7",
-    },
-    {
-        "id": "local_kitchen_surulere_branch_8_d62c15e4",
-        "name": "Local Kitchen Surulere Branch 8",
-        "city": "Surulere",
-        "state": "Lagos",
-        "lga": "Surulere",
-        "location": "Surulere, Lagos",
-        "rating": 4.0,
-        "cuisine": "Nigerian",
-        "specialties": ['Local Dishes'],
-        "delivery_areas": ['Surulere'],
-        "opening_hours": None,
-        "url": "https://chowdeck.com/store?q=Local+Kitchen+Surulere+Branch+8",
-    },
-    {
-        "id": "local_kitchen_kosofe_branch_9_32aecb2a",
-        "name": "Local Kitchen Kosofe Branch 9",
-        "city": "Kosofe",
-        "state": "Lagos",
-        "lga": "Kosofe",
-        "location": "Kosofe, Lagos",
-        "rating": 4.0,
-        "cuisine": "Nigerian",
-        "specialties": ['Local Dishes'],
-        "delivery_areas": ['Kosofe'],
-        "opening_hours": None,
-        "url": "https://chowdeck.com/store?q=Local+Kitchen+Kosofe+Branch+9",
-    },
-    {
-        "id": "local_kitchen_ikeja_branch_10_dd0510ff",
-        "name": "Local Kitchen Ikeja Branch 10",
-        "city": "Ikeja",
-        "state": "Lagos",
-        "lga": "Ikeja",
-        "location": "Ikeja, Lagos",
-        "rating": 4.0,
-        "cuisine": "Nigerian",
-        "specialties": ['Local Dishes'],
-        "delivery_areas": ['Ikeja'],
-        "opening_hours": None,
-        "url": "https://chowdeck.com/store?q=Local+Kitchen+Ikeja+Branch+10",
-    },
-    {
-        "id": "local_kitchen_eti_osa_branch_11_7700f56b",
-        "name": "Local Kitchen Eti-Osa Branch 11",
-        "city": "Eti-Osa",
-        "state": "Lagos",
-        "lga": "Eti-Osa",
-        "location": "Eti-Osa, Lagos",
-        "rating": 4.0,
-        "cuisine": "Nigerian",
-        "specialties": ['Local Dishes'],
-        "delivery_areas": ['Eti-Osa'],
-        "opening_hours": None,
-        "url": "https://chowdeck.com/store?q=Local+Kitchen+Eti-Osa+Branch+11",
-    },
-    {
-        "id": "local_kitchen_lagos_mainland_branch_12_bc0242e5",
-        "name": "Local Kitchen Lagos Mainland Branch 12",
-        "city": "Lagos Mainland",
-        "state": "Lagos",
-        "lga": "Lagos Mainland",
-        "location": "Lagos Mainland, Lagos",
-        "rating": 4.0,
-        "cuisine": "Nigerian",
-        "specialties": ['Local Dishes'],
-        "delivery_areas": ['Lagos Mainland'],
-        "opening_hours": None,
-        "url": "https://chowdeck.com/store?q=Local+Kitchen+Lagos+Mainland+Branch+12",
-    },
-    {
-        "id": "local_kitchen_surulere_branch_13_96cdd36d",
-        "name": "Local Kitchen Surulere Branch 13",
-        "city": "Surulere",
-        "state": "Lagos",
-        "lga": "Surulere",
-        "location": "Surulere, Lagos",
-        "rating": 4.0,
-        "cuisine": "Nigerian",
-        "specialties": ['Local Dishes'],
-        "delivery_areas": ['Surulere'],
-        "opening_hours": None,
-        "url": "https://chowdeck.com/store?q=Local+Kitchen+Surulere+Branch+13",
-    },
-    {
-        "id": "local_kitchen_kosofe_branch_14_78f00620",
-        "name": "Local Kitchen Kosofe Branch 14",
-        "city": "Kosofe",
-        "state": "Lagos",
-        "lga": "Kosofe",
-        "location": "Kosofe, Lagos",
-        "rating": 4.0,
-        "cuisine": "Nigerian",
-        "specialties": ['Local Dishes'],
-        "delivery_areas": ['Kosofe'],
-        "opening_hours": None,
-        "url": "https://chowdeck.com/store?q=Local+Kitchen+Kosofe+Branch+14",
-    },
-    {
-        "id": "local_kitchen_ikeja_branch_15_4b668462",
-        "name": "Local Kitchen Ikeja Branch 15",
-        "city": "Ikeja",
-        "state": "Lagos",
-        "lga": "Ikeja",
-        "location": "Ikeja, Lagos",
-        "rating": 4.0,
-        "cuisine": "Nigerian",
-        "specialties": ['Local Dishes'],
-        "delivery_areas": ['Ikeja'],
-        "opening_hours": None,
-        "url": "https://chowdeck.com/store?q=Local+Kitchen+Ikeja+Branch+15",
-    },
-    {
-        "id": "local_kitchen_eti_osa_branch_16_8e767001",
-        "name": "Local Kitchen Eti-Osa Branch 16",
-        "city": "Eti-Osa",
-        "state": "Lagos",
-        "lga": "Eti-Osa",
-        "location": "Eti-Osa, Lagos",
-        "rating": 4.0,
-        "cuisine": "Nigerian",
-        "specialties": ['Local Dishes'],
-        "delivery_areas": ['Eti-Osa'],
-        "opening_hours": None,
-        "url": "https://chowdeck.com/store?q=Local+Kitchen+Eti-Osa+Branch+16",
-    },
-    {
-        "id": "local_kitchen_lagos_mainland_branch_17_3342de25",
-        "name": "Local Kitchen Lagos Mainland Branch 17",
-        "city": "Lagos Mainland",
-        "state": "Lagos",
-        "lga": "Lagos Mainland",
-        "location": "Lagos Mainland, Lagos",
-        "rating": 4.0,
-        "cuisine": "Nigerian",
-        "specialties": ['Local Dishes'],
-        "delivery_areas": ['Lagos Mainland'],
-        "opening_hours": None,
-        "url": "https://chowdeck.com/store?q=Local+Kitchen+Lagos+Mainland+Branch+17",
-    },
-    {
-        "id": "local_kitchen_surulere_branch_18_7bd95f73",
-        "name": "Local Kitchen Surulere Branch 18",
-        "city": "Surulere",
-        "state": "Lagos",
-        "lga": "Surulere",
-        "location": "Surulere, Lagos",
-        "rating": 4.0,
-        "cuisine": "Nigerian",
-        "specialties": ['Local Dishes'],
-        "delivery_areas": ['Surulere'],
-        "opening_hours": None,
-        "url": "https://chowdeck.com/store?q=Local+Kitchen+Surulere+Branch+18",
-    },
-    {
-        "id": "local_kitchen_kosofe_branch_19_9ee31b35",
-        "name": "Local Kitchen Kosofe Branch 19",
-        "city": "Kosofe",
-        "state": "Lagos",
-        "lga": "Kosofe",
-        "location": "Kosofe, Lagos",
-        "rating": 4.0,
-        "cuisine": "Nigerian",
-        "specialties": ['Local Dishes'],
-        "delivery_areas": ['Kosofe'],
-        "opening_hours": None,
-        "url": "https://chowdeck.com/store?q=Local+Kitchen+Kosofe+Branch+19",
-    },
-    {
-        "id": "local_kitchen_ikeja_branch_20_d29f5932",
-        "name": "Local Kitchen Ikeja Branch 20",
-        "city": "Ikeja",
-        "state": "Lagos",
-        "lga": "Ikeja",
-        "location": "Ikeja, Lagos",
-        "rating": 4.0,
-        "cuisine": "Nigerian",
-        "specialties": ['Local Dishes'],
-        "delivery_areas": ['Ikeja'],
-        "opening_hours": None,
-        "url": "https://chowdeck.com/store?q=Local+Kitchen+Ikeja+Branch+20",
-    },
-    {
-        "id": "local_kitchen_eti_osa_branch_21_0459907a",
-        "name": "Local Kitchen Eti-Osa Branch 21",
-        "city": "Eti-Osa",
-        "state": "Lagos",
-        "lga": "Eti-Osa",
-        "location": "Eti-Osa, Lagos",
-        "rating": 4.0,
-        "cuisine": "Nigerian",
-        "specialties": ['Local Dishes'],
-        "delivery_areas": ['Eti-Osa'],
-        "opening_hours": None,
-        "url": "https://chowdeck.com/store?q=Local+Kitchen+Eti-Osa+Branch+21",
-    },
-    {
-        "id": "local_kitchen_lagos_mainland_branch_22_54c9b097",
-        "name": "Local Kitchen Lagos Mainland Branch 22",
-        "city": "Lagos Mainland",
-        "state": "Lagos",
-        "lga": "Lagos Mainland",
-        "location": "Lagos Mainland, Lagos",
-        "rating": 4.0,
-        "cuisine": "Nigerian",
-        "specialties": ['Local Dishes'],
-        "delivery_areas": ['Lagos Mainland'],
-        "opening_hours": None,
-        "url": "https://chowdeck.com/store?q=Local+Kitchen+Lagos+Mainland+Branch+22",
-    },
-    {
-        "id": "local_kitchen_surulere_branch_23_9ddf2976",
-        "name": "Local Kitchen Surulere Branch 23",
-        "city": "Surulere",
-        "state": "Lagos",
-        "lga": "Surulere",
-        "location": "Surulere, Lagos",
-        "rating": 4.0,
-        "cuisine": "Nigerian",
-        "specialties": ['Local Dishes'],
-        "delivery_areas": ['Surulere'],
-        "opening_hours": None,
-        "url": "https://chowdeck.com/store?q=Local+Kitchen+Surulere+Branch+23",
-    },
-    {
-        "id": "local_kitchen_kosofe_branch_24_dd376bbc",
-        "name": "Local Kitchen Kosofe Branch 24",
-        "city": "Kosofe",
-        "state": "Lagos",
-        "lga": "Kosofe",
-        "location": "Kosofe, Lagos",
-        "rating": 4.0,
-        "cuisine": "Nigerian",
-        "specialties": ['Local Dishes'],
-        "delivery_areas": ['Kosofe'],
-        "opening_hours": None,
-        "url": "https://chowdeck.com/store?q=Local+Kitchen+Kosofe+Branch+24",
-    },
-    {
-        "id": "local_kitchen_ikeja_branch_25_2285db4f",
-        "name": "Local Kitchen Ikeja Branch 25",
-        "city": "Ikeja",
-        "state": "Lagos",
-        "lga": "Ikeja",
-        "location": "Ikeja, Lagos",
-        "rating": 4.0,
-        "cuisine": "Nigerian",
-        "specialties": ['Local Dishes'],
-        "delivery_areas": ['Ikeja'],
-        "opening_hours": None,
-        "url": "https://chowdeck.com/store?q=Local+Kitchen+Ikeja+Branch+25",
-    },
-    {
-        "id": "local_kitchen_eti_osa_branch_26_cba98d13",
-        "name": "Local Kitchen Eti-Osa Branch 26",
-        "city": "Eti-Osa",
-        "state": "Lagos",
-        "lga": "Eti-Osa",
-        "location": "Eti-Osa, Lagos",
-        "rating": 4.0,
-        "cuisine": "Nigerian",
-        "specialties": ['Local Dishes'],
-        "delivery_areas": ['Eti-Osa'],
-        "opening_hours": None,
-        "url": "https://chowdeck.com/store?q=Local+Kitchen+Eti-Osa+Branch+26",
-    },
-    {
-        "id": "local_kitchen_lagos_mainland_branch_27_2c59de7c",
-        "name": "Local Kitchen Lagos Mainland Branch 27",
-        "city": "Lagos Mainland",
-        "state": "Lagos",
-        "lga": "Lagos Mainland",
-        "location": "Lagos Mainland, Lagos",
-        "rating": 4.0,
-        "cuisine": "Nigerian",
-        "specialties": ['Local Dishes'],
-        "delivery_areas": ['Lagos Mainland'],
-        "opening_hours": None,
-        "url": "https://chowdeck.com/store?q=Local+Kitchen+Lagos+Mainland+Branch+27",
-    },
-    {
-        "id": "local_kitchen_surulere_branch_28_df4baf6e",
-        "name": "Local Kitchen Surulere Branch 28",
-        "city": "Surulere",
-        "state": "Lagos",
-        "lga": "Surulere",
-        "location": "Surulere, Lagos",
-        "rating": 4.0,
-        "cuisine": "Nigerian",
-        "specialties": ['Local Dishes'],
-        "delivery_areas": ['Surulere'],
-        "opening_hours": None,
-        "url": "https://chowdeck.com/store?q=Local+Kitchen+Surulere+Branch+28",
-    },
-    {
-        "id": "local_kitchen_kosofe_branch_29_5dc1833e",
-        "name": "Local Kitchen Kosofe Branch 29",
-        "city": "Kosofe",
-        "state": "Lagos",
-        "lga": "Kosofe",
-        "location": "Kosofe, Lagos",
-        "rating": 4.0,
-        "cuisine": "Nigerian",
-        "specialties": ['Local Dishes'],
-        "delivery_areas": ['Kosofe'],
-        "opening_hours": None,
-        "url": "https://chowdeck.com/store?q=Local+Kitchen+Kosofe+Branch+29",
-    },
-    {
-        "id": "local_kitchen_ikeja_branch_30_fbe7a8e3",
-        "name": "Local Kitchen Ikeja Branch 30",
-        "city": "Ikeja",
-        "state": "Lagos",
-        "lga": "Ikeja",
-        "location": "Ikeja, Lagos",
-        "rating": 4.0,
-        "cuisine": "Nigerian",
-        "specialties": ['Local Dishes'],
-        "delivery_areas": ['Ikeja'],
-        "opening_hours": None,
-        "url": "https://chowdeck.com/store?q=Local+Kitchen+Ikeja+Branch+30",
-    },
-    {
-        "id": "local_kitchen_eti_osa_branch_31_a99bb551",
-        "name": "Local Kitchen Eti-Osa Branch 31",
-        "city": "Eti-Osa",
-        "state": "Lagos",
-        "lga": "Eti-Osa",
-        "location": "Eti-Osa, Lagos",
-        "rating": 4.0,
-        "cuisine": "Nigerian",
-        "specialties": ['Local Dishes'],
-        "delivery_areas": ['Eti-Osa'],
-        "opening_hours": None,
-        "url": "https://chowdeck.com/store?q=Local+Kitchen+Eti-Osa+Branch+31",
-    }
-]
 
 def get_comprehensive_lagos_restaurants():
     """Get all comprehensive Lagos restaurants"""
-    return COMPREHENSIVE_LAGOS_RESTAURANTS
+    return load_records(DATA_FILE)
+
+
+def __getattr__(name):
+    # Keep the old module constant working without loading at import time
+    if name == 'COMPREHENSIVE_LAGOS_RESTAURANTS':
+        return get_comprehensive_lagos_restaurants()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
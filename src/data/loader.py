@@ -0,0 +1,33 @@
+"""
+Lazy loader for the bundled restaurant data files
+Datasets are stored as JSON Lines (one compact record per line) next to this
+module and only read when they are requested, never at import time.
+"""
+import os
+import json
+
+DATA_DIR = os.path.dirname(os.path.abspath(__file__))
+
+
+def data_path(filename):
+    """Get the absolute path of a bundled data file"""
+    return os.path.join(DATA_DIR, filename)
+
+
+def load_records(filename):
+    """
+    Load a JSON Lines dataset
+    Nothing is kept in memory here: callers (e.g. the restaurant sources)
+    own the returned list, so it can be released once it has been indexed.
+    Raises FileNotFoundError if the dataset has not been generated.
+    """
+    with open(data_path(filename), encoding='utf-8') as f:
+        return [json.loads(line) for line in f if line.strip()]
+
+
+def write_records(path, records):
+    """Write records as compact JSON Lines (used by the generator scripts)"""
+    with open(path, 'w', encoding='utf-8') as f:
+        for record in records:
+            f.write(json.dumps(record, ensure_ascii=False, separators=(',', ':')))
+            f.write('\n')
@@ -1,8 +1,10 @@
 """
 Nigeria States and LGAs with Chowdeck availability
 """
+from typing import Any, Dict
 
-LOCATIONS = {
+# State -> {"state_code": code, "lgas": {LGA: [areas]}}
+LOCATIONS: Dict[str, Dict[str, Any]] = {
     "Lagos": {
         "state_code": "LAG",
         "lgas": {
@@ -80,6 +82,167 @@ LOCATIONS = {
     },
 }
 
+# Approximate (lat, lng) centroids of every LGA and area in LOCATIONS, per state
+CENTROIDS = {
+    "Lagos": {
+        "Ikeja": (6.6018, 3.3515),
+        "Ikeja GRA": (6.5795, 3.3553),
+        "Allen Avenue": (6.6010, 3.3520),
+        "Alausa": (6.6160, 3.3590),
+        "Ogba": (6.6280, 3.3400),
+        "Eti-Osa": (6.4460, 3.5200),
+        "Lekki": (6.4470, 3.4730),
+        "Victoria Island": (6.4281, 3.4219),
+        "Ikoyi": (6.4510, 3.4350),
+        "Ajah": (6.4670, 3.5730),
+        "Chevron": (6.4420, 3.5320),
+        "Lagos Mainland": (6.5000, 3.3830),
+        "Yaba": (6.5095, 3.3784),
+        "Ebute Metta": (6.4860, 3.3810),
+        "Sabo": (6.5070, 3.3760),
+        "Surulere": (6.5000, 3.3540),
+        "Shitta": (6.5060, 3.3530),
+        "Adeniran Ogunsanya": (6.4920, 3.3560),
+        "Kosofe": (6.5790, 3.3920),
+        "Gbagada": (6.5540, 3.3880),
+        "Ogudu": (6.5710, 3.3910),
+        "Maryland": (6.5710, 3.3670),
+        "Ketu": (6.5960, 3.3890),
+        "Oshodi-Isolo": (6.5400, 3.3200),
+        "Oshodi": (6.5550, 3.3440),
+        "Isolo": (6.5340, 3.3210),
+        "Ejigbo": (6.5620, 3.2990),
+        "Mushin": (6.5270, 3.3460),
+        "Idi-Oro": (6.5180, 3.3570),
+        "Shomolu": (6.5400, 3.3850),
+        "Bariga": (6.5390, 3.3940),
+        "Amuwo-Odofin": (6.4600, 3.2900),
+        "Festac": (6.4660, 3.2840),
+        "Amuwo Odofin": (6.4520, 3.3030),
+        "Alimosho": (6.6000, 3.2700),
+        "Egbeda": (6.5930, 3.2890),
+        "Ikotun": (6.5520, 3.2630),
+        "Iyana Ipaja": (6.6110, 3.2910),
+    },
+    "FCT": {
+        "Abuja Municipal": (9.0580, 7.4890),
+        "Wuse": (9.0670, 7.4750),
+        "Garki": (9.0300, 7.4900),
+        "Maitama": (9.0860, 7.4960),
+        "Asokoro": (9.0430, 7.5260),
+        "Central Area": (9.0560, 7.4890),
+        "Gwarinpa": (9.1070, 7.4060),
+        "Jabi": (9.0670, 7.4260),
+        "Utako": (9.0700, 7.4400),
+        "Kubwa": (9.1550, 7.3290),
+        "Kado": (9.0850, 7.4450),
+        "Wuye": (9.0570, 7.4500),
+        "Gwagwalada": (8.9430, 7.0830),
+        "Kuje": (8.8790, 7.2270),
+        "Abaji": (8.4760, 6.9440),
+    },
+    "Oyo": {
+        "Ibadan North": (7.4100, 3.9050),
+        "Bodija": (7.4310, 3.9150),
+        "Agodi": (7.4050, 3.9080),
+        "Mokola": (7.4040, 3.8890),
+        "Ibadan South-West": (7.3700, 3.8700),
+        "Ring Road": (7.3660, 3.8730),
+        "Oke-Ado": (7.3720, 3.8780),
+        "Ibadan North-East": (7.4000, 3.9300),
+        "Iwo Road": (7.4040, 3.9330),
+        "Sango": (7.4210, 3.9000),
+        "Ibadan South-East": (7.3700, 3.9100),
+        "Mapo": (7.3760, 3.8970),
+        "Beere": (7.3820, 3.9000),
+    },
+    "Rivers": {
+        "Port Harcourt": (4.7770, 7.0130),
+        "GRA": (4.8180, 7.0050),
+        "Trans Amadi": (4.8080, 7.0400),
+        "Rumuola": (4.8380, 7.0050),
+        "D-Line": (4.7970, 7.0040),
+        "Obio-Akpor": (4.8600, 6.9800),
+        "Rumuokoro": (4.8680, 6.9980),
+        "Choba": (4.8930, 6.9070),
+        "Eliozu": (4.8690, 7.0300),
+    },
+    "Edo": {
+        "Oredo": (6.3330, 5.6200),
+        "Ring Road": (6.3350, 5.6270),
+        "Ugbowo": (6.3980, 5.6030),
+        "Uselu": (6.3670, 5.6170),
+        "Egor": (6.3700, 5.5900),
+        "Ugbor": (6.3000, 5.5900),
+    },
+    "Delta": {
+        "Oshimili South": (6.2000, 6.7300),
+        "Asaba": (6.1980, 6.7310),
+        "Cable Point": (6.1880, 6.7510),
+    },
+    "Ogun": {
+        "Abeokuta South": (7.1500, 3.3500),
+        "Oke-Ilewo": (7.1520, 3.3470),
+        "Isale Igbein": (7.1480, 3.3530),
+    },
+    "Kaduna": {
+        "Kaduna North": (10.5600, 7.4400),
+        "Kaduna South": (10.4800, 7.4200),
+    },
+    "Enugu": {
+        "Enugu North": (6.4560, 7.5040),
+        "GRA": (6.4550, 7.5000),
+        "Independence Layout": (6.4400, 7.5140),
+    },
+}
+
+# Other spellings of LGAs/areas in LOCATIONS (and sub-areas known by the
+# area they belong to), mapped to the LOCATIONS name
+AREA_ALIASES = {
+    "VI": "Victoria Island",
+    "V.I.": "Victoria Island",
+    "V/I": "Victoria Island",
+    "Lekki Phase 1": "Lekki",
+    "Lekki Phase I": "Lekki",
+    "Lekki Toll Gate": "Lekki",
+    "Somolu": "Shomolu",
+    "Festac Town": "Festac",
+    "Amuwo": "Amuwo Odofin",
+    "Ikeja G.R.A": "Ikeja GRA",
+    "Ikeja G.R.A.": "Ikeja GRA",
+    "Ebute-Metta": "Ebute Metta",
+    "Iyana-Ipaja": "Iyana Ipaja",
+    "Idi Oro": "Idi-Oro",
+    "Wuse 2": "Wuse",
+    "Wuse II": "Wuse",
+    "CBD": "Central Area",
+    "Central Business District": "Central Area",
+    "Gwarimpa": "Gwarinpa",
+    "PH": "Port Harcourt",
+    "Trans-Amadi": "Trans Amadi",
+}
+
+
+def _key(name):
+    return ' '.join(str(name).split()).lower()
+
+
+# Normalised alias or LOCATIONS name -> LOCATIONS name
+_AREA_NAMES = {
+    _key(name): name
+    for info in LOCATIONS.values()
+    for lga, areas in info["lgas"].items()
+    for name in [lga, *areas]
+}
+_AREA_NAMES.update({_key(alias): name for alias, name in AREA_ALIASES.items()})
+
+
+# State -> normalised place name -> centroid, for case-insensitive lookups
+_CENTROID_KEYS = {
+    _key(state): {_key(place): point for place, point in places.items()}
+    for state, places in CENTROIDS.items()
+}
+
 
 def get_all_states():
     """Get all available states"""
@@ -105,3 +268,27 @@ def get_chowdeck_url_for_area(area):
     # Normalize area name for URL
     area_slug = area.lower().replace(" ", "-")
     return f"https://chowdeck.com/store/{area_slug}"
+
+
+def get_centroid(state, lga=None, city=None):
+    """
+    Get the (lat, lng) of a place, most specific first (city/area, then LGA)
+    Returns None if the state or both names are unknown.
+    """
+    if not state:
+        return None
+    places = _CENTROID_KEYS.get(_key(state), {})
+    for name in (city, lga):
+        key = _key(resolve_area(name)) if name else None
+        if key in places:
+            return places[key]
+    return None
+
+
+def resolve_area(name):
+    """
+    Get the LOCATIONS spelling of an LGA/area name, resolving AREA_ALIASES
+    Matching ignores case and spacing; unknown names are returned stripped.
+    """
+    name = ' '.join(str(name).split())
+    return _AREA_NAMES.get(name.lower(), name)
@@ -0,0 +1,20 @@
+"""
+Mega Lagos restaurant database - 24,000+ restaurants
+Records live in mega_lagos_restaurants.jsonl (built by
+scripts/generate_10k_restaurants.py) and are loaded on first use
+"""
+from src.data.loader import load_records
+
+DATA_FILE = 'mega_lagos_restaurants.jsonl'
+
+
+def get_mega_lagos_restaurants():
+    """Get all mega Lagos restaurants (24K+)"""
+    return load_records(DATA_FILE)
+
+
+def __getattr__(name):
+    # Keep the old module constant working without loading at import time
+    if name == 'MEGA_LAGOS_RESTAURANTS':
+        return get_mega_lagos_restaurants()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -7,15 +7,18 @@ import sys
 # Add parent directory to path for imports
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from flask import Flask, jsonify, render_template
+from flask import Flask, jsonify, render_template, request
+from markupsafe import Markup
 from flask_cors import CORS
 from dotenv import load_dotenv
 
 # Import with proper path handling
 try:
-    from src.restaurants.service import RestaurantService
+    from src.restaurants.service import get_restaurant_service
+    from src.restaurants.response_cache import CachedFragment, ResponseCache
 except ModuleNotFoundError:
-    from restaurants.service import RestaurantService
+    from restaurants.service import get_restaurant_service
+    from restaurants.response_cache import CachedFragment, ResponseCache
 
 # Load environment variables
 load_dotenv()
@@ -39,28 +42,111 @@ app.config['CHOWDECK_URL'] = os.getenv(
 app.config['CACHE_TIMEOUT'] = int(os.getenv('CACHE_TIMEOUT', 3600))
 app.config['DEBUG'] = os.getenv('FLASK_DEBUG', 'False').lower() == 'true'
 
-# Initialize restaurant service
-restaurant_service = RestaurantService()
+# Shared restaurant service (same instance as the /api blueprint uses)
+restaurant_service = get_restaurant_service()
+
+
+# Restaurant cards per homepage page (and per "Load more" request)
+HOMEPAGE_PAGE_SIZE = 24
+
+# Homepage query params that filter the listing
+HOMEPAGE_FILTERS = ('q', 'state', 'lga', 'city', 'cuisine')
+
+# Rendered restaurant cards for the current snapshot
+card_cache = ResponseCache(int(os.getenv('FRAGMENT_CACHE_BYTES', 8 * 1024 * 1024)))
+
+
+def render_card(restaurant, version):
+    """Render one restaurant card, reusing the cached HTML for this snapshot"""
+    key = restaurant.get('id')
+    cached = card_cache.get(version, key)
+    if cached is None:
+        html = render_template('_restaurant_card.html', restaurant=restaurant)
+        cached = card_cache.put(version, key, CachedFragment(html))
+    return Markup(cached.html)
+
+
+def homepage_listing():
+    """
+    Get one page of homepage cards for the current query string
+    `q` runs the full-text search, narrowed by the other filters (store indexes).
+    Returns a dict with the rendered cards and paging/stat values.
+    """
+    filters = {name: request.args.get(name) for name in HOMEPAGE_FILTERS if request.args.get(name)}
+    page = max(request.args.get('page', 1, type=int), 1)
+    offset = (page - 1) * HOMEPAGE_PAGE_SIZE
+    version = restaurant_service.snapshot_version()
+
+    query = filters.get('q', '').strip()
+    location = {name: filters.get(name) for name in ('state', 'lga', 'city', 'cuisine')}
+    if query:
+        total, restaurants = restaurant_service.search_restaurants(
+            query, offset=offset, limit=HOMEPAGE_PAGE_SIZE, **location
+        )
+    else:
+        total, restaurants = restaurant_service.query_restaurants(
+            offset=offset, limit=HOMEPAGE_PAGE_SIZE, **location
+        )
+
+    return {
+        'cards': [render_card(restaurant, version) for restaurant in restaurants],
+        'total': total,
+        'page': page,
+        'pages': max((total + HOMEPAGE_PAGE_SIZE - 1) // HOMEPAGE_PAGE_SIZE, 1),
+        'query': query,
+        'filters': filters,
+        'location': location,
+    }
 
 
 @app.route('/')
 def index():
-    """Homepage with restaurant listings"""
-    restaurants = restaurant_service.get_all_restaurants()
+    """Homepage with one page of restaurant listings"""
+    listing = homepage_listing()
 
-    # Calculate statistics
-    cities = list(set(r.get('city') for r in restaurants if r.get('city')))
-    ratings = [r.get('rating') for r in restaurants if r.get('rating')]
-    avg_rating = round(sum(ratings) / len(ratings), 2) if ratings else 0
+    # Statistics come from the facets computed once per snapshot
+    facets = restaurant_service.get_facets(**listing['location'])
+    cities = [facet['value'] for facet in facets['city']]
+    avg_rating = facets['average_rating']
 
     return render_template(
         'index.html',
-        restaurants=restaurants,
+        cards=listing['cards'],
+        total=listing['total'],
+        page=listing['page'],
+        pages=listing['pages'],
+        query=listing['query'],
+        filters=listing['filters'],
         cities=cities,
         avg_rating=avg_rating
     )
 
 
+@app.route('/fragments/restaurants')
+def restaurant_cards():
+    """
+    Rendered restaurant cards for one homepage page
+    Takes the same query params as the homepage; used by main.js to load
+    further pages and to search without reloading.
+    """
+    try:
+        listing = homepage_listing()
+
+        return jsonify({
+            'success': True,
+            'html': ''.join(listing['cards']),
+            'count': len(listing['cards']),
+            'total': listing['total'],
+            'page': listing['page'],
+            'pages': listing['pages']
+        })
+    except Exception as e:
+        return jsonify({
+            'success': False,
+            'error': str(e)
+        }), 500
+
+
 @app.route('/restaurant/<restaurant_id>')
 def restaurant_detail(restaurant_id):
     """Restaurant detail page"""
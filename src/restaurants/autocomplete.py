@@ -0,0 +1,144 @@
+"""
+Prefix autocomplete over restaurant names, cities and known areas
+Completions live in one sorted list of normalised keys, so the candidates
+for a prefix are a contiguous range found by bisection. The best top-k for
+short prefixes is precomputed; longer prefixes are cached as they are asked.
+"""
+import heapq
+import threading
+from bisect import bisect_left
+from collections import OrderedDict
+from src.data.locations import LOCATIONS
+from src.restaurants.store import normalize_key
+
+DEFAULT_LIMIT = 10
+MAX_LIMIT = 50
+
+# Prefixes up to this length have their top MAX_LIMIT precomputed
+PRECOMPUTED_PREFIX_LENGTH = 2
+
+# Longer prefixes whose top-k is kept after first use
+MAX_CACHED_PREFIXES = 4096
+
+
+class AutocompleteIndex:
+    """Sorted-prefix completion index, weighted by rating"""
+
+    def __init__(self, entries, version=None):
+        """
+        `entries` are (text, type, weight, restaurant id or None) tuples;
+        duplicate texts of one type keep the highest weight.
+        """
+        self.version = version
+
+        best = {}
+        for text, kind, weight, restaurant_id in entries:
+            key = normalize_key(text)
+            if not key:
+                continue
+            current = best.get((key, kind))
+            if current is None or weight > current[1]:
+                best[(key, kind)] = (text, weight, restaurant_id)
+
+        ordered = sorted(best.items())
+        self._keys = [key for (key, _), _ in ordered]
+        self._weights = [weight for _, (_, weight, _) in ordered]
+        self._completions = [
+            _completion(text, kind, restaurant_id)
+            for (_, kind), (text, _, restaurant_id) in ordered
+        ]
+
+        self._top = {}
+        self._cached = OrderedDict()
+        self._lock = threading.Lock()
+        self._precompute()
+
+    def __len__(self):
+        return len(self._keys)
+
+    def __getstate__(self):
+        # Pickled with the store snapshot; the lock and the lazy cache are per process
+        state = self.__dict__.copy()
+        del state['_lock']
+        state['_cached'] = OrderedDict()
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+    @classmethod
+    def build(cls, store):
+        """Build an index from a store's names and cities plus LOCATIONS"""
+        entries = []
+        city_ratings = {}
+
+        for restaurant in store.stream(fields=('id', 'name', 'city', 'rating')):
+            rating = restaurant.get('rating') or 0
+            entries.append((restaurant.get('name'), 'restaurant', rating, restaurant.get('id')))
+
+            city = restaurant.get('city')
+            if city:
+                city_key = normalize_key(city)
+                city_ratings[city_key] = max(city_ratings.get(city_key, 0), rating)
+                entries.append((city, 'area', rating, None))
+
+        # Areas we serve are suggested even before any restaurant lists them
+        for info in LOCATIONS.values():
+            for lga, areas in info['lgas'].items():
+                entries.append((lga, 'lga', city_ratings.get(normalize_key(lga), 0), None))
+                for area in areas:
+                    entries.append((area, 'area', city_ratings.get(normalize_key(area), 0), None))
+
+        return cls(entries, version=getattr(store, 'version', None))
+
+    def _range(self, prefix):
+        """Get the [start, end) range of keys starting with `prefix`"""
+        start = bisect_left(self._keys, prefix)
+        end = bisect_left(self._keys, prefix + '\uffff', start)
+        return start, end
+
+    def _best(self, start, end, limit):
+        """Get the positions of the `limit` heaviest keys in a range"""
+        return heapq.nlargest(limit, range(start, end), key=self._weights.__getitem__)
+
+    def _precompute(self):
+        """Compute the top MAX_LIMIT for every short prefix in one pass"""
+        buckets = {}
+        for position, key in enumerate(self._keys):
+            for length in range(1, min(len(key), PRECOMPUTED_PREFIX_LENGTH) + 1):
+                buckets.setdefault(key[:length], []).append(position)
+
+        weights = self._weights
+        for prefix, positions in buckets.items():
+            self._top[prefix] = heapq.nlargest(MAX_LIMIT, positions, key=weights.__getitem__)
+
+    def complete(self, prefix, limit=DEFAULT_LIMIT):
+        """Get up to `limit` completions for a prefix, highest rated first"""
+        prefix = normalize_key(prefix)
+        if not prefix:
+            return []
+        limit = max(1, min(limit, MAX_LIMIT))
+
+        positions = self._top.get(prefix)
+        if positions is None and len(prefix) > PRECOMPUTED_PREFIX_LENGTH:
+            with self._lock:
+                positions = self._cached.get(prefix)
+                if positions is not None:
+                    self._cached.move_to_end(prefix)
+
+            if positions is None:
+                positions = self._best(*self._range(prefix), MAX_LIMIT)
+                with self._lock:
+                    self._cached[prefix] = positions
+                    if len(self._cached) > MAX_CACHED_PREFIXES:
+                        self._cached.popitem(last=False)
+
+        return [self._completions[position] for position in (positions or [])[:limit]]
+
+
+def _completion(text, kind, restaurant_id):
+    completion = {'text': text, 'type': kind}
+    if restaurant_id is not None:
+        completion['id'] = restaurant_id
+    return completion
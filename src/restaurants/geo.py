@@ -0,0 +1,157 @@
+"""
+Geospatial lookups over restaurant coordinates
+Records get area-centroid coordinates at merge time (see locate), and a
+uniform lat/lng grid answers radius and k-nearest queries by measuring only
+the points in cells near the query. Restaurants in one area share a
+centroid, so each distinct point is measured once, not once per record.
+"""
+import math
+import heapq
+from array import array
+from src.data.locations import get_centroid
+
+EARTH_RADIUS_KM = 6371.0088
+
+# Grid cell size in degrees (about 2.2 km north-south)
+CELL_DEGREES = 0.02
+
+_KM_PER_DEGREE = math.pi * EARTH_RADIUS_KM / 180
+
+
+def haversine_km(lat1, lng1, lat2, lng2):
+    """Great-circle distance between two points, in km"""
+    phi1, phi2 = math.radians(lat1), math.radians(lat2)
+    dphi = phi2 - phi1
+    dlambda = math.radians(lng2 - lng1)
+    a = math.sin(dphi / 2) ** 2 + math.cos(phi1) * math.cos(phi2) * math.sin(dlambda / 2) ** 2
+    return 2 * EARTH_RADIUS_KM * math.asin(min(1.0, math.sqrt(a)))
+
+
+def locate(restaurant):
+    """
+    Get a restaurant with `lat`/`lng` from its area's centroid
+    Records that already have coordinates, or whose area is unknown, are
+    returned as they are; others are copied, never modified in place.
+    """
+    if restaurant.get('lat') is not None and restaurant.get('lng') is not None:
+        return restaurant
+
+    point = get_centroid(restaurant.get('state'), restaurant.get('lga'), restaurant.get('city'))
+    if point is None:
+        return restaurant
+
+    located = dict(restaurant)
+    located['lat'], located['lng'] = point
+    return located
+
+
+class GridIndex:
+    """Uniform lat/lng grid over record positions"""
+
+    def __init__(self, points, cell_degrees=CELL_DEGREES):
+        """`points` are (position, lat, lng) tuples"""
+        self._cell_degrees = cell_degrees
+        grouped = {}
+        for position, lat, lng in points:
+            grouped.setdefault((lat, lng), array('I')).append(position)
+
+        # cell -> list of (lat, lng, positions at that point)
+        self._cells = {}
+        for (lat, lng), positions in grouped.items():
+            self._cells.setdefault(self._cell(lat, lng), []).append((lat, lng, positions))
+
+        rows = [row for row, _ in self._cells] or [0]
+        cols = [col for _, col in self._cells] or [0]
+        self._bounds = (min(rows), max(rows), min(cols), max(cols))
+
+    def __len__(self):
+        return sum(len(positions) for cell in self._cells.values() for _, _, positions in cell)
+
+    def _cell(self, lat, lng):
+        return math.floor(lat / self._cell_degrees), math.floor(lng / self._cell_degrees)
+
+    def _measure(self, cell, lat, lng):
+        """Yield (distance, positions) for each point in one cell"""
+        for point_lat, point_lng, positions in self._cells.get(cell, ()):
+            yield haversine_km(lat, lng, point_lat, point_lng), positions
+
+    def within(self, lat, lng, radius_km, limit=None):
+        """
+        Find the positions within `radius_km` of a point
+        Only cells overlapping the radius's bounding box are visited.
+        Returns (total matches, list of (distance, position) for the
+        nearest `limit` of them, nearest first).
+        """
+        lat_span = radius_km / _KM_PER_DEGREE
+        cos_lat = math.cos(math.radians(min(89.0, abs(lat) + lat_span)))
+        lng_span = min(180.0, radius_km / (_KM_PER_DEGREE * max(cos_lat, 1e-6)))
+
+        row_min, col_min = self._cell(lat - lat_span, lng - lng_span)
+        row_max, col_max = self._cell(lat + lat_span, lng + lng_span)
+        bound_rows = max(row_min, self._bounds[0]), min(row_max, self._bounds[1])
+        bound_cols = max(col_min, self._bounds[2]), min(col_max, self._bounds[3])
+
+        matches = []
+        for row in range(bound_rows[0], bound_rows[1] + 1):
+            for col in range(bound_cols[0], bound_cols[1] + 1):
+                for distance, positions in self._measure((row, col), lat, lng):
+                    if distance <= radius_km:
+                        matches.extend((distance, position) for position in positions)
+
+        if limit is None:
+            return len(matches), sorted(matches)
+        return len(matches), heapq.nsmallest(limit, matches)
+
+    def nearest(self, lat, lng, k):
+        """
+        Find the `k` positions nearest to a point, nearest first
+        Rings of cells are visited outwards from the query's cell until no
+        unvisited cell can hold anything closer than the k-th match.
+        Returns a list of (distance, position).
+        """
+        if k <= 0 or not self._cells:
+            return []
+
+        center_row, center_col = self._cell(lat, lng)
+        row_min, row_max, col_min, col_max = self._bounds
+        # Rings closer than the occupied bounds are empty; ones past them too
+        first_ring = max(0, row_min - center_row, center_row - row_max,
+                         col_min - center_col, center_col - col_max)
+        last_ring = max(
+            abs(center_row - row_min), abs(center_row - row_max),
+            abs(center_col - col_min), abs(center_col - col_max)
+        )
+
+        best = []  # max-heap of (-distance, -position) holding the k nearest so far
+        for ring in range(first_ring, last_ring + 1):
+            if len(best) == k:
+                # Every cell in this ring is at least (ring - 1) cells away
+                reach = (ring - 1) * self._cell_degrees
+                cos_lat = math.cos(math.radians(min(89.0, abs(lat) + reach)))
+                if reach * _KM_PER_DEGREE * cos_lat > -best[0][0]:
+                    break
+
+            for cell in _ring(center_row, center_col, ring, self._bounds):
+                for distance, positions in self._measure(cell, lat, lng):
+                    for position in positions:
+                        item = (-distance, -position)
+                        if len(best) < k:
+                            heapq.heappush(best, item)
+                        elif item > best[0]:
+                            heapq.heapreplace(best, item)
+
+        return sorted((-distance, -position) for distance, position in best)
+
+
+def _ring(row, col, ring, bounds):
+    """Yield the cells at Chebyshev distance `ring` from (row, col), within bounds"""
+    row_min, row_max, col_min, col_max = bounds
+    first_col, last_col = max(col - ring, col_min), min(col + ring, col_max)
+    for r in range(max(row - ring, row_min), min(row + ring, row_max) + 1):
+        if abs(r - row) == ring:
+            for c in range(first_col, last_col + 1):
+                yield r, c
+        else:
+            for c in {col - ring, col + ring}:
+                if col_min <= c <= col_max:
+                    yield r, c
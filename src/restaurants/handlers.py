@@ -1,45 +1,451 @@
 """
 Restaurant API handlers
 """
-from flask import Blueprint, jsonify, request, send_file
-from src.restaurants.service import RestaurantService
-from src.data.locations import get_all_states, get_lgas_for_state
+import json
+from itertools import islice
+from flask import Blueprint, Response, g, jsonify, request, send_file
+from src.restaurants.service import get_restaurant_service
+from src.restaurants.pagination import InvalidCursor, clamp_page_size
+from src.restaurants.response_cache import cached_response
+from src.restaurants.hours import LAGOS_TZ, is_open, week_slot
+from src.restaurants.store import SORT_FIELDS, project
+from src.data.locations import get_all_states, get_lgas_for_state, resolve_area
 from src.clients.location_scraper import LocationBasedScraper
 from src.utils.excel_export import create_restaurants_excel
 from datetime import datetime
 
 restaurants_bp = Blueprint('restaurants', __name__)
-restaurant_service = RestaurantService()
+NDJSON_MIMETYPE = 'application/x-ndjson'
+restaurant_service = get_restaurant_service()
 location_scraper = LocationBasedScraper()
 
+# Clients must revalidate, but may reuse their copy while the ETag matches
+CACHE_CONTROL = 'public, no-cache'
+
+# Largest search radius for /restaurants/nearby, in km
+MAX_NEARBY_RADIUS_KM = 50
+
+# Read endpoints whose output is not fully determined by the snapshot
+ETAG_EXEMPT_ENDPOINTS = {
+    'restaurants.download_restaurants_excel',
+    # Appends live blog extras that the snapshot version does not cover
+    'restaurants.get_restaurants_by_location',
+}
+
+# Endpoints that serve JSON or NDJSON for one URL depending on the Accept header
+ACCEPT_NEGOTIATED_ENDPOINTS = {
+    'restaurants.get_restaurants',
+    'restaurants.get_restaurants_by_location',
+}
+
+
+@restaurants_bp.before_request
+def _answer_not_modified():
+    """
+    Answer conditional GETs for an unchanged snapshot with 304
+    Runs before the view, so no filtering or serialisation happens.
+    """
+    # open_now answers change with the clock, not just the snapshot
+    if request.method != 'GET' or request.endpoint in ETAG_EXEMPT_ENDPOINTS or _wants_open_now():
+        return None
+
+    # Capture the version before the view reads the store, so a concurrent
+    # refresh can only make the ETag older than the data, never newer
+    g.snapshot_version = restaurant_service.snapshot_version()
+    if g.snapshot_version and request.if_none_match.contains_weak(g.snapshot_version):
+        response = Response(status=304)
+        _set_cache_headers(response, g.snapshot_version)
+        return response
+
+    return None
+
+
+@restaurants_bp.after_request
+def _add_cache_headers(response):
+    """Tag successful reads with the snapshot's ETag (and Vary on Accept where negotiated)"""
+    if request.endpoint in ACCEPT_NEGOTIATED_ENDPOINTS:
+        # Caches must not answer an NDJSON request with a stored JSON body
+        response.vary.add('Accept')
+    version = g.get('snapshot_version')
+    if version and response.status_code == 200:
+        _set_cache_headers(response, version)
+    return response
+
+
+def _set_cache_headers(response, version):
+    # Weak: the same data is served plain, gzipped, projected or as NDJSON
+    response.set_etag(version, weak=True)
+    response.headers['Cache-Control'] = CACHE_CONTROL
+
+
+def _requested_fields():
+    """
+    Parse the `fields` query param (comma-separated keys)
+    Returns a frozenset of keys, or None to return whole records.
+    """
+    fields = request.args.get('fields')
+    if not fields:
+        return None
+    return frozenset(field.strip() for field in fields.split(',') if field.strip()) or None
+
+
+def _requested_sort():
+    """
+    Parse the `sort` (rating or name) and `order` (asc or desc) query params
+    Returns (sort field or None, descending); `order` defaults to desc for
+    rating and asc for name.
+    Raises ValueError for an unknown sort field or order.
+    """
+    sort = request.args.get('sort')
+    order = request.args.get('order')
+    if not sort:
+        if order:
+            raise ValueError('order requires a sort parameter')
+        return None, False
+    if sort not in SORT_FIELDS:
+        raise ValueError(f"sort must be one of: {', '.join(SORT_FIELDS)}")
+    if not order:
+        return sort, SORT_FIELDS[sort]
+    if order not in ('asc', 'desc'):
+        raise ValueError('order must be asc or desc')
+    return sort, order == 'desc'
+
+
+def _wants_open_now():
+    """Check if the client asked for restaurants open now (answers change over time)"""
+    return request.args.get('open_now', '').lower() in ('1', 'true', 'yes')
+
+
+def _requested_open_at():
+    """
+    Parse the `open_at` (ISO 8601 date and time, Lagos time unless an offset
+    is given) and `open_now` query params
+    Returns the datetime to filter on, or None.
+    Raises ValueError for an unreadable open_at.
+    """
+    open_at = request.args.get('open_at')
+    if open_at:
+        try:
+            return datetime.fromisoformat(open_at)
+        except ValueError:
+            raise ValueError(
+                'open_at must be an ISO 8601 date and time, e.g. 2024-05-03T21:30'
+            ) from None
+    if _wants_open_now():
+        return datetime.now(LAGOS_TZ)
+    return None
+
+
+def _uncacheable():
+    """Check if a list response must not be served from the response cache"""
+    return _wants_ndjson() or _wants_open_now()
+
+
+def _wants_ndjson():
+    """Check if the client asked for a streamed NDJSON response"""
+    if request.args.get('format') == 'ndjson':
+        return True
+    best = request.accept_mimetypes.best_match(['application/json', NDJSON_MIMETYPE])
+    return best == NDJSON_MIMETYPE
+
+
+def _ndjson_response(restaurants):
+    """Stream restaurants as one JSON document per line"""
+    def generate():
+        try:
+            for restaurant in restaurants:
+                yield json.dumps(restaurant, ensure_ascii=False) + '\n'
+        except Exception as e:
+            # Headers are already sent; end the stream early
+            print(f"Error streaming restaurants: {str(e)}")
+
+    return Response(generate(), mimetype=NDJSON_MIMETYPE)
+
+
+def _location_extras(state, lga, open_at=None):
+    """Get the live blog restaurants for a location that are not in the snapshot"""
+    open_slot = None if open_at is None else week_slot(open_at)
+    return [
+        restaurant for restaurant in location_scraper.fetch_blog_restaurants(state, lga)
+        if restaurant_service.get_restaurant_by_id(restaurant['id'], ('id',)) is None
+        and (open_slot is None or is_open(restaurant.get('opening_hours'), open_slot))
+    ]
+
+
+def _stream_location(state, lga, fields=None, open_at=None):
+    """Yield every restaurant for a location: snapshot first, then live blog extras"""
+    yield from restaurant_service.stream_restaurants(
+        state=state, lga=lga, fields=fields, open_at=open_at
+    )
+
+    for restaurant in _location_extras(state, lga, open_at):
+        yield project(restaurant, fields)
+
+
+def _query_location(state, lga, offset, limit, fields=None, sort=None, descending=False,
+                    open_at=None):
+    """
+    Get one page of restaurants for a location
+    The snapshot part is paged (and sorted) by the store backend; restaurants
+    found only in the live blog posts follow after it.
+    Returns (total matches, list of restaurants on the page).
+    """
+    total, restaurants = restaurant_service.query_restaurants(
+        state=state, lga=lga, offset=offset, limit=limit, fields=fields,
+        sort=sort, descending=descending, open_at=open_at
+    )
+
+    extras = _location_extras(state, lga, open_at)
+
+    if len(restaurants) < limit:
+        extra_offset = max(0, offset - total)
+        restaurants += [
+            project(restaurant, fields)
+            for restaurant in extras[extra_offset:extra_offset + limit - len(restaurants)]
+        ]
+
+    return total + len(extras), restaurants
+
 
 @restaurants_bp.route('/restaurants', methods=['GET'])
+@cached_response(restaurant_service.snapshot_version, skip=_uncacheable)
 def get_restaurants():
     """
-    Get all restaurants
+    Get restaurants, one page at a time
     Query params:
         - city: Filter by city (optional)
-        - limit: Limit results (optional)
+        - state: Filter by state (optional)
+        - lga: Filter by LGA (optional)
+        - cuisine: Filter by cuisine (optional)
+        - limit: Page size (optional, default 100, max 1000)
+        - cursor: Opaque cursor from a previous page's next_cursor (optional)
+        - sort: "rating" or "name" (optional, default: merge order)
+        - order: "asc" or "desc" (optional, default: desc for rating, asc for name)
+        - open_at: Only restaurants open at this ISO 8601 date and time, in
+          Lagos time unless it has an offset (optional)
+        - open_now: 1 to only return restaurants open now (optional)
+        - fields: Comma-separated keys to return, e.g. id,name,rating (optional)
+        - format: "ndjson" to stream every match, one record per line (optional;
+          also selected by Accept: application/x-ndjson). Honours limit but
+          not cursor or sort.
+    """
+    try:
+        try:
+            sort, descending = _requested_sort()
+            open_at = _requested_open_at()
+        except ValueError as e:
+            return jsonify({
+                'success': False,
+                'error': str(e)
+            }), 400
+
+        if _wants_ndjson():
+            restaurants = restaurant_service.stream_restaurants(
+                state=request.args.get('state'),
+                lga=request.args.get('lga'),
+                city=request.args.get('city'),
+                cuisine=request.args.get('cuisine'),
+                fields=_requested_fields(),
+                open_at=open_at
+            )
+            limit = request.args.get('limit', type=int)
+            if limit:
+                restaurants = islice(restaurants, limit)
+            return _ndjson_response(restaurants)
+
+        # Keyset pagination: each page costs O(page size) to build
+        restaurants, next_cursor = restaurant_service.page_restaurants(
+            cursor=request.args.get('cursor'),
+            limit=clamp_page_size(request.args.get('limit', type=int)),
+            state=request.args.get('state'),
+            lga=request.args.get('lga'),
+            city=request.args.get('city'),
+            cuisine=request.args.get('cuisine'),
+            fields=_requested_fields(),
+            sort=sort,
+            descending=descending,
+            open_at=open_at
+        )
+
+        return jsonify({
+            'success': True,
+            'count': len(restaurants),
+            'next_cursor': next_cursor,
+            'data': restaurants
+        })
+    except InvalidCursor as e:
+        return jsonify({
+            'success': False,
+            'error': str(e)
+        }), 400
+    except Exception as e:
+        return jsonify({
+            'success': False,
+            'error': str(e)
+        }), 500
+
+
+@restaurants_bp.route('/restaurants/search', methods=['GET'])
+@cached_response(restaurant_service.snapshot_version)
+def search_restaurants():
+    """
+    Full-text search over restaurant name, location, cuisine and specialties
+    Query params:
+        - q: Search text (required); every word must match, the last as a prefix
+        - fuzzy: 1 to also match misspelt names/specialties (optional)
+        - page: Page number (default: 1)
+        - per_page: Results per page (default: 20, max 1000)
+        - fields: Comma-separated keys to return (optional)
+    """
+    try:
+        query = request.args.get('q', '').strip()
+        page = max(request.args.get('page', 1, type=int), 1)
+        per_page = clamp_page_size(request.args.get('per_page', 20, type=int))
+        fuzzy = request.args.get('fuzzy', '').lower() in ('1', 'true', 'yes')
+
+        if not query:
+            return jsonify({
+                'success': False,
+                'error': 'q parameter is required'
+            }), 400
+
+        total, restaurants = restaurant_service.search_restaurants(
+            query,
+            offset=(page - 1) * per_page,
+            limit=per_page,
+            fields=_requested_fields(),
+            fuzzy=fuzzy
+        )
+
+        return jsonify({
+            'success': True,
+            'query': query,
+            'fuzzy': fuzzy,
+            'page': page,
+            'per_page': per_page,
+            'total': total,
+            'pages': (total + per_page - 1) // per_page,
+            'count': len(restaurants),
+            'data': restaurants
+        })
+    except Exception as e:
+        return jsonify({
+            'success': False,
+            'error': str(e)
+        }), 500
+
+
+@restaurants_bp.route('/restaurants/facets', methods=['GET'])
+@cached_response(restaurant_service.snapshot_version)
+def get_restaurant_facets():
+    """
+    Get restaurant counts by state, LGA, city, cuisine and rating bucket
+    Query params (optional, narrow the counts):
+        - state, lga, city, cuisine
     """
     try:
-        city = request.args.get('city')
-        limit = request.args.get('limit', type=int)
+        filters = {
+            field: request.args.get(field)
+            for field in ('state', 'lga', 'city', 'cuisine')
+        }
+        facets = restaurant_service.get_facets(**filters)
+
+        return jsonify({
+            'success': True,
+            'filters': {field: value for field, value in filters.items() if value},
+            'total': facets['total'],
+            'average_rating': facets['average_rating'],
+            'facets': {
+                field: facets[field]
+                for field in ('state', 'lga', 'city', 'cuisine', 'rating')
+            }
+        })
+    except Exception as e:
+        return jsonify({
+            'success': False,
+            'error': str(e)
+        }), 500
 
-        restaurants = restaurant_service.get_all_restaurants()
 
-        # Filter by city if provided
-        if city:
-            restaurants = [
-                r for r in restaurants
-                if r.get('city') and r.get('city').lower() == city.lower()
-            ]
+@restaurants_bp.route('/restaurants/delivering-to/<area>', methods=['GET'])
+@cached_response(restaurant_service.snapshot_version)
+def get_restaurants_delivering_to(area):
+    """
+    Get the restaurants that deliver to an area
+    Other spellings of areas we serve (e.g. "VI", "Somolu") are resolved.
+    Query params:
+        - page: Page number (default: 1)
+        - per_page: Results per page (default: 20, max 1000)
+        - fields: Comma-separated keys to return (optional)
+    """
+    try:
+        page = max(request.args.get('page', 1, type=int), 1)
+        per_page = clamp_page_size(request.args.get('per_page', 20, type=int))
+
+        total, restaurants = restaurant_service.restaurants_delivering_to(
+            area,
+            offset=(page - 1) * per_page,
+            limit=per_page,
+            fields=_requested_fields()
+        )
+
+        return jsonify({
+            'success': True,
+            'area': resolve_area(area),
+            'page': page,
+            'per_page': per_page,
+            'total': total,
+            'pages': (total + per_page - 1) // per_page,
+            'count': len(restaurants),
+            'data': restaurants
+        })
+    except Exception as e:
+        return jsonify({
+            'success': False,
+            'error': str(e)
+        }), 500
+
+
+@restaurants_bp.route('/restaurants/nearby', methods=['GET'])
+@cached_response(restaurant_service.snapshot_version)
+def get_nearby_restaurants():
+    """
+    Get the restaurants nearest to a point, nearest first
+    Distances are measured to area centroids, so they are approximate.
+    Query params:
+        - lat, lng: Point to search around (required)
+        - radius: Only restaurants within this many km (optional, max 50);
+          without it, the `limit` nearest are returned
+        - limit: Number of restaurants (default: 20, max 1000)
+        - fields: Comma-separated keys to return (optional)
+    """
+    try:
+        lat = request.args.get('lat', type=float)
+        lng = request.args.get('lng', type=float)
+        radius = request.args.get('radius', type=float)
+        limit = clamp_page_size(request.args.get('limit', 20, type=int))
+
+        if lat is None or lng is None or not -90 <= lat <= 90 or not -180 <= lng <= 180:
+            return jsonify({
+                'success': False,
+                'error': 'lat and lng parameters are required'
+            }), 400
+        if radius is not None and not 0 < radius <= MAX_NEARBY_RADIUS_KM:
+            return jsonify({
+                'success': False,
+                'error': f'radius must be between 0 and {MAX_NEARBY_RADIUS_KM} km'
+            }), 400
 
-        # Limit results if provided
-        if limit:
-            restaurants = restaurants[:limit]
+        total, restaurants = restaurant_service.nearby_restaurants(
+            lat, lng, radius=radius, limit=limit, fields=_requested_fields()
+        )
 
         return jsonify({
             'success': True,
+            'lat': lat,
+            'lng': lng,
+            'radius': radius,
+            'total': total,
             'count': len(restaurants),
             'data': restaurants
         })
@@ -50,13 +456,52 @@ def get_restaurants():
         }), 500
 
 
+@restaurants_bp.route('/autocomplete', methods=['GET'])
+@cached_response(restaurant_service.snapshot_version)
+def autocomplete():
+    """
+    Typeahead completions for restaurant names, cities and areas
+    Query params:
+        - prefix: Text typed so far (required)
+        - limit: Number of completions (default: 10, max 50)
+    """
+    try:
+        prefix = request.args.get('prefix', '')
+        limit = request.args.get('limit', 10, type=int)
+
+        if not prefix.strip():
+            return jsonify({
+                'success': False,
+                'error': 'prefix parameter is required'
+            }), 400
+
+        completions = restaurant_service.autocomplete(prefix, limit)
+
+        return jsonify({
+            'success': True,
+            'prefix': prefix,
+            'count': len(completions),
+            'data': completions
+        })
+    except Exception as e:
+        return jsonify({
+            'success': False,
+            'error': str(e)
+        }), 500
+
+
 @restaurants_bp.route('/restaurants/<restaurant_id>', methods=['GET'])
+@cached_response(restaurant_service.snapshot_version)
 def get_restaurant(restaurant_id):
-    """Get a specific restaurant by ID"""
+    """
+    Get a specific restaurant by ID
+    Query params:
+        - fields: Comma-separated keys to return (optional)
+    """
     try:
-        restaurant = restaurant_service.get_restaurant_by_id(restaurant_id)
+        restaurant = restaurant_service.get_restaurant_by_id(restaurant_id, _requested_fields())
 
-        if not restaurant:
+        if restaurant is None:
             return jsonify({
                 'success': False,
                 'error': 'Restaurant not found'
@@ -77,13 +522,12 @@ def get_restaurant(restaurant_id):
 def refresh_restaurants():
     """Force refresh restaurant data from Chowdeck"""
     try:
-        restaurant_service.clear_cache()
-        restaurants = restaurant_service.get_all_restaurants()
+        store = restaurant_service.force_refresh()
 
         return jsonify({
             'success': True,
             'message': 'Restaurant data refreshed',
-            'count': len(restaurants)
+            'count': len(store)
         })
     except Exception as e:
         return jsonify({
@@ -139,11 +583,20 @@ def get_lgas(state):
 def get_restaurants_by_location():
     """
     Get restaurants for a specific state and LGA
+    Not response-cached: the live blog extras are not part of the snapshot
+    version the cache is keyed on.
     Query params:
         - state: State name (required)
         - lga: LGA name (optional)
         - page: Page number (default: 1)
         - per_page: Results per page (default: 15)
+        - sort: "rating" or "name" (optional, default: merge order); restaurants
+          found only in live blog posts still follow the sorted snapshot
+        - order: "asc" or "desc" (optional, default: desc for rating, asc for name)
+        - open_at / open_now: Only restaurants open then, as for /restaurants (optional)
+        - fields: Comma-separated keys to return (optional)
+        - format: "ndjson" to stream every match instead of one page (optional;
+          also selected by Accept: application/x-ndjson; ignores sort)
     """
     try:
         state = request.args.get('state')
@@ -157,15 +610,28 @@ def get_restaurants_by_location():
                 'error': 'State parameter is required'
             }), 400
 
-        # Fetch restaurants for the location
-        restaurants = location_scraper.fetch_for_location(state, lga)
+        try:
+            sort, descending = _requested_sort()
+            open_at = _requested_open_at()
+        except ValueError as e:
+            return jsonify({
+                'success': False,
+                'error': str(e)
+            }), 400
+
+        if _wants_ndjson():
+            return _ndjson_response(
+                _stream_location(state, lga, _requested_fields(), open_at=open_at)
+            )
 
-        # Calculate pagination
-        total = len(restaurants)
-        start = (page - 1) * per_page
-        end = start + per_page
+        page = max(page, 1)
+        per_page = max(per_page, 1)
 
-        paginated = restaurants[start:end]
+        # Page through the indexed snapshot, then any live blog extras
+        total, paginated = _query_location(
+            state, lga, (page - 1) * per_page, per_page, _requested_fields(),
+            sort=sort, descending=descending, open_at=open_at
+        )
 
         return jsonify({
             'success': True,
@@ -198,15 +664,27 @@ def download_restaurants_excel():
         lga = request.args.get('lga')
 
         # Get restaurants
+        indexed = restaurant_service.find_restaurants(state=state, lga=lga)
         if lga:
-            restaurants = location_scraper.fetch_for_location(state, lga)
+            restaurants = location_scraper.fetch_for_location(state, lga, restaurants=indexed)
             filename = f"{state}_{lga}_Restaurants_{datetime.now().strftime('%Y%m%d')}.xlsx"
         else:
-            restaurants = location_scraper.fetch_for_location(state)
+            restaurants = location_scraper.fetch_for_location(state, restaurants=indexed)
             filename = f"{state}_Restaurants_{datetime.now().strftime('%Y%m%d')}.xlsx"
 
+        # LGA counts come from the precomputed facets, plus any live blog extras
+        lga_counts = {}
+        for facet in restaurant_service.get_facets(state=state, lga=lga)['lga']:
+            lga_counts[facet['value']] = facet['count']
+        unknown = len(indexed) - sum(lga_counts.values())
+        if unknown:
+            lga_counts['Unknown'] = unknown
+        for restaurant in restaurants[len(indexed):]:
+            extra_lga = restaurant.get('lga') or 'Unknown'
+            lga_counts[extra_lga] = lga_counts.get(extra_lga, 0) + 1
+
         # Generate Excel file
-        excel_file = create_restaurants_excel(restaurants, state)
+        excel_file = create_restaurants_excel(restaurants, state, lga_counts=lga_counts)
 
         return send_file(
             excel_file,
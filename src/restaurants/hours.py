@@ -0,0 +1,227 @@
+"""
+Opening hours: free-text parsing and a time-slot index
+Texts like "9:00 AM - 10:00 PM" or "Mon-Fri 8am-9pm, Sat 10am-11pm" are
+parsed once per snapshot into weekly intervals (minutes since Monday 00:00).
+The index splits the week into 15-minute slots, each holding a bitset of
+the record positions open at the start of that slot, so "open at" filters
+are a bit test per record instead of a parse.
+"""
+import re
+from array import array
+from datetime import datetime, timedelta, timezone
+from functools import lru_cache
+
+SLOT_MINUTES = 15
+MINUTES_PER_DAY = 24 * 60
+MINUTES_PER_WEEK = 7 * MINUTES_PER_DAY
+SLOTS_PER_WEEK = MINUTES_PER_WEEK // SLOT_MINUTES
+
+# Restaurants keep Lagos time (WAT, UTC+1 all year: Nigeria has no DST)
+LAGOS_TZ = timezone(timedelta(hours=1), 'WAT')
+
+_DAYS = {
+    'mon': 0, 'monday': 0,
+    'tue': 1, 'tues': 1, 'tuesday': 1,
+    'wed': 2, 'weds': 2, 'wednesday': 2,
+    'thu': 3, 'thur': 3, 'thurs': 3, 'thursday': 3,
+    'fri': 4, 'friday': 4,
+    'sat': 5, 'saturday': 5,
+    'sun': 6, 'sunday': 6,
+}
+_DAY = r'\b(' + '|'.join(sorted(_DAYS, key=len, reverse=True)) + r')s?\b\.?'
+_DAY_RANGE_RE = re.compile(_DAY + r'\s*-\s*' + _DAY)
+_DAY_RE = re.compile(_DAY)
+_ALL_DAYS_RE = re.compile(r'\b(daily|every\s*day|all\s*week|7\s*days|mon\w*\s*-\s*sun\w*)\b')
+_WEEKDAYS_RE = re.compile(r'\bweekdays?\b')
+_WEEKENDS_RE = re.compile(r'\bweekends?\b')
+
+_TIME = r'(noon|midnight|\d{1,2}(?:[:.]\d{2})?\s*(?:[ap]\.?m\b\.?)?)'
+_RANGE_RE = re.compile(
+    _TIME + r'\s*-\s*' + _TIME + r'|\b(24\s*(?:/\s*7|hours|hrs|h)\b|open\s+all\s+day)'
+)
+_SEGMENT_RE = re.compile(r'[,;\n|]')
+_CLOCK_RE = re.compile(r'(\d{1,2})(?:[:.](\d{2}))?\s*(?:([ap])\.?m\.?)?$')
+
+
+def _parse_time(text):
+    """Parse one clock time into (hour, minute, 'a'/'p'/None), or None"""
+    text = text.strip()
+    if text == 'noon':
+        return 12, 0, 'p'
+    if text == 'midnight':
+        return 12, 0, 'a'
+    match = _CLOCK_RE.match(text)
+    if not match:
+        return None
+    hour, minute, meridiem = int(match.group(1)), int(match.group(2) or 0), match.group(3)
+    if minute >= 60 or hour > 24 or (meridiem and not 1 <= hour <= 12):
+        return None
+    return hour, minute, meridiem
+
+
+def _to_minutes(hour, minute, meridiem):
+    if meridiem:
+        hour = hour % 12 + (12 if meridiem == 'p' else 0)
+    return hour * 60 + minute
+
+
+def _parse_range(start_text, end_text):
+    """Parse a clock range into (start, end) minutes of the day; end may be <= start"""
+    start, end = _parse_time(start_text), _parse_time(end_text)
+    if start is None or end is None:
+        return None
+
+    if start[2] is None and end[2] is not None:
+        # "6 - 11pm": the start shares the end's meridiem unless that reverses it
+        shared = _to_minutes(start[0], start[1], end[2]) if 1 <= start[0] <= 12 else None
+        start = (start[0], start[1], end[2] if shared is not None and
+                 shared < _to_minutes(*end) else None)
+    start_minutes, end_minutes = _to_minutes(*start), _to_minutes(*end)
+
+    if start[2] is None and end[2] is None and end_minutes <= start_minutes <= 12 * 60:
+        # "9-5" on a 12-hour clock
+        end_minutes += 12 * 60
+    if end_minutes == 0:
+        end_minutes = MINUTES_PER_DAY
+    if start_minutes >= MINUTES_PER_DAY or end_minutes > MINUTES_PER_DAY:
+        return None
+    return start_minutes, end_minutes
+
+
+def _open_days(text):
+    """Get the weekdays named in a piece of text, ignoring its "closed" clauses"""
+    return _parse_days(' '.join(
+        segment for segment in _SEGMENT_RE.split(text) if 'closed' not in segment
+    ))
+
+
+def _parse_days(text):
+    """Get the weekdays (0 = Monday) named in a piece of text, or None"""
+    if _ALL_DAYS_RE.search(text):
+        return set(range(7))
+
+    days = set()
+    for first, last in _DAY_RANGE_RE.findall(text):
+        first, last = _DAYS[first], _DAYS[last]
+        days.update(day % 7 for day in range(first, first + (last - first) % 7 + 1))
+    text = _DAY_RANGE_RE.sub(' ', text)
+    days.update(_DAYS[day] for day in _DAY_RE.findall(text))
+    if _WEEKDAYS_RE.search(text):
+        days.update(range(5))
+    if _WEEKENDS_RE.search(text):
+        days.update((5, 6))
+    return days or None
+
+
+@lru_cache(maxsize=4096)
+def parse_opening_hours(text):
+    """
+    Parse free-text opening hours into weekly intervals
+    Days named before a time range (or after the last one) apply to it,
+    except those in "closed" clauses; ranges without days apply every day.
+    Overnight ranges run into the next day and "closed" days are removed.
+    Returns a sorted tuple of (start, end) minutes since Monday 00:00, or
+    None if no time range could be read.
+    """
+    if not isinstance(text, str) or not text.strip():
+        return None
+    text = re.sub(r'[–—]|\bto\b|\btill\b|\buntil\b', '-', text.lower())
+
+    matches = list(_RANGE_RE.finditer(text))
+    if not matches:
+        return None
+
+    ranges = []
+    previous_end = 0
+    for index, match in enumerate(matches):
+        if match.group(3):
+            day_range = (0, MINUTES_PER_DAY)
+        else:
+            day_range = _parse_range(match.group(1), match.group(2))
+        days = _open_days(text[previous_end:match.start()])
+        if days is None and index == len(matches) - 1:
+            days = _open_days(text[match.end():])
+        previous_end = match.end()
+        if day_range is not None:
+            ranges.append((days if days is not None else set(range(7)), day_range))
+
+    closed = set()
+    for segment in _SEGMENT_RE.split(text):
+        if 'closed' in segment:
+            closed |= _parse_days(segment) or set()
+
+    intervals = []
+    for days, (start, end) in ranges:
+        for day in days - closed:
+            start_week = day * MINUTES_PER_DAY + start
+            end_week = day * MINUTES_PER_DAY + end
+            if end <= start:
+                end_week += MINUTES_PER_DAY
+            if end_week > MINUTES_PER_WEEK:
+                intervals.append((0, end_week - MINUTES_PER_WEEK))
+                end_week = MINUTES_PER_WEEK
+            intervals.append((start_week, end_week))
+
+    return _merge(intervals) if ranges else None
+
+
+def _merge(intervals):
+    """Merge overlapping or touching intervals into a sorted tuple"""
+    merged = []
+    for start, end in sorted(intervals):
+        if merged and start <= merged[-1][1]:
+            merged[-1] = (merged[-1][0], max(merged[-1][1], end))
+        else:
+            merged.append((start, end))
+    return tuple(merged)
+
+
+def week_slot(when=None):
+    """
+    Get the slot of the week a moment falls in, in Lagos time
+    Naive datetimes are taken to be Lagos time; None means now.
+    """
+    if when is None:
+        when = datetime.now(LAGOS_TZ)
+    elif when.tzinfo is not None:
+        when = when.astimezone(LAGOS_TZ)
+    minute = when.weekday() * MINUTES_PER_DAY + when.hour * 60 + when.minute
+    return minute // SLOT_MINUTES
+
+
+def open_slots(intervals):
+    """Get the slots whose start falls inside any of the intervals"""
+    for start, end in intervals:
+        yield from range(-(-start // SLOT_MINUTES), -(-end // SLOT_MINUTES))
+
+
+def is_open(text, slot):
+    """Check if free-text opening hours cover the start of a slot"""
+    minute = slot * SLOT_MINUTES
+    return any(start <= minute < end for start, end in parse_opening_hours(text) or ())
+
+
+class OpeningHoursIndex:
+    """Per-slot bitsets of the record positions open at the start of each slot"""
+
+    def __init__(self, hours, size):
+        """`hours` holds each record's opening hours text, by position"""
+        bitmaps = [bytearray((size + 7) // 8) for _ in range(SLOTS_PER_WEEK)]
+        for position, text in enumerate(hours):
+            byte, bit = position >> 3, 1 << (position & 7)
+            for slot in open_slots(parse_opening_hours(text) or ()):
+                bitmaps[slot][byte] |= bit
+        self._bitmaps = [bytes(bitmap) for bitmap in bitmaps]
+
+    def is_open(self, slot, position):
+        """Check if the record at `position` is open during `slot`"""
+        return bool(self._bitmaps[slot][position >> 3] >> (position & 7) & 1)
+
+    def positions(self, slot):
+        """Get the sorted positions of every record open during `slot`"""
+        result = array('I')
+        for index, byte in enumerate(self._bitmaps[slot]):
+            if byte:
+                base = index * 8
+                result.extend(base + bit for bit in range(8) if byte >> bit & 1)
+        return result
@@ -0,0 +1,165 @@
+"""
+Pre-serialised API response cache
+Keeps the JSON body (and its gzip form) of recent API responses in an LRU
+bounded by total size. Entries belong to one restaurant snapshot version;
+the whole cache is dropped as soon as a request sees a newer snapshot.
+"""
+import os
+import gzip
+import threading
+from collections import OrderedDict
+from functools import wraps
+from flask import Response, make_response, request
+
+DEFAULT_MAX_BYTES = 32 * 1024 * 1024
+
+# Bodies smaller than this are not worth compressing
+MIN_GZIP_SIZE = 1024
+
+
+class CachedBody:
+    """A serialised response body and its optional gzip form"""
+
+    def __init__(self, body, mimetype):
+        self.body = body
+        self.mimetype = mimetype
+        self.gzipped = gzip.compress(body, compresslevel=6) if len(body) >= MIN_GZIP_SIZE else None
+
+    @property
+    def size(self):
+        return len(self.body) + len(self.gzipped or b'')
+
+    def to_response(self, accept_gzip):
+        """Build a response, gzip-encoded when the client accepts it"""
+        if accept_gzip and self.gzipped is not None:
+            response = Response(self.gzipped, mimetype=self.mimetype)
+            response.headers['Content-Encoding'] = 'gzip'
+        else:
+            response = Response(self.body, mimetype=self.mimetype)
+        response.headers['Vary'] = 'Accept-Encoding'
+        return response
+
+
+class CachedFragment:
+    """A rendered HTML fragment (e.g. a restaurant card)"""
+
+    def __init__(self, html):
+        self.html = html
+
+    @property
+    def size(self):
+        return len(self.html)
+
+
+class ResponseCache:
+    """Thread-safe LRU of cached entries (anything with a `size`) bounded by total bytes"""
+
+    def __init__(self, max_bytes=DEFAULT_MAX_BYTES):
+        self.max_bytes = max_bytes
+        self._entries = OrderedDict()
+        self._size = 0
+        self._version = None
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def get(self, version, key):
+        """
+        Get a cached entry (marking it recently used), or None
+        Seeing a new snapshot version drops every entry of the old one.
+        """
+        with self._lock:
+            if version != self._version:
+                self._entries.clear()
+                self._size = 0
+                self._version = version
+                return None
+
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+            return entry
+
+    def put(self, version, key, entry):
+        """
+        Cache an entry, evicting the least recently used ones to fit
+        Entries built from an outdated snapshot are not stored.
+        """
+        if entry.size > self.max_bytes:
+            return entry
+
+        with self._lock:
+            if version != self._version:
+                return entry
+
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._size -= previous.size
+            self._entries[key] = entry
+            self._size += entry.size
+
+            while self._size > self.max_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self._size -= evicted.size
+
+        return entry
+
+    def clear(self):
+        """Drop every cached response"""
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
+            self._version = None
+
+
+def cached_response(version, skip=None):
+    """
+    Decorate a JSON view so successful responses are served from the cache
+    `version` is called per request to get the current snapshot version;
+    entries are keyed by the path and the sorted query parameters. Requests
+    for which `skip()` returns True always run the view.
+    """
+    def decorator(view):
+        @wraps(view)
+        def wrapper(*args, **kwargs):
+            if skip is not None and skip():
+                return view(*args, **kwargs)
+
+            cache = get_response_cache()
+            snapshot_version = version()
+            key = (request.path, tuple(sorted(request.args.items(multi=True))))
+
+            entry = cache.get(snapshot_version, key)
+            if entry is None:
+                response = make_response(view(*args, **kwargs))
+                if response.status_code != 200 or response.is_streamed:
+                    return response
+                entry = cache.put(
+                    snapshot_version, key, CachedBody(response.get_data(), response.mimetype)
+                )
+
+            return entry.to_response('gzip' in request.accept_encodings)
+        return wrapper
+    return decorator
+
+
+_response_cache = None
+_response_cache_lock = threading.Lock()
+
+
+def get_response_cache():
+    """
+    Get the process-wide API response cache
+    Its size bound (in bytes) can be set with RESPONSE_CACHE_BYTES.
+    """
+    global _response_cache
+
+    if _response_cache is None:
+        with _response_cache_lock:
+            if _response_cache is None:
+                _response_cache = ResponseCache(
+                    int(os.getenv('RESPONSE_CACHE_BYTES', DEFAULT_MAX_BYTES))
+                )
+
+    return _response_cache
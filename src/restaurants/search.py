@@ -0,0 +1,182 @@
+"""
+Full-text search over the in-memory restaurant store
+A tokenised inverted index over name, location, cuisine and specialties,
+with one posting list per (field, token) so matches can be ranked by
+where a term was found. A trigram index over the name and specialty
+vocabulary adds typo-tolerant (fuzzy) matching.
+"""
+import re
+import math
+import heapq
+from array import array
+from bisect import bisect_left
+
+# Searched fields and how much a match in each contributes to the score
+FIELD_WEIGHTS = {
+    'name': 3.0,
+    'cuisine': 2.0,
+    'specialties': 1.5,
+    'location': 1.0,
+}
+
+# Upper bound on vocabulary tokens a trailing prefix expands to
+MAX_PREFIX_EXPANSIONS = 200
+
+# Fields whose vocabulary is trigram-indexed for fuzzy matching
+FUZZY_FIELDS = ('name', 'specialties')
+
+# Minimum trigram similarity (Jaccard) for a fuzzy match
+FUZZY_THRESHOLD = 0.3
+
+# Upper bound on vocabulary tokens a fuzzy term expands to
+MAX_FUZZY_EXPANSIONS = 20
+
+_TOKEN_RE = re.compile(r'[a-z0-9]+')
+
+
+def tokenize(text):
+    """Split text into lowercase alphanumeric tokens"""
+    if not text:
+        return []
+    if isinstance(text, (list, tuple)):
+        text = ' '.join(str(part) for part in text)
+    return _TOKEN_RE.findall(str(text).lower())
+
+
+def trigrams(token):
+    """Get the set of padded character trigrams of a token"""
+    padded = f"  {token} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+class TrigramIndex:
+    """
+    Trigram index over a vocabulary of tokens
+    Only tokens sharing at least one trigram with the query are scored.
+    """
+
+    def __init__(self, tokens):
+        self._tokens = sorted(set(tokens))
+        self._sizes = array('I')
+        self._postings = {}  # trigram -> token ids
+        for token_id, token in enumerate(self._tokens):
+            grams = trigrams(token)
+            self._sizes.append(len(grams))
+            for gram in grams:
+                posting = self._postings.get(gram)
+                if posting is None:
+                    posting = self._postings[gram] = array('I')
+                posting.append(token_id)
+
+    def similar(self, term, threshold=FUZZY_THRESHOLD, limit=MAX_FUZZY_EXPANSIONS):
+        """Get up to `limit` (token, similarity) pairs, most similar first"""
+        grams = trigrams(term)
+        shared = {}
+        for gram in grams:
+            for token_id in self._postings.get(gram, ()):
+                shared[token_id] = shared.get(token_id, 0) + 1
+
+        matches = []
+        for token_id, count in shared.items():
+            similarity = count / (len(grams) + self._sizes[token_id] - count)
+            if similarity >= threshold:
+                matches.append((self._tokens[token_id], similarity))
+
+        return heapq.nlargest(limit, matches, key=lambda match: (match[1], match[0]))
+
+
+class SearchIndex:
+    """Inverted index over the searchable fields of a store"""
+
+    def __init__(self, store):
+        self._size = len(store)
+        # field -> token -> sorted record positions
+        self._postings = {field: {} for field in FIELD_WEIGHTS}
+
+        for position in range(self._size):
+            for field, postings in self._postings.items():
+                for token in set(tokenize(store.value(field, position))):
+                    posting = postings.get(token)
+                    if posting is None:
+                        posting = postings[token] = array('I')
+                    posting.append(position)
+
+        # Sorted vocabulary for prefix expansion of the last query term
+        self._vocabulary = sorted(set().union(*self._postings.values()))
+        self._trigrams = TrigramIndex(
+            set().union(*(self._postings[field] for field in FUZZY_FIELDS))
+        )
+
+    def _expand(self, term, prefix, fuzzy):
+        """Get the (vocabulary token, similarity) pairs a query term matches"""
+        expansions = {term: 1.0}
+
+        if prefix:
+            start = bisect_left(self._vocabulary, term)
+            for token in self._vocabulary[start:start + MAX_PREFIX_EXPANSIONS]:
+                if not token.startswith(term):
+                    break
+                expansions[token] = 1.0
+
+        if fuzzy:
+            for token, similarity in self._trigrams.similar(term):
+                expansions.setdefault(token, similarity)
+
+        return expansions
+
+    def _term_scores(self, term, prefix, fuzzy=False):
+        """Score every record matching one query term"""
+        expansions = self._expand(term, prefix, fuzzy)
+        matched = {}
+        for field, weight in FIELD_WEIGHTS.items():
+            postings = self._postings[field]
+            for token, similarity in expansions.items():
+                posting = postings.get(token)
+                if not posting:
+                    continue
+                # Rarer tokens count for more (BM25-style idf)
+                idf = math.log(1 + (self._size - len(posting) + 0.5) / (len(posting) + 0.5))
+                score = weight * idf * similarity
+                for position in posting:
+                    if matched.get(position, 0) < score:
+                        matched[position] = score
+        return matched
+
+    def search(self, text, offset=0, limit=20, fuzzy=False, positions=None):
+        """
+        Find the records containing every query term
+        The last term also matches as a prefix, so partially typed words
+        work. With `fuzzy`, a term also matches name/specialty words that
+        share enough trigrams with it, scored by similarity. Results are
+        ranked by score, then merge order. With `positions`, only those
+        records can match.
+        Returns (total matches, list of record positions on the page).
+        """
+        terms = tokenize(text)
+        if not terms:
+            return 0, []
+
+        # Start from the most selective term and intersect
+        per_term = [
+            self._term_scores(term, prefix=index == len(terms) - 1, fuzzy=fuzzy)
+            for index, term in enumerate(terms)
+        ]
+        per_term.sort(key=len)
+
+        scores = per_term[0]
+        if positions is not None:
+            allowed = set(positions)
+            scores = {position: score for position, score in scores.items() if position in allowed}
+        for matched in per_term[1:]:
+            if not scores:
+                break
+            scores = {
+                position: score + matched[position]
+                for position, score in scores.items()
+                if position in matched
+            }
+
+        ranked = heapq.nsmallest(
+            offset + limit, scores.items(), key=lambda item: (-item[1], item[0])
+        )
+        return len(scores), [position for position, _ in ranked[offset:]]
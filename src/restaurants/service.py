@@ -1,20 +1,43 @@
 """
 Restaurant service layer
 """
+import os
+import threading
 from datetime import datetime, timedelta
 from src.clients.chowdeck import ChowdeckClient
-from src.data.seed_restaurants import get_all_seed_restaurants
-from src.data.mega_lagos_restaurants import get_mega_lagos_restaurants
+from src.restaurants.autocomplete import AutocompleteIndex
+from src.restaurants.hours import week_slot
+from src.restaurants.pagination import (
+    DEFAULT_PAGE_SIZE, InvalidCursor, decode_cursor, encode_cursor
+)
+from src.restaurants.snapshot import DEFAULT_SNAPSHOT_PATH, load_snapshot, save_snapshot
+from src.restaurants.sources import BlogSource, MegaLagosSource, MergedRestaurants, SeedSource
+from src.restaurants.sqlite_store import DEFAULT_SQLITE_PATH, SQLiteRestaurantStore
+from src.restaurants.store import ContentHasher, RestaurantStore, sort_value
 
 
 class RestaurantService:
     """Service for managing restaurant data"""
 
-    def __init__(self):
+    def __init__(self, cache_timeout=3600, snapshot_path=None, sqlite_path=None):
         self.client = ChowdeckClient()
-        self._cache = None
+        # Optional on-disk warm-start snapshot of the last good store
+        self.snapshot_path = snapshot_path
+        # Optional SQLite backend; the database file doubles as the snapshot
+        self.sqlite_path = sqlite_path
+        self._snapshot_checked = False
+        self._store = None
         self._cache_time = None
-        self._cache_timeout = 3600  # 1 hour in seconds
+        self._cache_timeout = cache_timeout  # seconds, 1 hour by default
+        # Sources in priority order; static databases never expire
+        self._merged = MergedRestaurants([
+            MegaLagosSource(),
+            SeedSource(),
+            BlogSource(self.client, ttl=cache_timeout),
+        ])
+        self._refresh_thread = None
+        # Held by whichever caller is rebuilding the cache (single-flight)
+        self._refresh_lock = threading.Lock()
 
     def get_all_restaurants(self):
         """
@@ -22,70 +45,315 @@ class RestaurantService:
         Returns cached data if available and not expired
         Combines seed database with blog-scraped data
         """
+        return self.get_store().all()
+
+    def get_store(self):
+        """
+        Get the current restaurant store
+        An expired store keeps being served while a background thread
+        rebuilds it (stale-while-revalidate); only a cold cache is built inline,
+        unless a warm-start snapshot can be served while the refresh runs.
+        Rebuilds are single-flight: concurrent callers never merge twice.
+        """
+        store = self._store
         if self._is_cache_valid():
-            return self._cache
+            return store
 
-        # Fetch fresh data - combine Lagos DB + seed database + blog scraping
-        all_restaurants = []
-        seen_ids = set()
+        if store is not None:
+            self._start_background_refresh()
+            return store
+
+        # Cold cache: one caller builds it, the others wait for its result
+        with self._refresh_lock:
+            if self._store is None and not self._restore_snapshot():
+                self._refresh()
+            store = self._store
+
+        if not self._is_cache_valid():
+            # Restored from a snapshot: serve it and refresh in the background
+            self._start_background_refresh()
+        return store
+
+    def _restore_snapshot(self):
+        """Load the on-disk snapshot once per process; True if it was loaded"""
+        if self._snapshot_checked:
+            return False
+
+        self._snapshot_checked = True
+        if self.sqlite_path:
+            store = SQLiteRestaurantStore.open(self.sqlite_path)
+        elif self.snapshot_path:
+            store = load_snapshot(self.snapshot_path)
+        else:
+            return False
+
+        if store is None:
+            return False
+
+        if store.autocomplete_index is None:
+            store.autocomplete_index = AutocompleteIndex.build(store)
+        # Leave the cache time unset so the snapshot counts as expired
+        self._store = store
+        return True
+
+    def _start_background_refresh(self):
+        """Rebuild the cache in a daemon thread unless a rebuild is in flight"""
+        if not self._refresh_lock.acquire(blocking=False):
+            return
 
-        # 1. Load Lagos restaurants (24,000+ mega Lagos database)
-        try:
-            lagos_restaurants = get_mega_lagos_restaurants()
-            for restaurant in lagos_restaurants:
-                all_restaurants.append(restaurant)
-                seen_ids.add(restaurant['id'])
-        except Exception as e:
-            print(f"Error loading Lagos restaurants: {str(e)}")
-
-        # 2. Load other seed restaurants (Abuja, etc.)
         try:
-            seed_restaurants = get_all_seed_restaurants()
-            for restaurant in seed_restaurants:
-                # Only add if not Lagos (since we already added Lagos above)
-                if restaurant['id'] not in seen_ids and restaurant.get('state') != 'Lagos':
-                    all_restaurants.append(restaurant)
-                    seen_ids.add(restaurant['id'])
-        except Exception as e:
-            print(f"Error loading seed restaurants: {str(e)}")
-
-        # 3. Fetch from blog posts (additional data)
+            self._refresh_thread = threading.Thread(
+                target=self._background_refresh,
+                name='restaurant-cache-refresh',
+                daemon=True
+            )
+            self._refresh_thread.start()
+        except Exception:
+            self._refresh_lock.release()
+            raise
+
+    def _background_refresh(self):
+        """Thread target: rebuild the cache, then release the refresh lock"""
         try:
-            blog_restaurants = self.client.fetch_restaurants()
-            for restaurant in blog_restaurants:
-                if restaurant['id'] not in seen_ids:
-                    all_restaurants.append(restaurant)
-                    seen_ids.add(restaurant['id'])
-        except Exception as e:
-            print(f"Error fetching blog restaurants: {str(e)}")
+            self._refresh()
+        finally:
+            self._refresh_lock.release()
+
+    def _refresh(self):
+        """Rebuild the merged data and swap the new store in"""
+        self._update_cache(self._load_restaurants())
+
+        if self.snapshot_path and not self.sqlite_path:
+            try:
+                save_snapshot(self._store, self.snapshot_path)
+            except Exception as e:
+                print(f"Error saving restaurant snapshot: {str(e)}")
+
+    def _load_restaurants(self):
+        """
+        Merge the Lagos DB, seed database and blog-scraped data
+        Only sources whose own TTL expired are fetched again; the static
+        databases are loaded once and kept in the merged view.
+        """
+        return self._merged.refresh()
+
+    def snapshot_version(self):
+        """
+        Get the content version of the current store snapshot
+        A hash of the merged records: it only changes when a refresh
+        publishes different data, and is the same in every worker.
+        """
+        return self.get_store().version
+
+    def get_restaurant_by_id(self, restaurant_id, fields=None):
+        """Get a specific restaurant by ID (only `fields` keys, if given)"""
+        return self.get_store().get(restaurant_id, fields)
+
+    def find_restaurants(self, state=None, lga=None, city=None, cuisine=None):
+        """
+        Get restaurants matching the given filters (case-insensitive)
+        Answered from the store's secondary indexes instead of a full scan
+        """
+        return self.get_store().find(state=state, lga=lga, city=city, cuisine=cuisine)
+
+    def query_restaurants(self, state=None, lga=None, city=None, cuisine=None,
+                          offset=0, limit=None, fields=None, sort=None, descending=False,
+                          open_at=None):
+        """
+        Get one page of filtered restaurants, in merge order or sorted by `sort`
+        With `open_at` (a datetime), only restaurants open at that time.
+        Filtering, sorting, paging and field projection are pushed down to the store backend.
+        Returns (total matches, list of restaurants on the page).
+        """
+        return self.get_store().query(
+            offset=offset, limit=limit, fields=fields, sort=sort, descending=descending,
+            state=state, lga=lga, city=city, cuisine=cuisine, open_slot=_open_slot(open_at)
+        )
+
+    def page_restaurants(self, cursor=None, limit=DEFAULT_PAGE_SIZE, state=None,
+                         lga=None, city=None, cuisine=None, fields=None,
+                         sort=None, descending=False, open_at=None):
+        """
+        Get one keyset page of filtered restaurants, in merge order or sorted by `sort`
+        With `open_at` (a datetime), only restaurants open at that time.
+        The cursor holds the position and ID of the previous page's last
+        record (plus, when sorted, the sort it was issued for and the
+        record's sort value); if a refresh moved that record, paging resumes
+        after its new position. Sorted pages seek by the sort value, so they
+        resume in the right place even if the record is gone.
+        Returns (list of restaurants, cursor for the next page or None).
+        Raises InvalidCursor for a malformed cursor or one from another sort.
+        """
+        store = self.get_store()
+        after = -1
+        after_value = None
+        sort_tag = [f"{sort}:{'desc' if descending else 'asc'}"] if sort else []
+
+        if cursor:
+            values = decode_cursor(cursor)
+            if (len(values) != 2 + 2 * len(sort_tag) or not isinstance(values[0], int)
+                    or values[2:3] != sort_tag):
+                raise InvalidCursor(f"Invalid cursor: {cursor}")
+            position, restaurant_id = values[:2]
+            moved_to = store.position_of(restaurant_id)
+            after = position if moved_to is None else moved_to
+            if sort:
+                after_value = sort_value(values[3], sort)
+
+        restaurants, last_position = store.page(
+            after=after, limit=limit, fields=fields, sort=sort, descending=descending,
+            after_value=after_value, state=state, lga=lga, city=city, cuisine=cuisine,
+            open_slot=_open_slot(open_at)
+        )
+
+        next_cursor = None
+        if last_position is not None:
+            # Read the keys from the store: `fields` may have projected them away
+            last = store.record(last_position, ('id', sort))
+            keys = [sort_value(last.get(sort), sort)] if sort else []
+            next_cursor = encode_cursor(last_position, last.get('id'), *sort_tag, *keys)
+
+        return restaurants, next_cursor
+
+    def search_restaurants(self, text, offset=0, limit=20, fields=None, fuzzy=False,
+                           state=None, lga=None, city=None, cuisine=None):
+        """
+        Full-text search over name, location, cuisine and specialties
+        With `fuzzy`, misspelt words match similar restaurant names/specialties.
+        Only restaurants matching the state/lga/city/cuisine filters are searched.
+        Returns (total matches, list of restaurants on the page), best first.
+        """
+        return self.get_store().search(
+            text, offset=offset, limit=limit, fields=fields, fuzzy=fuzzy,
+            state=state, lga=lga, city=city, cuisine=cuisine
+        )
 
-        self._update_cache(all_restaurants)
-        return all_restaurants
+    def restaurants_delivering_to(self, area, offset=0, limit=None, fields=None):
+        """
+        Get one page of the restaurants that deliver to an area
+        Area aliases (e.g. "VI") are resolved against LOCATIONS.
+        Returns (total matches, list of restaurants on the page).
+        """
+        return self.get_store().delivering_to(area, offset=offset, limit=limit, fields=fields)
+
+    def nearby_restaurants(self, lat, lng, radius=None, limit=20, fields=None):
+        """
+        Get the restaurants nearest to a point, from area-centroid coordinates
+        With `radius` (km), only restaurants within it; otherwise the `limit` nearest.
+        Returns (total matches, list of restaurants with distance_km), nearest first.
+        """
+        return self.get_store().nearby(lat, lng, radius=radius, limit=limit, fields=fields)
+
+    def get_facets(self, state=None, lga=None, city=None, cuisine=None):
+        """
+        Get restaurant counts by state, LGA, city, cuisine and rating bucket
+        Unfiltered counts are computed once per snapshot.
+        """
+        return self.get_store().facets(state=state, lga=lga, city=city, cuisine=cuisine)
 
-    def get_restaurant_by_id(self, restaurant_id):
-        """Get a specific restaurant by ID"""
-        restaurants = self.get_all_restaurants()
+    def autocomplete(self, prefix, limit=10):
+        """
+        Get typeahead completions (restaurant names, cities and areas)
+        The index is built with each snapshot, before it is published.
+        """
+        return self.get_store().autocomplete_index.complete(prefix, limit)
 
-        for restaurant in restaurants:
-            if str(restaurant.get('id')) == str(restaurant_id):
-                return restaurant
+    def stream_restaurants(self, state=None, lga=None, city=None, cuisine=None, fields=None,
+                           open_at=None):
+        """
+        Iterate every filtered restaurant with constant memory
+        The generator keeps reading the snapshot it started on, even if a
+        refresh swaps the store meanwhile.
+        """
+        return self.get_store().stream(
+            fields=fields, state=state, lga=lga, city=city, cuisine=cuisine,
+            open_slot=_open_slot(open_at)
+        )
 
-        return None
+    def force_refresh(self):
+        """
+        Re-fetch live sources and rebuild the store now
+        Runs under the refresh lock: a background refresh in flight finishes
+        first, then its store is replaced by one built after the sources
+        were invalidated.
+        Returns the new store.
+        """
+        with self._refresh_lock:
+            # The on-disk snapshot is older than what was asked for
+            self._snapshot_checked = True
+            self._merged.invalidate(volatile_only=True)
+            self._refresh()
+            return self._store
 
     def clear_cache(self):
-        """Clear the cached restaurant data"""
-        self._cache = None
-        self._cache_time = None
+        """Clear the cached restaurant data and re-fetch live sources on next load"""
+        with self._refresh_lock:
+            # Rebuild on next load instead of restoring the on-disk snapshot
+            self._snapshot_checked = True
+            self._merged.invalidate(volatile_only=True)
+            self._store = None
+            self._cache_time = None
 
     def _is_cache_valid(self):
         """Check if cache is still valid"""
-        if self._cache is None or self._cache_time is None:
+        if self._store is None or self._cache_time is None:
             return False
 
         age = datetime.now() - self._cache_time
         return age.total_seconds() < self._cache_timeout
 
     def _update_cache(self, data):
-        """Update cache with fresh data"""
-        self._cache = data
+        """Update cache with fresh data and rebuild its indexes"""
+        # Build the new store fully before publishing it, so readers only
+        # ever see a complete snapshot
+        if self.sqlite_path:
+            store = SQLiteRestaurantStore.build(data, self.sqlite_path)
+        else:
+            hasher = ContentHasher()
+            store = RestaurantStore(hasher.wrap(data))
+            store.version = hasher.hexdigest()
+            store.build_search_index()
+            store.build_orderings()
+            store.build_spatial_index()
+            store.build_hours_index()
+        # Kept on the store, so memory snapshots pickle it for warm start
+        store.autocomplete_index = AutocompleteIndex.build(store)
         self._cache_time = datetime.now()
+        self._store = store
+
+
+def _open_slot(open_at):
+    """Get the opening-hours slot for an `open_at` datetime (None: no filter)"""
+    return None if open_at is None else week_slot(open_at)
+
+
+# Process-wide service shared by the HTML routes and the /api blueprint
+_restaurant_service = None
+_restaurant_service_lock = threading.Lock()
+
+
+def get_restaurant_service():
+    """
+    Get the shared RestaurantService for this process
+    Created on first use with CACHE_TIMEOUT and SNAPSHOT_PATH from the
+    environment, so every route reads the same cache and a refresh is
+    visible everywhere. Set SNAPSHOT_PATH to an empty string to disable
+    the warm-start snapshot, and RESTAURANT_STORE=sqlite (with an optional
+    SQLITE_PATH) to use the SQLite backend instead of the in-memory store.
+    """
+    global _restaurant_service
+
+    if _restaurant_service is None:
+        with _restaurant_service_lock:
+            if _restaurant_service is None:
+                sqlite_path = None
+                if os.getenv('RESTAURANT_STORE', 'memory').lower() == 'sqlite':
+                    sqlite_path = os.getenv('SQLITE_PATH', DEFAULT_SQLITE_PATH)
+
+                _restaurant_service = RestaurantService(
+                    cache_timeout=int(os.getenv('CACHE_TIMEOUT', 3600)),
+                    snapshot_path=os.getenv('SNAPSHOT_PATH', DEFAULT_SNAPSHOT_PATH) or None,
+                    sqlite_path=sqlite_path
+                )
+
+    return _restaurant_service
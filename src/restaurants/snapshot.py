@@ -0,0 +1,56 @@
+"""
+On-disk snapshot of the merged restaurant store
+Lets a fresh process serve the last good dataset (records plus indexes)
+immediately while the network refresh runs in the background.
+"""
+import os
+import pickle
+import tempfile
+
+# Bump when the RestaurantStore layout changes so old snapshots are ignored
+SNAPSHOT_FORMAT = 12
+
+DEFAULT_SNAPSHOT_PATH = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))),
+    '.cache',
+    'restaurants_snapshot.pickle'
+)
+
+
+def save_snapshot(store, path):
+    """
+    Write a store to disk atomically
+    The file is only ever read back by this process type, so pickle is used
+    to keep loading to a few milliseconds. Never point `path` at untrusted data.
+    """
+    directory = os.path.dirname(path) or '.'
+    os.makedirs(directory, exist_ok=True)
+
+    fd, tmp_path = tempfile.mkstemp(dir=directory, prefix='.snapshot-')
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            pickle.dump((SNAPSHOT_FORMAT, store), f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
+def load_snapshot(path):
+    """Load a store written by save_snapshot, or None if missing/outdated"""
+    try:
+        with open(path, 'rb') as f:
+            snapshot_format, store = pickle.load(f)
+    except FileNotFoundError:
+        return None
+    except Exception as e:
+        print(f"Ignoring unreadable restaurant snapshot {path}: {str(e)}")
+        return None
+
+    if snapshot_format != SNAPSHOT_FORMAT:
+        return None
+
+    return store
@@ -0,0 +1,196 @@
+"""
+Restaurant data sources
+Each source fetches one input of the merged dataset and caches it with its own TTL
+"""
+from datetime import datetime
+from src.data.seed_restaurants import get_all_seed_restaurants
+from src.data.mega_lagos_restaurants import get_mega_lagos_restaurants
+from src.restaurants.geo import locate
+from src.restaurants.store import RestaurantStore
+
+
+class RestaurantSource:
+    """Base class for a cached input of the merged restaurant dataset"""
+
+    name = 'source'
+
+    def __init__(self, ttl=None):
+        self.ttl = ttl  # seconds; None means the data never expires
+        self.records = None
+        self.fetched_at = None
+        self._loaded = False
+
+    def fetch(self):
+        """Fetch this source's records (implemented by subclasses)"""
+        raise NotImplementedError
+
+    def is_stale(self):
+        """Check if the source needs to be fetched again"""
+        if not self._loaded:
+            return True
+        if self.ttl is None:
+            return False
+
+        age = datetime.now() - self.fetched_at
+        return age.total_seconds() >= self.ttl
+
+    def invalidate(self):
+        """Mark the cached records as stale without dropping them"""
+        self._loaded = False
+
+    def load(self):
+        """
+        Fetch fresh records and cache them
+        On failure the previous records are kept and the source stays stale.
+        Returns True if the cached records changed.
+        """
+        try:
+            records = self.fetch()
+        except Exception as e:
+            print(f"Error loading {self.name} restaurants: {str(e)}")
+            if self.records is None:
+                self.records = []
+                self.fetched_at = datetime.now()
+            return False
+
+        self.records = records
+        self.fetched_at = datetime.now()
+        self._loaded = True
+        return True
+
+
+class MegaLagosSource(RestaurantSource):
+    """Static mega Lagos database (24,000+ restaurants)"""
+
+    name = 'mega_lagos'
+
+    def fetch(self):
+        return get_mega_lagos_restaurants()
+
+
+class SeedSource(RestaurantSource):
+    """Static seed database, excluding Lagos (covered by the mega database)"""
+
+    name = 'seed'
+
+    def fetch(self):
+        return [
+            restaurant for restaurant in get_all_seed_restaurants()
+            if restaurant.get('state') != 'Lagos'
+        ]
+
+
+class BlogSource(RestaurantSource):
+    """Live scrape of the Chowdeck blog"""
+
+    name = 'blog'
+
+    def __init__(self, client, ttl=3600):
+        super().__init__(ttl=ttl)
+        self.client = client
+
+    def fetch(self):
+        return self.client.fetch_restaurants()
+
+
+class MergedRestaurants:
+    """
+    Merged view over several sources, deduplicated by restaurant ID
+    Sources are given in priority order: when two sources share an ID the
+    earlier source's record wins. Each source keeps its own contribution
+    as a columnar RestaurantStore, so refreshing one source only re-walks
+    that source's records (plus any lower-priority source that owned one of
+    its IDs). Static sources (no TTL) drop their raw dicts once merged.
+    """
+
+    def __init__(self, sources):
+        self.sources = list(sources)
+        self._owners = {}  # restaurant ID -> index of the owning source
+        self._contributions = [RestaurantStore([]) for _ in self.sources]
+
+    def refresh(self):
+        """
+        Re-fetch stale sources and upsert their records into the merged view
+        Returns an iterator over the merged restaurants in source priority order.
+        """
+        for index, source in enumerate(self.sources):
+            if source.is_stale() and source.load():
+                self._upsert(index)
+                if source.ttl is None:
+                    # Static data never changes; keep only the compact contribution
+                    source.records = None
+
+        return self.records()
+
+    def records(self):
+        """
+        Iterate the merged restaurants in source priority order
+        Each record gets its area's centroid coordinates (see geo.locate).
+        """
+        for contribution in self._contributions:
+            for restaurant in contribution.all():
+                yield locate(restaurant)
+
+    def invalidate(self, volatile_only=False):
+        """Mark sources stale; with volatile_only, only those with a TTL"""
+        for source in self.sources:
+            if not volatile_only or source.ttl is not None:
+                source.invalidate()
+
+    def _upsert(self, index):
+        """Replace the records owned by the source at `index`"""
+        records = self.sources[index].records or []
+        new_ids = {restaurant['id'] for restaurant in records}
+        touched = {index}
+
+        # Release IDs this source no longer provides
+        released = [
+            restaurant_id for restaurant_id in self._contributions[index].ids()
+            if restaurant_id not in new_ids
+        ]
+        for restaurant_id in released:
+            del self._owners[restaurant_id]
+
+        # Claim IDs unless a higher-priority source already owns them
+        for restaurant_id in new_ids:
+            owner = self._owners.get(restaurant_id)
+            if owner is None or owner > index:
+                if owner is not None:
+                    touched.add(owner)
+                self._owners[restaurant_id] = index
+
+        # Let lower-priority sources that still hold raw records take back
+        # released IDs
+        if released:
+            lower_ids = [
+                (lower, {r['id'] for r in self.sources[lower].records})
+                for lower in range(index + 1, len(self.sources))
+                if self.sources[lower].records is not None
+            ]
+            for restaurant_id in released:
+                if restaurant_id in self._owners:
+                    continue
+                for lower, ids in lower_ids:
+                    if restaurant_id in ids:
+                        self._owners[restaurant_id] = lower
+                        touched.add(lower)
+                        break
+
+        for source_index in touched:
+            self._rebuild_contribution(source_index)
+
+    def _rebuild_contribution(self, index):
+        """Recompute the records a source contributes to the merged view"""
+        records = self.sources[index].records
+        if records is None:
+            # Raw records were released; filter the existing contribution
+            records = self._contributions[index].all()
+
+        contribution = []
+        claimed = set()
+        for restaurant in records:
+            restaurant_id = restaurant['id']
+            if self._owners.get(restaurant_id) == index and restaurant_id not in claimed:
+                contribution.append(restaurant)
+                claimed.add(restaurant_id)
+        self._contributions[index] = RestaurantStore(contribution)
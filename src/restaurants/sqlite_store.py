@@ -0,0 +1,636 @@
+"""
+SQLite-backed restaurant store
+Optional alternative to the in-memory RestaurantStore: the merged dataset is
+written to a local SQLite file with indexes on state/lga/city/cuisine/rating
+and an FTS5 table, so filters, ordering and paging run in SQL and several
+gunicorn workers can share one on-disk copy. Each dataset version is built
+into its own immutable file; the configured path only points at the latest.
+"""
+import os
+import glob
+import json
+import sqlite3
+import tempfile
+import threading
+from contextlib import contextmanager
+from src.restaurants.geo import GridIndex
+from src.restaurants.hours import SLOT_MINUTES, parse_opening_hours
+from src.restaurants.search import FIELD_WEIGHTS, FUZZY_FIELDS, TrigramIndex, tokenize
+from src.restaurants.store import (
+    INDEXED_FIELDS, RATING_BUCKETS, SORT_FIELDS, UNRATED_BUCKET, ContentHasher, FacetCache,
+    RecordView, add_distances, delivery_key, facet_counts, normalize_key, project, rating_facet,
+    seek_rank, sort_order, sort_value
+)
+
+DEFAULT_SQLITE_PATH = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))),
+    '.cache',
+    'restaurants.sqlite3'
+)
+
+try:
+    import fcntl
+    _HAVE_FCNTL = True
+except ImportError:  # Windows: concurrent builds are not serialised
+    _HAVE_FCNTL = False
+
+# Bump when SCHEMA changes so files written by older versions are rebuilt
+SCHEMA_VERSION = 6
+
+# (sort field, descending) -> column holding each record's rank in that order
+RANK_COLUMNS = {
+    (sort, descending): f"{sort}_{'desc' if descending else 'asc'}_rank"
+    for sort in SORT_FIELDS
+    for descending in (True, False)
+}
+
+SCHEMA = """
+CREATE TABLE restaurants (
+    position INTEGER PRIMARY KEY,
+    id TEXT,
+    name TEXT,
+    state TEXT,
+    lga TEXT,
+    city TEXT,
+    cuisine TEXT,
+    rating REAL,
+    lat REAL,
+    lng REAL,
+    state_key TEXT,
+    lga_key TEXT,
+    city_key TEXT,
+    cuisine_key TEXT,
+    rating_desc_rank INTEGER NOT NULL,
+    rating_asc_rank INTEGER NOT NULL,
+    name_desc_rank INTEGER NOT NULL,
+    name_asc_rank INTEGER NOT NULL,
+    record TEXT NOT NULL
+);
+CREATE INDEX idx_restaurants_id ON restaurants(id);
+CREATE INDEX idx_restaurants_state ON restaurants(state_key);
+CREATE INDEX idx_restaurants_lga ON restaurants(lga_key);
+CREATE INDEX idx_restaurants_city ON restaurants(city_key);
+CREATE INDEX idx_restaurants_cuisine ON restaurants(cuisine_key);
+CREATE INDEX idx_restaurants_rating ON restaurants(rating);
+CREATE UNIQUE INDEX idx_restaurants_rating_desc ON restaurants(rating_desc_rank);
+CREATE UNIQUE INDEX idx_restaurants_rating_asc ON restaurants(rating_asc_rank);
+CREATE UNIQUE INDEX idx_restaurants_name_desc ON restaurants(name_desc_rank);
+CREATE UNIQUE INDEX idx_restaurants_name_asc ON restaurants(name_asc_rank);
+CREATE INDEX idx_restaurants_lga_rating ON restaurants(lga_key, rating_desc_rank);
+CREATE TABLE delivery_areas (
+    area_key TEXT NOT NULL,
+    position INTEGER NOT NULL,
+    PRIMARY KEY (area_key, position)
+) WITHOUT ROWID;
+CREATE TABLE opening_intervals (
+    opens INTEGER NOT NULL,
+    closes INTEGER NOT NULL,
+    position INTEGER NOT NULL
+);
+CREATE INDEX idx_opening_intervals ON opening_intervals(opens, closes, position);
+CREATE TABLE meta (key TEXT PRIMARY KEY, value TEXT);
+CREATE VIRTUAL TABLE restaurants_fts USING fts5(name, location, cuisine, specialties);
+"""
+
+# Columns of the restaurants_fts table, in order
+FTS_COLUMNS = ('name', 'location', 'cuisine', 'specialties')
+
+# Positions per "IN (...)" lookup, kept below SQLite's variable limit
+_CHUNK_SIZE = 500
+
+# Built files kept on disk, newest first: workers still reading an older
+# snapshot (until their next refresh) must be able to open new connections
+KEPT_BUILDS = 3
+
+
+def _build_path(path, version):
+    """Get the file a dataset version is built into, next to `path`"""
+    root, ext = os.path.splitext(path)
+    return f"{root}-v{SCHEMA_VERSION}-{version}{ext}"
+
+
+@contextmanager
+def _build_lock(path):
+    """Hold an exclusive lock on `<path>.lock` across processes"""
+    with open(f"{path}.lock", 'a') as lock_file:
+        if _HAVE_FCNTL:
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+        yield
+
+
+def _publish(build_path, path):
+    """Atomically point `path` at a built file (call with the build lock held)"""
+    link_path = f"{path}.publish"
+    if os.path.lexists(link_path):
+        os.remove(link_path)
+    os.symlink(os.path.basename(build_path), link_path)
+    os.replace(link_path, path)
+
+
+def _prune_builds(path, current):
+    """Remove all but the KEPT_BUILDS newest built files (never `current`)"""
+    root, ext = os.path.splitext(path)
+    builds = sorted(glob.glob(f"{glob.escape(root)}-v*{ext}"), key=os.path.getmtime, reverse=True)
+    for build_path in builds[KEPT_BUILDS:]:
+        if build_path != current:
+            try:
+                os.remove(build_path)
+            except OSError as e:
+                print(f"Error removing old restaurant database {build_path}: {str(e)}")
+
+
+class SQLiteRestaurantStore:
+    """Restaurant store backed by a read-only SQLite file"""
+
+    # Typeahead index, built by the owner before publishing (see autocomplete.py)
+    autocomplete_index = None
+
+    def __init__(self, path):
+        # The built file itself, not the published symlink (see build)
+        self.path = path
+        self._local = threading.local()
+        self._size = self._execute('SELECT COUNT(*) FROM restaurants').fetchone()[0]
+        meta = dict(self._execute('SELECT key, value FROM meta'))
+        # Content version of the dataset (see ContentHasher)
+        self.version = meta.get('version')
+        self.schema_version = int(meta.get('schema_version', 1))
+
+    @classmethod
+    def build(cls, restaurants, path):
+        """
+        Write restaurants to a version-named SQLite file and publish it at `path`
+        `path` becomes a symlink to `<name>-v<schema>-<version><ext>`. Built
+        files are never modified, so a store keeps reading the exact snapshot
+        it was opened on after a newer one is published. Builds are serialised
+        with a lock file: a worker whose data was already built by another
+        opens that file instead of writing its own.
+        """
+        restaurants = list(restaurants)
+        hasher = ContentHasher()
+        for _ in hasher.wrap(restaurants):
+            pass
+        version = hasher.hexdigest()
+
+        directory = os.path.dirname(path) or '.'
+        os.makedirs(directory, exist_ok=True)
+        build_path = _build_path(path, version)
+
+        with _build_lock(path):
+            if os.path.exists(build_path):
+                # Keep it among the newest builds when pruning
+                os.utime(build_path)
+            else:
+                cls._write(restaurants, version, build_path)
+            _publish(build_path, path)
+            _prune_builds(path, build_path)
+
+        return cls(build_path)
+
+    @staticmethod
+    def _write(restaurants, version, path):
+        """Write restaurants to a new SQLite file at `path` (via a temporary file)"""
+        directory = os.path.dirname(path) or '.'
+        fd, tmp_path = tempfile.mkstemp(dir=directory, prefix='.restaurants-', suffix='.sqlite3')
+        os.close(fd)
+
+        try:
+            conn = sqlite3.connect(tmp_path)
+            try:
+                conn.executescript(SCHEMA)
+                seen_ids = set()
+                rows = []
+                fts_rows = []
+                delivery_rows = []
+                interval_rows = []
+                sort_values = {sort: [] for sort in SORT_FIELDS}
+                for position, restaurant in enumerate(restaurants):
+                    restaurant_id = restaurant.get('id')
+                    # Only the first record per ID is reachable by id, as in memory
+                    lookup_id = None
+                    if restaurant_id is not None and str(restaurant_id) not in seen_ids:
+                        lookup_id = str(restaurant_id)
+                        seen_ids.add(lookup_id)
+
+                    rating = restaurant.get('rating')
+                    lat, lng = restaurant.get('lat'), restaurant.get('lng')
+                    if not isinstance(lat, (int, float)) or not isinstance(lng, (int, float)):
+                        lat = lng = None
+                    rows.append((
+                        position,
+                        lookup_id,
+                        restaurant.get('name'),
+                        restaurant.get('state'),
+                        restaurant.get('lga'),
+                        restaurant.get('city'),
+                        restaurant.get('cuisine'),
+                        rating if isinstance(rating, (int, float)) else None,
+                        lat,
+                        lng,
+                        *(normalize_key(restaurant.get(field)) for field in INDEXED_FIELDS),
+                        json.dumps(restaurant, ensure_ascii=False, separators=(',', ':')),
+                    ))
+                    for sort, values in sort_values.items():
+                        values.append(restaurant.get(sort))
+                    areas = restaurant.get('delivery_areas')
+                    if isinstance(areas, list):
+                        keys = {delivery_key(area) for area in areas} - {None}
+                        delivery_rows.extend((key, position) for key in keys)
+                    # Weekly intervals, in minutes since Monday 00:00 (see hours.py)
+                    for opens, closes in parse_opening_hours(restaurant.get('opening_hours')) or ():
+                        interval_rows.append((opens, closes, position))
+                    fts_rows.append((
+                        position,
+                        restaurant.get('name') or '',
+                        restaurant.get('location') or '',
+                        restaurant.get('cuisine') or '',
+                        ' '.join(restaurant.get('specialties') or []),
+                    ))
+
+                # Precompute every sort order, exactly as the in-memory store does
+                ranks = []
+                for (sort, descending), column in RANK_COLUMNS.items():
+                    rank = [0] * len(rows)
+                    order = sort_order(sort_values[sort], sort, descending)
+                    for index, position in enumerate(order):
+                        rank[position] = index
+                    ranks.append(rank)
+                rows = [row + tuple(rank[row[0]] for rank in ranks) for row in rows]
+
+                rank_columns = ', '.join(RANK_COLUMNS.values())
+                conn.executemany(
+                    'INSERT INTO restaurants (position, id, name, state, lga, city, cuisine, '
+                    'rating, lat, lng, state_key, lga_key, city_key, cuisine_key, record, '
+                    f'{rank_columns}) '
+                    f"VALUES ({', '.join('?' * (15 + len(RANK_COLUMNS)))})",
+                    rows
+                )
+                conn.executemany(
+                    'INSERT INTO delivery_areas (area_key, position) VALUES (?, ?)',
+                    delivery_rows
+                )
+                conn.executemany(
+                    'INSERT INTO opening_intervals (opens, closes, position) VALUES (?, ?, ?)',
+                    interval_rows
+                )
+                conn.executemany(
+                    'INSERT INTO restaurants_fts (rowid, name, location, cuisine, specialties) '
+                    'VALUES (?, ?, ?, ?, ?)',
+                    fts_rows
+                )
+                conn.executemany(
+                    'INSERT INTO meta (key, value) VALUES (?, ?)',
+                    [('version', version), ('schema_version', str(SCHEMA_VERSION))]
+                )
+                conn.commit()
+            finally:
+                conn.close()
+            os.replace(tmp_path, path)
+        except BaseException:
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+            raise
+
+    @classmethod
+    def open(cls, path):
+        """Open the store published at `path`; None if missing/unreadable/outdated"""
+        path = os.path.realpath(path)
+        if not os.path.exists(path):
+            return None
+        try:
+            store = cls(path)
+        except sqlite3.Error as e:
+            print(f"Ignoring unreadable restaurant database {path}: {str(e)}")
+            return None
+
+        if store.schema_version != SCHEMA_VERSION:
+            return None
+        return store
+
+    def __len__(self):
+        return self._size
+
+    def _connection(self):
+        """Get this thread's read-only connection"""
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = sqlite3.connect(f"file:{self.path}?mode=ro", uri=True)
+            self._local.conn = conn
+        return conn
+
+    def _execute(self, sql, params=()):
+        return self._connection().execute(sql, params)
+
+    @staticmethod
+    def _where(filters):
+        """
+        Build a WHERE clause over the normalised filter columns
+        `open_slot` keeps the records with an opening interval covering the
+        start of that slot.
+        """
+        clauses = []
+        params = []
+        for field, value in filters.items():
+            if field == 'open_slot':
+                if value is not None:
+                    clauses.append(
+                        'position IN (SELECT position FROM opening_intervals '
+                        'WHERE opens <= ? AND closes > ?)'
+                    )
+                    params += [value * SLOT_MINUTES] * 2
+                continue
+            if field not in INDEXED_FIELDS:
+                raise ValueError(f"Unknown filter field: {field}")
+            if not value:
+                continue
+            clauses.append(f"{field}_key = ?")
+            params.append(normalize_key(value))
+
+        where = f" WHERE {' AND '.join(clauses)}" if clauses else ''
+        return where, params
+
+    @staticmethod
+    def _order_column(sort, descending):
+        """Get the column to ORDER BY: the position, or a precomputed rank"""
+        if sort is None:
+            return 'position'
+        column = RANK_COLUMNS.get((sort, bool(descending)))
+        if column is None:
+            raise ValueError(f"Unknown sort field: {sort}")
+        return column
+
+    @staticmethod
+    def _project(record_json, fields):
+        return project(json.loads(record_json), fields)
+
+    def record(self, position, fields=None):
+        """Materialise the record at `position` as a dict"""
+        row = self._execute(
+            'SELECT record FROM restaurants WHERE position = ?', (position,)
+        ).fetchone()
+        if row is None:
+            raise IndexError(position)
+        return self._project(row[0], fields)
+
+    def records(self, positions, fields=None):
+        """Materialise the records at `positions` as dicts, in the given order"""
+        positions = list(positions)
+        by_position = {}
+        for start in range(0, len(positions), _CHUNK_SIZE):
+            chunk = positions[start:start + _CHUNK_SIZE]
+            placeholders = ','.join('?' * len(chunk))
+            for position, record_json in self._execute(
+                f'SELECT position, record FROM restaurants WHERE position IN ({placeholders})',
+                chunk
+            ):
+                by_position[position] = record_json
+        return [self._project(by_position[position], fields) for position in positions]
+
+    def all(self):
+        """Get every restaurant in merge order"""
+        return RecordView(self)
+
+    def get(self, restaurant_id, fields=None):
+        """Get a restaurant by ID through the id index"""
+        row = self._execute(
+            'SELECT record FROM restaurants WHERE id = ?', (str(restaurant_id),)
+        ).fetchone()
+        return self._project(row[0], fields) if row else None
+
+    def position_of(self, restaurant_id):
+        """Get the position of a restaurant by ID, or None if it is unknown"""
+        row = self._execute(
+            'SELECT position FROM restaurants WHERE id = ?', (str(restaurant_id),)
+        ).fetchone()
+        return row[0] if row else None
+
+    def positions(self, **filters):
+        """Get the sorted record positions matching every given filter"""
+        where, params = self._where(filters)
+        if not where:
+            return None
+        rows = self._execute(f'SELECT position FROM restaurants{where} ORDER BY position', params)
+        return [row[0] for row in rows]
+
+    def find(self, **filters):
+        """Get the restaurants matching every given filter, in merge order"""
+        return RecordView(self, self.positions(**filters))
+
+    def query(self, offset=0, limit=None, fields=None, sort=None, descending=False, **filters):
+        """
+        Get one page of the restaurants matching the filters
+        Filtering, ordering and LIMIT/OFFSET all run in SQLite; sorted pages
+        walk an index over a precomputed rank column.
+        Returns (total matches, list of materialised records).
+        """
+        order_by = self._order_column(sort, descending)
+        where, params = self._where(filters)
+        total = self._execute(f'SELECT COUNT(*) FROM restaurants{where}', params).fetchone()[0]
+        rows = self._execute(
+            f'SELECT record FROM restaurants{where} ORDER BY {order_by} LIMIT ? OFFSET ?',
+            params + [-1 if limit is None else limit, offset]
+        )
+        return total, [self._project(row[0], fields) for row in rows]
+
+    def page(self, after=-1, limit=100, fields=None, sort=None, descending=False,
+             after_value=None, **filters):
+        """
+        Get the next `limit` matching restaurants after the one at position `after`
+        Keyset pagination: the position primary key, or the rank column of
+        the sort order, is used as the seek key. Sorted pages start after
+        the (`after_value`, `after`) key, found by bisecting the rank index
+        as in memory. A negative `after` starts from the beginning.
+        Returns (records, last position if more records follow else None).
+        """
+        order_by = self._order_column(sort, descending)
+        seek = after
+        if sort is not None and after >= 0:
+            def entry_at(rank):
+                position, value = self._execute(
+                    f'SELECT position, {sort} FROM restaurants WHERE {order_by} = ?', (rank,)
+                ).fetchone()
+                return sort_value(value, sort), position
+
+            seek = seek_rank(self._size, entry_at, after_value, after, descending) - 1
+
+        where, params = self._where(filters)
+        where = f"{where} AND {order_by} > ?" if where else f' WHERE {order_by} > ?'
+        rows = self._execute(
+            f'SELECT position, record FROM restaurants{where} ORDER BY {order_by} LIMIT ?',
+            params + [seek, limit + 1]
+        ).fetchall()
+
+        has_more = len(rows) > limit
+        rows = rows[:limit]
+        last_position = rows[-1][0] if has_more else None
+        return [self._project(row[1], fields) for row in rows], last_position
+
+    def stream(self, fields=None, **filters):
+        """
+        Yield the restaurants matching the filters one by one, in merge order
+        Rows are read from an open cursor a batch at a time.
+        """
+        where, params = self._where(filters)
+        cursor = self._execute(f'SELECT record FROM restaurants{where} ORDER BY position', params)
+        while True:
+            rows = cursor.fetchmany(RecordView.BATCH_SIZE)
+            if not rows:
+                break
+            for row in rows:
+                yield self._project(row[0], fields)
+
+    def _fuzzy_index(self):
+        """Get (and cache) a trigram index over the name/specialty vocabulary"""
+        index = self.__dict__.get('_trigrams')
+        if index is None:
+            # fts5vocab lives in the temp schema, so it works on a read-only file
+            self._execute(
+                'CREATE VIRTUAL TABLE IF NOT EXISTS temp.restaurants_vocab '
+                'USING fts5vocab(main, restaurants_fts, col)'
+            )
+            rows = self._execute(
+                'SELECT DISTINCT term FROM temp.restaurants_vocab WHERE col IN '
+                f"({', '.join('?' * len(FUZZY_FIELDS))})",
+                FUZZY_FIELDS
+            )
+            index = self._trigrams = TrigramIndex(row[0] for row in rows)
+        return index
+
+    def search(self, text, offset=0, limit=20, fields=None, fuzzy=False, **filters):
+        """
+        Full-text search over name, location, cuisine and specialties
+        Every word must match (the last one as a prefix); results are ranked
+        by bm25 with the same field weights as the in-memory index. With
+        `fuzzy`, each word also matches similar name/specialty words.
+        `filters` narrow the matches as in positions().
+        Returns (total matches, list of materialised records).
+        """
+        terms = tokenize(text)
+        if not terms:
+            return 0, []
+
+        clauses = []
+        for index, term in enumerate(terms):
+            alternatives = [f'"{term}"*' if index == len(terms) - 1 else f'"{term}"']
+            if fuzzy:
+                alternatives += [f'"{token}"' for token, _ in self._fuzzy_index().similar(term)]
+            clauses.append(f"({' OR '.join(alternatives)})")
+        match = ' AND '.join(clauses)
+
+        where, params = self._where(filters)
+        match_clause = 'restaurants_fts MATCH ?'
+        where = f"{where} AND {match_clause}" if where else f' WHERE {match_clause}'
+        params.append(match)
+        joined = 'restaurants_fts f JOIN restaurants r ON r.position = f.rowid'
+
+        total = self._execute(f'SELECT COUNT(*) FROM {joined}{where}', params).fetchone()[0]
+        weights = ', '.join(str(FIELD_WEIGHTS[column]) for column in FTS_COLUMNS)
+        rows = self._execute(
+            f'SELECT r.record FROM {joined}{where} '
+            f'ORDER BY bm25(restaurants_fts, {weights}), r.position LIMIT ? OFFSET ?',
+            params + [limit, offset]
+        )
+        return total, [self._project(row[0], fields) for row in rows]
+
+    def delivering_to(self, area, offset=0, limit=None, fields=None):
+        """
+        Get one page of the restaurants delivering to an area, in merge order
+        Answered from the delivery_areas table's primary key.
+        Returns (total matches, list of materialised records).
+        """
+        key = delivery_key(area)
+        total = self._execute(
+            'SELECT COUNT(*) FROM delivery_areas WHERE area_key = ?', (key,)
+        ).fetchone()[0]
+        rows = self._execute(
+            'SELECT r.record FROM delivery_areas d JOIN restaurants r ON r.position = d.position '
+            'WHERE d.area_key = ? ORDER BY d.position LIMIT ? OFFSET ?',
+            (key, -1 if limit is None else limit, offset)
+        )
+        return total, [self._project(row[0], fields) for row in rows]
+
+    def _spatial_index(self):
+        """Get (and cache) a grid over the stored coordinates"""
+        index = self.__dict__.get('_grid')
+        if index is None:
+            rows = self._execute(
+                'SELECT position, lat, lng FROM restaurants '
+                'WHERE lat IS NOT NULL AND lng IS NOT NULL'
+            )
+            index = self._grid = GridIndex(rows)
+        return index
+
+    def nearby(self, lat, lng, radius=None, limit=20, fields=None):
+        """
+        Get the restaurants nearest to a point, nearest first
+        Coordinates are read once into the same grid index as in memory.
+        Returns (total matches, list of materialised records with distance_km).
+        """
+        if radius is None:
+            matches = self._spatial_index().nearest(lat, lng, limit)
+            total = len(matches)
+        else:
+            total, matches = self._spatial_index().within(lat, lng, radius, limit)
+        return total, add_distances(matches, self.records([p for _, p in matches], fields))
+
+    def facets(self, **filters):
+        """
+        Count restaurants by state, LGA, city, cuisine and rating bucket
+        Each count is one indexed GROUP BY; results are cached per store
+        (see FacetCache).
+        """
+        cache = self.__dict__.get('_facet_cache')
+        if cache is None:
+            cache = self._facet_cache = FacetCache()
+        return cache.get(filters, lambda: self._count_facets(*self._where(filters)))
+
+    def _count_facets(self, where, params):
+        result = {
+            'total': self._execute(f'SELECT COUNT(*) FROM restaurants{where}', params).fetchone()[0]
+        }
+
+        for field in INDEXED_FIELDS:
+            # The bare column comes from the MIN(position) row: first spelling wins
+            rows = self._execute(
+                f'SELECT {field}, MIN(position), COUNT(*) FROM restaurants{where} '
+                f'GROUP BY {field}_key',
+                params
+            )
+            result[field] = facet_counts({
+                value: count for value, _, count in rows if normalize_key(value)
+            })
+
+        cases = ' '.join(
+            f"WHEN rating >= {lower} THEN '{label}'" for label, lower in RATING_BUCKETS
+        )
+        rows = self._execute(
+            f"SELECT CASE WHEN rating IS NULL OR rating = 0 THEN '{UNRATED_BUCKET}' {cases} "
+            f"ELSE '{RATING_BUCKETS[-1][0]}' END AS bucket, COUNT(*) "
+            f'FROM restaurants{where} GROUP BY bucket',
+            params
+        )
+        result['rating'] = rating_facet(dict(rows.fetchall()))
+
+        where_rated = f"{where} AND rating > 0" if where else ' WHERE rating > 0'
+        average = self._execute(
+            f'SELECT AVG(rating) FROM restaurants{where_rated}', params
+        ).fetchone()[0]
+        result['average_rating'] = round(average, 2) if average is not None else 0
+
+        return result
+
+    def categories(self, field):
+        """Get the distinct (non-empty) values of a categorical field"""
+        if field not in INDEXED_FIELDS:
+            raise ValueError(f"Unknown field: {field}")
+        rows = self._execute(
+            f"SELECT {field} FROM restaurants WHERE {field} IS NOT NULL AND {field} != '' "
+            f"GROUP BY {field} ORDER BY MIN(position)"
+        )
+        return [row[0] for row in rows]
+
+    def average_rating(self):
+        """Get the mean of all known ratings, rounded to 2 places"""
+        row = self._execute('SELECT AVG(rating) FROM restaurants WHERE rating > 0').fetchone()
+        return round(row[0], 2) if row[0] is not None else 0
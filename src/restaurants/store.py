@@ -0,0 +1,793 @@
+"""
+In-memory restaurant store
+Holds one snapshot of the merged restaurant data together with its lookup tables.
+Records are kept column by column (one array per field, categorical codes for
+state/lga/city/cuisine, shared tuples for list fields) and only turned back
+into dicts when they are read.
+
+Every store backend (see also sqlite_store.py) exposes the same read API:
+len(), all(), get(), position_of(), find(), query(), page(), stream(),
+search(), nearby(), delivering_to(), facets(), record(), records(), categories() and
+average_rating(). Records are addressed by their
+merge-order position; query() and page() can also return them in a SORT_FIELDS order.
+"""
+import math
+import hashlib
+import threading
+from array import array
+from bisect import bisect_right
+from collections import Counter, OrderedDict
+from src.data.locations import resolve_area
+from src.restaurants.geo import GridIndex
+from src.restaurants.hours import OpeningHoursIndex
+from src.restaurants.search import SearchIndex
+
+# Fields with a secondary index (normalised value -> record positions)
+INDEXED_FIELDS = ('state', 'lga', 'city', 'cuisine')
+
+# Low-cardinality fields stored as small integer codes into a value table
+CATEGORICAL_FIELDS = INDEXED_FIELDS
+
+# List fields stored as shared (interned) tuples
+TUPLE_FIELDS = ('specialties', 'delivery_areas')
+
+# Repetitive free-text fields whose strings are interned
+INTERNED_FIELDS = ('location', 'opening_hours')
+
+# Numeric fields stored in a float array (NaN means None)
+FLOAT_FIELDS = ('rating', 'lat', 'lng')
+
+# Remaining known fields, stored as plain columns
+PLAIN_FIELDS = ('id', 'name', 'url')
+
+_KNOWN_FIELDS = frozenset(
+    CATEGORICAL_FIELDS + TUPLE_FIELDS + INTERNED_FIELDS + FLOAT_FIELDS + PLAIN_FIELDS
+)
+
+# Rating facet buckets as (label, lower bound), best first
+RATING_BUCKETS = (
+    ('4.5+', 4.5),
+    ('4.0-4.4', 4.0),
+    ('3.5-3.9', 3.5),
+    ('3.0-3.4', 3.0),
+    ('below 3.0', 0),
+)
+UNRATED_BUCKET = 'unrated'
+
+# Filtered facet results kept per store (most recently used)
+MAX_CACHED_FACETS = 256
+
+# Fields query()/page() can sort by, and whether each sorts descending by default
+SORT_FIELDS = {'rating': True, 'name': False}
+
+
+def normalize_key(value):
+    """Normalise an indexed value for case-insensitive lookups"""
+    if value is None:
+        return None
+    return ' '.join(str(value).split()).lower()
+
+
+class ContentHasher:
+    """
+    Hash records as they stream past, to version a snapshot by its content
+    Equal merged datasets (same records in the same order) hash equally in
+    every process, so the version is safe to share across workers.
+    """
+
+    def __init__(self):
+        self._hash = hashlib.blake2b(digest_size=8)
+
+    def wrap(self, restaurants):
+        """Yield `restaurants` unchanged, feeding each record into the hash"""
+        update = self._hash.update
+        for restaurant in restaurants:
+            update(repr(restaurant).encode())
+            yield restaurant
+
+    def hexdigest(self):
+        return self._hash.hexdigest()
+
+
+def rating_bucket(rating):
+    """Get the RATING_BUCKETS label for a rating (missing/zero is unrated)"""
+    if not isinstance(rating, (int, float)) or not rating or math.isnan(rating):
+        return UNRATED_BUCKET
+    for label, lower in RATING_BUCKETS:
+        if rating >= lower:
+            return label
+    return RATING_BUCKETS[-1][0]
+
+
+def facet_counts(counts):
+    """Turn {value: count} into a list of {value, count}, most common first"""
+    return [
+        {'value': value, 'count': count}
+        for value, count in sorted(counts.items(), key=lambda item: (-item[1], str(item[0])))
+    ]
+
+
+def rating_facet(counts):
+    """Turn {bucket: count} into a list of {value, count} in bucket order"""
+    labels = [label for label, _ in RATING_BUCKETS] + [UNRATED_BUCKET]
+    return [{'value': label, 'count': counts[label]} for label in labels if counts.get(label)]
+
+
+class FacetCache:
+    """Bounded LRU of one store's facet results, keyed by normalised filters"""
+
+    def __init__(self, max_entries=MAX_CACHED_FACETS):
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def key(filters):
+        """Get the cache key of a filter dict (values normalised, empty ones dropped)"""
+        return tuple(sorted(
+            (field, normalize_key(value)) for field, value in filters.items() if value
+        ))
+
+    def get(self, filters, count):
+        """Get the cached facets for `filters`, calling `count()` on a miss"""
+        key = self.key(filters)
+        with self._lock:
+            result = self._entries.get(key)
+            if result is not None:
+                self._entries.move_to_end(key)
+                return result
+
+        result = count()
+        with self._lock:
+            self._entries[key] = result
+            if len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return result
+
+
+def delivery_key(area):
+    """Normalise a delivery area, resolving aliases against LOCATIONS"""
+    if not isinstance(area, str) or not area.strip():
+        return None
+    return normalize_key(resolve_area(area))
+
+
+def sort_order(values, sort, descending=False):
+    """
+    Get record positions ordered by one field (`values` holds it per position)
+    Ratings sort numerically with unrated records last in either direction;
+    names sort case-insensitively. Ties keep merge order.
+    """
+    if sort == 'rating':
+        def key(position):
+            rating = values[position]
+            if rating_bucket(rating) == UNRATED_BUCKET:
+                return (1, 0)
+            return (0, -rating if descending else rating)
+        return sorted(range(len(values)), key=key)
+
+    if sort == 'name':
+        keys = [normalize_key(value) or '' for value in values]
+        # Stable even when reversed, so equal names stay in merge order
+        return sorted(range(len(values)), key=keys.__getitem__, reverse=descending)
+
+    raise ValueError(f"Unknown sort field: {sort}")
+
+
+def sort_value(value, sort):
+    """
+    Get the value a record is ordered by in sort_order, for keyset cursors
+    The rating (None if unrated) or the normalised name.
+    """
+    if sort == 'rating':
+        return None if rating_bucket(value) == UNRATED_BUCKET else value
+    if sort == 'name':
+        return normalize_key(value) or ''
+    raise ValueError(f"Unknown sort field: {sort}")
+
+
+def _compare_sort_values(a, b, descending):
+    """Compare two sort_value results in sort_order: -1 if `a` comes first"""
+    if a == b:
+        return 0
+    # Unrated records come last in either direction
+    if a is None:
+        return 1
+    if b is None:
+        return -1
+    return -1 if (a > b if descending else a < b) else 1
+
+
+def seek_rank(size, entry_at, value, position, descending):
+    """
+    Count the records of a sort order that come at or before a cursor
+    The order is sort_order's: by value, then by merge position.
+    `entry_at(rank)` gives the (sort_value, position) at a rank; the
+    cursor's record need not exist any more. O(log n) lookups.
+    """
+    low, high = 0, size
+    while low < high:
+        middle = (low + high) // 2
+        middle_value, middle_position = entry_at(middle)
+        comparison = _compare_sort_values(middle_value, value, descending)
+        if comparison < 0 or (comparison == 0 and middle_position <= position):
+            low = middle + 1
+        else:
+            high = middle
+    return low
+
+
+def project(restaurant, fields):
+    """Keep only the requested keys of a record dict (all keys if fields is None)"""
+    if fields is None:
+        return restaurant
+    return {key: value for key, value in restaurant.items() if key in fields}
+
+
+def _intersect(postings):
+    """Intersect sorted posting lists, starting from the shortest"""
+    postings = sorted(postings, key=len)
+    result = postings[0]
+    for posting in postings[1:]:
+        if not result:
+            break
+        allowed = set(posting)
+        result = array('I', (item for item in result if item in allowed))
+    return result
+
+
+def add_distances(matches, records):
+    """Add `distance_km` from (distance, position) matches to their records"""
+    for (distance, _), record in zip(matches, records):
+        record['distance_km'] = round(distance, 3)
+    return records
+
+
+class RecordView:
+    """
+    Read-only sequence of store records, materialised as dicts on access
+    Slicing returns another view, so nothing is built until it is iterated.
+    """
+
+    # Records are fetched from the store in batches while iterating
+    BATCH_SIZE = 500
+
+    def __init__(self, store, positions=None):
+        self._store = store
+        self._positions = positions  # None means every record, in order
+
+    def __len__(self):
+        if self._positions is None:
+            return len(self._store)
+        return len(self._positions)
+
+    def __getitem__(self, item):
+        positions = self.positions
+        if isinstance(item, slice):
+            return RecordView(self._store, positions[item])
+        return self._store.record(positions[item])
+
+    def __iter__(self):
+        positions = self.positions
+        for start in range(0, len(positions), self.BATCH_SIZE):
+            yield from self._store.records(positions[start:start + self.BATCH_SIZE])
+
+    def __repr__(self):
+        return f"<RecordView of {len(self)} restaurants>"
+
+    @property
+    def positions(self):
+        """Record positions covered by this view"""
+        if self._positions is None:
+            return range(len(self._store))
+        return self._positions
+
+    def records(self, fields=None):
+        """Materialise the view as a list of dicts (optionally projected)"""
+        return self._store.records(self.positions, fields)
+
+
+class Ordering:
+    """
+    One precomputed sort order over a store
+    `order` lists positions in sort order and `rank` is its inverse. Every
+    secondary index key also gets its posting list re-expressed as sorted
+    ranks, so e.g. the best rated restaurants in one LGA are a slice.
+    """
+
+    def __init__(self, store, sort, descending):
+        self.order = array('I', sort_order(
+            [store.value(sort, position) for position in range(len(store))], sort, descending
+        ))
+        self.rank = array('I', bytes(4 * len(self.order)))
+        for rank, position in enumerate(self.order):
+            self.rank[position] = rank
+
+        # field -> normalised value -> ascending ranks of its records
+        self.postings = {field: {} for field in INDEXED_FIELDS}
+        for field, postings in self.postings.items():
+            keys = [normalize_key(value) for value in store._categories[field]]
+            codes = store._codes[field]
+            for rank, position in enumerate(self.order):
+                key = keys[codes[position]]
+                if key:
+                    posting = postings.get(key)
+                    if posting is None:
+                        posting = postings[key] = array('I')
+                    posting.append(rank)
+
+
+class RestaurantStore:
+    """Columnar snapshot of restaurant records with hash and secondary indexes"""
+
+    # Content version, set by the owner of a published snapshot
+    version = None
+
+    # Typeahead index, built by the owner before publishing (see autocomplete.py)
+    autocomplete_index = None
+
+    def __init__(self, restaurants):
+        self._size = 0
+        self._by_id = {}
+        self._indexes = {field: {} for field in INDEXED_FIELDS}
+        # Reverse index: delivery_key(area) -> positions of records delivering there
+        self._delivery_index = {}
+
+        # Categorical columns: codes into a per-field value table (code 0 is None)
+        self._categories = {field: [None] for field in CATEGORICAL_FIELDS}
+        self._codes = {field: array('I') for field in CATEGORICAL_FIELDS}
+        self._tuples = {field: [] for field in TUPLE_FIELDS}
+        self._strings = {field: [] for field in INTERNED_FIELDS + PLAIN_FIELDS}
+        self._floats = {field: array('d') for field in FLOAT_FIELDS}
+
+        # Key layout of each record (shared tuples) and out-of-schema values
+        self._layouts = []
+        self._extras = {}
+
+        # Full-text index, built on demand (see build_search_index)
+        self._search_index = None
+
+        # Grid over record coordinates, built on demand (see build_spatial_index)
+        self._spatial_index = None
+
+        # Open-at slot bitsets, built on demand (see build_hours_index)
+        self._hours_index = None
+
+        # (sort field, descending) -> Ordering, built on demand (see build_orderings)
+        self._orderings = {}
+
+        category_codes = {field: {None: 0} for field in CATEGORICAL_FIELDS}
+        interned = {}
+
+        for position, restaurant in enumerate(restaurants):
+            layout = tuple(restaurant.keys())
+            self._layouts.append(interned.setdefault(layout, layout))
+            extras = {}
+
+            for field in CATEGORICAL_FIELDS:
+                value = restaurant.get(field)
+                if value is not None and not isinstance(value, str):
+                    extras[field] = value
+                    value = None
+                codes = category_codes[field]
+                code = codes.get(value)
+                if code is None:
+                    code = codes[value] = len(self._categories[field])
+                    self._categories[field].append(value)
+                self._codes[field].append(code)
+
+                key = normalize_key(value)
+                if key:
+                    self._indexes[field].setdefault(key, array('I')).append(position)
+
+            for field in TUPLE_FIELDS:
+                value = restaurant.get(field)
+                if isinstance(value, list):
+                    value = tuple(value)
+                    value = interned.setdefault((field, value), value)
+                elif value is not None:
+                    extras[field] = value
+                    value = None
+                self._tuples[field].append(value)
+
+            areas = self._tuples['delivery_areas'][-1] or ()
+            for key in {delivery_key(area) for area in areas} - {None}:
+                self._delivery_index.setdefault(key, array('I')).append(position)
+
+            for field in INTERNED_FIELDS:
+                value = restaurant.get(field)
+                if isinstance(value, str):
+                    value = interned.setdefault(value, value)
+                self._strings[field].append(value)
+
+            for field in PLAIN_FIELDS:
+                self._strings[field].append(restaurant.get(field))
+
+            for field in FLOAT_FIELDS:
+                value = restaurant.get(field)
+                if value is not None and type(value) is not float:
+                    extras[field] = value
+                    value = None
+                self._floats[field].append(math.nan if value is None else value)
+
+            for key in layout:
+                if key not in extras and key not in _KNOWN_FIELDS:
+                    extras[key] = restaurant[key]
+            if extras:
+                self._extras[position] = extras
+
+            restaurant_id = restaurant.get('id')
+            if restaurant_id is not None:
+                # First record wins, matching the order of the merged list
+                self._by_id.setdefault(str(restaurant_id), position)
+
+            self._size += 1
+
+        # Rating bucket -> positions, and the rating counted in the average
+        # (0 when unrated), so facets intersect postings instead of reading records
+        self._rating_postings = {}
+        self._rating_values = array('d')
+        for position in range(self._size):
+            rating = self.value('rating', position)
+            bucket = rating_bucket(rating)
+            self._rating_postings.setdefault(bucket, array('I')).append(position)
+            self._rating_values.append(0.0 if bucket == UNRATED_BUCKET else rating)
+
+    def __len__(self):
+        return self._size
+
+    def __getstate__(self):
+        # Column getters are closures; rebuild them after unpickling
+        state = self.__dict__.copy()
+        state.pop('_getter_cache', None)
+        state.pop('_facet_cache', None)
+        return state
+
+    def _getters(self):
+        """Get (and cache) a column reader for every known field"""
+        getters = self.__dict__.get('_getter_cache')
+        if getters is not None:
+            return getters
+
+        getters = {}
+        for field in CATEGORICAL_FIELDS:
+            categories, codes = self._categories[field], self._codes[field]
+            getters[field] = lambda p, c=categories, k=codes: c[k[p]]
+        for field in TUPLE_FIELDS:
+            column = self._tuples[field]
+            getters[field] = lambda p, c=column: list(c[p]) if c[p] is not None else None
+        for field in INTERNED_FIELDS + PLAIN_FIELDS:
+            getters[field] = self._strings[field].__getitem__
+        for field in FLOAT_FIELDS:
+            column = self._floats[field]
+            getters[field] = lambda p, c=column: None if math.isnan(c[p]) else c[p]
+
+        self._getter_cache = getters
+        return getters
+
+    def value(self, field, position):
+        """Get a single field of a record without materialising it"""
+        extras = self._extras.get(position)
+        if extras and field in extras:
+            return extras[field]
+
+        getter = self._getters().get(field)
+        return getter(position) if getter else None
+
+    def record(self, position, fields=None):
+        """
+        Materialise the record at `position` as a dict
+        With `fields`, only those keys (that the record has) are built.
+        """
+        layout = self._layouts[position]
+        if fields is not None:
+            layout = [key for key in layout if key in fields]
+
+        getters = self._getters()
+        extras = self._extras.get(position)
+        if extras is None:
+            return {key: getters[key](position) for key in layout}
+        return {
+            key: extras[key] if key in extras else getters[key](position)
+            for key in layout
+        }
+
+    def records(self, positions, fields=None):
+        """Materialise the records at `positions` as dicts"""
+        record = self.record
+        return [record(position, fields) for position in positions]
+
+    def all(self):
+        """Get every restaurant in merge order"""
+        return RecordView(self)
+
+    def get(self, restaurant_id, fields=None):
+        """Get a restaurant by ID in O(1), or None if it is unknown"""
+        position = self._by_id.get(str(restaurant_id))
+        if position is None:
+            return None
+        return self.record(position, fields)
+
+    def position_of(self, restaurant_id):
+        """Get the position of a restaurant by ID, or None if it is unknown"""
+        return self._by_id.get(str(restaurant_id))
+
+    def ids(self):
+        """Get the ID of every record, in merge order"""
+        return [self.value('id', position) for position in range(self._size)]
+
+    def keys(self, field):
+        """Get the normalised values present in a secondary index"""
+        return list(self._indexes[field].keys())
+
+    def categories(self, field):
+        """Get the distinct (non-empty) values of a categorical field"""
+        return [value for value in self._categories[field] if value]
+
+    def average_rating(self):
+        """Get the mean of all known ratings, rounded to 2 places"""
+        ratings = [rating for rating in self._floats['rating'] if rating and not math.isnan(rating)]
+        return round(sum(ratings) / len(ratings), 2) if ratings else 0
+
+    def positions(self, open_slot=None, **filters):
+        """
+        Get the sorted record positions matching every given filter
+        Filters are INDEXED_FIELDS names; None/empty values are ignored.
+        `open_slot` (see hours.week_slot) keeps only restaurants open then.
+        Returns None when no filter applies (i.e. every record matches).
+        """
+        postings = []
+        for field, value in filters.items():
+            if field not in self._indexes:
+                raise ValueError(f"Unknown filter field: {field}")
+            if not value:
+                continue
+            postings.append(self._indexes[field].get(normalize_key(value), array('I')))
+
+        if open_slot is not None:
+            hours = self._opening_hours()
+            if not postings:
+                return hours.positions(open_slot)
+            return array('I', (
+                position for position in _intersect(postings)
+                if hours.is_open(open_slot, position)
+            ))
+
+        if not postings:
+            return None
+        return _intersect(postings)
+
+    def find(self, **filters):
+        """Get the restaurants matching every given filter, in merge order"""
+        return RecordView(self, self.positions(**filters))
+
+    def build_orderings(self):
+        """Precompute every SORT_FIELDS ordering now instead of on first use"""
+        for sort, default_descending in SORT_FIELDS.items():
+            for descending in (default_descending, not default_descending):
+                self._ordering(sort, descending)
+
+    def _ordering(self, sort, descending):
+        """Get (and cache) the Ordering for a sort field and direction"""
+        if sort not in SORT_FIELDS:
+            raise ValueError(f"Unknown sort field: {sort}")
+        key = (sort, bool(descending))
+        ordering = self._orderings.get(key)
+        if ordering is None:
+            ordering = self._orderings[key] = Ordering(self, sort, descending)
+        return ordering
+
+    def _ranks(self, ordering, filters):
+        """Get the ascending ranks in `ordering` of the records matching the filters"""
+        filters = dict(filters)
+        open_slot = filters.pop('open_slot', None)
+        if open_slot is not None:
+            hours, order = self._opening_hours(), ordering.order
+            return array('I', (
+                rank for rank in self._ranks(ordering, filters)
+                if hours.is_open(open_slot, order[rank])
+            ))
+
+        postings = []
+        for field, value in filters.items():
+            if field not in self._indexes:
+                raise ValueError(f"Unknown filter field: {field}")
+            if not value:
+                continue
+            postings.append(ordering.postings[field].get(normalize_key(value), array('I')))
+
+        if not postings:
+            return range(self._size)
+        return _intersect(postings)
+
+    def query(self, offset=0, limit=None, fields=None, sort=None, descending=False, **filters):
+        """
+        Get one page of the restaurants matching the filters
+        In merge order, or by a SORT_FIELDS field; sorted pages are slices
+        of a precomputed ordering. With `fields`, only those keys of each
+        record are built.
+        Returns (total matches, list of materialised records).
+        """
+        end = None if limit is None else offset + limit
+        if sort is None:
+            positions = self.positions(**filters)
+            if positions is None:
+                positions = range(self._size)
+            return len(positions), self.records(positions[offset:end], fields)
+
+        ordering = self._ordering(sort, descending)
+        ranks = self._ranks(ordering, filters)
+        order = ordering.order
+        return len(ranks), self.records([order[rank] for rank in ranks[offset:end]], fields)
+
+    def page(self, after=-1, limit=100, fields=None, sort=None, descending=False,
+             after_value=None, **filters):
+        """
+        Get the next `limit` matching restaurants after the one at position `after`
+        Keyset pagination over merge order, or over a SORT_FIELDS ordering
+        after the (`after_value`, `after`) key, where `after_value` is the
+        previous record's sort_value: the start is found by bisection, so a
+        page costs O(log n + limit). A negative `after` starts from the beginning.
+        Returns (records, last position if more records follow else None).
+        """
+        if sort is None:
+            keys = self.positions(**filters)
+            if keys is None:
+                keys = range(self._size)
+            seek = after
+        else:
+            ordering = self._ordering(sort, descending)
+            keys = self._ranks(ordering, filters)
+            seek = -1
+            if after >= 0:
+                order = ordering.order
+                seek = seek_rank(
+                    self._size,
+                    lambda rank: (sort_value(self.value(sort, order[rank]), sort), order[rank]),
+                    after_value, after, descending
+                ) - 1
+
+        start = bisect_right(keys, seek)
+        selected = keys[start:start + limit]
+        has_more = start + limit < len(keys)
+        if sort is not None:
+            selected = [ordering.order[rank] for rank in selected]
+        return self.records(selected, fields), (selected[-1] if has_more and selected else None)
+
+    def stream(self, fields=None, **filters):
+        """
+        Yield the restaurants matching the filters one by one, in merge order
+        Records are materialised a batch at a time, so memory stays constant.
+        """
+        positions = self.positions(**filters)
+        if positions is None:
+            positions = range(self._size)
+
+        batch_size = RecordView.BATCH_SIZE
+        for start in range(0, len(positions), batch_size):
+            yield from self.records(positions[start:start + batch_size], fields)
+
+    def build_search_index(self):
+        """Build the full-text index now instead of on the first search"""
+        self._search_index = SearchIndex(self)
+
+    def search(self, text, offset=0, limit=20, fields=None, fuzzy=False, **filters):
+        """
+        Full-text search over name, location, cuisine and specialties
+        Every word must match (the last one as a prefix); results are ranked.
+        With `fuzzy`, misspelt name/specialty words match similar ones.
+        `filters` narrow the matches as in positions().
+        Returns (total matches, list of materialised records).
+        """
+        if self._search_index is None:
+            self.build_search_index()
+        total, positions = self._search_index.search(
+            text, offset, limit, fuzzy, self.positions(**filters)
+        )
+        return total, self.records(positions, fields)
+
+    def delivering_to(self, area, offset=0, limit=None, fields=None):
+        """
+        Get one page of the restaurants delivering to an area, in merge order
+        `area` may be any spelling known to LOCATIONS (e.g. "VI"); the
+        reverse index makes this O(page size).
+        Returns (total matches, list of materialised records).
+        """
+        positions = self._delivery_index.get(delivery_key(area), ())
+        end = None if limit is None else offset + limit
+        return len(positions), self.records(positions[offset:end], fields)
+
+    def build_hours_index(self):
+        """Parse opening hours into slot bitsets now instead of on first use"""
+        self._hours_index = OpeningHoursIndex(
+            (self.value('opening_hours', position) for position in range(self._size)),
+            self._size
+        )
+
+    def _opening_hours(self):
+        if self._hours_index is None:
+            self.build_hours_index()
+        return self._hours_index
+
+    def build_spatial_index(self):
+        """Build the coordinate grid now instead of on the first nearby query"""
+        lats, lngs = self._floats['lat'], self._floats['lng']
+        self._spatial_index = GridIndex(
+            (position, lats[position], lngs[position])
+            for position in range(self._size)
+            if not math.isnan(lats[position]) and not math.isnan(lngs[position])
+        )
+
+    def nearby(self, lat, lng, radius=None, limit=20, fields=None):
+        """
+        Get the restaurants nearest to a point, nearest first
+        With `radius` (km), every restaurant within it is counted and the
+        nearest `limit` returned; without it, the `limit` nearest overall.
+        Each record gets a `distance_km` key.
+        Returns (total matches, list of materialised records).
+        """
+        if self._spatial_index is None:
+            self.build_spatial_index()
+        if radius is None:
+            matches = self._spatial_index.nearest(lat, lng, limit)
+            total = len(matches)
+        else:
+            total, matches = self._spatial_index.within(lat, lng, radius, limit)
+        return total, add_distances(matches, self.records([p for _, p in matches], fields))
+
+    def facets(self, **filters):
+        """
+        Count restaurants by state, LGA, city, cuisine and rating bucket
+        Filters narrow the counts to the intersection of their posting
+        lists; results are cached per store (see FacetCache).
+        Values differing only in case/spacing are counted together under
+        their first spelling.
+        """
+        cache = self.__dict__.get('_facet_cache')
+        if cache is None:
+            cache = self._facet_cache = FacetCache()
+
+        def count():
+            positions = self.positions(**filters)
+            return self._count_facets(range(self._size) if positions is None else positions)
+
+        return cache.get(filters, count)
+
+    def _count_facets(self, positions):
+        result = {'total': len(positions)}
+
+        for field in CATEGORICAL_FIELDS:
+            codes = self._codes[field]
+            if len(positions) == self._size:
+                code_counts = Counter(codes)
+            else:
+                code_counts = Counter(codes[position] for position in positions)
+
+            counts = {}
+            display = {}
+            for code, count in code_counts.items():
+                value = self._categories[field][code]
+                key = normalize_key(value)
+                if not key:
+                    continue
+                display.setdefault(key, value)
+                counts[display[key]] = counts.get(display[key], 0) + count
+            result[field] = facet_counts(counts)
+
+        # Intersect each rating bucket's posting list with the matches
+        whole = len(positions) == self._size
+        allowed = None if whole else set(positions)
+        values = self._rating_values
+        buckets = {}
+        rated = 0
+        rating_sum = 0.0
+        for bucket, posting in self._rating_postings.items():
+            matched = posting if whole else [p for p in posting if p in allowed]
+            buckets[bucket] = len(matched)
+            if bucket != UNRATED_BUCKET:
+                rated += len(matched)
+                rating_sum += sum(values[position] for position in matched)
+        result['rating'] = rating_facet(buckets)
+        result['average_rating'] = round(rating_sum / rated, 2) if rated else 0
+
+        return result
@@ -9,13 +9,15 @@ from datetime import datetime
 from io import BytesIO
 
 
-def create_restaurants_excel(restaurants, state="Lagos"):
+def create_restaurants_excel(restaurants, state="Lagos", lga_counts=None):
     """
     Create a well-formatted Excel workbook with restaurant data
 
     Args:
         restaurants: List of restaurant dictionaries
         state: State name for filtering (default: Lagos)
+        lga_counts: Precomputed {LGA: count} for the summary (optional,
+            counted from `restaurants` if not given)
 
     Returns:
         BytesIO object containing the Excel file
@@ -26,7 +28,7 @@ def create_restaurants_excel(restaurants, state="Lagos"):
     wb.remove(wb.active)
 
     # 1. Create Summary Sheet
-    create_summary_sheet(wb, restaurants, state)
+    create_summary_sheet(wb, restaurants, state, lga_counts)
 
     # 2. Create All Restaurants Sheet
     create_all_restaurants_sheet(wb, restaurants, state)
@@ -42,7 +44,7 @@ def create_restaurants_excel(restaurants, state="Lagos"):
     return excel_file
 
 
-def create_summary_sheet(wb, restaurants, state):
+def create_summary_sheet(wb, restaurants, state, lga_counts=None):
     """Create summary statistics sheet"""
     ws = wb.create_sheet("Summary", 0)
 
@@ -83,11 +85,12 @@ def create_summary_sheet(wb, restaurants, state):
         cell.fill = PatternFill(start_color="4472C4", end_color="4472C4", fill_type="solid")
         cell.alignment = Alignment(horizontal="center")
 
-    # Count by LGA
-    lga_counts = {}
-    for r in restaurants:
-        lga = r.get('lga') or 'Unknown'
-        lga_counts[lga] = lga_counts.get(lga, 0) + 1
+    # Count by LGA (unless the caller already has the counts)
+    if lga_counts is None:
+        lga_counts = {}
+        for r in restaurants:
+            lga = r.get('lga') or 'Unknown'
+            lga_counts[lga] = lga_counts.get(lga, 0) + 1
 
     row += 1
     start_data_row = row
@@ -107,6 +107,12 @@ document.addEventListener('DOMContentLoaded', function() {
         noResults.style.display = 'none';
         paginationControls.style.display = 'none';
 
+        // Location results have their own pagination
+        const homePagination = document.getElementById('homePagination');
+        if (homePagination) {
+            homePagination.style.display = 'none';
+        }
+
         try {
             let url = `/api/restaurants/location?state=${encodeURIComponent(state)}&page=${currentPage}&per_page=15`;
 
@@ -1,68 +1,79 @@
-// Search and Filter Functionality
+// Search and paging: cards are rendered by the server one page at a time
 document.addEventListener('DOMContentLoaded', function() {
     const searchInput = document.getElementById('searchInput');
-    const cityFilter = document.getElementById('cityFilter');
     const restaurantsGrid = document.getElementById('restaurantsGrid');
     const noResults = document.getElementById('noResults');
     const totalCount = document.getElementById('totalCount');
+    const currentPageSpan = document.getElementById('currentPage');
+    const homePagination = document.getElementById('homePagination');
+    const loadMoreBtn = document.getElementById('loadMoreBtn');
 
-    // Get all restaurant cards
-    const restaurantCards = Array.from(document.querySelectorAll('.restaurant-card'));
+    let searchTimer = null;
+    let requestId = 0;
 
-    // Filter function
-    function filterRestaurants() {
-        const searchTerm = searchInput.value.toLowerCase();
-        const selectedCity = cityFilter.value;
+    // Fetch one page of rendered cards; replace the grid or append to it
+    async function loadCards(page, append) {
+        const params = new URLSearchParams(window.location.search);
+        params.set('page', page);
 
-        let visibleCount = 0;
-
-        restaurantCards.forEach(card => {
-            const restaurantName = card.getAttribute('data-name');
-            const restaurantCity = card.getAttribute('data-city');
-            const restaurantLocation = card.getAttribute('data-location') || '';
-            const restaurantCuisine = card.getAttribute('data-cuisine') || '';
-            const restaurantSpecialties = card.getAttribute('data-specialties') || '';
+        const query = searchInput ? searchInput.value.trim() : '';
+        if (query) {
+            params.set('q', query);
+        } else {
+            params.delete('q');
+        }
 
-            // Search across all fields
-            const searchableText = `${restaurantName} ${restaurantLocation} ${restaurantCuisine} ${restaurantSpecialties}`.toLowerCase();
+        const thisRequest = ++requestId;
 
-            // Check search term - matches if found in any field
-            const matchesSearch = !searchTerm || searchableText.includes(searchTerm);
+        try {
+            const response = await fetch('/fragments/restaurants?' + params.toString());
+            const data = await response.json();
 
-            // Check city filter
-            const matchesCity = !selectedCity || restaurantCity === selectedCity;
+            // Ignore responses overtaken by a newer search
+            if (thisRequest !== requestId || !data.success) {
+                return;
+            }
 
-            // Show/hide card
-            if (matchesSearch && matchesCity) {
-                card.style.display = 'flex';
-                visibleCount++;
+            if (append) {
+                restaurantsGrid.insertAdjacentHTML('beforeend', data.html);
             } else {
-                card.style.display = 'none';
+                restaurantsGrid.innerHTML = data.html;
             }
-        });
+            observeCards();
 
-        // Update count
-        if (totalCount) {
-            totalCount.textContent = visibleCount;
-        }
+            if (totalCount) {
+                totalCount.textContent = data.total;
+            }
+            if (currentPageSpan) {
+                currentPageSpan.textContent = data.page;
+            }
 
-        // Show/hide no results message
-        if (visibleCount === 0) {
-            restaurantsGrid.style.display = 'none';
-            noResults.style.display = 'block';
-        } else {
-            restaurantsGrid.style.display = 'grid';
-            noResults.style.display = 'none';
+            restaurantsGrid.style.display = data.total > 0 ? 'grid' : 'none';
+            noResults.style.display = data.total > 0 ? 'none' : 'block';
+
+            if (homePagination && loadMoreBtn) {
+                loadMoreBtn.dataset.nextPage = data.page + 1;
+                homePagination.style.display = data.page < data.pages ? 'flex' : 'none';
+            }
+        } catch (error) {
+            console.error('Error loading restaurants:', error);
         }
     }
 
-    // Add event listeners
+    // Search on the server as the user types (debounced)
     if (searchInput) {
-        searchInput.addEventListener('input', filterRestaurants);
+        searchInput.addEventListener('input', function() {
+            clearTimeout(searchTimer);
+            searchTimer = setTimeout(() => loadCards(1, false), 250);
+        });
     }
 
-    if (cityFilter) {
-        cityFilter.addEventListener('change', filterRestaurants);
+    // Append the next page instead of navigating (the link still works without JS)
+    if (loadMoreBtn) {
+        loadMoreBtn.addEventListener('click', function(e) {
+            e.preventDefault();
+            loadCards(parseInt(loadMoreBtn.dataset.nextPage, 10), true);
+        });
     }
 
     // Smooth scroll for navigation
@@ -102,10 +113,15 @@ document.addEventListener('DOMContentLoaded', function() {
         });
     }, observerOptions);
 
-    // Observe all restaurant cards
-    restaurantCards.forEach(card => {
-        observer.observe(card);
-    });
+    // Observe restaurant cards that have not been animated yet
+    function observeCards() {
+        restaurantsGrid.querySelectorAll('.restaurant-card:not([data-observed])').forEach(card => {
+            card.setAttribute('data-observed', '');
+            observer.observe(card);
+        });
+    }
+
+    observeCards();
 });
 
 // Download Excel functionality
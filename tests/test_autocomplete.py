@@ -0,0 +1,39 @@
+"""
+Tests for the prefix autocomplete index
+"""
+from src.restaurants.autocomplete import AutocompleteIndex
+from src.restaurants.store import RestaurantStore
+
+
+def _index():
+    return AutocompleteIndex([
+        ('Jollof Palace', 'restaurant', 4.1, 'a'),
+        ('Jollof House', 'restaurant', 4.8, 'b'),
+        ('Jos Kitchen', 'restaurant', 3.0, 'c'),
+        ('Jollof Palace', 'restaurant', 3.5, 'd'),
+        ('Jabi', 'area', 0, None),
+    ])
+
+
+def test_complete_orders_by_rating():
+    """Test that completions are ranked by weight"""
+    completions = _index().complete('JOL')
+    assert [c['id'] for c in completions] == ['b', 'a']
+
+
+def test_complete_short_prefix_and_limit():
+    """Test precomputed short prefixes and the limit"""
+    index = _index()
+    assert [c['text'] for c in index.complete('j', limit=2)] == ['Jollof House', 'Jollof Palace']
+    assert index.complete('x') == []
+    assert index.complete('') == []
+
+
+def test_build_includes_known_areas():
+    """Test that areas from LOCATIONS are suggested without restaurants"""
+    index = AutocompleteIndex.build(RestaurantStore([
+        {'id': 'a', 'name': 'Mama Put', 'city': 'Yaba', 'rating': 4.0},
+    ]))
+    texts = [c['text'] for c in index.complete('ma', limit=50)]
+    assert 'Mama Put' in texts
+    assert 'Maitama' in texts
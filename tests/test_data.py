@@ -0,0 +1,31 @@
+"""
+Tests for the bundled data files
+"""
+from src.data import loader
+from src.data.locations import LOCATIONS, get_centroid
+from src.data.comprehensive_lagos import get_comprehensive_lagos_restaurants
+
+
+def test_comprehensive_lagos_loaded_from_data_file():
+    """Test that the JSON Lines dataset loads through the module interface"""
+    restaurants = get_comprehensive_lagos_restaurants()
+    assert len(restaurants) >= 500
+    assert restaurants[0]['state'] == 'Lagos'
+
+
+def test_write_and_load_records(tmp_path, monkeypatch):
+    """Test that written records round-trip through the loader"""
+    monkeypatch.setattr(loader, 'DATA_DIR', str(tmp_path))
+    records = [{'id': 'a', 'name': 'Àmàlà Spot', 'specialties': ['Amala'], 'rating': None}]
+    loader.write_records(loader.data_path('sample.jsonl'), records)
+
+    assert loader.load_records('sample.jsonl') == records
+
+
+def test_every_location_has_a_centroid():
+    """Test that every LGA and area in LOCATIONS has coordinates"""
+    for state, info in LOCATIONS.items():
+        for lga, areas in info['lgas'].items():
+            assert get_centroid(state, lga) is not None
+            for area in areas:
+                assert get_centroid(state, lga, area) is not None
@@ -0,0 +1,51 @@
+"""
+Tests for coordinates and the spatial grid index
+"""
+import random
+
+from src.restaurants.geo import GridIndex, haversine_km, locate
+from src.restaurants.store import RestaurantStore
+
+
+def test_locate_copies_record_with_area_centroid():
+    """Test that coordinates come from the most specific known place"""
+    restaurant = {'id': 'a', 'state': 'Lagos', 'lga': 'Lagos Mainland', 'city': 'Yaba'}
+    located = locate(restaurant)
+    assert (located['lat'], located['lng']) == (6.5095, 3.3784)
+    assert 'lat' not in restaurant
+
+    # Unknown area falls back to the LGA; unknown LGA leaves the record alone
+    assert locate(dict(restaurant, city='Akoka'))['lat'] == 6.5
+    assert 'lat' not in locate({'id': 'b', 'state': 'Lagos', 'lga': 'Apapa'})
+
+
+def test_grid_matches_brute_force():
+    """Test radius and k-nearest queries against measuring every point"""
+    rng = random.Random(7)
+    points = [(i, 6.4 + rng.random() * 0.3, 3.2 + rng.random() * 0.4) for i in range(500)]
+    index = GridIndex(points)
+    assert len(index) == 500
+
+    for _ in range(20):
+        lat, lng = 6.35 + rng.random() * 0.4, 3.15 + rng.random() * 0.5
+        brute = sorted((haversine_km(lat, lng, p_lat, p_lng), p) for p, p_lat, p_lng in points)
+        assert index.nearest(lat, lng, 7) == brute[:7]
+
+        inside = [match for match in brute if match[0] <= 3]
+        assert index.within(lat, lng, 3, limit=5) == (len(inside), inside[:5])
+
+
+def test_store_nearby_adds_distances():
+    """Test nearest-first results with distance_km from the store"""
+    store = RestaurantStore([
+        locate({'id': 'yaba', 'state': 'Lagos', 'lga': 'Lagos Mainland', 'city': 'Yaba'}),
+        locate({'id': 'lekki', 'state': 'Lagos', 'lga': 'Eti-Osa', 'city': 'Lekki'}),
+        {'id': 'nowhere', 'state': 'Lagos'},
+    ])
+    total, records = store.nearby(6.51, 3.38, fields=('id',))
+    assert total == 2
+    assert [r['id'] for r in records] == ['yaba', 'lekki']
+    assert records[0]['distance_km'] < 1
+
+    total, records = store.nearby(6.51, 3.38, radius=5)
+    assert [r['id'] for r in records] == ['yaba']
@@ -0,0 +1,62 @@
+"""
+Tests for opening hours parsing and the open-at slot index
+"""
+from datetime import datetime, timezone
+
+from src.restaurants.hours import (
+    MINUTES_PER_DAY, MINUTES_PER_WEEK, OpeningHoursIndex, is_open, parse_opening_hours, week_slot
+)
+
+MONDAY = datetime(2024, 5, 6)
+
+
+def _at(day, hour, minute=0):
+    return week_slot(MONDAY.replace(day=MONDAY.day + day, hour=hour, minute=minute))
+
+
+def test_parse_daily_range():
+    """Test that a bare range applies to every day"""
+    intervals = parse_opening_hours('9:00 AM - 10:00 PM')
+    assert len(intervals) == 7
+    assert intervals[0] == (9 * 60, 22 * 60)
+    assert intervals[6] == (6 * MINUTES_PER_DAY + 9 * 60, 6 * MINUTES_PER_DAY + 22 * 60)
+
+
+def test_parse_days_closed_days_and_overnight():
+    """Test day ranges, "closed" days and ranges running past midnight"""
+    intervals = parse_opening_hours('Mon-Fri 8am-9pm, Sat 10am to 11pm, Sun closed')
+    assert len(intervals) == 6
+    assert intervals[-1] == (5 * MINUTES_PER_DAY + 10 * 60, 5 * MINUTES_PER_DAY + 23 * 60)
+
+    # Sunday night wraps around to Monday morning
+    intervals = parse_opening_hours('Sun 8pm - 2am')
+    assert intervals == ((0, 120), (6 * MINUTES_PER_DAY + 20 * 60, MINUTES_PER_WEEK))
+
+    # Days in a "closed" clause are not the days of the range after it
+    intervals = parse_opening_hours('Closed on Sundays, 9am-9pm')
+    assert len(intervals) == 6
+    assert intervals[0] == (9 * 60, 21 * 60)
+    assert len(parse_opening_hours('9am-9pm, closed Sundays')) == 6
+
+    assert parse_opening_hours('Open 24/7') == ((0, MINUTES_PER_WEEK),)
+    assert parse_opening_hours('Call to order') is None
+    assert parse_opening_hours(None) is None
+
+
+def test_week_slot_uses_lagos_time():
+    """Test that aware datetimes are converted to Lagos time (UTC+1)"""
+    utc = datetime(2024, 5, 6, 20, 30, tzinfo=timezone.utc)
+    assert week_slot(utc) == _at(0, 21, 30)
+
+
+def test_index_answers_open_at():
+    """Test that the slot bitsets agree with the parsed intervals"""
+    hours = ['9:00 AM - 10:00 PM', None, 'Sat-Sun 12pm - 2am', 'Mon-Fri 9-5']
+    index = OpeningHoursIndex(hours, len(hours))
+
+    assert list(index.positions(_at(0, 12))) == [0, 3]
+    assert list(index.positions(_at(6, 1, 30))) == [2]
+    assert list(index.positions(_at(5, 22))) == [2]
+    assert index.is_open(_at(4, 16, 59), 3)
+    assert not index.is_open(_at(4, 17), 3)
+    assert is_open(hours[2], _at(6, 1, 30))
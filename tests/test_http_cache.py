@@ -0,0 +1,56 @@
+"""
+Tests for the shared HTTP response cache
+"""
+from src.clients.http_cache import HTTPCache
+
+
+class _FakeResponse:
+    def __init__(self, status_code, content=b'', headers=None):
+        self.status_code = status_code
+        self.content = content
+        self.headers = headers or {}
+
+
+class _FakeSession:
+    """Session that serves one page with an ETag and honours If-None-Match"""
+
+    def __init__(self):
+        self.requests = []
+        self.body = b'<h2>v1</h2>'
+        self.etag = '"v1"'
+
+    def get(self, url, headers=None, timeout=None):
+        self.requests.append(dict(headers or {}))
+        if (headers or {}).get('If-None-Match') == self.etag:
+            return _FakeResponse(304)
+        return _FakeResponse(200, self.body, {'ETag': self.etag})
+
+
+def test_not_modified_reuses_parse_result():
+    """Test that a 304 skips re-parsing the page"""
+    session = _FakeSession()
+    cache = HTTPCache(cache_dir=None, session=session)
+    parses = []
+
+    def parse(response):
+        parses.append(response.content)
+        return [response.content]
+
+    assert cache.get_parsed('http://example.com/post', parse) == [b'<h2>v1</h2>']
+    assert cache.get_parsed('http://example.com/post', parse) == [b'<h2>v1</h2>']
+    assert len(parses) == 1
+    assert session.requests[1]['If-None-Match'] == '"v1"'
+
+    session.body, session.etag = b'<h2>v2</h2>', '"v2"'
+    assert cache.get_parsed('http://example.com/post', parse) == [b'<h2>v2</h2>']
+    assert len(parses) == 2
+
+
+def test_disk_cache_survives_new_instance(tmp_path):
+    """Test that validators and bodies are reloaded from disk"""
+    session = _FakeSession()
+    HTTPCache(cache_dir=str(tmp_path), session=session).get('http://example.com/post')
+
+    response = HTTPCache(cache_dir=str(tmp_path), session=session).get('http://example.com/post')
+    assert response.from_cache is True
+    assert response.content == b'<h2>v1</h2>'
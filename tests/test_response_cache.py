@@ -0,0 +1,43 @@
+"""
+Tests for the pre-serialised API response cache
+"""
+import gzip
+
+from src.restaurants.response_cache import CachedBody, ResponseCache
+
+
+def _body(size):
+    return CachedBody(b'x' * size, 'application/json')
+
+
+def test_lru_eviction_by_size():
+    """Test that the least recently used entries are evicted to fit"""
+    cache = ResponseCache(max_bytes=250)
+    cache.get(1, 'a')
+    cache.put(1, 'a', _body(100))
+    cache.put(1, 'b', _body(100))
+    cache.get(1, 'a')
+    cache.put(1, 'c', _body(100))
+    assert cache.get(1, 'b') is None
+    assert cache.get(1, 'a') is not None
+    assert cache.get(1, 'c') is not None
+
+
+def test_new_version_drops_entries():
+    """Test that a snapshot swap invalidates every cached response"""
+    cache = ResponseCache()
+    cache.get(1, 'a')
+    cache.put(1, 'a', _body(10))
+    assert cache.get(2, 'a') is None
+    assert len(cache) == 0
+
+    # Responses built from the old snapshot are not stored
+    cache.put(1, 'a', _body(10))
+    assert cache.get(2, 'a') is None
+
+
+def test_gzip_form_is_precomputed():
+    """Test that large bodies carry a gzip copy"""
+    entry = CachedBody(b'{"data": []}' * 200, 'application/json')
+    assert gzip.decompress(entry.gzipped) == entry.body
+    assert _body(10).gzipped is None
@@ -2,24 +2,29 @@
 Tests for restaurant API endpoints
 """
 import pytest
-from src.main import app
+from src.main import app, restaurant_service
 
 
 @pytest.fixture
-def client():
+def client(monkeypatch):
     """Create a test client"""
     app.config['TESTING'] = True
+    # Never read or leave behind a warm-start snapshot in the repo's .cache
+    monkeypatch.setattr(restaurant_service, 'snapshot_path', None)
     with app.test_client() as client:
         yield client
 
 
 def test_index(client):
-    """Test the index endpoint"""
+    """Test the paginated HTML homepage"""
     response = client.get('/')
     assert response.status_code == 200
-    data = response.get_json()
-    assert data['name'] == 'Chowdeck Restaurant API'
-    assert 'endpoints' in data
+    assert response.mimetype == 'text/html'
+    total = client.get('/fragments/restaurants').get_json()['total']
+    assert f'id="totalCount">{total}<'.encode() in response.data
+    assert b'id="currentPage">1<' in response.data
+    assert b'data-next-page="2"' in response.data
+    assert b'>Load more</a>' in response.data
 
 
 def test_health(client):
@@ -94,3 +99,231 @@ def test_refresh_restaurants(client):
     data = response.get_json()
     assert data['success'] is True
     assert 'count' in data
+
+
+def test_get_restaurants_with_lga_filter(client):
+    """Test filtering restaurants by state and LGA"""
+    response = client.get('/api/restaurants?state=lagos&lga=Ikeja&limit=20')
+    assert response.status_code == 200
+    data = response.get_json()
+    assert data['success'] is True
+    for restaurant in data['data']:
+        assert restaurant['state'] == 'Lagos'
+        assert restaurant['lga'] == 'Ikeja'
+
+
+def test_routes_share_one_service():
+    """Test that the HTML routes and the API blueprint share one cache"""
+    from src import main
+    from src.restaurants import handlers
+    assert main.restaurant_service is handlers.restaurant_service
+
+
+def test_get_restaurants_cursor_pagination(client):
+    """Test walking pages with next_cursor"""
+    first = client.get('/api/restaurants?limit=3').get_json()
+    assert first['count'] <= 3
+
+    if first['next_cursor']:
+        second = client.get(f"/api/restaurants?limit=3&cursor={first['next_cursor']}").get_json()
+        first_ids = {r['id'] for r in first['data']}
+        assert not first_ids & {r['id'] for r in second['data']}
+
+
+def test_get_restaurants_invalid_cursor(client):
+    """Test that a malformed cursor is rejected"""
+    response = client.get('/api/restaurants?cursor=not-a-cursor')
+    assert response.status_code == 400
+    assert response.get_json()['success'] is False
+
+
+def test_get_restaurants_sorted_by_rating(client):
+    """Test sorted keyset pages, best rated first"""
+    first = client.get('/api/restaurants?sort=rating&limit=5&fields=id,rating').get_json()
+    ratings = [r.get('rating') or 0 for r in first['data']]
+    assert ratings == sorted(ratings, reverse=True)
+
+    if first['next_cursor']:
+        second = client.get(
+            f"/api/restaurants?sort=rating&limit=5&cursor={first['next_cursor']}"
+        ).get_json()
+        assert not {r['id'] for r in first['data']} & {r['id'] for r in second['data']}
+
+        # A cursor only continues the sort it was issued for
+        response = client.get(f"/api/restaurants?sort=name&cursor={first['next_cursor']}")
+        assert response.status_code == 400
+
+
+def test_get_restaurants_invalid_sort(client):
+    """Test that unknown sort fields and orders are rejected"""
+    assert client.get('/api/restaurants?sort=price').status_code == 400
+    assert client.get('/api/restaurants?sort=name&order=up').status_code == 400
+
+
+def test_get_restaurants_open_at(client):
+    """Test the opening-hours filter on the list endpoint"""
+    response = client.get(
+        '/api/restaurants?open_at=2024-05-06T12:00&fields=id,opening_hours&limit=20'
+    )
+    assert response.status_code == 200
+    # Restaurants without (readable) hours are never reported open
+    assert all(r.get('opening_hours') for r in response.get_json()['data'])
+
+    response = client.get('/api/restaurants?open_now=1&limit=5')
+    assert response.status_code == 200
+    assert 'ETag' not in response.headers
+
+    assert client.get('/api/restaurants?open_at=tonight').status_code == 400
+
+
+def test_get_restaurants_with_fields(client):
+    """Test projecting list and detail responses to the requested keys"""
+    data = client.get('/api/restaurants?limit=5&fields=id,name').get_json()
+    assert data['success'] is True
+    for restaurant in data['data']:
+        assert set(restaurant) <= {'id', 'name'}
+
+    if data['data']:
+        restaurant_id = data['data'][0]['id']
+        detail = client.get(f'/api/restaurants/{restaurant_id}?fields=rating').get_json()
+        assert set(detail['data']) <= {'rating'}
+
+
+def test_get_restaurants_ndjson_stream(client):
+    """Test streaming restaurants as NDJSON"""
+    import json
+    response = client.get('/api/restaurants?limit=3', headers={'Accept': 'application/x-ndjson'})
+    assert response.status_code == 200
+    assert response.mimetype == 'application/x-ndjson'
+    lines = response.get_data(as_text=True).splitlines()
+    assert len(lines) <= 3
+    for line in lines:
+        assert 'id' in json.loads(line)
+
+
+def test_get_restaurants_gzip_from_cache(client):
+    """Test that repeated list queries are served pre-compressed"""
+    import gzip
+    import json
+    plain = client.get('/api/restaurants?limit=50').get_json()
+    response = client.get('/api/restaurants?limit=50', headers={'Accept-Encoding': 'gzip'})
+    assert response.status_code == 200
+    body = response.data
+    if response.headers.get('Content-Encoding') == 'gzip':
+        body = gzip.decompress(body)
+    assert json.loads(body) == plain
+
+
+def test_get_restaurants_not_modified(client):
+    """Test ETag revalidation against the snapshot version"""
+    response = client.get('/api/restaurants?limit=5')
+    etag = response.headers.get('ETag')
+    assert etag
+    assert 'no-cache' in response.headers['Cache-Control']
+
+    response = client.get('/api/restaurants?limit=5', headers={'If-None-Match': etag})
+    assert response.status_code == 304
+    assert response.data == b''
+    # The same URL also serves NDJSON, chosen by the Accept header
+    assert 'Accept' in response.vary
+    assert 'Accept' in client.get('/api/restaurants?limit=5').vary
+
+    # Live blog extras are not covered by the snapshot version
+    response = client.get('/api/restaurants/location?state=Lagos', headers={'If-None-Match': etag})
+    assert response.status_code == 200
+    assert 'ETag' not in response.headers
+
+
+def test_search_restaurants(client):
+    """Test the full-text search endpoint"""
+    response = client.get('/api/restaurants/search?q=rice&per_page=5')
+    assert response.status_code == 200
+    data = response.get_json()
+    assert data['success'] is True
+    assert len(data['data']) <= 5
+
+    assert client.get('/api/restaurants/search').status_code == 400
+
+
+def test_autocomplete(client):
+    """Test typeahead completions"""
+    response = client.get('/api/autocomplete?prefix=ik&limit=5')
+    assert response.status_code == 200
+    data = response.get_json()
+    assert data['success'] is True
+    assert 0 < len(data['data']) <= 5
+
+    assert client.get('/api/autocomplete').status_code == 400
+
+
+def test_get_restaurant_facets(client):
+    """Test facet counts narrowed by a filter"""
+    response = client.get('/api/restaurants/facets?state=Lagos')
+    assert response.status_code == 200
+    data = response.get_json()
+    assert data['success'] is True
+    assert set(data['facets']) == {'state', 'lga', 'city', 'cuisine', 'rating'}
+    assert sum(f['count'] for f in data['facets']['rating']) == data['total']
+
+
+def test_get_restaurants_delivering_to(client):
+    """Test the who-delivers-here endpoint with an area alias"""
+    response = client.get('/api/restaurants/delivering-to/VI?per_page=5&fields=id,delivery_areas')
+    assert response.status_code == 200
+    data = response.get_json()
+    assert data['area'] == 'Victoria Island'
+    assert data['count'] <= 5
+    for restaurant in data['data']:
+        assert {'VI', 'Victoria Island'} & set(restaurant['delivery_areas'])
+
+
+def test_get_nearby_restaurants(client):
+    """Test nearest-first results around a point in Lagos"""
+    response = client.get('/api/restaurants/nearby?lat=6.51&lng=3.38&radius=5&limit=10')
+    assert response.status_code == 200
+    data = response.get_json()
+    distances = [r['distance_km'] for r in data['data']]
+    assert distances == sorted(distances)
+    assert all(distance <= 5 for distance in distances)
+
+    assert client.get('/api/restaurants/nearby?lat=6.51').status_code == 400
+    assert client.get('/api/restaurants/nearby?lat=6.51&lng=3.38&radius=500').status_code == 400
+
+
+def test_homepage_renders_one_page(client):
+    """Test that the homepage renders a single page of cards"""
+    from src.main import HOMEPAGE_PAGE_SIZE
+    response = client.get('/?page=2')
+    assert response.status_code == 200
+    assert response.data.count(b'class="restaurant-card"') <= HOMEPAGE_PAGE_SIZE
+
+
+def test_restaurant_card_fragments(client):
+    """Test the card fragments used by main.js for further pages"""
+    data = client.get('/fragments/restaurants?page=1&q=rice').get_json()
+    assert data['success'] is True
+    assert data['page'] == 1
+    assert data['html'].count('class="restaurant-card"') == data['count']
+
+
+def test_restaurant_card_fragments_search_within_filters(client):
+    """Test that the homepage search keeps the location filters"""
+    searched = client.get('/fragments/restaurants?q=jollof').get_json()
+    in_state = client.get('/fragments/restaurants?state=FCT').get_json()
+    both = client.get('/fragments/restaurants?q=jollof&state=FCT').get_json()
+    assert both['success'] is True
+    assert both['total'] <= min(searched['total'], in_state['total'])
+    assert both['total'] < searched['total']
+
+
+def test_location_serves_current_blog_extras(client, monkeypatch):
+    """Test that live blog extras are not served from the response cache"""
+    from src.restaurants import handlers
+    extras = [{'id': 'blog-1', 'name': 'First Post'}]
+    monkeypatch.setattr(handlers.location_scraper, 'fetch_blog_restaurants',
+                        lambda state, lga: list(extras))
+
+    url = '/api/restaurants/location?state=Lagos&lga=Ikeja&per_page=100000'
+    assert client.get(url).get_json()['data'][-1]['id'] == 'blog-1'
+    extras[0] = {'id': 'blog-2', 'name': 'Second Post'}
+    assert client.get(url).get_json()['data'][-1]['id'] == 'blog-2'
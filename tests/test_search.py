@@ -0,0 +1,65 @@
+"""
+Tests for the in-memory full-text search index
+"""
+from src.restaurants.store import RestaurantStore
+
+
+def _store():
+    return RestaurantStore([
+        {'id': 'a', 'name': 'Mama Put', 'location': 'Ikeja GRA, Lagos', 'cuisine': 'Nigerian',
+         'specialties': ['Jollof Rice', 'Amala']},
+        {'id': 'b', 'name': 'Jollof Palace', 'location': 'Lekki, Lagos', 'cuisine': 'Nigerian',
+         'specialties': ['Fried Rice']},
+        {'id': 'c', 'name': 'Pizza Corner', 'location': 'Ikeja, Lagos', 'cuisine': 'Italian',
+         'specialties': ['Pizza']},
+    ])
+
+
+def test_search_ranks_name_matches_first():
+    """Test that a match in the name outranks one in the specialties"""
+    total, results = _store().search('jollof')
+    assert total == 2
+    assert [r['id'] for r in results] == ['b', 'a']
+
+
+def test_search_intersects_terms_and_prefixes_last():
+    """Test that every term must match and the last one may be partial"""
+    store = _store()
+    assert [r['id'] for r in store.search('ikeja piz')[1]] == ['c']
+    assert store.search('lekki pizza') == (0, [])
+    assert store.search('  ') == (0, [])
+
+
+def test_search_within_filters():
+    """Test that filters narrow the searched records"""
+    store = RestaurantStore([
+        {'id': 'a', 'name': 'Jollof Palace', 'state': 'Lagos', 'cuisine': 'Nigerian'},
+        {'id': 'b', 'name': 'Jollof Hut', 'state': 'FCT', 'cuisine': 'Nigerian'},
+    ])
+    total, results = store.search('jollof', state='fct')
+    assert total == 1
+    assert [r['id'] for r in results] == ['b']
+    assert store.search('jollof', state='Kano') == (0, [])
+
+
+def test_search_pages_results():
+    """Test offset/limit over ranked results"""
+    total, results = _store().search('lagos', offset=1, limit=1, fields=('id',))
+    assert total == 3
+    assert results == [{'id': 'b'}]
+
+
+def test_fuzzy_search_matches_misspellings():
+    """Test that fuzzy mode matches names sharing enough trigrams"""
+    store = _store()
+    assert store.search('jolof') == (0, [])
+    total, results = store.search('jolof palce', fuzzy=True)
+    assert total == 1
+    assert results[0]['id'] == 'b'
+
+
+def test_trigram_similarity_threshold():
+    """Test that unrelated words are not fuzzy matches"""
+    from src.restaurants.search import TrigramIndex
+    index = TrigramIndex(['shawarma', 'suya', 'amala'])
+    assert [token for token, _ in index.similar('shwarma')] == ['shawarma']
@@ -0,0 +1,233 @@
+"""
+Tests for the restaurant service cache
+"""
+import threading
+import time
+from datetime import datetime, timedelta
+
+from src.restaurants.service import RestaurantService
+from src.restaurants.sources import MergedRestaurants, RestaurantSource
+
+
+def _make_service(batches):
+    """Create a service whose loads return the given batches in order"""
+    service = RestaurantService()
+    loads = iter(batches)
+    service._load_restaurants = lambda: next(loads)
+    return service
+
+
+def test_cold_cache_is_built_inline():
+    """Test that the first call builds the cache synchronously"""
+    service = _make_service([[{'id': 'a'}]])
+    assert service.get_restaurant_by_id('a') == {'id': 'a'}
+
+
+def test_expired_cache_is_served_while_refreshing():
+    """Test stale-while-revalidate on cache expiry"""
+    service = _make_service([[{'id': 'old'}], [{'id': 'new'}]])
+    service.get_store()
+    service._cache_time = datetime.now() - timedelta(hours=2)
+
+    # The stale snapshot is returned immediately
+    assert service.get_restaurant_by_id('old') is not None
+
+    service._refresh_thread.join(timeout=5)
+    assert service.get_restaurant_by_id('new') is not None
+    assert service.get_restaurant_by_id('old') is None
+
+
+def test_force_refresh_waits_for_background_refresh():
+    """Test that a forced refresh rebuilds after an in-flight background one"""
+    release = threading.Event()
+    loads = iter([
+        lambda: [{'id': 'old'}],
+        lambda: release.wait(timeout=5) and [{'id': 'background'}],
+        lambda: [{'id': 'forced'}],
+    ])
+    service = RestaurantService()
+    service._load_restaurants = lambda: next(loads)()
+    service.get_store()
+    service._cache_time = datetime.now() - timedelta(hours=2)
+    service.get_store()
+
+    forced = threading.Thread(target=service.force_refresh)
+    forced.start()
+    release.set()
+    forced.join(timeout=5)
+    assert service.get_restaurant_by_id('forced') is not None
+    assert service.get_restaurant_by_id('background') is None
+
+
+def test_concurrent_cold_loads_are_single_flight():
+    """Test that concurrent callers on a cold cache trigger one rebuild"""
+    calls = []
+
+    def slow_load():
+        calls.append(1)
+        time.sleep(0.05)
+        return [{'id': 'a'}]
+
+    service = RestaurantService()
+    service._load_restaurants = slow_load
+
+    threads = [threading.Thread(target=service.get_store) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(timeout=5)
+
+    assert len(calls) == 1
+    assert service.get_restaurant_by_id('a') is not None
+
+
+def test_expired_cache_refreshes_once():
+    """Test that repeated reads of an expired cache start a single rebuild"""
+    service = _make_service([[{'id': 'old'}], [{'id': 'new'}]])
+    service.get_store()
+    service._cache_time = datetime.now() - timedelta(hours=2)
+
+    # A second rebuild would exhaust the batches and raise StopIteration
+    for _ in range(5):
+        service.get_store()
+
+    service._refresh_thread.join(timeout=5)
+    assert service.get_restaurant_by_id('new') is not None
+
+
+class _ListSource(RestaurantSource):
+    """Source returning a preset list of records"""
+
+    def __init__(self, name, records, ttl=None):
+        super().__init__(ttl=ttl)
+        self.name = name
+        self.next_records = records
+        self.fetches = 0
+
+    def fetch(self):
+        self.fetches += 1
+        return self.next_records
+
+
+def test_merge_priority_and_per_source_refresh():
+    """Test that stale sources are re-fetched alone and upserted by priority"""
+    static = _ListSource('static', [{'id': 'a', 'src': 'static'}])
+    live = _ListSource('live', [{'id': 'a', 'src': 'live'}, {'id': 'b', 'src': 'live'}], ttl=60)
+    merged = MergedRestaurants([static, live])
+
+    assert [(r['id'], r['src']) for r in merged.refresh()] == [('a', 'static'), ('b', 'live')]
+
+    live.next_records = [{'id': 'c', 'src': 'live'}]
+    merged.invalidate(volatile_only=True)
+    assert [r['id'] for r in merged.refresh()] == ['a', 'c']
+    assert static.fetches == 1
+    assert live.fetches == 2
+
+
+def test_merge_released_id_falls_back_to_lower_source():
+    """Test that an ID dropped by a source is taken over by a lower one"""
+    static = _ListSource('static', [{'id': 'a', 'src': 'static'}], ttl=60)
+    live = _ListSource('live', [{'id': 'a', 'src': 'live'}], ttl=60)
+    merged = MergedRestaurants([static, live])
+    merged.refresh()
+
+    static.next_records = []
+    static.invalidate()
+    assert [r['src'] for r in merged.refresh()] == ['live']
+
+
+def test_warm_start_from_snapshot(tmp_path):
+    """Test that a new service serves the saved snapshot, then refreshes"""
+    path = str(tmp_path / 'snapshot.pickle')
+    first = RestaurantService(snapshot_path=path)
+    first._load_restaurants = lambda: [{'id': 'saved', 'state': 'Lagos'}]
+    first.get_store()
+
+    release = threading.Event()
+
+    def blocked_load():
+        release.wait(timeout=5)
+        return [{'id': 'fresh'}]
+
+    second = RestaurantService(snapshot_path=path)
+    second._load_restaurants = blocked_load
+    assert second.get_restaurant_by_id('saved') is not None
+    assert len(second.find_restaurants(state='lagos')) == 1
+
+    release.set()
+    second._refresh_thread.join(timeout=5)
+    assert second.get_restaurant_by_id('fresh') is not None
+
+
+def test_clear_cache_skips_warm_start_snapshot(tmp_path):
+    """Test that clearing the cache rebuilds instead of restoring the snapshot"""
+    path = str(tmp_path / 'snapshot.pickle')
+    first = RestaurantService(snapshot_path=path)
+    first._load_restaurants = lambda: [{'id': 'old'}]
+    first.get_store()
+
+    second = RestaurantService(snapshot_path=path)
+    second._load_restaurants = lambda: [{'id': 'new'}]
+    second.clear_cache()
+    assert [r['id'] for r in second.get_all_restaurants()] == ['new']
+
+
+def test_page_cursor_resumes_after_moved_record():
+    """Test that a cursor follows its record's ID across refreshes"""
+    service = _make_service([
+        [{'id': str(i)} for i in range(5)],
+        [{'id': 'new'}] + [{'id': str(i)} for i in range(5)],
+    ])
+    page, cursor = service.page_restaurants(limit=2)
+    assert [r['id'] for r in page] == ['0', '1']
+
+    service._refresh()
+    page, cursor = service.page_restaurants(cursor=cursor, limit=2)
+    assert [r['id'] for r in page] == ['2', '3']
+    page, cursor = service.page_restaurants(cursor=cursor, limit=2)
+    assert [r['id'] for r in page] == ['4']
+    assert cursor is None
+
+
+def test_sorted_cursor_survives_removed_record(tmp_path):
+    """Test that a sorted cursor resumes by value in both store backends"""
+    ratings = range(10, 0, -1)
+    batches = [
+        [{'id': str(r), 'rating': float(r)} for r in ratings],
+        [{'id': 'new', 'rating': 2.5}] + [{'id': str(r), 'rating': float(r)} for r in ratings
+                                          if r != 8],
+    ]
+    for sqlite_path in (None, str(tmp_path / 'restaurants.sqlite3')):
+        service = _make_service(list(batches))
+        service.sqlite_path = sqlite_path
+        page, cursor = service.page_restaurants(limit=3, sort='rating', descending=True)
+        assert [r['id'] for r in page] == ['10', '9', '8']
+
+        service._refresh()
+        page, cursor = service.page_restaurants(cursor=cursor, limit=3, sort='rating',
+                                                descending=True)
+        assert [r['id'] for r in page] == ['7', '6', '5']
+
+
+def test_snapshot_version_follows_content():
+    """Test that the snapshot version only changes with the data"""
+    service = _make_service([[{'id': 'a'}], [{'id': 'a'}], [{'id': 'b'}]])
+    first = service.snapshot_version()
+    service._refresh()
+    assert service.snapshot_version() == first
+    service._refresh()
+    assert service.snapshot_version() != first
+
+
+def test_autocomplete_index_published_with_snapshot(tmp_path):
+    """Test that the autocomplete index is built before publishing and pickled"""
+    path = str(tmp_path / 'snapshot.pickle')
+    first = RestaurantService(snapshot_path=path)
+    first._load_restaurants = lambda: [{'id': 'a', 'name': 'Ikoyi Grill', 'rating': 4.0}]
+    assert first.get_store().autocomplete_index is not None
+    completions = first.autocomplete('ikoyi g')
+    assert completions == [{'text': 'Ikoyi Grill', 'type': 'restaurant', 'id': 'a'}]
+
+    second = RestaurantService(snapshot_path=path)
+    assert second._restore_snapshot()
+    assert second._store.autocomplete_index.complete('ikoyi g') == completions
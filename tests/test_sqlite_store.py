@@ -0,0 +1,180 @@
+"""
+Tests for the SQLite restaurant store
+"""
+from src.restaurants.sqlite_store import SQLiteRestaurantStore
+
+
+def _restaurant(restaurant_id, **fields):
+    restaurant = {'id': restaurant_id, 'name': f"Restaurant {restaurant_id}"}
+    restaurant.update(fields)
+    return restaurant
+
+
+def _build(tmp_path):
+    return SQLiteRestaurantStore.build([
+        _restaurant('a', state='Lagos', lga='Ikeja', cuisine='Nigerian', rating=4.0),
+        _restaurant('b', name='Jollof Palace', state='Lagos', lga='Eti-Osa',
+                    cuisine='Nigerian', specialties=['Jollof Rice'], rating=5.0),
+        _restaurant('c', state='FCT', lga='Abuja Municipal', cuisine='Fast Food'),
+        _restaurant('a', name='Duplicate'),
+    ], str(tmp_path / 'restaurants.sqlite3'))
+
+
+def test_get_by_id(tmp_path):
+    """Test id lookup, keeping the first record for duplicate IDs"""
+    store = _build(tmp_path)
+    assert len(store) == 4
+    assert store.get('a')['name'] == 'Restaurant a'
+    assert store.get('missing') is None
+    assert store.version
+
+
+def test_query_filters_and_pages(tmp_path):
+    """Test that filters, LIMIT and OFFSET run in SQL"""
+    store = _build(tmp_path)
+    total, page = store.query(offset=1, limit=1, state='lagos', cuisine='NIGERIAN')
+    assert total == 2
+    assert [r['id'] for r in page] == ['b']
+    assert [r['id'] for r in store.find(state='FCT')] == ['c']
+    assert store.average_rating() == 4.5
+
+
+def test_page_seeks_after_position(tmp_path):
+    """Test keyset paging with the position primary key"""
+    store = _build(tmp_path)
+    records, last = store.page(limit=1, state='Lagos')
+    assert [r['id'] for r in records] == ['a']
+    records, last = store.page(after=last, limit=1, state='Lagos')
+    assert [r['id'] for r in records] == ['b']
+    assert last is None
+
+
+def test_sorted_pages_match_memory_store(tmp_path):
+    """Test that the precomputed rank columns order like the in-memory store"""
+    from src.restaurants.store import RestaurantStore
+    store = _build(tmp_path)
+    memory = RestaurantStore(list(store.all()))
+    for sort, descending in (('rating', True), ('rating', False), ('name', False), ('name', True)):
+        assert store.query(sort=sort, descending=descending) == \
+            memory.query(sort=sort, descending=descending)
+
+    records, last = store.page(limit=1, sort='rating', descending=True)
+    assert [r['id'] for r in records] == ['b']
+    records, last = store.page(after=last, limit=2, sort='rating', descending=True,
+                               after_value=5.0)
+    assert [r['id'] for r in records] == ['a', 'c']
+    assert last == 2
+
+    # Records gone from the file are sought by value, as in memory
+    for sort, descending, value in (('rating', True, 4.5), ('rating', False, None),
+                                    ('name', False, 'jz'), ('name', True, 'restaurant b')):
+        for after in (0, 7):
+            assert store.page(after=after, limit=10, sort=sort, descending=descending,
+                              after_value=value) == \
+                memory.page(after=after, limit=10, sort=sort, descending=descending,
+                            after_value=value)
+
+
+def test_nearby_matches_memory_store(tmp_path):
+    """Test that stored coordinates answer nearby queries like the memory store"""
+    from src.restaurants.geo import locate
+    from src.restaurants.store import RestaurantStore
+    restaurants = [
+        locate(_restaurant('a', state='Lagos', lga='Ikeja', city='Ikeja GRA')),
+        locate(_restaurant('b', state='Lagos', lga='Eti-Osa', city='Ajah')),
+        _restaurant('c', state='Lagos'),
+    ]
+    store = SQLiteRestaurantStore.build(restaurants, str(tmp_path / 'restaurants.sqlite3'))
+    memory = RestaurantStore(restaurants)
+    assert store.nearby(6.6, 3.35) == memory.nearby(6.6, 3.35)
+    assert store.nearby(6.6, 3.35, radius=10) == memory.nearby(6.6, 3.35, radius=10)
+
+
+def test_delivering_to_matches_memory_store(tmp_path):
+    """Test that the delivery_areas table answers like the memory reverse index"""
+    from src.restaurants.store import RestaurantStore
+    restaurants = [
+        _restaurant('a', delivery_areas=['Somolu', 'Yaba']),
+        _restaurant('b', delivery_areas=['Shomolu']),
+        _restaurant('c', delivery_areas='Yaba'),
+    ]
+    store = SQLiteRestaurantStore.build(restaurants, str(tmp_path / 'restaurants.sqlite3'))
+    memory = RestaurantStore(restaurants)
+    assert store.delivering_to('shomolu') == memory.delivering_to('shomolu')
+    assert store.delivering_to('Shomolu', offset=1, limit=1)[1] == [restaurants[1]]
+    assert store.delivering_to('Yaba') == memory.delivering_to('Yaba')
+
+
+def test_open_slot_matches_memory_store(tmp_path):
+    """Test that stored opening intervals filter like the slot bitsets"""
+    from src.restaurants.hours import SLOTS_PER_WEEK
+    from src.restaurants.store import RestaurantStore
+    restaurants = [
+        _restaurant('a', opening_hours='9:00 AM - 10:00 PM', state='Lagos'),
+        _restaurant('b', opening_hours='Sat-Sun 6:30pm - 2am', state='Lagos'),
+        _restaurant('c', opening_hours='Mon-Fri 9-5', state='FCT'),
+        _restaurant('d', opening_hours='Hours vary'),
+    ]
+    store = SQLiteRestaurantStore.build(restaurants, str(tmp_path / 'restaurants.sqlite3'))
+    memory = RestaurantStore(restaurants)
+    for slot in range(0, SLOTS_PER_WEEK, 7):
+        assert store.positions(open_slot=slot) == list(memory.positions(open_slot=slot))
+        assert store.query(open_slot=slot, state='Lagos') == \
+            memory.query(open_slot=slot, state='Lagos')
+
+
+def test_facets_match_memory_store(tmp_path):
+    """Test that SQL facet counts agree with the in-memory store"""
+    from src.restaurants.store import RestaurantStore
+    store = _build(tmp_path)
+    memory = RestaurantStore(list(store.all()))
+    assert store.facets() == memory.facets()
+    assert store.facets(state='lagos') == memory.facets(state='lagos')
+
+
+def test_search(tmp_path):
+    """Test full-text prefix search over names and specialties"""
+    store = _build(tmp_path)
+    total, results = store.search('jol')
+    assert total == 1
+    assert results[0]['id'] == 'b'
+    assert store.search('palace jol', fields=('id',)) == (1, [{'id': 'b'}])
+    assert store.search('') == (0, [])
+    assert store.search('jolof', fuzzy=True)[0] == 1
+    assert store.search('restaurant', lga='ikeja', fields=('id',)) == (1, [{'id': 'a'}])
+    assert store.search('jol', state='FCT') == (0, [])
+
+
+def test_store_keeps_reading_its_own_build(tmp_path):
+    """Test that publishing a new build leaves open stores on their own file"""
+    import threading
+    path = str(tmp_path / 'restaurants.sqlite3')
+    old = SQLiteRestaurantStore.build([_restaurant(str(i)) for i in range(10)], path)
+    new = SQLiteRestaurantStore.build([_restaurant('x')], path)
+    assert new.version != old.version
+    assert SQLiteRestaurantStore.open(path).version == new.version
+
+    # A thread's first query opens a fresh connection to the old store's file
+    results = []
+    thread = threading.Thread(target=lambda: results.append(
+        (old.query()[0], old.records([5], ('id',)))
+    ))
+    thread.start()
+    thread.join()
+    assert results == [(10, [{'id': '5'}])]
+
+
+def test_build_reuses_identical_data(tmp_path):
+    """Test that rebuilding the same data opens the existing file"""
+    path = str(tmp_path / 'restaurants.sqlite3')
+    first = SQLiteRestaurantStore.build([_restaurant('a')], path)
+    second = SQLiteRestaurantStore.build([_restaurant('a')], path)
+    assert second.path == first.path
+    for i in range(5):
+        SQLiteRestaurantStore.build([_restaurant(str(i))], path)
+    assert len(list(tmp_path.glob('restaurants-v*.sqlite3'))) == 3
+
+
+def test_open_missing_file(tmp_path):
+    """Test that a missing database is reported as None"""
+    assert SQLiteRestaurantStore.open(str(tmp_path / 'missing.sqlite3')) is None
@@ -0,0 +1,178 @@
+"""
+Tests for the in-memory restaurant store
+"""
+from src.restaurants.store import RestaurantStore
+
+
+def _restaurant(restaurant_id, **fields):
+    restaurant = {'id': restaurant_id, 'name': f"Restaurant {restaurant_id}"}
+    restaurant.update(fields)
+    return restaurant
+
+
+def test_get_by_id():
+    """Test O(1) lookup by restaurant ID"""
+    store = RestaurantStore([_restaurant('a'), _restaurant('b')])
+    assert store.get('b')['name'] == 'Restaurant b'
+    assert store.get('missing') is None
+    assert len(store) == 2
+
+
+def test_get_by_id_keeps_first_duplicate():
+    """Test that the first record wins when IDs collide"""
+    store = RestaurantStore([_restaurant('a', name='First'), _restaurant('a', name='Second')])
+    assert store.get('a')['name'] == 'First'
+
+
+def test_get_by_numeric_id():
+    """Test that numeric IDs are matched by their string form"""
+    store = RestaurantStore([_restaurant(7)])
+    assert store.get('7')['id'] == 7
+
+
+def test_find_by_secondary_index():
+    """Test case-insensitive filtering through the secondary indexes"""
+    store = RestaurantStore([
+        _restaurant('a', state='Lagos', lga='Ikeja', cuisine='Nigerian'),
+        _restaurant('b', state='Lagos', lga='Eti-Osa', cuisine='Fast Food'),
+        _restaurant('c', state='FCT', lga='Abuja Municipal', cuisine='Nigerian'),
+    ])
+    assert [r['id'] for r in store.find(state='lagos')] == ['a', 'b']
+    assert [r['id'] for r in store.find(cuisine='NIGERIAN', state='Lagos')] == ['a']
+    assert list(store.find(lga='Unknown')) == []
+    assert len(store.find()) == 3
+
+
+def test_page_seeks_after_position():
+    """Test keyset paging over filtered merge order"""
+    store = RestaurantStore([
+        _restaurant(str(i), state='Lagos' if i % 2 else 'FCT') for i in range(7)
+    ])
+    records, last = store.page(limit=2, state='Lagos')
+    assert [r['id'] for r in records] == ['1', '3']
+    records, last = store.page(after=last, limit=2, state='Lagos')
+    assert [r['id'] for r in records] == ['5']
+    assert last is None
+
+
+def test_sorted_pages_by_rating_and_name():
+    """Test precomputed orderings: unrated last, ties in merge order"""
+    store = RestaurantStore([
+        _restaurant('a', name='delta', lga='Eti-Osa', rating=4.0),
+        _restaurant('b', name='Alpha', lga='Ikeja', rating=4.8),
+        _restaurant('c', name='charlie', lga='Eti-Osa'),
+        _restaurant('d', name='Bravo', lga='Eti-Osa', rating=4.6),
+        _restaurant('e', name='echo', lga='Eti-Osa', rating=4.0),
+    ])
+    total, records = store.query(sort='rating', descending=True)
+    assert [r['id'] for r in records] == ['b', 'd', 'a', 'e', 'c']
+    total, records = store.query(sort='rating', descending=False)
+    assert [r['id'] for r in records] == ['a', 'e', 'd', 'b', 'c']
+    total, records = store.query(sort='name', limit=2)
+    assert [r['id'] for r in records] == ['b', 'd']
+
+    # Top-k within one LGA, then keyset paging in the same order
+    total, records = store.query(sort='rating', descending=True, limit=2, lga='eti-osa')
+    assert total == 4
+    assert [r['id'] for r in records] == ['d', 'a']
+    records, last = store.page(limit=2, sort='rating', descending=True, lga='Eti-Osa')
+    records, last = store.page(after=last, limit=2, sort='rating', descending=True,
+                               after_value=4.0, lga='Eti-Osa')
+    assert [r['id'] for r in records] == ['e', 'c']
+    assert last is None
+
+
+def test_sorted_page_seeks_by_value():
+    """Test that a sorted page resumes by sort value when its record is gone"""
+    ratings = range(10, 0, -1)
+    store = RestaurantStore([_restaurant(str(rating), rating=float(rating)) for rating in ratings])
+    records, last = store.page(limit=3, sort='rating', descending=True)
+    assert [r['id'] for r in records] == ['10', '9', '8']
+
+    # A refresh adds a record in front and drops '8'
+    refreshed = RestaurantStore([_restaurant('new', rating=2.5)] + [
+        _restaurant(str(rating), rating=float(rating)) for rating in ratings if rating != 8
+    ])
+    records, _ = refreshed.page(after=last, limit=3, sort='rating', descending=True,
+                                after_value=8.0)
+    assert [r['id'] for r in records] == ['7', '6', '5']
+    records, _ = refreshed.page(after=5, limit=2, sort='name', after_value='restaurant 5')
+    assert [r['id'] for r in records] == ['6', '7']
+
+
+def test_delivering_to_resolves_area_aliases():
+    """Test the delivery-area reverse index, matching aliases and spellings"""
+    store = RestaurantStore([
+        _restaurant('a', delivery_areas=['VI', 'Ikoyi']),
+        _restaurant('b', delivery_areas=['victoria  island', 'Victoria Island']),
+        _restaurant('c', delivery_areas=['Yaba']),
+        _restaurant('d'),
+    ])
+    total, records = store.delivering_to('Victoria Island')
+    assert total == 2
+    assert [r['id'] for r in records] == ['a', 'b']
+    assert [r['id'] for r in store.delivering_to('v.i.', offset=1)[1]] == ['b']
+    assert store.delivering_to('Nowhere') == (0, [])
+
+
+def test_open_slot_filter():
+    """Test filtering by opening hours, alone, with indexes and sorted"""
+    from datetime import datetime
+    from src.restaurants.hours import week_slot
+    store = RestaurantStore([
+        _restaurant('a', lga='Ikeja', rating=4.0, opening_hours='9:00 AM - 10:00 PM'),
+        _restaurant('b', lga='Ikeja', rating=4.5, opening_hours='6pm - 2am'),
+        _restaurant('c', lga='Yaba', rating=4.9, opening_hours='Mon-Fri 6pm - 11pm'),
+        _restaurant('d', lga='Ikeja'),
+    ])
+    friday_night = week_slot(datetime(2024, 5, 10, 21, 0))
+    saturday_late = week_slot(datetime(2024, 5, 11, 23, 30))
+
+    assert [r['id'] for r in store.find(open_slot=friday_night)] == ['a', 'b', 'c']
+    assert [r['id'] for r in store.find(open_slot=saturday_late)] == ['b']
+    assert store.query(open_slot=friday_night, lga='ikeja')[0] == 2
+    total, records = store.query(sort='rating', descending=True, open_slot=friday_night)
+    assert [r['id'] for r in records] == ['c', 'b', 'a']
+    assert store.facets(open_slot=saturday_late)['total'] == 1
+
+
+def test_field_projection():
+    """Test that only the requested keys are built"""
+    store = RestaurantStore([_restaurant('a', state='Lagos', rating=4.5, extra='x')])
+    assert store.get('a', ('id', 'rating')) == {'id': 'a', 'rating': 4.5}
+    total, records = store.query(fields=frozenset(['name', 'extra']))
+    assert records == [{'name': 'Restaurant a', 'extra': 'x'}]
+
+
+def test_stream_yields_filtered_records():
+    """Test streaming filtered records across batch boundaries"""
+    store = RestaurantStore([
+        _restaurant(str(i), state='Lagos' if i % 3 else 'FCT') for i in range(1200)
+    ])
+    streamed = list(store.stream(fields=('id',), state='FCT'))
+    assert len(streamed) == 400
+    assert streamed[:2] == [{'id': '0'}, {'id': '3'}]
+
+
+def test_facets_count_filtered_values():
+    """Test facet counts, merged spellings and rating buckets"""
+    store = RestaurantStore([
+        _restaurant('a', state='Lagos', lga='Ikeja', cuisine='Nigerian', rating=4.6),
+        _restaurant('b', state='lagos', lga='Ikeja', cuisine='Fast Food', rating=3.2),
+        _restaurant('c', state='FCT', lga='Garki', cuisine='Nigerian'),
+    ])
+    facets = store.facets()
+    assert facets['total'] == 3
+    assert facets['state'] == [{'value': 'Lagos', 'count': 2}, {'value': 'FCT', 'count': 1}]
+    assert facets['average_rating'] == 3.9
+    assert {f['value']: f['count'] for f in facets['rating']} == {
+        '4.5+': 1, '3.0-3.4': 1, 'unrated': 1
+    }
+
+    narrowed = store.facets(cuisine='nigerian')
+    assert narrowed['total'] == 2
+    assert narrowed['average_rating'] == 4.6
+    assert {f['value']: f['count'] for f in narrowed['rating']} == {'4.5+': 1, 'unrated': 1}
+    # Filtered results are cached per store under their normalised filters
+    assert store.facets(cuisine=' Nigerian ') is narrowed
+    assert narrowed['lga'] == [{'value': 'Garki', 'count': 1}, {'value': 'Ikeja', 'count': 1}]